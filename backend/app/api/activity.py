@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from collections import deque
 from datetime import UTC, datetime
@@ -24,6 +23,7 @@ from app.models.boards import Board
 from app.models.tasks import Task
 from app.schemas.activity_events import ActivityEventRead, ActivityTaskCommentFeedItemRead
 from app.schemas.pagination import DefaultLimitOffsetPage
+from app.services.board_events import BoardEventKey, board_event_bus
 from app.services.organizations import (
     OrganizationContext,
     get_active_membership,
@@ -39,7 +39,6 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="/activity", tags=["activity"])
 
 SSE_SEEN_MAX = 2000
-STREAM_POLL_SECONDS = 2
 TASK_COMMENT_ROW_LEN = 4
 SESSION_DEP = Depends(get_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
@@ -243,43 +242,46 @@ async def stream_task_comment_feed(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     seen_ids: set[UUID] = set()
     seen_queue: deque[UUID] = deque()
+    stream_board_ids = [board_id] if board_id is not None else list(allowed_ids)
+    stream_keys: list[BoardEventKey] = [("tasks", item) for item in stream_board_ids]
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         last_seen = since_dt
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as stream_session:
-                if board_id is not None:
-                    rows = await _fetch_task_comment_events(
-                        stream_session,
-                        last_seen,
-                        board_id=board_id,
-                    )
-                elif allowed_ids:
-                    rows = await _fetch_task_comment_events(stream_session, last_seen)
-                    rows = [row for row in rows if row[1].board_id in allowed_ids]
-                else:
-                    rows = []
-            for event, task, board, agent in rows:
-                event_id = event.id
-                if event_id in seen_ids:
-                    continue
-                seen_ids.add(event_id)
-                seen_queue.append(event_id)
-                if len(seen_queue) > SSE_SEEN_MAX:
-                    oldest = seen_queue.popleft()
-                    seen_ids.discard(oldest)
-                last_seen = max(event.created_at, last_seen)
-                payload = {
-                    "comment": _feed_item(
-                        event,
-                        task,
-                        board,
-                        agent,
-                    ).model_dump(mode="json"),
-                }
-                yield {"event": "comment", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        with board_event_bus().subscribe(stream_keys) as subscription:
+            while True:
+                if await request.is_disconnected():
+                    break
+                async with async_session_maker() as stream_session:
+                    if board_id is not None:
+                        rows = await _fetch_task_comment_events(
+                            stream_session,
+                            last_seen,
+                            board_id=board_id,
+                        )
+                    elif allowed_ids:
+                        rows = await _fetch_task_comment_events(stream_session, last_seen)
+                        rows = [row for row in rows if row[1].board_id in allowed_ids]
+                    else:
+                        rows = []
+                for event, task, board, agent in rows:
+                    event_id = event.id
+                    if event_id in seen_ids:
+                        continue
+                    seen_ids.add(event_id)
+                    seen_queue.append(event_id)
+                    if len(seen_queue) > SSE_SEEN_MAX:
+                        oldest = seen_queue.popleft()
+                        seen_ids.discard(oldest)
+                    last_seen = max(event.created_at, last_seen)
+                    payload = {
+                        "comment": _feed_item(
+                            event,
+                            task,
+                            board,
+                            agent,
+                        ).model_dump(mode="json"),
+                    }
+                    yield {"event": "comment", "data": json.dumps(payload)}
+                await subscription.wait()
 
     return EventSourceResponse(event_generator(), ping=15)
@@ -47,7 +47,14 @@ from app.schemas.gateway_coordination import (
 from app.schemas.health import AgentHealthStatusResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.tags import TagRef
-from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import (
+    TaskBulkUpdate,
+    TaskCommentCreate,
+    TaskCommentRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.services.activity_log import record_activity
 from app.services.openclaw.coordination_service import GatewayCoordinationService
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
@@ -809,6 +816,55 @@ async def update_task(
     )
 
 
+@router.post(
+    "/boards/{board_id}/tasks/bulk-update",
+    response_model=list[TaskRead],
+    tags=AGENT_BOARD_TAGS,
+    summary="Update many tasks at once",
+    description=(
+        "Apply one status and/or assignment change to a list of board tasks.\n\n"
+        "The same rules as single-task updates apply; the batch is all-or-nothing."
+    ),
+    openapi_extra=_agent_board_openapi_hints(
+        intent="agent_task_bulk_update",
+        when_to_use=[
+            "The same status move or reassignment applies to several tasks.",
+            "Lead is rebalancing ownership across many tasks in one step.",
+        ],
+        routing_examples=[
+            {
+                "input": {
+                    "intent": "lead approves every reviewed task",
+                    "required_privilege": "board_lead",
+                },
+                "decision": "agent_task_bulk_update",
+            },
+            {
+                "input": {
+                    "intent": "worker moves several of its tasks to review",
+                    "required_privilege": "any_agent",
+                },
+                "decision": "agent_task_bulk_update",
+            },
+        ],
+    ),
+)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    board: Board = BOARD_DEP,
+    session: AsyncSession = SESSION_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> list[TaskRead]:
+    """Update several board tasks in one all-or-nothing batch."""
+    _guard_board_access(agent_ctx, board)
+    return await tasks_api.bulk_update_tasks(
+        payload=payload,
+        board=board,
+        session=session,
+        actor=_actor(agent_ctx),
+    )
+
+
 @router.delete(
     "/boards/{board_id}/tasks/{task_id}",
     response_model=OkResponse,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -23,13 +22,12 @@ from app.api.deps import (
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.tasks import Task
 from app.schemas.approvals import ApprovalCreate, ApprovalRead, ApprovalStatus, ApprovalUpdate
 from app.schemas.pagination import DefaultLimitOffsetPage
-from app.services.activity_log import record_activity
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
     lock_tasks_for_approval,
@@ -38,10 +36,12 @@ from app.services.approval_task_links import (
     replace_approval_task_links,
     task_counts_for_board,
 )
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
+from app.services.board_stream_hub import StreamMessage, stream_board_messages
+from app.services.openclaw.agent_notifications import notify_agents
+from app.services.openclaw.gateway_dispatch import AgentNotification, NotificationActivity
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -51,7 +51,6 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="/boards/{board_id}/approvals", tags=["approvals"])
 logger = get_logger(__name__)
 
-STREAM_POLL_SECONDS = 2
 STATUS_FILTER_QUERY = Query(default=None, alias="status")
 SINCE_QUERY = Query(default=None)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
@@ -241,41 +240,29 @@ async def _notify_lead_on_approval_resolution(
     if lead is None or not lead.openclaw_session_id:
         return
 
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
-
     task_ids_by_approval = await load_task_ids_by_approval(session, approval_ids=[approval.id])
     message = _approval_resolution_message(
         board=board,
         approval=approval,
         task_ids=task_ids_by_approval.get(approval.id, []),
     )
-    error = await dispatch.try_send_agent_message(
+    notification = AgentNotification(
+        board_id=board.id,
         session_key=lead.openclaw_session_id,
-        config=config,
         agent_name=lead.name,
         message=message,
-        deliver=False,
+        activities=(
+            NotificationActivity(
+                sent_event_type="approval.lead_notified",
+                sent_message=f"Lead agent notified for {approval.status} approval {approval.id}.",
+                failed_event_type="approval.lead_notify_failed",
+                failed_message=f"Lead notify failed for approval {approval.id}",
+                agent_id=lead.id,
+                task_id=approval.task_id,
+            ),
+        ),
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="approval.lead_notified",
-            message=f"Lead agent notified for {approval.status} approval {approval.id}.",
-            agent_id=lead.id,
-            task_id=approval.task_id,
-        )
-    else:
-        record_activity(
-            session,
-            event_type="approval.lead_notify_failed",
-            message=f"Lead notify failed for approval {approval.id}: {error}",
-            agent_id=lead.id,
-            task_id=approval.task_id,
-        )
-    await session.commit()
+    await notify_agents(session, [notification], boards=[board])
 
 
 async def _fetch_approval_events(
@@ -321,6 +308,62 @@ async def list_approvals(
     return await paginate(session, statement.statement, transformer=_transform)
 
 
+async def _fetch_approval_stream_messages(
+    session: AsyncSession,
+    board_id: UUID,
+    since: datetime,
+) -> list[StreamMessage]:
+    approvals = await _fetch_approval_events(session, board_id, since)
+    if not approvals:
+        return []
+    approval_reads = await _approval_reads(session, approvals)
+    pending_approvals_count = int(
+        (
+            await session.exec(
+                select(func.count(col(Approval.id)))
+                .where(col(Approval.board_id) == board_id)
+                .where(col(Approval.status) == "pending"),
+            )
+        ).one(),
+    )
+    task_ids = {task_id for approval_read in approval_reads for task_id in approval_read.task_ids}
+    counts_by_task_id = await task_counts_for_board(
+        session,
+        board_id=board_id,
+        task_ids=task_ids,
+    )
+    messages: list[StreamMessage] = []
+    for approval, approval_read in zip(approvals, approval_reads, strict=True):
+        updated_at = _approval_updated_at(approval)
+        payload: dict[str, object] = {
+            "approval": _serialize_approval(approval_read),
+            "pending_approvals_count": pending_approvals_count,
+        }
+        task_counts = [
+            {
+                "task_id": str(task_id),
+                "approvals_count": total,
+                "approvals_pending_count": pending,
+            }
+            for task_id in approval_read.task_ids
+            if (counts := counts_by_task_id.get(task_id)) is not None
+            for total, pending in [counts]
+        ]
+        if len(task_counts) == 1:
+            payload["task_counts"] = task_counts[0]
+        elif task_counts:
+            payload["task_counts"] = task_counts
+        messages.append(
+            StreamMessage(
+                event="approval",
+                data=json.dumps(payload),
+                key=(approval.id, updated_at),
+                cursor=updated_at,
+            ),
+        )
+    return messages
+
+
 @router.get("/stream")
 async def stream_approvals(
     request: Request,
@@ -330,60 +373,16 @@ async def stream_approvals(
 ) -> EventSourceResponse:
     """Stream approval updates for a board using server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
-
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as session:
-                approvals = await _fetch_approval_events(session, board.id, last_seen)
-                approval_reads = await _approval_reads(session, approvals)
-                pending_approvals_count = int(
-                    (
-                        await session.exec(
-                            select(func.count(col(Approval.id)))
-                            .where(col(Approval.board_id) == board.id)
-                            .where(col(Approval.status) == "pending"),
-                        )
-                    ).one(),
-                )
-                task_ids = {
-                    task_id
-                    for approval_read in approval_reads
-                    for task_id in approval_read.task_ids
-                }
-                counts_by_task_id = await task_counts_for_board(
-                    session,
-                    board_id=board.id,
-                    task_ids=task_ids,
-                )
-            for approval, approval_read in zip(approvals, approval_reads, strict=True):
-                updated_at = _approval_updated_at(approval)
-                last_seen = max(updated_at, last_seen)
-                payload: dict[str, object] = {
-                    "approval": _serialize_approval(approval_read),
-                    "pending_approvals_count": pending_approvals_count,
-                }
-                task_counts = [
-                    {
-                        "task_id": str(task_id),
-                        "approvals_count": total,
-                        "approvals_pending_count": pending,
-                    }
-                    for task_id in approval_read.task_ids
-                    if (counts := counts_by_task_id.get(task_id)) is not None
-                    for total, pending in [counts]
-                ]
-                if len(task_counts) == 1:
-                    payload["task_counts"] = task_counts[0]
-                elif task_counts:
-                    payload["task_counts"] = task_counts
-                yield {"event": "approval", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
-
-    return EventSourceResponse(event_generator(), ping=15)
+    return EventSourceResponse(
+        stream_board_messages(
+            request,
+            topic="approvals",
+            board_id=board.id,
+            since=since_dt,
+            fetch=_fetch_approval_stream_messages,
+        ),
+        ping=15,
+    )
 
 
 @router.post("", response_model=ApprovalRead)
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
-from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, cast
@@ -33,8 +31,10 @@ from app.models.boards import Board
 from app.models.users import User
 from app.schemas.board_group_memory import BoardGroupMemoryCreate, BoardGroupMemoryRead
 from app.schemas.pagination import DefaultLimitOffsetPage
+from app.services.board_events import BoardEventKey, board_event_bus
 from app.services.mentions import extract_mentions, matches_agent_mention
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
+from app.services.openclaw.agent_notifications import notify_agents
+from app.services.openclaw.gateway_dispatch import AgentNotification
 from app.services.organizations import (
     is_org_admin,
     list_accessible_board_ids,
@@ -60,7 +60,6 @@ board_router = APIRouter(
     tags=["board-group-memory"],
 )
 MAX_SNIPPET_LENGTH = 800
-STREAM_POLL_SECONDS = 2
 SESSION_DEP = Depends(get_session)
 ORG_MEMBER_DEP = Depends(require_org_member)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
@@ -243,54 +242,38 @@ def _group_header(*, is_broadcast: bool, mentioned: bool) -> str:
     return "GROUP CHAT"
 
 
-@dataclass(frozen=True)
-class _NotifyGroupContext:
-    session: AsyncSession
-    dispatch: GatewayDispatchService
-    group: BoardGroup
-    board_by_id: dict[UUID, Board]
-    mentions: set[str]
-    is_broadcast: bool
-    actor_name: str
-    snippet: str
-    base_url: str
-
-
-async def _notify_group_target(
-    context: _NotifyGroupContext,
+def _group_target_notification(
+    *,
     agent: Agent,
-) -> None:
-    session_key = agent.openclaw_session_id
-    board_id = agent.board_id
-    if not session_key or board_id is None:
-        return
-    board = context.board_by_id.get(board_id)
-    if board is None:
-        return
-    config = await context.dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
+    board: Board,
+    group: BoardGroup,
+    mentions: set[str],
+    is_broadcast: bool,
+    actor_name: str,
+    snippet: str,
+    base_url: str,
+) -> AgentNotification | None:
+    if not agent.openclaw_session_id:
+        return None
     header = _group_header(
-        is_broadcast=context.is_broadcast,
-        mentioned=matches_agent_mention(agent, context.mentions),
+        is_broadcast=is_broadcast,
+        mentioned=matches_agent_mention(agent, mentions),
     )
     message = (
         f"{header}\n"
-        f"Group: {context.group.name}\n"
-        f"From: {context.actor_name}\n\n"
-        f"{context.snippet}\n\n"
+        f"Group: {group.name}\n"
+        f"From: {actor_name}\n\n"
+        f"{snippet}\n\n"
         "Reply via group chat (shared across linked boards):\n"
-        f"POST {context.base_url}/api/v1/boards/{board.id}/group-memory\n"
+        f"POST {base_url}/api/v1/boards/{board.id}/group-memory\n"
         'Body: {"content":"...","tags":["chat"]}'
     )
-    error = await context.dispatch.try_send_agent_message(
-        session_key=session_key,
-        config=config,
+    return AgentNotification(
+        board_id=board.id,
+        session_key=agent.openclaw_session_id,
         agent_name=agent.name,
         message=message,
     )
-    if error is not None:
-        return
 
 
 async def _notify_group_memory_targets(
@@ -333,19 +316,24 @@ async def _notify_group_memory_targets(
 
     base_url = settings.base_url or "http://localhost:8000"
 
-    context = _NotifyGroupContext(
-        session=session,
-        dispatch=GatewayDispatchService(session),
-        group=group,
-        board_by_id=board_by_id,
-        mentions=mentions,
-        is_broadcast=is_broadcast,
-        actor_name=actor_name,
-        snippet=snippet,
-        base_url=base_url,
-    )
+    notifications: list[AgentNotification] = []
     for agent in targets.values():
-        await _notify_group_target(context, agent)
+        board = board_by_id.get(agent.board_id) if agent.board_id is not None else None
+        if board is None:
+            continue
+        notification = _group_target_notification(
+            agent=agent,
+            board=board,
+            group=group,
+            mentions=mentions,
+            is_broadcast=is_broadcast,
+            actor_name=actor_name,
+            snippet=snippet,
+            base_url=base_url,
+        )
+        if notification is not None:
+            notifications.append(notification)
+    await notify_agents(session, notifications, boards=boards)
 
 
 @group_router.get("", response_model=DefaultLimitOffsetPage[BoardGroupMemoryRead])
@@ -384,21 +372,22 @@ async def stream_board_group_memory(
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as s:
-                memories = await _fetch_memory_events(
-                    s,
-                    group.id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        with board_event_bus().subscribe([("group_memory", group.id)]) as subscription:
+            while True:
+                if await request.is_disconnected():
+                    break
+                async with async_session_maker() as s:
+                    memories = await _fetch_memory_events(
+                        s,
+                        group.id,
+                        last_seen,
+                        is_chat=is_chat,
+                    )
+                for memory in memories:
+                    last_seen = max(memory.created_at, last_seen)
+                    payload = {"memory": _serialize_memory(memory)}
+                    yield {"event": "memory", "data": json.dumps(payload)}
+                await subscription.wait()
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -536,24 +525,26 @@ async def stream_board_group_memory_for_board(
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            if group_id is None:
-                await asyncio.sleep(2)
-                continue
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
-                    group_id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        stream_keys: list[BoardEventKey] = [] if group_id is None else [("group_memory", group_id)]
+        with board_event_bus().subscribe(stream_keys) as subscription:
+            while True:
+                if await request.is_disconnected():
+                    break
+                if group_id is None:
+                    await subscription.wait()
+                    continue
+                async with async_session_maker() as session:
+                    memories = await _fetch_memory_events(
+                        session,
+                        group_id,
+                        last_seen,
+                        is_chat=is_chat,
+                    )
+                for memory in memories:
+                    last_seen = max(memory.created_at, last_seen)
+                    payload = {"memory": _serialize_memory(memory)}
+                    yield {"event": "memory", "data": json.dumps(payload)}
+                await subscription.wait()
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -22,18 +21,17 @@ from app.api.deps import (
 from app.core.config import settings
 from app.core.time import utcnow
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
 from app.schemas.pagination import DefaultLimitOffsetPage
+from app.services.board_stream_hub import StreamMessage, stream_board_messages
 from app.services.mentions import extract_mentions, matches_agent_mention
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
-from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.openclaw.agent_notifications import notify_agents
+from app.services.openclaw.gateway_dispatch import AgentNotification
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
-
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -41,7 +39,6 @@ if TYPE_CHECKING:
 
 router = APIRouter(prefix="/boards/{board_id}/memory", tags=["board-memory"])
 MAX_SNIPPET_LENGTH = 800
-STREAM_POLL_SECONDS = 2
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
@@ -94,34 +91,29 @@ async def _fetch_memory_events(
     return await statement.all(session)
 
 
-async def _send_control_command(
+def _control_command_notifications(
     *,
-    session: AsyncSession,
+    agents: list[Agent],
     board: Board,
     actor: ActorContext,
-    dispatch: GatewayDispatchService,
-    config: GatewayClientConfig,
     command: str,
-) -> None:
-    pause_targets: list[Agent] = await Agent.objects.filter_by(
-        board_id=board.id,
-    ).all(
-        session,
-    )
-    for agent in pause_targets:
+) -> list[AgentNotification]:
+    notifications: list[AgentNotification] = []
+    for agent in agents:
         if actor.actor_type == "agent" and actor.agent and agent.id == actor.agent.id:
             continue
         if not agent.openclaw_session_id:
             continue
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=command,
-            deliver=True,
+        notifications.append(
+            AgentNotification(
+                board_id=board.id,
+                session_key=agent.openclaw_session_id,
+                agent_name=agent.name,
+                message=command,
+                deliver=True,
+            ),
         )
-        if error is not None:
-            continue
+    return notifications
 
 
 def _chat_targets(
@@ -159,32 +151,27 @@ async def _notify_chat_targets(
 ) -> None:
     if not memory.content:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
+    agents = await Agent.objects.filter_by(board_id=board.id).all(session)
 
     normalized = memory.content.strip()
     command = normalized.lower()
     # Special-case control commands to reach all board agents.
     # These are intended to be parsed verbatim by agent runtimes.
     if command in {"/pause", "/resume"}:
-        await _send_control_command(
-            session=session,
-            board=board,
-            actor=actor,
-            dispatch=dispatch,
-            config=config,
-            command=command,
+        await notify_agents(
+            session,
+            _control_command_notifications(
+                agents=agents,
+                board=board,
+                actor=actor,
+                command=command,
+            ),
+            boards=[board],
         )
         return
 
     mentions = extract_mentions(memory.content)
-    targets = _chat_targets(
-        agents=await Agent.objects.filter_by(board_id=board.id).all(session),
-        mentions=mentions,
-        actor=actor,
-    )
+    targets = _chat_targets(agents=agents, mentions=mentions, actor=actor)
     if not targets:
         return
     actor_name = _actor_display_name(actor)
@@ -192,6 +179,7 @@ async def _notify_chat_targets(
     if len(snippet) > MAX_SNIPPET_LENGTH:
         snippet = f"{snippet[: MAX_SNIPPET_LENGTH - 3]}..."
     base_url = settings.base_url or "http://localhost:8000"
+    notifications: list[AgentNotification] = []
     for agent in targets.values():
         if not agent.openclaw_session_id:
             continue
@@ -206,14 +194,15 @@ async def _notify_chat_targets(
             f"POST {base_url}/api/v1/agent/boards/{board.id}/memory\n"
             'Body: {"content":"...","tags":["chat"]}'
         )
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=message,
+        notifications.append(
+            AgentNotification(
+                board_id=board.id,
+                session_key=agent.openclaw_session_id,
+                agent_name=agent.name,
+                message=message,
+            ),
         )
-        if error is not None:
-            continue
+    await notify_agents(session, notifications, boards=[board])
 
 
 @router.get("", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
@@ -237,6 +226,24 @@ async def list_board_memory(
     return await paginate(session, statement.statement)
 
 
+async def _fetch_memory_stream_messages(
+    session: AsyncSession,
+    board_id: UUID,
+    since: datetime,
+) -> list[StreamMessage]:
+    memories = await _fetch_memory_events(session, board_id, since)
+    return [
+        StreamMessage(
+            event="memory",
+            data=json.dumps({"memory": _serialize_memory(memory)}),
+            key=memory.id,
+            cursor=memory.created_at,
+            is_chat=memory.is_chat,
+        )
+        for memory in memories
+    ]
+
+
 @router.get("/stream")
 async def stream_board_memory(
     request: Request,
@@ -248,27 +255,17 @@ async def stream_board_memory(
 ) -> EventSourceResponse:
     """Stream board memory events over server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
-
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
-                    board.id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
-
-    return EventSourceResponse(event_generator(), ping=15)
+    return EventSourceResponse(
+        stream_board_messages(
+            request,
+            topic="memory",
+            board_id=board.id,
+            since=since_dt,
+            fetch=_fetch_memory_stream_messages,
+            include=None if is_chat is None else (lambda message: message.is_chat == is_chat),
+        ),
+        ping=15,
+    )
 
 
 @router.post("", response_model=BoardMemoryRead)
@@ -6,7 +6,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Literal, cast
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import func
 from sqlmodel import col, select
 
@@ -30,12 +30,15 @@ from app.schemas.boards import BoardCreate, BoardRead, BoardUpdate
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.view_models import BoardGroupSnapshot, BoardSnapshot
-from app.services.activity_log import record_activity
 from app.services.board_group_snapshot import build_board_group_snapshot
 from app.services.board_lifecycle import delete_board as delete_board_service
-from app.services.board_snapshot import build_board_snapshot
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
-from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.board_snapshot import load_board_snapshot
+from app.services.openclaw.agent_notifications import notify_agents
+from app.services.openclaw.gateway_dispatch import (
+    AgentNotification,
+    GatewayDispatchService,
+    NotificationActivity,
+)
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.organizations import OrganizationContext, board_access_filter
 
@@ -237,20 +240,16 @@ async def _notify_agents_on_board_group_change(
     if not agents:
         return
 
-    config_by_board_id: dict[UUID, GatewayClientConfig] = {}
-    for group_board in board_by_id.values():
-        config = await dispatch.optional_gateway_config_for_board(group_board)
-        if config is None:
-            logger.warning(
-                "board.group.%s.notify_skipped board_id=%s group_id=%s target_board_id=%s "
-                "reason=no_gateway_config",
-                action,
-                board.id,
-                group.id,
-                group_board.id,
-            )
-            continue
-        config_by_board_id[group_board.id] = config
+    config_by_board_id = await dispatch.gateway_configs_for_boards(board_by_id.values())
+    for group_board_id in board_by_id.keys() - config_by_board_id.keys():
+        logger.warning(
+            "board.group.%s.notify_skipped board_id=%s group_id=%s target_board_id=%s "
+            "reason=no_gateway_config",
+            action,
+            board.id,
+            group.id,
+            group_board_id,
+        )
 
     if not config_by_board_id:
         logger.warning(
@@ -271,11 +270,10 @@ async def _notify_agents_on_board_group_change(
         for recipient_board_id, recipient_board in board_by_id.items()
     }
 
-    notified = 0
-    failed = 0
     skipped_missing_session = 0
     skipped_missing_config = 0
     skipped_missing_board = 0
+    notifications: list[AgentNotification] = []
     for agent in agents:
         if not agent.openclaw_session_id:
             skipped_missing_session += 1
@@ -283,55 +281,45 @@ async def _notify_agents_on_board_group_change(
         if agent.board_id is None:
             skipped_missing_board += 1
             continue
-        config = config_by_board_id.get(agent.board_id)
-        message = message_by_board_id.get(agent.board_id)
-        recipient_board = board_by_id.get(agent.board_id)
-        if config is None or message is None or recipient_board is None:
+        if agent.board_id not in config_by_board_id:
             skipped_missing_config += 1
             continue
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=message,
-            deliver=False,
-        )
-        if error is None:
-            notified += 1
-            record_activity(
-                session,
-                event_type=f"board.group.{action}.notified",
-                message=(
-                    f"Board-group {action} notice sent to {agent.name} for board "
-                    f"{recipient_board.name} related to {board.name} and {group.name}."
-                ),
-                agent_id=agent.id,
-            )
-        else:
-            failed += 1
-            record_activity(
-                session,
-                event_type=f"board.group.{action}.notify_failed",
-                message=(
-                    f"Board-group {action} notify failed for {agent.name} on board "
-                    f"{recipient_board.name}: {error}"
+        recipient_board = board_by_id[agent.board_id]
+        notifications.append(
+            AgentNotification(
+                board_id=agent.board_id,
+                session_key=agent.openclaw_session_id,
+                agent_name=agent.name,
+                message=message_by_board_id[agent.board_id],
+                activities=(
+                    NotificationActivity(
+                        sent_event_type=f"board.group.{action}.notified",
+                        sent_message=(
+                            f"Board-group {action} notice sent to {agent.name} for board "
+                            f"{recipient_board.name} related to {board.name} and {group.name}."
+                        ),
+                        failed_event_type=f"board.group.{action}.notify_failed",
+                        failed_message=(
+                            f"Board-group {action} notify failed for {agent.name} on board "
+                            f"{recipient_board.name}"
+                        ),
+                        agent_id=agent.id,
+                    ),
                 ),
-                agent_id=agent.id,
-            )
+            ),
+        )
 
-    if notified or failed:
-        await session.commit()
+    await notify_agents(session, notifications, boards=board_by_id.values())
     logger.info(
         "board.group.%s.notify_complete board_id=%s group_id=%s boards_total=%s agents_total=%s "
-        "agents_notified=%s agents_failed=%s agents_skipped_no_session=%s "
+        "agents_targeted=%s agents_skipped_no_session=%s "
         "agents_skipped_no_gateway=%s agents_skipped_no_board=%s",
         action,
         board.id,
         group.id,
         len(board_by_id),
         len(agents),
-        notified,
-        failed,
+        len(notifications),
         skipped_missing_session,
         skipped_missing_config,
         skipped_missing_board,
@@ -410,11 +398,19 @@ def get_board(
 
 @router.get("/{board_id}/snapshot", response_model=BoardSnapshot)
 async def get_board_snapshot(
+    request: Request,
     board: Board = BOARD_ACTOR_READ_DEP,
     session: AsyncSession = SESSION_DEP,
-) -> BoardSnapshot:
-    """Get a board snapshot view model."""
-    return await build_board_snapshot(session, board)
+) -> Response:
+    """Get a board snapshot view model.
+
+    Responds `304 Not Modified` when `If-None-Match` names the current snapshot.
+    """
+    snapshot = await load_board_snapshot(session, board)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if snapshot.matches(request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -34,7 +34,7 @@ from app.services.admin_access import require_admin
 from app.services.organizations import (
     OrganizationContext,
     ensure_member_for_user,
-    get_active_membership,
+    get_active_organization_context,
     is_org_admin,
     require_board_access,
 )
@@ -89,9 +89,10 @@ async def require_org_member(
     """Resolve and require active organization membership for the current user."""
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    member = await get_active_membership(session, auth.user)
-    if member is None:
-        member = await ensure_member_for_user(session, auth.user)
+    ctx = await get_active_organization_context(session, auth.user)
+    if ctx is not None:
+        return ctx
+    member = await ensure_member_for_user(session, auth.user)
     if member is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     organization = await Organization.objects.by_id(member.organization_id).first(
@@ -114,14 +115,25 @@ async def require_org_admin(
     return ctx
 
 
+async def _load_board(session: AsyncSession, board_id: str) -> Board:
+    # Resolved through the session identity map so later loads in the same
+    # request (task rules, notifications) reuse this board without a query.
+    try:
+        board_uuid = UUID(board_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND) from exc
+    board = await Board.objects.get(session, board_uuid)
+    if board is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return board
+
+
 async def get_board_or_404(
     board_id: str,
     session: AsyncSession = SESSION_DEP,
 ) -> Board:
     """Load a board by id or raise HTTP 404."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board(session, board_id)
     return board
 
 
@@ -131,9 +143,7 @@ async def get_board_for_actor_read(
     actor: ActorContext = ACTOR_DEP,
 ) -> Board:
     """Load a board and enforce actor read access."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board(session, board_id)
     if actor.actor_type == "agent":
         if actor.agent and actor.agent.board_id and actor.agent.board_id != board.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
@@ -150,9 +160,7 @@ async def get_board_for_actor_write(
     actor: ActorContext = ACTOR_DEP,
 ) -> Board:
     """Load a board and enforce actor write access."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board(session, board_id)
     if actor.actor_type == "agent":
         if actor.agent and actor.agent.board_id and actor.agent.board_id != board.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
@@ -169,9 +177,7 @@ async def get_board_for_user_read(
     auth: AuthContext = AUTH_DEP,
 ) -> Board:
     """Load a board and enforce authenticated-user read access."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board(session, board_id)
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
     await require_board_access(session, user=auth.user, board=board, write=False)
@@ -184,9 +190,7 @@ async def get_board_for_user_write(
     auth: AuthContext = AUTH_DEP,
 ) -> Board:
     """Load a board and enforce authenticated-user write access."""
-    board = await Board.objects.by_id(board_id).first(session)
-    if board is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board = await _load_board(session, board_id)
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
     await require_board_access(session, user=auth.user, board=board, write=True)
@@ -202,7 +206,7 @@ async def get_task_or_404(
     session: AsyncSession = SESSION_DEP,
 ) -> Task:
     """Load a task for a board or raise HTTP 404."""
-    task = await Task.objects.by_id(task_id).first(session)
+    task = await Task.objects.get(session, task_id)
     if task is None or task.board_id != board.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return task
@@ -7,8 +7,10 @@ from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import col
+from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import require_org_admin
+from app.core.agent_token_cache import agent_token_cache
 from app.core.auth import AuthContext, get_auth_context
 from app.db import crud
 from app.db.pagination import paginate
@@ -25,9 +27,12 @@ from app.schemas.gateways import (
 )
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.openclaw.admin_service import GatewayAdminLifecycleService
+from app.services.openclaw.gateway_resolver import invalidate_gateway_config
 from app.services.openclaw.session_service import GatewayTemplateSyncQuery
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -141,6 +146,7 @@ async def update_gateway(
         if next_url:
             await service.assert_gateway_runtime_compatible(url=next_url, token=next_token)
     await crud.patch(session, gateway, updates)
+    invalidate_gateway_config(gateway.id)
     await service.ensure_main_agent(gateway, auth, action="update")
     return gateway
 
@@ -162,6 +168,29 @@ async def sync_gateway_templates(
     return await service.sync_templates(gateway, query=sync_query, auth=auth)
 
 
+@router.post("/{gateway_id}/templates/sync/stream")
+async def stream_gateway_template_sync(
+    gateway_id: UUID,
+    sync_query: GatewayTemplateSyncQuery = SYNC_QUERY_DEP,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = AUTH_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> EventSourceResponse:
+    """Sync templates, streaming an `agent` event per agent and a final `result` event."""
+    service = GatewayAdminLifecycleService(session)
+    gateway = await service.require_gateway(
+        gateway_id=gateway_id,
+        organization_id=ctx.organization.id,
+    )
+
+    async def event_generator() -> AsyncIterator[dict[str, str]]:
+        async for update in service.iter_template_sync(gateway, query=sync_query, auth=auth):
+            event = "result" if isinstance(update, GatewayTemplatesSyncResult) else "agent"
+            yield {"event": event, "data": update.model_dump_json()}
+
+    return EventSourceResponse(event_generator(), ping=15)
+
+
 @router.delete("/{gateway_id}", response_model=OkResponse)
 async def delete_gateway(
     gateway_id: UUID,
@@ -174,10 +203,12 @@ async def delete_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
     )
+    deleted_agent_ids: list[UUID] = []
     main_agent = await service.find_main_agent(gateway)
     if main_agent is not None:
         await service.clear_agent_foreign_keys(agent_id=main_agent.id)
         await session.delete(main_agent)
+        deleted_agent_ids.append(main_agent.id)
 
     duplicate_main_agents = await Agent.objects.filter_by(
         gateway_id=gateway.id,
@@ -188,6 +219,7 @@ async def delete_gateway(
             continue
         await service.clear_agent_foreign_keys(agent_id=agent.id)
         await session.delete(agent)
+        deleted_agent_ids.append(agent.id)
 
     # NOTE: The migration declares `ondelete="CASCADE"` for gateway_installed_skills.gateway_id,
     # but some backends/test environments (e.g. SQLite without FK pragma) may not
@@ -200,4 +232,6 @@ async def delete_gateway(
 
     await session.delete(gateway)
     await session.commit()
+    invalidate_gateway_config(gateway.id)
+    agent_token_cache.evict_agents(deleted_agent_ids)
     return OkResponse()
@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import statistics
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Any, Concatenate, ParamSpec, TypeVar
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import DateTime, case
-from sqlalchemy import cast as sql_cast
-from sqlalchemy import func
+from sqlalchemy import case, func
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import require_org_member
+from app.core.config import settings
 from app.core.time import utcnow
-from app.db.session import get_session
+from app.core.ttl_cache import TTLCache
+from app.db.session import async_session_maker, get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.boards import Board
+from app.models.metric_rollups import MetricRollup
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.metrics import (
     DashboardBucketKey,
@@ -32,6 +39,21 @@ from app.schemas.metrics import (
     DashboardWipRangeSeries,
     DashboardWipSeriesSet,
 )
+from app.services.metric_rollups import (
+    CYCLE_TIME_BUCKET_EDGES_HOURS,
+    METRIC_ACTIVITY_EVENTS,
+    METRIC_CYCLE_TIME_HOURS,
+    METRIC_ERROR_EVENTS,
+    METRIC_TASKS_DONE,
+    METRIC_TASKS_IN_PROGRESS,
+    METRIC_TASKS_INBOX,
+    METRIC_TASKS_REVIEW,
+    TRANSITION_METRICS,
+    cycle_time_bucket_metric,
+    load_rollup_watermark,
+    median_from_histogram,
+    transition_metrics,
+)
 from app.services.organizations import OrganizationContext, list_accessible_board_ids
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
@@ -43,6 +65,16 @@ BOARD_ID_QUERY = Query(default=None)
 GROUP_ID_QUERY = Query(default=None)
 SESSION_DEP = Depends(get_session)
 ORG_MEMBER_DEP = Depends(require_org_member)
+_PRIMARY_WINDOW = "primary"
+_COMPARISON_WINDOW = "comparison"
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# Absorbs dashboard auto-refresh; keyed by (organization, visible boards, range).
+_dashboard_cache: TTLCache[tuple[UUID, str, DashboardRangeKey], DashboardMetrics] = TTLCache(
+    max_entries=settings.metrics_cache_max_entries,
+    ttl_seconds=settings.metrics_cache_ttl_seconds,
+)
 
 
 @dataclass(frozen=True)
@@ -161,173 +193,166 @@ def _wip_series_from_mapping(
     )
 
 
-async def _query_throughput(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("bucket")
-    statement = (
-        select(bucket_col, func.count())
-        .where(col(Task.status) == "review")
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
-    )
-    results = (await session.exec(statement)).all()
-    mapping = {row[0]: float(row[1]) for row in results}
-    return _series_from_mapping(range_spec, mapping)
+# Per-window running totals: window -> bucket -> metric name -> value.
+_WindowTotals = dict[str, dict[datetime, dict[str, float]]]
 
 
-async def _query_cycle_time(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("bucket")
-    in_progress = sql_cast(Task.in_progress_at, DateTime)
-    duration_hours = func.extract("epoch", Task.updated_at - in_progress) / 3600.0
-    statement = (
-        select(bucket_col, func.avg(duration_hours))
-        .where(col(Task.status) == "review")
-        .where(col(Task.in_progress_at).is_not(None))
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
+@dataclass(frozen=True)
+class MetricWindows:
+    """Primary and comparison ranges plus where rollups hand over to raw rows."""
+
+    primary: RangeSpec
+    comparison: RangeSpec
+    # Rollups cover [comparison.start, rollups_until); raw rows cover the rest.
+    rollups_until: datetime | None = None
+
+    @property
+    def live_start(self) -> datetime:
+        """Return the start of the range still read from raw rows."""
+        return self.rollups_until or self.comparison.start
+
+
+async def _resolve_windows(session: AsyncSession, primary: RangeSpec) -> MetricWindows:
+    comparison = _comparison_range(primary)
+    # Hourly series stay on raw rows; rollups pay off for day/week/month buckets.
+    if primary.bucket == "hour":
+        return MetricWindows(primary=primary, comparison=comparison)
+    rolled_until = await load_rollup_watermark(session)
+    if rolled_until is None or rolled_until <= comparison.start:
+        return MetricWindows(primary=primary, comparison=comparison)
+    return MetricWindows(
+        primary=primary,
+        comparison=comparison,
+        rollups_until=min(rolled_until, primary.end),
     )
-    results = (await session.exec(statement)).all()
-    mapping = {row[0]: float(row[1] or 0) for row in results}
-    return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_error_rate(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(
-        range_spec.bucket,
-        ActivityEvent.created_at,
-    ).label("bucket")
-    error_case = case(
-        (
-            col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN),
-            1,
+def _empty_totals() -> _WindowTotals:
+    return {_PRIMARY_WINDOW: {}, _COMPARISON_WINDOW: {}}
+
+
+def _add_total(
+    totals: _WindowTotals,
+    window: str,
+    bucket: datetime,
+    metric: str,
+    value: float | None,
+) -> None:
+    metrics = totals[window].setdefault(bucket, {})
+    metrics[metric] = metrics.get(metric, 0.0) + float(value or 0)
+
+
+def _merge_totals(*parts: _WindowTotals) -> _WindowTotals:
+    merged = _empty_totals()
+    for part in parts:
+        for window, buckets in part.items():
+            for bucket, metrics in buckets.items():
+                for metric, value in metrics.items():
+                    _add_total(merged, window, bucket, metric, value)
+    return merged
+
+
+def _sum_buckets(buckets: dict[datetime, dict[str, float]]) -> dict[str, float]:
+    summed: dict[str, float] = {}
+    for metrics in buckets.values():
+        for metric, value in metrics.items():
+            summed[metric] = summed.get(metric, 0.0) + value
+    return summed
+
+
+def _cycle_time_histogram(values: dict[str, float]) -> dict[int, float]:
+    return {
+        index: values.get(cycle_time_bucket_metric(index), 0.0)
+        for index in range(len(CYCLE_TIME_BUCKET_EDGES_HOURS) + 1)
+    }
+
+
+def _cycle_time_value(values: dict[str, float]) -> float:
+    count = sum(_cycle_time_histogram(values).values())
+    return values.get(METRIC_CYCLE_TIME_HOURS, 0.0) / count if count > 0 else 0.0
+
+
+def _error_rate_value(values: dict[str, float]) -> float:
+    total = values.get(METRIC_ACTIVITY_EVENTS, 0.0)
+    return (values.get(METRIC_ERROR_EVENTS, 0.0) / total) * 100 if total > 0 else 0.0
+
+
+def _series_set(
+    windows: MetricWindows,
+    totals: _WindowTotals,
+    value: Callable[[dict[str, float]], float],
+) -> DashboardSeriesSet:
+    return DashboardSeriesSet(
+        primary=_series_from_mapping(
+            windows.primary,
+            {bucket: value(values) for bucket, values in totals[_PRIMARY_WINDOW].items()},
+        ),
+        comparison=_series_from_mapping(
+            windows.comparison,
+            {bucket: value(values) for bucket, values in totals[_COMPARISON_WINDOW].items()},
         ),
-        else_=0,
-    )
-    statement = (
-        select(bucket_col, func.sum(error_case), func.count())
-        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.created_at) >= range_spec.start)
-        .where(col(ActivityEvent.created_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
     )
-    results = (await session.exec(statement)).all()
-    mapping: dict[datetime, float] = {}
-    for bucket, errors, total in results:
-        total_count = float(total or 0)
-        error_count = float(errors or 0)
-        rate = (error_count / total_count) * 100 if total_count > 0 else 0.0
-        mapping[bucket] = rate
-    return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_wip(
-    session: AsyncSession,
+def _wip_series_from_totals(
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+    buckets: dict[datetime, dict[str, float]],
 ) -> DashboardWipRangeSeries:
-    if not board_ids:
-        return _wip_series_from_mapping(range_spec, {})
-
-    inbox_bucket_col = func.date_trunc(range_spec.bucket, Task.created_at).label("inbox_bucket")
-    inbox_statement = (
-        select(inbox_bucket_col, func.count())
-        .where(col(Task.status) == "inbox")
-        .where(col(Task.created_at) >= range_spec.start)
-        .where(col(Task.created_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-        .group_by(inbox_bucket_col)
-        .order_by(inbox_bucket_col)
+    return _wip_series_from_mapping(
+        range_spec,
+        {
+            bucket: {
+                "inbox": int(values.get(METRIC_TASKS_INBOX, 0)),
+                "in_progress": int(values.get(METRIC_TASKS_IN_PROGRESS, 0)),
+                "review": int(values.get(METRIC_TASKS_REVIEW, 0)),
+                "done": int(values.get(METRIC_TASKS_DONE, 0)),
+            }
+            for bucket, values in buckets.items()
+        },
     )
-    inbox_results = (await session.exec(inbox_statement)).all()
 
-    status_bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("status_bucket")
-    progress_case = case((col(Task.status) == "in_progress", 1), else_=0)
-    review_case = case((col(Task.status) == "review", 1), else_=0)
-    done_case = case((col(Task.status) == "done", 1), else_=0)
-    status_statement = (
-        select(
-            status_bucket_col,
-            func.sum(progress_case),
-            func.sum(review_case),
-            func.sum(done_case),
-        )
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-        .group_by(status_bucket_col)
-        .order_by(status_bucket_col)
-    )
-    status_results = (await session.exec(status_statement)).all()
 
-    mapping: dict[datetime, dict[str, int]] = {}
-    for bucket, inbox in inbox_results:
-        values = mapping.setdefault(bucket, {})
-        values["inbox"] = int(inbox or 0)
-    for bucket, in_progress, review, done in status_results:
-        values = mapping.setdefault(bucket, {})
-        values["in_progress"] = int(in_progress or 0)
-        values["review"] = int(review or 0)
-        values["done"] = int(done or 0)
-    return _wip_series_from_mapping(range_spec, mapping)
+def _window_label(column: Any, primary: RangeSpec) -> Any:
+    """Label each row with the window it falls in; callers bound rows to both windows."""
+    return case((column >= primary.start, _PRIMARY_WINDOW), else_=_COMPARISON_WINDOW).label(
+        "window",
+    )
 
 
-async def _median_cycle_time_for_range(
+async def _query_rollups(
     session: AsyncSession,
-    range_spec: RangeSpec,
+    windows: MetricWindows,
     board_ids: list[UUID],
-) -> float | None:
-    in_progress = sql_cast(Task.in_progress_at, DateTime)
-    duration_hours = func.extract("epoch", Task.updated_at - in_progress) / 3600.0
+) -> _WindowTotals:
+    """Sum hourly rollups into dashboard buckets for the rolled-up part of both windows."""
+    totals = _empty_totals()
+    if not board_ids or windows.rollups_until is None:
+        return totals
+    window_col = _window_label(col(MetricRollup.hour), windows.primary)
+    bucket_col = func.date_trunc(windows.primary.bucket, MetricRollup.hour).label("bucket")
     statement = (
-        select(func.percentile_cont(0.5).within_group(duration_hours))
-        .where(col(Task.status) == "review")
-        .where(col(Task.in_progress_at).is_not(None))
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
+        select(window_col, bucket_col, col(MetricRollup.metric), func.sum(MetricRollup.value))
+        .where(col(MetricRollup.board_id).in_(board_ids))
+        .where(col(MetricRollup.hour) >= windows.comparison.start)
+        .where(col(MetricRollup.hour) < windows.rollups_until)
+        .group_by(window_col, bucket_col, col(MetricRollup.metric))
     )
-    if not board_ids:
-        return None
-    statement = statement.where(col(Task.board_id).in_(board_ids))
-    value = (await session.exec(statement)).one_or_none()
-    if value is None:
-        return None
-    if isinstance(value, tuple):
-        value = value[0]
-    if value is None:
-        return None
-    return float(value)
-
-
-async def _error_rate_kpi(
+    for window, bucket, metric, value in (await session.exec(statement)).all():
+        _add_total(totals, window, bucket, metric, value)
+    return totals
+
+
+async def _query_error_rate(
     session: AsyncSession,
-    range_spec: RangeSpec,
+    windows: MetricWindows,
     board_ids: list[UUID],
-) -> float:
+) -> _WindowTotals:
+    """Return error and total activity counts for the raw-row part of both windows."""
+    totals = _empty_totals()
+    if not board_ids:
+        return totals
+    window_col = _window_label(col(ActivityEvent.created_at), windows.primary)
+    bucket_col = func.date_trunc(windows.primary.bucket, ActivityEvent.created_at).label("bucket")
     error_case = case(
         (
             col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN),
@@ -336,21 +361,58 @@ async def _error_rate_kpi(
         else_=0,
     )
     statement = (
-        select(func.sum(error_case), func.count())
+        select(window_col, bucket_col, func.sum(error_case), func.count())
         .join(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.created_at) >= range_spec.start)
-        .where(col(ActivityEvent.created_at) <= range_spec.end)
+        .where(col(ActivityEvent.created_at) >= windows.live_start)
+        .where(col(ActivityEvent.created_at) <= windows.primary.end)
+        .where(col(Task.board_id).in_(board_ids))
+        .group_by(window_col, bucket_col)
     )
+    for window, bucket, errors, total in (await session.exec(statement)).all():
+        _add_total(totals, window, bucket, METRIC_ERROR_EVENTS, errors)
+        _add_total(totals, window, bucket, METRIC_ACTIVITY_EVENTS, total)
+    return totals
+
+
+async def _query_transitions(
+    session: AsyncSession,
+    windows: MetricWindows,
+    board_ids: list[UUID],
+) -> tuple[_WindowTotals, float | None]:
+    """Return status counts and cycle times for the raw-row part of both windows.
+
+    Reads `task_status_transitions` like the rollup job, through the same
+    `transition_metrics`, so a task edited after the watermark without a status
+    change is not counted again. Review counts double as throughput. Without
+    rollups the tail spans the whole primary window, so the exact median cycle
+    time is returned too.
+    """
+    totals = _empty_totals()
     if not board_ids:
-        return 0.0
-    statement = statement.where(col(Task.board_id).in_(board_ids))
-    result = (await session.exec(statement)).one_or_none()
-    if result is None:
-        return 0.0
-    errors, total = result
-    total_count = float(total or 0)
-    error_count = float(errors or 0)
-    return (error_count / total_count) * 100 if total_count > 0 else 0.0
+        return totals, None
+    statement = (
+        select(
+            col(TaskStatusTransition.to_status),
+            col(TaskStatusTransition.created_at),
+            col(TaskStatusTransition.in_progress_at),
+        )
+        .where(col(TaskStatusTransition.to_status).in_(tuple(TRANSITION_METRICS)))
+        .where(col(TaskStatusTransition.created_at) >= windows.live_start)
+        .where(col(TaskStatusTransition.created_at) <= windows.primary.end)
+        .where(col(TaskStatusTransition.board_id).in_(board_ids))
+    )
+    primary_cycle_times: list[float] = []
+    for to_status, changed_at, in_progress_at in (await session.exec(statement)).all():
+        window = _PRIMARY_WINDOW if changed_at >= windows.primary.start else _COMPARISON_WINDOW
+        bucket = _bucket_start(changed_at, windows.primary.bucket)
+        for metric, value in transition_metrics(to_status, changed_at, in_progress_at):
+            _add_total(totals, window, bucket, metric, value)
+            if metric == METRIC_CYCLE_TIME_HOURS and window == _PRIMARY_WINDOW:
+                primary_cycle_times.append(value)
+    if windows.rollups_until is not None or not primary_cycle_times:
+        # Estimated from the merged histogram once rollups are available.
+        return totals, None
+    return totals, statistics.median(primary_cycle_times)
 
 
 async def _active_agents(
@@ -370,22 +432,24 @@ async def _active_agents(
     return int(result)
 
 
-async def _tasks_in_progress(
-    session: AsyncSession,
-    range_spec: RangeSpec,
+async def _in_own_session(
+    query: Callable[Concatenate[AsyncSession, _P], Awaitable[_T]],
+    *args: _P.args,
+    **kwargs: _P.kwargs,
+) -> _T:
+    async with async_session_maker() as session:
+        return await query(session, *args, **kwargs)
+
+
+def _dashboard_cache_key(
+    organization_id: UUID,
     board_ids: list[UUID],
-) -> int:
-    if not board_ids:
-        return 0
-    statement = (
-        select(func.count())
-        .where(col(Task.status) == "in_progress")
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-    )
-    result = (await session.exec(statement)).one()
-    return int(result)
+    range_key: DashboardRangeKey,
+) -> tuple[UUID, str, DashboardRangeKey]:
+    digest = hashlib.sha256()
+    for board_id in sorted(board_ids):
+        digest.update(board_id.bytes)
+    return (organization_id, digest.hexdigest(), range_key)
 
 
 async def _resolve_dashboard_board_ids(
@@ -428,8 +492,6 @@ async def dashboard_metrics(
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> DashboardMetrics:
     """Return dashboard KPIs and time-series data for accessible boards."""
-    primary = _resolve_range(range_key)
-    comparison = _comparison_range(primary)
     board_ids = await _resolve_dashboard_board_ids(
         session,
         ctx=ctx,
@@ -437,48 +499,44 @@ async def dashboard_metrics(
         group_id=group_id,
     )
 
-    throughput_primary = await _query_throughput(session, primary, board_ids)
-    throughput_comparison = await _query_throughput(session, comparison, board_ids)
-    throughput = DashboardSeriesSet(
-        primary=throughput_primary,
-        comparison=throughput_comparison,
-    )
-    cycle_time_primary = await _query_cycle_time(session, primary, board_ids)
-    cycle_time_comparison = await _query_cycle_time(session, comparison, board_ids)
-    cycle_time = DashboardSeriesSet(
-        primary=cycle_time_primary,
-        comparison=cycle_time_comparison,
-    )
-    error_rate_primary = await _query_error_rate(session, primary, board_ids)
-    error_rate_comparison = await _query_error_rate(session, comparison, board_ids)
-    error_rate = DashboardSeriesSet(
-        primary=error_rate_primary,
-        comparison=error_rate_comparison,
-    )
-    wip_primary = await _query_wip(session, primary, board_ids)
-    wip_comparison = await _query_wip(session, comparison, board_ids)
-    wip = DashboardWipSeriesSet(
-        primary=wip_primary,
-        comparison=wip_comparison,
+    cache_key = _dashboard_cache_key(ctx.member.organization_id, board_ids, range_key)
+    cached = _dashboard_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    windows = await _resolve_windows(session, _resolve_range(range_key))
+    # Independent metric families run concurrently, each on its own pooled connection.
+    rollups, (transitions, exact_median), errors, active_agents = await asyncio.gather(
+        _in_own_session(_query_rollups, windows, board_ids),
+        _in_own_session(_query_transitions, windows, board_ids),
+        _in_own_session(_query_error_rate, windows, board_ids),
+        _in_own_session(_active_agents, windows.primary, board_ids),
     )
+    totals = _merge_totals(rollups, transitions, errors)
+    primary_totals = _sum_buckets(totals[_PRIMARY_WINDOW])
 
     kpis = DashboardKpis(
-        active_agents=await _active_agents(session, primary, board_ids),
-        tasks_in_progress=await _tasks_in_progress(session, primary, board_ids),
-        error_rate_pct=await _error_rate_kpi(session, primary, board_ids),
-        median_cycle_time_hours_7d=await _median_cycle_time_for_range(
-            session,
-            primary,
-            board_ids,
+        active_agents=active_agents,
+        tasks_in_progress=int(primary_totals.get(METRIC_TASKS_IN_PROGRESS, 0)),
+        error_rate_pct=_error_rate_value(primary_totals),
+        median_cycle_time_hours_7d=(
+            exact_median
+            if windows.rollups_until is None
+            else median_from_histogram(_cycle_time_histogram(primary_totals))
         ),
     )
 
-    return DashboardMetrics(
-        range=primary.key,
+    metrics = DashboardMetrics(
+        range=windows.primary.key,
         generated_at=utcnow(),
         kpis=kpis,
-        throughput=throughput,
-        cycle_time=cycle_time,
-        error_rate=error_rate,
-        wip=wip,
+        throughput=_series_set(windows, totals, lambda values: values.get(METRIC_TASKS_REVIEW, 0)),
+        cycle_time=_series_set(windows, totals, _cycle_time_value),
+        error_rate=_series_set(windows, totals, _error_rate_value),
+        wip=DashboardWipSeriesSet(
+            primary=_wip_series_from_totals(windows.primary, totals[_PRIMARY_WINDOW]),
+            comparison=_wip_series_from_totals(windows.comparison, totals[_COMPARISON_WINDOW]),
+        ),
     )
+    _dashboard_cache.put(cache_key, metrics)
+    return metrics
@@ -28,6 +28,7 @@ from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
 from app.models.gateways import Gateway
+from app.models.metric_rollups import MetricRollup
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
 from app.models.organization_invites import OrganizationInvite
@@ -35,6 +36,7 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.models.users import User
 from app.schemas.common import OkResponse
@@ -59,8 +61,10 @@ from app.services.organizations import (
     apply_invite_board_access,
     apply_invite_to_member,
     apply_member_access_update,
+    clear_membership_caches,
     get_active_membership,
     get_member,
+    invalidate_member_access,
     is_org_admin,
     normalize_invited_email,
     normalize_role,
@@ -272,6 +276,18 @@ async def delete_my_org(
         col(TaskFingerprint.board_id).in_(board_ids),
         commit=False,
     )
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.board_id).in_(board_ids),
+        commit=False,
+    )
+    await crud.delete_where(
+        session,
+        MetricRollup,
+        col(MetricRollup.board_id).in_(board_ids),
+        commit=False,
+    )
     await crud.delete_where(
         session,
         ApprovalTaskLink,
@@ -396,6 +412,7 @@ async def delete_my_org(
         commit=False,
     )
     await session.commit()
+    clear_membership_caches()
     return OkResponse()
 
 
@@ -484,6 +501,7 @@ async def update_org_member(
         updates["role"] = normalize_role(updates["role"])
     updates["updated_at"] = utcnow()
     member = await crud.patch(session, member, updates)
+    invalidate_member_access(member)
     user = await User.objects.by_id(member.user_id).first(session)
     return _member_to_read(member, user)
 
@@ -517,6 +535,7 @@ async def update_member_access(
 
     await apply_member_access_update(session, member=member, update=payload)
     await session.commit()
+    invalidate_member_access(member)
     await session.refresh(member)
     user = await User.objects.by_id(member.user_id).first(session)
     return _member_to_read(member, user)
@@ -584,6 +603,7 @@ async def remove_org_member(
         session.add(user)
 
     await crud.delete(session, member)
+    invalidate_member_access(member)
     return OkResponse()
 
 
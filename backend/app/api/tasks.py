@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
-from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast
@@ -18,6 +16,7 @@ from sse_starlette.sse import EventSourceResponse
 from app.api.deps import (
     ActorContext,
     get_board_for_actor_read,
+    get_board_for_actor_write,
     get_board_for_user_write,
     get_task_or_404,
     require_admin_auth,
@@ -26,7 +25,7 @@ from app.api.deps import (
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.session import get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
@@ -50,16 +49,23 @@ from app.schemas.task_custom_fields import (
     TaskCustomFieldValues,
     validate_custom_field_value,
 )
-from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import (
+    TaskBulkUpdate,
+    TaskCommentCreate,
+    TaskCommentRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.services.activity_log import record_activity
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
     pending_approval_conflicts_by_task,
 )
+from app.services.board_stream_hub import StreamMessage, stream_board_messages
 from app.services.mentions import extract_mentions, matches_agent_mention
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
-from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.openclaw.agent_notifications import notify_agents
+from app.services.openclaw.gateway_dispatch import AgentNotification, NotificationActivity
 from app.services.organizations import require_board_access
 from app.services.tags import (
     TagState,
@@ -72,12 +78,13 @@ from app.services.task_dependencies import (
     dependency_ids_by_task_id,
     dependency_status_by_id,
     dependent_task_ids,
+    dependent_task_ids_by_dependency_id,
     replace_task_dependencies,
     validate_dependency_update,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import AsyncIterator, Iterable, Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -95,11 +102,11 @@ TASK_EVENT_TYPES = {
     "task.status_changed",
     "task.comment",
 }
-SSE_SEEN_MAX = 2000
 TASK_SNIPPET_MAX_LEN = 500
 TASK_SNIPPET_TRUNCATED_LEN = 497
 TASK_EVENT_ROW_LEN = 2
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
+BOARD_ACTOR_WRITE_DEP = Depends(get_board_for_actor_write)
 ACTOR_DEP = Depends(require_admin_or_agent)
 SINCE_QUERY = Query(default=None)
 STATUS_QUERY = Query(default=None, alias="status")
@@ -226,12 +233,8 @@ async def _require_approved_linked_approval_for_done(
 ) -> None:
     if previous_status == "done" or target_status != "done":
         return
-    requires_approval = (
-        await session.exec(
-            select(col(Board.require_approval_for_done)).where(col(Board.id) == board_id),
-        )
-    ).first()
-    if requires_approval is False:
+    board = await Board.objects.get(session, board_id)
+    if board is not None and not board.require_approval_for_done:
         return
     if not await _task_has_approved_linked_approval(
         session,
@@ -250,12 +253,8 @@ async def _require_review_before_done_when_enabled(
 ) -> None:
     if previous_status == "done" or target_status != "done":
         return
-    requires_review = (
-        await session.exec(
-            select(col(Board.require_review_before_done)).where(col(Board.id) == board_id),
-        )
-    ).first()
-    if requires_review and previous_status != "review":
+    board = await Board.objects.get(session, board_id)
+    if board is not None and board.require_review_before_done and previous_status != "review":
         raise _review_required_for_done_error()
 
 
@@ -270,14 +269,8 @@ async def _require_no_pending_approval_for_status_change_when_enabled(
 ) -> None:
     if not status_requested or previous_status == target_status:
         return
-    blocks_status_change = (
-        await session.exec(
-            select(col(Board.block_status_changes_with_pending_approval)).where(
-                col(Board.id) == board_id,
-            ),
-        )
-    ).first()
-    if not blocks_status_change:
+    board = await Board.objects.get(session, board_id)
+    if board is None or not board.block_status_changes_with_pending_approval:
         return
     if await _task_has_pending_linked_approval(
         session,
@@ -433,45 +426,54 @@ async def _reconcile_dependents_for_dependency_toggle(
     reopened = previous_status == "done" and dependency_task.status != "done"
 
     for dependent in dependents:
-        if dependent.status == "done":
-            continue
-        if reopened:
-            should_reset = (
-                dependent.status != "inbox"
-                or dependent.assigned_agent_id is not None
-                or dependent.in_progress_at is not None
-            )
-            if should_reset:
-                dependent.status = "inbox"
-                dependent.assigned_agent_id = None
-                dependent.in_progress_at = None
-                dependent.updated_at = utcnow()
-                session.add(dependent)
-                record_activity(
-                    session,
-                    event_type="task.status_changed",
-                    task_id=dependent.id,
-                    message=(
-                        "Task returned to inbox: dependency reopened " f"({dependency_task.title})."
-                    ),
-                    agent_id=actor_agent_id,
-                )
-            else:
-                record_activity(
-                    session,
-                    event_type="task.updated",
-                    task_id=dependent.id,
-                    message=f"Dependency completion changed: {dependency_task.title}.",
-                    agent_id=actor_agent_id,
-                )
-        else:
+        _reconcile_dependent(
+            session,
+            dependent=dependent,
+            dependency_task=dependency_task,
+            reopened=reopened,
+            actor_agent_id=actor_agent_id,
+        )
+
+
+def _reconcile_dependent(
+    session: AsyncSession,
+    *,
+    dependent: Task,
+    dependency_task: Task,
+    reopened: bool,
+    actor_agent_id: UUID | None,
+) -> None:
+    if dependent.status == "done":
+        return
+    if reopened:
+        should_reset = (
+            dependent.status != "inbox"
+            or dependent.assigned_agent_id is not None
+            or dependent.in_progress_at is not None
+        )
+        if should_reset:
+            dependent.status = "inbox"
+            dependent.assigned_agent_id = None
+            dependent.in_progress_at = None
+            dependent.updated_at = utcnow()
+            session.add(dependent)
             record_activity(
                 session,
-                event_type="task.updated",
+                event_type="task.status_changed",
                 task_id=dependent.id,
-                message=f"Dependency completion changed: {dependency_task.title}.",
+                message=(
+                    "Task returned to inbox: dependency reopened " f"({dependency_task.title})."
+                ),
                 agent_id=actor_agent_id,
             )
+            return
+    record_activity(
+        session,
+        event_type="task.updated",
+        task_id=dependent.id,
+        message=f"Dependency completion changed: {dependency_task.title}.",
+        agent_id=actor_agent_id,
+    )
 
 
 async def _fetch_task_events(
@@ -500,36 +502,42 @@ def _serialize_comment(event: ActivityEvent) -> dict[str, object]:
     return TaskCommentRead.model_validate(event).model_dump(mode="json")
 
 
-async def _send_lead_task_message(
+def _task_notification(
     *,
-    dispatch: GatewayDispatchService,
+    board: Board,
     session_key: str,
-    config: GatewayClientConfig,
+    agent_name: str,
     message: str,
-) -> OpenClawGatewayError | None:
-    return await dispatch.try_send_agent_message(
+    activities: Iterable[NotificationActivity] = (),
+) -> AgentNotification:
+    return AgentNotification(
+        board_id=board.id,
         session_key=session_key,
-        config=config,
-        agent_name="Lead Agent",
+        agent_name=agent_name,
         message=message,
-        deliver=False,
+        activities=tuple(activities),
     )
 
 
-async def _send_agent_task_message(
-    *,
-    dispatch: GatewayDispatchService,
-    session_key: str,
-    config: GatewayClientConfig,
-    agent_name: str,
-    message: str,
-) -> OpenClawGatewayError | None:
-    return await dispatch.try_send_agent_message(
-        session_key=session_key,
-        config=config,
-        agent_name=agent_name,
-        message=message,
-        deliver=False,
+def _assignee_activity(agent: Agent, task: Task) -> NotificationActivity:
+    return NotificationActivity(
+        sent_event_type="task.assignee_notified",
+        sent_message=f"Agent notified for assignment: {agent.name}.",
+        failed_event_type="task.assignee_notify_failed",
+        failed_message="Assignee notify failed",
+        agent_id=agent.id,
+        task_id=task.id,
+    )
+
+
+def _lead_unassigned_activity(lead: Agent, task: Task) -> NotificationActivity:
+    return NotificationActivity(
+        sent_event_type="task.lead_unassigned_notified",
+        sent_message=f"Lead notified task returned to inbox: {task.title}.",
+        failed_event_type="task.lead_unassigned_notify_failed",
+        failed_message="Lead notify failed",
+        agent_id=lead.id,
+        task_id=task.id,
     )
 
 
@@ -542,10 +550,6 @@ async def _notify_agent_on_task_assign(
 ) -> None:
     if not agent.openclaw_session_id:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
     description = _truncate_snippet(task.description or "")
     details = [
         f"Board: {board.name}",
@@ -560,31 +564,14 @@ async def _notify_agent_on_task_assign(
         + "\n".join(details)
         + ("\n\nTake action: open the task and begin work. " "Post updates as task comments.")
     )
-    error = await _send_agent_task_message(
-        dispatch=dispatch,
+    notification = _task_notification(
+        board=board,
         session_key=agent.openclaw_session_id,
-        config=config,
         agent_name=agent.name,
         message=message,
+        activities=[_assignee_activity(agent, task)],
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.assignee_notified",
-            message=f"Agent notified for assignment: {agent.name}.",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.assignee_notify_failed",
-            message=f"Assignee notify failed: {error}",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
+    await notify_agents(session, [notification], boards=[board])
 
 
 async def notify_agent_on_task_assign(
@@ -616,10 +603,6 @@ async def _notify_lead_on_task_create(
     )
     if lead is None or not lead.openclaw_session_id:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
     description = _truncate_snippet(task.description or "")
     details = [
         f"Board: {board.name}",
@@ -634,30 +617,23 @@ async def _notify_lead_on_task_create(
         + "\n".join(details)
         + "\n\nTake action: triage, assign, or plan next steps."
     )
-    error = await _send_lead_task_message(
-        dispatch=dispatch,
+    notification = _task_notification(
+        board=board,
         session_key=lead.openclaw_session_id,
-        config=config,
+        agent_name="Lead Agent",
         message=message,
+        activities=[
+            NotificationActivity(
+                sent_event_type="task.lead_notified",
+                sent_message=f"Lead agent notified for task: {task.title}.",
+                failed_event_type="task.lead_notify_failed",
+                failed_message="Lead notify failed",
+                agent_id=lead.id,
+                task_id=task.id,
+            ),
+        ],
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.lead_notified",
-            message=f"Lead agent notified for task: {task.title}.",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.lead_notify_failed",
-            message=f"Lead notify failed: {error}",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
+    await notify_agents(session, [notification], boards=[board])
 
 
 async def _notify_lead_on_task_unassigned(
@@ -673,10 +649,6 @@ async def _notify_lead_on_task_unassigned(
     )
     if lead is None or not lead.openclaw_session_id:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
     description = _truncate_snippet(task.description or "")
     details = [
         f"Board: {board.name}",
@@ -691,30 +663,14 @@ async def _notify_lead_on_task_unassigned(
         + "\n".join(details)
         + "\n\nTake action: assign a new owner or adjust the plan."
     )
-    error = await _send_lead_task_message(
-        dispatch=dispatch,
+    notification = _task_notification(
+        board=board,
         session_key=lead.openclaw_session_id,
-        config=config,
+        agent_name="Lead Agent",
         message=message,
+        activities=[_lead_unassigned_activity(lead, task)],
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.lead_unassigned_notified",
-            message=f"Lead notified task returned to inbox: {task.title}.",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.lead_unassigned_notify_failed",
-            message=f"Lead notify failed: {error}",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
+    await notify_agents(session, [notification], boards=[board])
 
 
 def _status_values(status_filter: str | None) -> list[str]:
@@ -734,13 +690,10 @@ async def _organization_custom_field_definitions_for_board(
     *,
     board_id: UUID,
 ) -> dict[str, _BoardCustomFieldDefinition]:
-    organization_id = (
-        await session.exec(
-            select(Board.organization_id).where(col(Board.id) == board_id),
-        )
-    ).first()
-    if organization_id is None:
+    board = await Board.objects.get(session, board_id)
+    if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    organization_id = board.organization_id
     definitions = list(
         await session.exec(
             select(TaskCustomFieldDefinition)
@@ -1174,50 +1127,52 @@ def _task_event_payload(
     return payload
 
 
-async def _task_event_generator(
+async def _fetch_task_stream_messages(
+    session: AsyncSession,
+    board_id: UUID,
+    since: datetime,
+) -> list[StreamMessage]:
+    rows = await _fetch_task_events(session, board_id, since)
+    deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
+        await _stream_task_state(
+            session,
+            board_id=board_id,
+            rows=rows,
+        )
+    )
+    return [
+        StreamMessage(
+            event="task",
+            data=json.dumps(
+                _task_event_payload(
+                    event,
+                    task,
+                    deps_map=deps_map,
+                    dep_status=dep_status,
+                    tag_state_by_task_id=tag_state_by_task_id,
+                    custom_field_values_by_task_id=custom_field_values_by_task_id,
+                ),
+            ),
+            key=event.id,
+            cursor=event.created_at,
+        )
+        for event, task in rows
+    ]
+
+
+def _task_event_generator(
     *,
     request: Request,
     board_id: UUID,
     since_dt: datetime,
 ) -> AsyncIterator[dict[str, str]]:
-    last_seen = since_dt
-    seen_ids: set[UUID] = set()
-    seen_queue: deque[UUID] = deque()
-
-    while True:
-        if await request.is_disconnected():
-            break
-
-        async with async_session_maker() as session:
-            rows = await _fetch_task_events(session, board_id, last_seen)
-            deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
-                await _stream_task_state(
-                    session,
-                    board_id=board_id,
-                    rows=rows,
-                )
-            )
-
-        for event, task in rows:
-            if event.id in seen_ids:
-                continue
-            seen_ids.add(event.id)
-            seen_queue.append(event.id)
-            if len(seen_queue) > SSE_SEEN_MAX:
-                oldest = seen_queue.popleft()
-                seen_ids.discard(oldest)
-            last_seen = max(event.created_at, last_seen)
-
-            payload = _task_event_payload(
-                event,
-                task,
-                deps_map=deps_map,
-                dep_status=dep_status,
-                tag_state_by_task_id=tag_state_by_task_id,
-                custom_field_values_by_task_id=custom_field_values_by_task_id,
-            )
-            yield {"event": "task", "data": json.dumps(payload)}
-        await asyncio.sleep(2)
+    return stream_board_messages(
+        request,
+        topic="tasks",
+        board_id=board_id,
+        since=since_dt,
+        fetch=_fetch_task_stream_messages,
+    )
 
 
 @router.get("/stream")
@@ -1341,9 +1296,7 @@ async def create_task(
     await session.commit()
     await _notify_lead_on_task_create(session=session, board=board, task=task)
     if task.assigned_agent_id:
-        assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
-            session,
-        )
+        assigned_agent = await Agent.objects.get(session, task.assigned_agent_id)
         if assigned_agent:
             await _notify_agent_on_task_assign(
                 session=session,
@@ -1499,7 +1452,7 @@ async def delete_task(
     """Delete a task and related records."""
     if task.board_id is None:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
-    board = await Board.objects.by_id(task.board_id).first(session)
+    board = await Board.objects.get(session, task.board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if auth.user is None:
@@ -1537,7 +1490,7 @@ async def _validate_task_comment_access(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
 
     if actor.actor_type == "user" and actor.user is not None:
-        board = await Board.objects.by_id(task.board_id).first(session)
+        board = await Board.objects.get(session, task.board_id)
         if board is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
         await require_board_access(session, user=actor.user, board=board, write=True)
@@ -1585,9 +1538,7 @@ async def _comment_targets(
             if matches_agent_mention(agent, mention_names):
                 targets[agent.id] = agent
     if not mention_names and task.assigned_agent_id:
-        assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
-            session,
-        )
+        assigned_agent = await Agent.objects.get(session, task.assigned_agent_id)
         if assigned_agent:
             targets[assigned_agent.id] = assigned_agent
 
@@ -1613,19 +1564,14 @@ async def _notify_task_comment_targets(
     if not request.targets:
         return
     board = (
-        await Board.objects.by_id(request.task.board_id).first(session)
-        if request.task.board_id
-        else None
+        await Board.objects.get(session, request.task.board_id) if request.task.board_id else None
     )
     if board is None:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if not config:
-        return
 
     snippet = _truncate_snippet(request.message)
     actor_name = _comment_actor_name(request.actor)
+    notifications: list[AgentNotification] = []
     for agent in request.targets.values():
         if not agent.openclaw_session_id:
             continue
@@ -1647,13 +1593,15 @@ async def _notify_task_comment_targets(
             "If you are mentioned but not assigned, reply in the task "
             "thread but do not change task status."
         )
-        await _send_agent_task_message(
-            dispatch=dispatch,
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=notification,
+        notifications.append(
+            _task_notification(
+                board=board,
+                session_key=agent.openclaw_session_id,
+                agent_name=agent.name,
+                message=notification,
+            ),
         )
+    await notify_agents(session, notifications, boards=[board])
 
 
 @dataclass(slots=True)
@@ -1691,13 +1639,10 @@ async def _board_organization_id(
     *,
     board_id: UUID,
 ) -> UUID:
-    organization_id = (
-        await session.exec(
-            select(Board.organization_id).where(col(Board.id) == board_id),
-        )
-    ).first()
-    if organization_id is None:
+    board = await Board.objects.get(session, board_id)
+    if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    organization_id = board.organization_id
     return organization_id
 
 
@@ -1775,7 +1720,7 @@ async def _require_task_user_write_access(
     board_id: UUID,
     user: User | None,
 ) -> None:
-    board = await Board.objects.by_id(board_id).first(session)
+    board = await Board.objects.get(session, board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if user is None:
@@ -1892,7 +1837,11 @@ async def _lead_apply_assignment(
     if not assigned_id:
         update.task.assigned_agent_id = None
         return
-    agent = await Agent.objects.by_id(assigned_id).first(session)
+    agent = await Agent.objects.get(session, assigned_id)
+    update.task.assigned_agent_id = _lead_assignable_agent(agent, board_id=update.task.board_id).id
+
+
+def _lead_assignable_agent(agent: Agent | None, *, board_id: UUID | None) -> Agent:
     if agent is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if agent.is_board_lead:
@@ -1900,9 +1849,9 @@ async def _lead_apply_assignment(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Board leads cannot assign tasks to themselves.",
         )
-    if agent.board_id and update.task.board_id and agent.board_id != update.task.board_id:
+    if agent.board_id and board_id and agent.board_id != board_id:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT)
-    update.task.assigned_agent_id = agent.id
+    return agent
 
 
 def _lead_apply_status(update: _TaskUpdateInput) -> None:
@@ -1947,16 +1896,10 @@ async def _lead_notify_new_assignee(
         or update.task.assigned_agent_id == update.previous_assigned
     ):
         return
-    assigned_agent = await Agent.objects.by_id(update.task.assigned_agent_id).first(
-        session,
-    )
+    assigned_agent = await Agent.objects.get(session, update.task.assigned_agent_id)
     if assigned_agent is None:
         return
-    board = (
-        await Board.objects.by_id(update.task.board_id).first(session)
-        if update.task.board_id
-        else None
-    )
+    board = await Board.objects.get(session, update.task.board_id) if update.task.board_id else None
     if board:
         await _notify_agent_on_task_assign(
             session=session,
@@ -2101,14 +2044,8 @@ async def _apply_non_lead_agent_task_rules(
             message="Agents may only update status, comment, and custom field values.",
         )
     if "status" in update.updates:
-        only_lead_can_change_status = (
-            await session.exec(
-                select(col(Board.only_lead_can_change_status)).where(
-                    col(Board.id) == update.board_id,
-                ),
-            )
-        ).first()
-        if only_lead_can_change_status:
+        board = await Board.objects.get(session, update.board_id)
+        if board is not None and board.only_lead_can_change_status:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only board leads can change task status.",
@@ -2127,18 +2064,22 @@ async def _apply_non_lead_agent_task_rules(
             )
             if blocked_ids:
                 raise _blocked_task_error(blocked_ids)
-        if status_value == "inbox":
-            update.task.assigned_agent_id = None
-            update.task.previous_in_progress_at = update.task.in_progress_at
-            update.task.in_progress_at = None
-        elif status_value == "review":
-            update.task.previous_in_progress_at = update.task.in_progress_at
-            update.task.assigned_agent_id = None
-            update.task.in_progress_at = None
-        else:
-            update.task.assigned_agent_id = update.actor.agent.id if update.actor.agent else None
-            if status_value == "in_progress":
-                update.task.in_progress_at = utcnow()
+        _apply_agent_status_transition(update, status_value)
+
+
+def _apply_agent_status_transition(update: _TaskUpdateInput, status_value: str) -> None:
+    if status_value == "inbox":
+        update.task.assigned_agent_id = None
+        update.task.previous_in_progress_at = update.task.in_progress_at
+        update.task.in_progress_at = None
+    elif status_value == "review":
+        update.task.previous_in_progress_at = update.task.in_progress_at
+        update.task.assigned_agent_id = None
+        update.task.in_progress_at = None
+    else:
+        update.task.assigned_agent_id = update.actor.agent.id if update.actor.agent else None
+        if status_value == "in_progress":
+            update.task.in_progress_at = utcnow()
 
 
 async def _apply_admin_task_rules(
@@ -2178,6 +2119,25 @@ async def _apply_admin_task_rules(
         board_id=update.board_id,
         dep_ids=effective_deps,
     )
+    _apply_admin_status_transition(update, blocked_ids)
+
+    assigned_agent_id = _optional_assigned_agent_id(
+        update.updates.get("assigned_agent_id"),
+    )
+    if assigned_agent_id:
+        agent = await Agent.objects.get(session, assigned_agent_id)
+        _admin_assignable_agent(agent, board_id=update.task.board_id)
+
+
+def _admin_assignable_agent(agent: Agent | None, *, board_id: UUID | None) -> Agent:
+    if agent is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if agent.board_id and board_id and agent.board_id != board_id:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT)
+    return agent
+
+
+def _apply_admin_status_transition(update: _TaskUpdateInput, blocked_ids: Sequence[UUID]) -> None:
     target_status = _required_status_value(
         update.updates.get("status", update.task.status),
     )
@@ -2203,16 +2163,6 @@ async def _apply_admin_task_rules(
         elif status_value == "in_progress":
             update.task.in_progress_at = utcnow()
 
-    assigned_agent_id = _optional_assigned_agent_id(
-        update.updates.get("assigned_agent_id"),
-    )
-    if assigned_agent_id:
-        agent = await Agent.objects.by_id(assigned_agent_id).first(session)
-        if agent is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        if agent.board_id and update.task.board_id and agent.board_id != update.task.board_id:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT)
-
 
 async def _record_task_comment_from_update(
     session: AsyncSession,
@@ -2274,9 +2224,7 @@ async def _notify_task_update_assignment_changes(
         and (update.previous_status != "inbox" or update.previous_assigned is not None)
     ):
         board = (
-            await Board.objects.by_id(update.task.board_id).first(session)
-            if update.task.board_id
-            else None
+            await Board.objects.get(session, update.task.board_id) if update.task.board_id else None
         )
         if board:
             await _notify_lead_on_task_unassigned(
@@ -2296,16 +2244,10 @@ async def _notify_task_update_assignment_changes(
         and update.task.assigned_agent_id == update.actor.agent.id
     ):
         return
-    assigned_agent = await Agent.objects.by_id(update.task.assigned_agent_id).first(
-        session,
-    )
+    assigned_agent = await Agent.objects.get(session, update.task.assigned_agent_id)
     if assigned_agent is None:
         return
-    board = (
-        await Board.objects.by_id(update.task.board_id).first(session)
-        if update.task.board_id
-        else None
-    )
+    board = await Board.objects.get(session, update.task.board_id) if update.task.board_id else None
     if board:
         await _notify_agent_on_task_assign(
             session=session,
@@ -2436,3 +2378,482 @@ async def create_task_comment(
         ),
     )
     return event
+
+
+def _is_lead_actor(actor: ActorContext) -> bool:
+    return bool(actor.actor_type == "agent" and actor.agent and actor.agent.is_board_lead)
+
+
+def _actor_agent_id(actor: ActorContext) -> UUID | None:
+    return actor.agent.id if actor.actor_type == "agent" and actor.agent else None
+
+
+def _bulk_task_error(task: Task, exc: HTTPException) -> HTTPException:
+    detail = exc.detail if isinstance(exc.detail, dict) else {"message": exc.detail}
+    return HTTPException(
+        status_code=exc.status_code,
+        detail={**detail, "task_id": str(task.id)},
+    )
+
+
+def _bulk_task_lines(tasks: Sequence[Task]) -> str:
+    return "\n".join(
+        f"- {task.title} (Task ID: {task.id}, Status: {task.status})" for task in tasks
+    )
+
+
+async def _load_bulk_tasks(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_ids: Sequence[UUID],
+) -> list[Task]:
+    requested = list(dict.fromkeys(task_ids))
+    tasks_by_id = {
+        task.id: task
+        for task in await session.exec(
+            select(Task).where(col(Task.board_id) == board_id).where(col(Task.id).in_(requested)),
+        )
+    }
+    missing = [task_id for task_id in requested if task_id not in tasks_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "message": "Tasks not found on this board.",
+                "task_ids": [str(task_id) for task_id in missing],
+            },
+        )
+    return [tasks_by_id[task_id] for task_id in requested]
+
+
+async def _blocked_ids_by_task_id(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    tasks: Sequence[Task],
+) -> dict[UUID, list[UUID]]:
+    deps_map = await dependency_ids_by_task_id(
+        session,
+        board_id=board_id,
+        task_ids=[task.id for task in tasks],
+    )
+    dep_status = await dependency_status_by_id(
+        session,
+        board_id=board_id,
+        dependency_ids=list({dep_id for dep_ids in deps_map.values() for dep_id in dep_ids}),
+    )
+    return {
+        task_id: blocked_by_dependency_ids(dependency_ids=dep_ids, status_by_id=dep_status)
+        for task_id, dep_ids in deps_map.items()
+    }
+
+
+def _require_bulk_agent_fields(board: Board, payload: TaskBulkUpdate) -> None:
+    if "assigned_agent_id" in payload.model_fields_set:
+        raise _task_update_forbidden_error(
+            code="task_update_field_forbidden",
+            message="Agents may only update status, comment, and custom field values.",
+        )
+    if board.only_lead_can_change_status:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only board leads can change task status.",
+        )
+
+
+async def _bulk_assigned_agent(
+    session: AsyncSession,
+    *,
+    board: Board,
+    actor: ActorContext,
+    payload: TaskBulkUpdate,
+) -> Agent | None:
+    if payload.assigned_agent_id is None:
+        return None
+    agent = await Agent.objects.get(session, payload.assigned_agent_id)
+    if _is_lead_actor(actor):
+        return _lead_assignable_agent(agent, board_id=board.id)
+    return _admin_assignable_agent(agent, board_id=board.id)
+
+
+def _bulk_update_input(
+    task: Task,
+    *,
+    board: Board,
+    actor: ActorContext,
+    payload: TaskBulkUpdate,
+) -> _TaskUpdateInput:
+    return _TaskUpdateInput(
+        task=task,
+        actor=actor,
+        board_id=board.id,
+        previous_status=task.status,
+        previous_assigned=task.assigned_agent_id,
+        previous_in_progress_at=task.in_progress_at,
+        status_requested=payload.status is not None and payload.status != task.status,
+        updates=payload.model_dump(include={"status", "assigned_agent_id"}, exclude_unset=True),
+        comment=None,
+        depends_on_task_ids=None,
+        tag_ids=None,
+        custom_field_values={},
+        custom_field_values_set=False,
+    )
+
+
+def _apply_bulk_task_rules(
+    update: _TaskUpdateInput,
+    *,
+    assigned_agent: Agent | None,
+    blocked_by: list[UUID],
+) -> None:
+    if _is_lead_actor(update.actor):
+        # Every bulk payload carries a status or assignment transition.
+        if blocked_by:
+            raise _blocked_task_error(blocked_by)
+        if "assigned_agent_id" in update.updates:
+            update.task.assigned_agent_id = assigned_agent.id if assigned_agent else None
+        _lead_apply_status(update)
+        return
+    if update.actor.actor_type == "agent":
+        agent = update.actor.agent
+        if (
+            agent
+            and update.task.assigned_agent_id is not None
+            and update.task.assigned_agent_id != agent.id
+        ):
+            raise _task_update_forbidden_error(
+                code="task_assignee_mismatch",
+                message="Agents can only change status on tasks assigned to them.",
+            )
+        status_value = _required_status_value(update.updates["status"])
+        if status_value != "inbox" and blocked_by:
+            raise _blocked_task_error(blocked_by)
+        _apply_agent_status_transition(update, status_value)
+    else:
+        _apply_admin_status_transition(update, blocked_by)
+    for key, value in update.updates.items():
+        setattr(update.task, key, value)
+
+
+async def _approved_task_ids(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_ids: Sequence[UUID],
+) -> set[UUID]:
+    linked = await session.exec(
+        select(col(ApprovalTaskLink.task_id))
+        .join(Approval, col(Approval.id) == col(ApprovalTaskLink.approval_id))
+        .where(col(Approval.board_id) == board_id)
+        .where(col(Approval.status) == "approved")
+        .where(col(ApprovalTaskLink.task_id).in_(task_ids)),
+    )
+    direct = await session.exec(
+        select(col(Approval.task_id))
+        .where(col(Approval.board_id) == board_id)
+        .where(col(Approval.status) == "approved")
+        .where(col(Approval.task_id).in_(task_ids)),
+    )
+    return {*linked, *(task_id for task_id in direct if task_id is not None)}
+
+
+async def _review_commented_task_ids(
+    session: AsyncSession,
+    *,
+    updates: Sequence[_TaskUpdateInput],
+) -> set[UUID]:
+    # Mirrors `has_valid_recent_comment`: the latest comment by the reviewing
+    # agent since work started must be non-empty.
+    criteria: dict[UUID, tuple[UUID, datetime]] = {}
+    for update in updates:
+        author = update.task.assigned_agent_id or update.previous_assigned
+        since = (
+            update.task.previous_in_progress_at
+            if update.task.previous_in_progress_at is not None
+            else update.previous_in_progress_at
+        )
+        if author is not None and since is not None:
+            criteria[update.task.id] = (author, since)
+    if not criteria:
+        return set()
+    events = await session.exec(
+        select(ActivityEvent)
+        .where(col(ActivityEvent.task_id).in_(list(criteria)))
+        .where(col(ActivityEvent.event_type) == "task.comment")
+        .where(col(ActivityEvent.agent_id).in_({author for author, _ in criteria.values()}))
+        .where(col(ActivityEvent.created_at) >= min(since for _, since in criteria.values()))
+        .order_by(desc(col(ActivityEvent.created_at))),
+    )
+    latest: dict[UUID, bool] = {}
+    for event in events:
+        if event.task_id is None or event.task_id in latest:
+            continue
+        author, since = criteria[event.task_id]
+        if event.agent_id == author and event.created_at >= since:
+            latest[event.task_id] = bool((event.message or "").strip())
+    return {task_id for task_id, valid in latest.items() if valid}
+
+
+async def _require_bulk_status_rules(
+    session: AsyncSession,
+    *,
+    board: Board,
+    updates: Sequence[_TaskUpdateInput],
+) -> None:
+    changed = [
+        update
+        for update in updates
+        if update.status_requested and update.previous_status != update.task.status
+    ]
+    if changed and board.block_status_changes_with_pending_approval:
+        conflicts = await pending_approval_conflicts_by_task(
+            session,
+            board_id=board.id,
+            task_ids=[update.task.id for update in changed],
+        )
+        for update in changed:
+            if update.task.id in conflicts:
+                raise _bulk_task_error(update.task, _pending_approval_blocks_status_change_error())
+
+    completing = [
+        update
+        for update in updates
+        if update.previous_status != "done" and update.task.status == "done"
+    ]
+    if board.require_review_before_done:
+        for update in completing:
+            if update.previous_status != "review":
+                raise _bulk_task_error(update.task, _review_required_for_done_error())
+    if completing and board.require_approval_for_done:
+        approved = await _approved_task_ids(
+            session,
+            board_id=board.id,
+            task_ids=[update.task.id for update in completing],
+        )
+        for update in completing:
+            if update.task.id not in approved:
+                raise _bulk_task_error(update.task, _approval_required_for_done_error())
+
+    reviewing = [update for update in updates if update.updates.get("status") == "review"]
+    if reviewing:
+        commented = await _review_commented_task_ids(session, updates=reviewing)
+        for update in reviewing:
+            if update.task.id not in commented:
+                raise _bulk_task_error(update.task, _comment_validation_error())
+
+
+async def _reconcile_bulk_dependents(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    updates: Sequence[_TaskUpdateInput],
+    actor_agent_id: UUID | None,
+) -> None:
+    toggled = [
+        update
+        for update in updates
+        if (update.previous_status == "done") != (update.task.status == "done")
+    ]
+    if not toggled:
+        return
+    dependents_by_dependency_id = await dependent_task_ids_by_dependency_id(
+        session,
+        board_id=board_id,
+        dependency_task_ids=[update.task.id for update in toggled],
+    )
+    dependent_ids = {
+        task_id for task_ids in dependents_by_dependency_id.values() for task_id in task_ids
+    }
+    if not dependent_ids:
+        return
+    dependents = {
+        task.id: task
+        for task in await session.exec(
+            select(Task)
+            .where(col(Task.board_id) == board_id)
+            .where(col(Task.id).in_(dependent_ids)),
+        )
+    }
+    for update in toggled:
+        reopened = update.previous_status == "done" and update.task.status != "done"
+        for dependent_id in dependents_by_dependency_id.get(update.task.id, []):
+            dependent = dependents.get(dependent_id)
+            if dependent is None:
+                continue
+            _reconcile_dependent(
+                session,
+                dependent=dependent,
+                dependency_task=update.task,
+                reopened=reopened,
+                actor_agent_id=actor_agent_id,
+            )
+
+
+async def _notify_agent_on_tasks_assign(
+    *,
+    session: AsyncSession,
+    board: Board,
+    tasks: Sequence[Task],
+    agent: Agent,
+) -> None:
+    if len(tasks) == 1:
+        await _notify_agent_on_task_assign(session=session, board=board, task=tasks[0], agent=agent)
+        return
+    if not agent.openclaw_session_id:
+        return
+    message = (
+        f"TASKS ASSIGNED\nBoard: {board.name}\n"
+        + _bulk_task_lines(tasks)
+        + "\n\nTake action: open each task and begin work. Post updates as task comments."
+    )
+    notification = _task_notification(
+        board=board,
+        session_key=agent.openclaw_session_id,
+        agent_name=agent.name,
+        message=message,
+        activities=[_assignee_activity(agent, task) for task in tasks],
+    )
+    await notify_agents(session, [notification], boards=[board])
+
+
+async def _notify_lead_on_tasks_unassigned(
+    *,
+    session: AsyncSession,
+    board: Board,
+    tasks: Sequence[Task],
+) -> None:
+    if len(tasks) == 1:
+        await _notify_lead_on_task_unassigned(session=session, board=board, task=tasks[0])
+        return
+    lead = (
+        await Agent.objects.filter_by(board_id=board.id)
+        .filter(col(Agent.is_board_lead).is_(True))
+        .first(session)
+    )
+    if lead is None or not lead.openclaw_session_id:
+        return
+    message = (
+        f"TASKS BACK IN INBOX\nBoard: {board.name}\n"
+        + _bulk_task_lines(tasks)
+        + "\n\nTake action: assign new owners or adjust the plan."
+    )
+    notification = _task_notification(
+        board=board,
+        session_key=lead.openclaw_session_id,
+        agent_name="Lead Agent",
+        message=message,
+        activities=[_lead_unassigned_activity(lead, task) for task in tasks],
+    )
+    await notify_agents(session, [notification], boards=[board])
+
+
+async def _notify_bulk_update_changes(
+    session: AsyncSession,
+    *,
+    board: Board,
+    actor: ActorContext,
+    updates: Sequence[_TaskUpdateInput],
+) -> None:
+    if not _is_lead_actor(actor):
+        returned_to_inbox = [
+            update.task
+            for update in updates
+            if update.task.status == "inbox"
+            and update.task.assigned_agent_id is None
+            and (update.previous_status != "inbox" or update.previous_assigned is not None)
+        ]
+        if returned_to_inbox:
+            await _notify_lead_on_tasks_unassigned(
+                session=session,
+                board=board,
+                tasks=returned_to_inbox,
+            )
+
+    actor_agent_id = _actor_agent_id(actor)
+    assigned: dict[UUID, list[Task]] = {}
+    for update in updates:
+        agent_id = update.task.assigned_agent_id
+        if not agent_id or agent_id in {update.previous_assigned, actor_agent_id}:
+            continue
+        assigned.setdefault(agent_id, []).append(update.task)
+    if not assigned:
+        return
+    for agent in await session.exec(select(Agent).where(col(Agent.id).in_(list(assigned)))):
+        await _notify_agent_on_tasks_assign(
+            session=session,
+            board=board,
+            tasks=assigned[agent.id],
+            agent=agent,
+        )
+
+
+@router.post(
+    "/bulk-update",
+    response_model=list[TaskRead],
+    responses={409: {"model": BlockedTaskError}},
+)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    board: Board = BOARD_ACTOR_WRITE_DEP,
+    session: AsyncSession = SESSION_DEP,
+    actor: ActorContext = ACTOR_DEP,
+) -> list[TaskRead]:
+    """Apply one status and/or assignment change to many tasks at once.
+
+    Enforces the same lead, agent, and admin rules as the single-task PATCH, but
+    loads tasks, dependencies, and approval state in a fixed number of queries.
+    The batch is all-or-nothing: the first violation is returned with its
+    `task_id` and nothing is written. Dependency checks use the statuses stored
+    before the request, and assignment notifications are sent once per agent.
+    """
+    if actor.actor_type == "agent" and not _is_lead_actor(actor):
+        _require_bulk_agent_fields(board, payload)
+    tasks = await _load_bulk_tasks(session, board_id=board.id, task_ids=payload.task_ids)
+    assigned_agent = await _bulk_assigned_agent(
+        session,
+        board=board,
+        actor=actor,
+        payload=payload,
+    )
+    blocked_ids_by_task_id = await _blocked_ids_by_task_id(
+        session,
+        board_id=board.id,
+        tasks=tasks,
+    )
+    updates: list[_TaskUpdateInput] = []
+    for task in tasks:
+        update = _bulk_update_input(task, board=board, actor=actor, payload=payload)
+        try:
+            _apply_bulk_task_rules(
+                update,
+                assigned_agent=assigned_agent,
+                blocked_by=blocked_ids_by_task_id.get(task.id, []),
+            )
+        except HTTPException as exc:
+            raise _bulk_task_error(task, exc) from exc
+        updates.append(update)
+    await _require_bulk_status_rules(session, board=board, updates=updates)
+
+    now = utcnow()
+    actor_agent_id = _actor_agent_id(actor)
+    for update in updates:
+        update.task.updated_at = now
+        session.add(update.task)
+        event_type, message = _task_event_details(update.task, update.previous_status)
+        record_activity(
+            session,
+            event_type=event_type,
+            task_id=update.task.id,
+            message=message,
+            agent_id=actor_agent_id,
+        )
+    await _reconcile_bulk_dependents(
+        session,
+        board_id=board.id,
+        updates=updates,
+        actor_agent_id=actor_agent_id,
+    )
+    await session.commit()
+    await _notify_bulk_update_changes(session, board=board, actor=actor, updates=updates)
+    return await _task_read_page(session=session, board_id=board.id, tasks=tasks)
@@ -21,6 +21,7 @@ from app.models.board_memory import BoardMemory
 from app.models.board_onboarding import BoardOnboardingSession
 from app.models.boards import Board
 from app.models.gateways import Gateway
+from app.models.metric_rollups import MetricRollup
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
 from app.models.organization_invites import OrganizationInvite
@@ -28,10 +29,12 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.models.users import User
 from app.schemas.common import OkResponse
 from app.schemas.users import UserRead, UserUpdate
+from app.services.organizations import invalidate_member_access
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -84,6 +87,18 @@ async def _delete_organization_tree(
         col(TaskFingerprint.board_id).in_(board_ids),
         commit=False,
     )
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.board_id).in_(board_ids),
+        commit=False,
+    )
+    await crud.delete_where(
+        session,
+        MetricRollup,
+        col(MetricRollup.board_id).in_(board_ids),
+        commit=False,
+    )
     await crud.delete_where(
         session,
         ApprovalTaskLink,
@@ -289,4 +304,6 @@ async def delete_me(
         commit=False,
     )
     await session.commit()
+    for member in memberships:
+        invalidate_member_access(member)
     return OkResponse()
@@ -6,6 +6,11 @@ Key ideas:
 - Agents authenticate with an opaque token presented as `X-Agent-Token: <token>`.
 - For convenience, some deployments may also allow `Authorization: Bearer <token>`
   for agents (controlled by caller/dependency).
+- Tokens are located via a non-secret fingerprint column so each request verifies
+  a single PBKDF2 hash; agents minted before fingerprints existed are backfilled
+  the first time they present their token.
+- Recently verified tokens are remembered in a short-TTL in-process cache
+  (`app.core.agent_token_cache`) so repeat calls skip the PBKDF2 check.
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
   interval and we avoid touching it for safe/read-only HTTP methods.
 
@@ -22,7 +27,8 @@ from typing import TYPE_CHECKING, Literal
 from fastapi import Depends, Header, HTTPException, Request, status
 from sqlmodel import col, select
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import agent_token_fingerprint, verify_agent_token_async
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.session import get_session
@@ -47,13 +53,71 @@ class AgentAuthContext:
 
 
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
-    agents = list(
-        await session.exec(
-            select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
-        ),
+    fingerprint = agent_token_fingerprint(token)
+    cached = await _find_cached_agent_for_token(session, token, fingerprint=fingerprint)
+    if cached is not None:
+        return cached
+    agent = await _verify_agent_for_token(session, token, fingerprint=fingerprint)
+    if agent is not None:
+        agent_token_cache.put(token, agent.id)
+    return agent
+
+
+async def _find_cached_agent_for_token(
+    session: AsyncSession,
+    token: str,
+    *,
+    fingerprint: str,
+) -> Agent | None:
+    agent_id = agent_token_cache.get(token)
+    if agent_id is None:
+        return None
+    agent = await session.get(Agent, agent_id)
+    # Rotation or deletion in another worker process leaves a stale local entry;
+    # the persisted fingerprint no longer matching is the signal to drop it.
+    if agent is None or agent.agent_token_fingerprint != fingerprint:
+        agent_token_cache.evict_agent(agent_id)
+        return None
+    return agent
+
+
+async def _verify_agent_for_token(
+    session: AsyncSession,
+    token: str,
+    *,
+    fingerprint: str,
+) -> Agent | None:
+    candidates = await session.exec(
+        select(Agent).where(col(Agent.agent_token_fingerprint) == fingerprint),
+    )
+    for agent in candidates:
+        if agent.agent_token_hash and await verify_agent_token_async(token, agent.agent_token_hash):
+            return agent
+    return await _find_legacy_agent_for_token(session, token, fingerprint=fingerprint)
+
+
+async def _find_legacy_agent_for_token(
+    session: AsyncSession,
+    token: str,
+    *,
+    fingerprint: str,
+) -> Agent | None:
+    """Scan agents minted before fingerprints existed and backfill on match.
+
+    The candidate set shrinks as each legacy agent authenticates once, so this
+    path trends to an empty query after rollout.
+    """
+    legacy_agents = await session.exec(
+        select(Agent)
+        .where(col(Agent.agent_token_hash).is_not(None))
+        .where(col(Agent.agent_token_fingerprint).is_(None)),
     )
-    for agent in agents:
-        if agent.agent_token_hash and verify_agent_token(token, agent.agent_token_hash):
+    for agent in legacy_agents:
+        if agent.agent_token_hash and await verify_agent_token_async(token, agent.agent_token_hash):
+            agent.agent_token_fingerprint = fingerprint
+            session.add(agent)
+            await session.commit()
+            logger.info("agent auth fingerprint backfilled agent_id=%s", agent.id)
             return agent
     return None
 
@@ -0,0 +1,196 @@
+"""Bounded in-process cache of recently verified agent tokens.
+
+Agent auth verifies a PBKDF2 hash on every request, which dominates the CPU cost of
+heartbeat-heavy agents. This cache remembers which agent a presented token resolved
+to for a short TTL so repeat calls can skip the hash check.
+
+Entries are keyed by a SHA-256 digest of the raw token, never the token itself.
+Callers must still re-check the loaded agent's `agent_token_fingerprint` on a hit:
+that keeps rotations and deletions performed by other worker processes safe even
+though eviction hooks only reach the local process.
+
+Hit/miss counters are per process; `start_agent_token_cache_stats_logging` emits them
+as a periodic `agent_token_cache.stats` log line so operators can judge the hit rate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AgentTokenCacheStats:
+    """Point-in-time counters for the verified-token cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return hits over lookups, or 0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AgentTokenCache:
+    """Short-TTL LRU mapping of token digests to verified agent ids."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[UUID, float]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether caching is active for the configured limits."""
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> UUID | None:
+        """Return the cached agent id for a token, or `None` on miss/expiry."""
+        if not self.enabled:
+            return None
+        key = self._key(token)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            agent_id, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return agent_id
+
+    def put(self, token: str, agent_id: UUID) -> None:
+        """Remember that `token` was verified for `agent_id`."""
+        if not self.enabled:
+            return
+        key = self._key(token)
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (agent_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def evict_agent(self, agent_id: UUID) -> None:
+        """Drop every cached token that resolved to `agent_id`."""
+        self.evict_agents((agent_id,))
+
+    def evict_agents(self, agent_ids: Iterable[UUID]) -> None:
+        """Drop every cached token that resolved to any of `agent_ids`."""
+        targets = set(agent_ids)
+        if not targets:
+            return
+        with self._lock:
+            stale = [key for key, (cached_id, _) in self._entries.items() if cached_id in targets]
+            for key in stale:
+                del self._entries[key]
+            self._evictions += len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> AgentTokenCacheStats:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return AgentTokenCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+agent_token_cache = AgentTokenCache(
+    max_entries=settings.agent_token_cache_max_entries,
+    ttl_seconds=settings.agent_token_cache_ttl_seconds,
+)
+_stats_task: asyncio.Task[None] | None = None
+
+
+def log_agent_token_cache_stats() -> None:
+    """Log the shared cache's counters as one structured line."""
+    stats = agent_token_cache.stats()
+    logger.info(
+        "agent_token_cache.stats",
+        extra={
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+            "size": stats.size,
+            "hit_ratio": round(stats.hit_ratio, 3),
+        },
+    )
+
+
+async def _log_stats_periodically(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        log_agent_token_cache_stats()
+
+
+def start_agent_token_cache_stats_logging() -> None:
+    """Start the periodic stats log when the cache and interval are both enabled."""
+    global _stats_task
+    interval = settings.agent_token_cache_stats_log_interval_seconds
+    if interval <= 0 or not agent_token_cache.enabled:
+        return
+    if _stats_task is None or _stats_task.done():
+        _stats_task = asyncio.create_task(_log_stats_periodically(interval))
+
+
+async def stop_agent_token_cache_stats_logging() -> None:
+    """Cancel the periodic stats log and emit a final line with the totals."""
+    global _stats_task
+    task, _stats_task = _stats_task, None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    log_agent_token_cache_stats()
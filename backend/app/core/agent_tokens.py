@@ -1,14 +1,26 @@
-"""Token generation and verification helpers for agent authentication."""
+"""Token generation and verification helpers for agent authentication.
+
+PBKDF2 hashing is deliberately slow. Async callers should use the `*_async`
+variants, which run the work on a bounded thread pool (`hashlib` releases the GIL)
+so a burst of agent logins does not stall the event loop.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
 import secrets
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
+
+from app.core.config import settings
 
 ITERATIONS = 200_000
 SALT_BYTES = 16
+FINGERPRINT_HEX_CHARS = 16
 
 
 def generate_agent_token() -> str:
@@ -32,6 +44,16 @@ def hash_agent_token(token: str) -> str:
     return f"pbkdf2_sha256${ITERATIONS}${_b64encode(salt)}${_b64encode(digest)}"
 
 
+def agent_token_fingerprint(token: str) -> str:
+    """Return the non-secret lookup key used to find an agent by its raw token.
+
+    The fingerprint is a truncated SHA-256 digest: cheap enough to compute on every
+    request and selective enough to narrow auth to a single candidate row, while
+    still leaving the PBKDF2 hash as the only value that can confirm a token.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:FINGERPRINT_HEX_CHARS]
+
+
 def verify_agent_token(token: str, stored_hash: str) -> bool:
     """Verify a plaintext token against a stored PBKDF2 hash representation."""
     try:
@@ -53,3 +75,60 @@ def verify_agent_token(token: str, stored_hash: str) -> bool:
         iterations_int,
     )
     return hmac.compare_digest(candidate, expected_digest)
+
+
+class _TokenHashPool:
+    """Lazily created worker pool plus per-event-loop admission limit."""
+
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    _slots: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.agent_token_hash_workers,
+                thread_name_prefix="agent-token-hash",
+            )
+        return cls._executor
+
+    @classmethod
+    def slots(cls) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = cls._slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(settings.agent_token_hash_max_concurrency)
+            cls._slots[loop] = slots
+        return slots
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+
+async def hash_agent_token_async(token: str) -> str:
+    """Hash an agent token on the token-hash worker pool."""
+    async with _TokenHashPool.slots():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_TokenHashPool.executor(), hash_agent_token, token)
+
+
+async def verify_agent_token_async(token: str, stored_hash: str) -> bool:
+    """Verify an agent token on the token-hash worker pool."""
+    async with _TokenHashPool.slots():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _TokenHashPool.executor(),
+            verify_agent_token,
+            token,
+            stored_hash,
+        )
+
+
+def shutdown_agent_token_hashing() -> None:
+    """Release token-hash worker threads (called on application shutdown)."""
+    _TokenHashPool.shutdown()
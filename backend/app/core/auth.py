@@ -18,6 +18,7 @@ Notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from hmac import compare_digest
 from typing import TYPE_CHECKING, Literal
 
@@ -25,15 +26,21 @@ import httpx
 from clerk_backend_api import Clerk
 from clerk_backend_api.models.clerkerrors import ClerkErrors
 from clerk_backend_api.models.sdkerror import SDKError
-from clerk_backend_api.security.types import AuthenticateRequestOptions, AuthStatus, RequestState
+from clerk_backend_api.security.types import (
+    AuthErrorReason,
+    AuthStatus,
+    RequestState,
+    TokenVerificationError,
+)
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ValidationError
-from starlette.concurrency import run_in_threadpool
 
 from app.core.auth_mode import AuthMode
+from app.core.clerk_jwks import ClerkSessionVerifier
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
 from app.db import crud
 from app.db.session import get_session
 from app.models.users import User
@@ -185,25 +192,47 @@ def _normalize_clerk_server_url(raw: str) -> str | None:
     return server_url
 
 
-def _make_authenticate_request_options() -> AuthenticateRequestOptions:
-    # Follow the clerk-backend-api documented flow: authenticate_request() with a secret key.
-    return AuthenticateRequestOptions(
+@lru_cache(maxsize=1)
+def _clerk_session_verifier() -> ClerkSessionVerifier:
+    server_url = _normalize_clerk_server_url(settings.clerk_api_url or "")
+    return ClerkSessionVerifier(
+        jwks_url=f"{server_url}/jwks",
         secret_key=settings.clerk_secret_key.strip(),
-        clock_skew_in_ms=int(settings.clerk_leeway * 1000),
-        accepts_token=["session_token"],
+        refresh_seconds=settings.clerk_jwks_refresh_seconds,
+        min_refresh_interval_seconds=settings.clerk_jwks_min_refresh_interval_seconds,
+        leeway_seconds=settings.clerk_leeway,
+        verify_iat=settings.clerk_verify_iat,
+        verified_tokens=TTLCache(
+            max_entries=settings.clerk_verified_token_cache_max_entries,
+            ttl_seconds=settings.clerk_verified_token_cache_ttl_seconds,
+        ),
     )
 
 
+def _extract_clerk_session_token(request: Request) -> str | None:
+    # Same sources as the Clerk SDK: the bearer header, then the `__session` cookie.
+    token = _extract_bearer_token(request.headers.get("Authorization"))
+    if token is not None:
+        return token
+    for name, value in request.cookies.items():
+        if name.startswith("__session") and value:
+            return value
+    return None
+
+
 async def _authenticate_clerk_request(request: Request) -> RequestState:
-    # The SDK docs use httpx.Request as the request object; build one from the ASGI request.
-    httpx_request = httpx.Request(
-        request.method,
-        str(request.url),
-        headers=dict(request.headers),
-    )
-    options = _make_authenticate_request_options()
-    sdk = Clerk(bearer_auth=options.secret_key or "")
-    return await run_in_threadpool(sdk.authenticate_request, httpx_request, options)
+    # Session JWTs are verified locally against the cached JWKS; see `app.core.clerk_jwks`.
+    token = _extract_clerk_session_token(request)
+    if token is None:
+        return RequestState(
+            status=AuthStatus.SIGNED_OUT,
+            reason=AuthErrorReason.SESSION_TOKEN_MISSING,
+        )
+    try:
+        claims = await _clerk_session_verifier().verify(token)
+    except TokenVerificationError as exc:
+        return RequestState(status=AuthStatus.SIGNED_OUT, reason=exc.reason)
+    return RequestState(status=AuthStatus.SIGNED_IN, token=token, payload=claims)
 
 
 async def _fetch_clerk_profile(clerk_user_id: str) -> tuple[str | None, str | None]:
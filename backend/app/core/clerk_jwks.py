@@ -0,0 +1,176 @@
+"""Local verification of Clerk session tokens against a cached JWKS.
+
+Clerk session tokens are short-lived RS256 JWTs signed with the instance's JWKS.
+Verifying them only needs the public keys, so this module keeps those keys in
+process instead of running the Clerk SDK's request flow on every call:
+
+- The JWKS is fetched once and refreshed in the background after
+  `refresh_seconds`; requests keep using the current keys while that runs.
+- A token signed with an unknown `kid` (key rotation) triggers an immediate
+  re-fetch, rate limited by `min_refresh_interval_seconds`.
+- Verified claims are remembered by SHA-256 digest of the token until its `exp`,
+  so repeat requests with the same token skip signature checks entirely.
+
+Failures raise the SDK's `TokenVerificationError` so callers keep reporting the
+same reasons the SDK would.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import jwt
+from clerk_backend_api.security.types import TokenVerificationError, TokenVerificationErrorReason
+
+from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
+
+logger = get_logger(__name__)
+
+JWKS_FETCH_TIMEOUT_SECONDS = 5.0
+
+
+class ClerkSessionVerifier:
+    """Verify Clerk session JWTs locally using a cached, self-refreshing JWKS."""
+
+    def __init__(
+        self,
+        *,
+        jwks_url: str,
+        secret_key: str,
+        refresh_seconds: float,
+        min_refresh_interval_seconds: float,
+        leeway_seconds: float,
+        verify_iat: bool,
+        verified_tokens: TTLCache[bytes, dict[str, Any]],
+        transport: httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._jwks_url = jwks_url
+        self._secret_key = secret_key
+        self._refresh_seconds = refresh_seconds
+        self._min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._leeway_seconds = leeway_seconds
+        self._verify_iat = verify_iat
+        self._verified_tokens = verified_tokens
+        self._transport = transport
+        self._clock = clock
+        self._keys: dict[str, jwt.PyJWK] | None = None
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._background_refresh: asyncio.Task[None] | None = None
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """Return the verified claims for `token` or raise `TokenVerificationError`."""
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        cached = self._verified_tokens.get(digest)
+        if cached is not None:
+            return dict(cached)
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.InvalidTokenError as exc:
+            raise TokenVerificationError(TokenVerificationErrorReason.TOKEN_INVALID) from exc
+        key = await self._signing_key(kid if isinstance(kid, str) else None)
+        claims = self._decode(token, key)
+        exp = claims.get("exp")
+        if isinstance(exp, int | float):
+            self._verified_tokens.put(digest, claims, ttl_seconds=exp - time.time())
+        return dict(claims)
+
+    def _decode(self, token: str, key: jwt.PyJWK) -> dict[str, Any]:
+        try:
+            return jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                options={"verify_iss": False, "verify_aud": False, "verify_iat": self._verify_iat},
+                leeway=self._leeway_seconds,
+            )
+        except jwt.ExpiredSignatureError as exc:
+            raise TokenVerificationError(TokenVerificationErrorReason.TOKEN_EXPIRED) from exc
+        except jwt.InvalidSignatureError as exc:
+            raise TokenVerificationError(
+                TokenVerificationErrorReason.TOKEN_INVALID_SIGNATURE,
+            ) from exc
+        except jwt.ImmatureSignatureError as exc:
+            raise TokenVerificationError(TokenVerificationErrorReason.TOKEN_NOT_ACTIVE_YET) from exc
+        except jwt.InvalidTokenError as exc:
+            raise TokenVerificationError(TokenVerificationErrorReason.TOKEN_INVALID) from exc
+
+    async def _signing_key(self, kid: str | None) -> jwt.PyJWK:
+        if self._keys is None:
+            await self.refresh()
+        elif self._is_stale():
+            self._schedule_background_refresh()
+        key = self._keys.get(kid) if self._keys is not None and kid else None
+        if key is None and kid and self._may_refetch():
+            # Unknown kid usually means Clerk rotated its signing key.
+            await self.refresh()
+            key = self._keys.get(kid) if self._keys is not None else None
+        if key is None:
+            raise TokenVerificationError(TokenVerificationErrorReason.JWK_KID_MISMATCH)
+        return key
+
+    def _is_stale(self) -> bool:
+        return self._fetched_at is None or self._clock() - self._fetched_at >= self._refresh_seconds
+
+    def _may_refetch(self) -> bool:
+        return (
+            self._attempted_at is None
+            or self._clock() - self._attempted_at >= self._min_refresh_interval_seconds
+        )
+
+    def _schedule_background_refresh(self) -> None:
+        if self._background_refresh is not None and not self._background_refresh.done():
+            return
+        self._background_refresh = asyncio.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        except TokenVerificationError:
+            logger.warning("auth.clerk.jwks.background_refresh_failed url=%s", self._jwks_url)
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS now, keeping the previous keys if the fetch fails."""
+        attempted_at = self._attempted_at
+        async with self._refresh_lock:
+            if self._attempted_at != attempted_at and self._keys is not None:
+                # Another caller refreshed while this one waited for the lock.
+                return
+            self._attempted_at = self._clock()
+            keys = await self._fetch_keys()
+            self._keys = keys
+            self._fetched_at = self._clock()
+        logger.info("auth.clerk.jwks.refreshed keys=%s", len(keys))
+
+    async def _fetch_keys(self) -> dict[str, jwt.PyJWK]:
+        try:
+            async with httpx.AsyncClient(
+                transport=self._transport,
+                timeout=JWKS_FETCH_TIMEOUT_SECONDS,
+            ) as client:
+                response = await client.get(
+                    self._jwks_url,
+                    headers={
+                        "Accept": "application/json",
+                        "Authorization": f"Bearer {self._secret_key}",
+                    },
+                )
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise TokenVerificationError(TokenVerificationErrorReason.JWK_FAILED_TO_LOAD) from exc
+        if not isinstance(payload, dict):
+            raise TokenVerificationError(TokenVerificationErrorReason.JWK_REMOTE_INVALID)
+        try:
+            jwks = jwt.PyJWKSet.from_dict(payload)
+        except jwt.PyJWKSetError as exc:
+            raise TokenVerificationError(TokenVerificationErrorReason.JWK_REMOTE_INVALID) from exc
+        return {key.key_id: key for key in jwks.keys if key.key_id}
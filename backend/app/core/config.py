@@ -46,10 +46,26 @@ class Settings(BaseSettings):
     clerk_api_url: str = "https://api.clerk.com"
     clerk_verify_iat: bool = True
     clerk_leeway: float = 10.0
+    # Clerk session tokens: JWKS cached in process, refreshed in the background
+    clerk_jwks_refresh_seconds: float = Field(default=3600.0, gt=0)
+    clerk_jwks_min_refresh_interval_seconds: float = Field(default=30.0, ge=0)
+    # Verified session tokens are remembered until `exp`, capped by the TTL
+    # (set TTL or size to 0 to disable)
+    clerk_verified_token_cache_ttl_seconds: float = Field(default=300.0, ge=0)
+    clerk_verified_token_cache_max_entries: int = Field(default=4096, ge=0)
 
     cors_origins: str = ""
     base_url: str = ""
 
+    # Agent auth: verified-token cache (set TTL or size to 0 to disable)
+    agent_token_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+    agent_token_cache_max_entries: int = Field(default=1024, ge=0)
+    # Log the cache's hit/miss counters this often (0 disables)
+    agent_token_cache_stats_log_interval_seconds: float = Field(default=300.0, ge=0)
+    # Agent auth: PBKDF2 hashing runs on a bounded thread pool off the event loop
+    agent_token_hash_workers: int = Field(default=4, ge=1)
+    agent_token_hash_max_concurrency: int = Field(default=16, ge=1)
+
     # Database lifecycle
     db_auto_migrate: bool = False
 
@@ -60,6 +76,69 @@ class Settings(BaseSettings):
     rq_dispatch_max_retries: int = 3
     rq_dispatch_retry_base_seconds: float = 10.0
     rq_dispatch_retry_max_seconds: float = 120.0
+    rq_worker_concurrency: int = Field(default=8, ge=1)
+    rq_worker_poll_seconds: float = Field(default=5.0, gt=0)
+    rq_lease_visibility_seconds: float = Field(default=300.0, gt=0)
+    rq_lease_reap_interval_seconds: float = Field(default=30.0, gt=0)
+
+    # SSE streams: change notifications over Redis pub/sub, with a slow fallback poll
+    sse_event_bus_redis_enabled: bool = True
+    sse_fallback_poll_seconds: float = Field(default=30.0, gt=0)
+    sse_subscriber_buffer_max: int = Field(default=256, ge=1)
+
+    # Organization membership: active member/org per user and board grants per member
+    # (set TTL or size to 0 to disable)
+    org_membership_cache_ttl_seconds: float = Field(default=15.0, ge=0)
+    org_membership_cache_max_entries: int = Field(default=4096, ge=0)
+
+    # Board snapshots: per-board cache of encoded payloads (set TTL or size to 0 to disable)
+    board_snapshot_cache_ttl_seconds: float = Field(default=30.0, ge=0)
+    board_snapshot_cache_max_boards: int = Field(default=256, ge=0)
+
+    # Dashboard metrics: short-lived result cache (set TTL or size to 0 to disable)
+    metrics_cache_ttl_seconds: float = Field(default=15.0, ge=0)
+    metrics_cache_max_entries: int = Field(default=256, ge=0)
+    # Dashboard metrics: hourly rollups maintained by the queue worker
+    metrics_rollup_interval_seconds: float = Field(default=300.0, gt=0)
+    metrics_rollup_settle_seconds: float = Field(default=300.0, ge=0)
+
+    # Skill pack sync (git clone + repository scan)
+    skill_pack_sync_workers: int = Field(default=4, ge=1)
+    skill_pack_sync_max_per_org: int = Field(default=2, ge=1)
+    skill_pack_sync_status_ttl_seconds: float = Field(default=86400.0, gt=0)
+    # Queued/running claim; the worker refreshes it while a sync runs
+    skill_pack_sync_claim_ttl_seconds: float = Field(default=300.0, gt=0)
+
+    # OpenClaw gateway RPC connection pool
+    gateway_rpc_pool_enabled: bool = True
+    gateway_rpc_pool_max_connections: int = Field(default=2, ge=1)
+    gateway_rpc_pool_max_in_flight: int = Field(default=16, ge=1)
+    gateway_rpc_pool_idle_seconds: float = Field(default=60.0, ge=0)
+    gateway_rpc_pool_ping_interval_seconds: float = Field(default=20.0, ge=0)
+    # Pooled requests without a response by then fail and free their slot (0 disables)
+    gateway_rpc_request_timeout_seconds: float = Field(default=120.0, ge=0)
+
+    # OpenClaw gateway template sync: agents provisioned concurrently per gateway
+    gateway_template_sync_concurrency: int = Field(default=8, ge=1)
+    # Digests of pushed agent files, used to skip unchanged uploads (set TTL or size to 0 to disable).
+    # Kept per process, so a file rewritten elsewhere at the same size can be skipped until expiry.
+    gateway_agent_file_digest_cache_ttl_seconds: float = Field(default=86400.0, ge=0)
+    gateway_agent_file_digest_cache_max_entries: int = Field(default=50000, ge=0)
+
+    # OpenClaw gateway coordination: lead broadcasts dispatched concurrently per request
+    gateway_lead_broadcast_concurrency: int = Field(default=8, ge=1)
+
+    # Agent notifications (assignment, comments, approvals, chat, broadcasts): concurrent
+    # sends per gateway, optionally queued per session so the worker coalesces pending
+    # messages into one chat.send and retries with backoff
+    agent_notification_gateway_concurrency: int = Field(default=8, ge=1)
+    agent_notification_queue_enabled: bool = False
+    agent_notification_coalesce_max_messages: int = Field(default=20, ge=1)
+
+    # OpenClaw gateway configs: per-process cache for notification dispatch
+    # (set TTL or size to 0 to disable)
+    gateway_config_cache_ttl_seconds: float = Field(default=30.0, ge=0)
+    gateway_config_cache_max_entries: int = Field(default=1024, ge=0)
 
     # OpenClaw gateway runtime compatibility
     gateway_min_version: str = "2026.02.9"
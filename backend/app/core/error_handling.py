@@ -17,6 +17,8 @@ Design notes:
 - The request-id middleware is installed *outermost* so it runs even when other
   middleware returns early.
 - Health endpoints are excluded from request logs by default to reduce noise.
+- Request logs include `db_queries`, the number of SQL statements the request
+  executed before its response started.
 """
 
 from __future__ import annotations
@@ -41,6 +43,7 @@ from app.core.logging import (
     set_request_id,
     set_request_route_context,
 )
+from app.db.query_stats import reset_query_count, start_query_count
 
 if TYPE_CHECKING:  # pragma: no cover
     from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -82,6 +85,7 @@ class RequestIdMiddleware:
 
         request_id = self._get_or_create_request_id(scope)
         context_token = set_request_id(request_id)
+        queries, query_count_token = start_query_count()
         route_context_tokens = set_request_route_context(method, path)
         if should_log:
             logger.log(
@@ -111,6 +115,7 @@ class RequestIdMiddleware:
                         "path": path,
                         "status_code": status_code,
                         "duration_ms": duration_ms,
+                        "db_queries": queries.count,
                         "client_ip": client_ip,
                     }
                     if status_code >= 500:
@@ -142,6 +147,7 @@ class RequestIdMiddleware:
                         "client_ip": client_ip,
                     },
                 )
+            reset_query_count(query_count_token)
             reset_request_route_context(route_context_tokens)
             reset_request_id(context_token)
 
@@ -0,0 +1,93 @@
+"""Small thread-safe LRU cache whose entries expire after a fixed TTL.
+
+Used for short-lived, per-process memoization of read-heavy results where a few
+seconds of staleness is acceptable. A cache with `max_entries` or `ttl_seconds`
+set to `0` is disabled and never stores anything.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU mapping with per-entry expiry."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether caching is active for the configured limits."""
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or `None` on miss/expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V, *, ttl_seconds: float | None = None) -> None:
+        """Store a value, evicting the least recently used entries past the limit.
+
+        `ttl_seconds` shortens the configured TTL for this entry; it never extends it.
+        """
+        if not self.enabled:
+            return
+        ttl = self._ttl_seconds if ttl_seconds is None else min(ttl_seconds, self._ttl_seconds)
+        if ttl <= 0:
+            return
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Drop one entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def evict_where(self, predicate: Callable[[K], bool]) -> int:
+        """Drop every entry whose key matches `predicate`; return how many were dropped."""
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
 ModelT = TypeVar("ModelT", bound=SQLModel)
 
@@ -54,6 +55,15 @@ class ModelManager(Generic[ModelT]):
             queryset = queryset.filter(col(getattr(self.model, field_name)) == value)
         return queryset
 
+    async def get(self, session: AsyncSession, obj_id: object) -> ModelT | None:
+        """Return the row with primary key `obj_id`, reusing the session identity map.
+
+        A request shares one session across its dependencies and handlers, so an
+        entity loaded once (for example by `api.deps`) is returned again without
+        another query.
+        """
+        return await session.get(self.model, obj_id)
+
     def by_id(self, obj_id: object) -> QuerySet[ModelT]:
         """Return queryset filtered by primary identifier field."""
         return self.by_field(self.id_field, obj_id)
@@ -0,0 +1,60 @@
+"""Per-request SQL statement counting.
+
+`count_queries()` installs a counter for the current context; every statement any
+engine executes while it is active increments it. The request-id middleware starts
+one per HTTP request so `http.request.complete` logs report `db_queries`, and tests
+use it to pin the number of round trips a code path makes.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass(slots=True)
+class QueryCounter:
+    """Mutable count of statements executed inside a `count_queries()` block."""
+
+    count: int = 0
+
+
+_CURRENT_COUNTER: ContextVar[QueryCounter | None] = ContextVar("db_query_counter", default=None)
+
+
+def start_query_count() -> tuple[QueryCounter, Token[QueryCounter | None]]:
+    """Install a fresh counter for the current context."""
+    counter = QueryCounter()
+    return counter, _CURRENT_COUNTER.set(counter)
+
+
+def reset_query_count(token: Token[QueryCounter | None]) -> None:
+    """Restore the counter that was active before `start_query_count()`."""
+    _CURRENT_COUNTER.reset(token)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Count statements executed in this context until the block exits."""
+    counter, token = start_query_count()
+    try:
+        yield counter
+    finally:
+        reset_query_count(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(*_args: object) -> None:
+    # SQLAlchemy runs the sync engine inside a greenlet that inherits this
+    # context, so the counter set by the awaiting caller is visible here.
+    counter = _CURRENT_COUNTER.get()
+    if counter is not None:
+        counter.count += 1
@@ -15,12 +15,15 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app import models as _models
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.services import task_status_transitions as _task_status_transitions
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 # Import model modules so SQLModel metadata is fully registered at startup.
 _MODEL_REGISTRY = _models
+# Install the session hook that logs task status transitions for metric rollups.
+_SESSION_HOOKS = (_task_status_transitions,)
 
 
 def _normalize_database_url(database_url: str) -> str:
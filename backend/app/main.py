@@ -31,11 +31,20 @@ from app.api.tags import router as tags_router
 from app.api.task_custom_fields import router as task_custom_fields_router
 from app.api.tasks import router as tasks_router
 from app.api.users import router as users_router
+from app.core.agent_token_cache import (
+    start_agent_token_cache_stats_logging,
+    stop_agent_token_cache_stats_logging,
+)
+from app.core.agent_tokens import shutdown_agent_token_hashing
 from app.core.config import settings
 from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
 from app.db.session import init_db
 from app.schemas.health import HealthStatusResponse
+from app.services.board_events import close_board_event_bus
+from app.services.openclaw.gateway_rpc import close_gateway_connections
+from app.services.queue import close_redis_clients
+from app.services.skill_packs import shutdown_skill_pack_sync
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -436,10 +445,17 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    start_agent_token_cache_stats_logging()
     logger.info("app.lifecycle.started")
     try:
         yield
     finally:
+        await stop_agent_token_cache_stats_logging()
+        await close_board_event_bus()
+        await close_gateway_connections()
+        shutdown_agent_token_hashing()
+        shutdown_skill_pack_sync()
+        close_redis_clients()
         logger.info("app.lifecycle.stopped")
 
 
@@ -12,6 +12,7 @@ from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
 from app.models.gateways import Gateway
+from app.models.metric_rollups import MetricRollup, MetricRollupWatermark
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
 from app.models.organization_invites import OrganizationInvite
@@ -27,6 +28,7 @@ from app.models.task_custom_fields import (
 )
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.models.users import User
 
@@ -43,6 +45,8 @@ __all__ = [
     "BoardGroup",
     "Board",
     "Gateway",
+    "MetricRollup",
+    "MetricRollupWatermark",
     "GatewayInstalledSkill",
     "MarketplaceSkill",
     "SkillPack",
@@ -57,6 +61,7 @@ __all__ = [
     "TaskDependency",
     "Task",
     "TaskFingerprint",
+    "TaskStatusTransition",
     "Tag",
     "TagAssignment",
     "User",
@@ -0,0 +1,44 @@
+"""Hourly per-board metric rollups used by long-range dashboard queries."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.base import QueryModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class MetricRollup(QueryModel, table=True):
+    """One aggregated metric value for a board and hour."""
+
+    __tablename__ = "metric_rollups"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        UniqueConstraint(
+            "board_id",
+            "hour",
+            "metric",
+            name="uq_metric_rollups_board_id_hour_metric",
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    hour: datetime = Field(index=True)
+    metric: str
+    value: float = 0.0
+
+
+class MetricRollupWatermark(QueryModel, table=True):
+    """Exclusive upper bound of the hours already rolled up for a rollup stream."""
+
+    __tablename__ = "metric_rollup_watermarks"  # pyright: ignore[reportAssignmentType]
+
+    name: str = Field(primary_key=True)
+    rolled_until: datetime
+    updated_at: datetime = Field(default_factory=utcnow)
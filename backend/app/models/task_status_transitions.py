@@ -0,0 +1,32 @@
+"""Task status transition log used to build hourly metric rollups."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.base import QueryModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class TaskStatusTransition(QueryModel, table=True):
+    """One change of a task's status, stamped with the time it happened.
+
+    `task_id` is not a foreign key so history outlives deleted tasks, matching the
+    rollups already built from it.
+    """
+
+    __tablename__ = "task_status_transitions"  # pyright: ignore[reportAssignmentType]
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    task_id: UUID = Field(index=True)
+    from_status: str | None = None
+    to_status: str
+    # Start of the in-progress stint this transition ends, for cycle time on review.
+    in_progress_at: datetime | None = None
+    created_at: datetime = Field(default_factory=utcnow, index=True)
@@ -48,7 +48,7 @@ from app.schemas.souls_directory import (
     SoulsDirectorySoulRef,
 )
 from app.schemas.tags import TagCreate, TagRead, TagRef, TagUpdate
-from app.schemas.tasks import TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import TaskBulkUpdate, TaskCreate, TaskRead, TaskUpdate
 from app.schemas.users import UserCreate, UserRead, UserUpdate
 
 __all__ = [
@@ -103,6 +103,7 @@ __all__ = [
     "TagRead",
     "TagRef",
     "TagUpdate",
+    "TaskBulkUpdate",
     "TaskCreate",
     "TaskRead",
     "TaskUpdate",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import field_validator
@@ -75,6 +76,16 @@ class GatewayTemplatesSyncError(SQLModel):
     message: str
 
 
+class GatewayTemplatesSyncAgentResult(SQLModel):
+    """Outcome for one agent, streamed while a gateway template sync runs."""
+
+    agent_id: UUID
+    agent_name: str
+    board_id: UUID | None = None
+    status: Literal["updated", "skipped", "failed"]
+    errors: list[GatewayTemplatesSyncError] = Field(default_factory=list)
+
+
 class GatewayTemplatesSyncResult(SQLModel):
     """Summary payload returned by gateway template sync endpoints."""
 
@@ -84,4 +95,8 @@ class GatewayTemplatesSyncResult(SQLModel):
     agents_updated: int
     agents_skipped: int
     main_updated: bool
+    files_written: int = 0
+    # Uploads skipped because the gateway already had identical content.
+    files_unchanged: int = 0
+    bytes_unchanged: int = 0
     errors: list[GatewayTemplatesSyncError] = Field(default_factory=list)
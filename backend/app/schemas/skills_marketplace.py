@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import AnyHttpUrl
@@ -96,3 +97,18 @@ class SkillPackSyncResponse(SQLModel):
     created: int
     updated: int
     warnings: list[str] = Field(default_factory=list)
+
+
+SkillPackSyncState = Literal["queued", "running", "succeeded", "failed"]
+
+
+class SkillPackSyncStatusRead(SQLModel):
+    """Progress of a background pack sync job."""
+
+    pack_id: UUID
+    status: SkillPackSyncState
+    requested_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: SkillPackSyncResponse | None = None
+    error: str | None = None
@@ -15,6 +15,8 @@ from app.schemas.task_custom_fields import TaskCustomFieldValues
 
 TaskStatus = Literal["inbox", "in_progress", "review", "done"]
 STATUS_REQUIRED_ERROR = "status is required"
+BULK_UPDATE_FIELDS_REQUIRED_ERROR = "status or assigned_agent_id is required"
+TASK_BULK_UPDATE_MAX_TASKS = 200
 # Keep these symbols as runtime globals so Pydantic can resolve
 # deferred annotations reliably.
 RUNTIME_ANNOTATION_TYPES = (datetime, UUID, NonEmptyStr, TagRef)
@@ -72,6 +74,23 @@ class TaskUpdate(SQLModel):
         return self
 
 
+class TaskBulkUpdate(SQLModel):
+    """Payload applying one status and/or assignment change to many tasks."""
+
+    task_ids: list[UUID] = Field(min_length=1, max_length=TASK_BULK_UPDATE_MAX_TASKS)
+    status: TaskStatus | None = None
+    assigned_agent_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def validate_fields(self) -> Self:
+        """Require a change and reject an explicit null status."""
+        if "status" in self.model_fields_set and self.status is None:
+            raise ValueError(STATUS_REQUIRED_ERROR)
+        if not {"status", "assigned_agent_id"} & self.model_fields_set:
+            raise ValueError(BULK_UPDATE_FIELDS_REQUIRED_ERROR)
+        return self
+
+
 class TaskRead(TaskBase):
     """Task payload returned from read endpoints."""
 
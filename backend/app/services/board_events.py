@@ -0,0 +1,340 @@
+"""Board change notifications that wake SSE streams instead of fixed-interval polling.
+
+Write paths do not call this module directly. SQLAlchemy session hooks record which
+boards had task activity, approvals, memory or agents change during a transaction
+and publish those keys once the transaction commits. Notifications fan out to local
+subscribers in memory and, when enabled, to other processes over Redis pub/sub.
+
+Streams still build payloads from the database with their existing `since`
+catch-up query; the bus only tells them when that query is worth running. A slow
+fallback poll covers notifications lost while Redis is unavailable. In-process caches
+register change listeners to drop entries for the boards named by each notification.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import weakref
+from collections.abc import Callable
+from contextlib import suppress
+from itertools import chain
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Literal, Self
+from uuid import UUID, uuid4
+
+import redis.asyncio as redis_async
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.approval_task_links import ApprovalTaskLink
+from app.models.approvals import Approval
+from app.models.board_group_memory import BoardGroupMemory
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.tag_assignments import TagAssignment
+from app.models.tags import Tag
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable
+    from types import TracebackType
+
+    from sqlalchemy.orm import UOWTransaction
+
+logger = get_logger(__name__)
+
+BoardEventTopic = Literal["boards", "tasks", "approvals", "memory", "group_memory", "agents"]
+# `None` scope means "every scope for this topic" (used when the board is unknown).
+BoardEventKey = tuple[BoardEventTopic, UUID | None]
+BoardChangeListener = Callable[[frozenset[BoardEventKey]], None]
+
+REDIS_CHANNEL = "mission-control:board-events"
+_PENDING_INFO_KEY = "board_event_keys"
+_REDIS_RETRY_SECONDS = 5.0
+
+_change_listeners: list[BoardChangeListener] = []
+
+
+def add_board_change_listener(listener: BoardChangeListener) -> None:
+    """Call `listener` with the keys of every local or remote board change."""
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+
+def remove_board_change_listener(listener: BoardChangeListener) -> None:
+    """Stop calling a listener registered with `add_board_change_listener`."""
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+
+class BoardEventSubscription:
+    """Wake-up handle for one stream, registered for a fixed set of keys."""
+
+    def __init__(self, bus: BoardEventBus, keys: Iterable[BoardEventKey]) -> None:
+        self._bus = bus
+        self.keys = frozenset(keys)
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        """Mark the subscription as having pending changes."""
+        self._event.set()
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Wait for a change notification or the fallback poll interval.
+
+        Returns `True` when woken by a notification. Notifications that arrive while
+        the caller is busy are kept, so the next call returns immediately.
+        """
+        resolved_timeout = settings.sse_fallback_poll_seconds if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=resolved_timeout)
+        except TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def close(self) -> None:
+        """Stop receiving notifications."""
+        self._bus.unsubscribe(self)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class BoardEventBus:
+    """Per-event-loop fan-out of board change notifications."""
+
+    def __init__(self, *, redis_url: str | None) -> None:
+        self._redis_url = redis_url
+        self._origin = uuid4().hex
+        self._subscriptions: dict[BoardEventKey, set[BoardEventSubscription]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._listener: asyncio.Task[None] | None = None
+        self._publisher: redis_async.Redis | None = None
+        self._redis_unavailable_until = 0.0
+
+    def subscribe(self, keys: Iterable[BoardEventKey]) -> BoardEventSubscription:
+        """Register a stream for notifications on the given keys."""
+        subscription = BoardEventSubscription(self, keys)
+        for key in subscription.keys:
+            self._subscriptions.setdefault(key, set()).add(subscription)
+        self.ensure_remote_listener()
+        return subscription
+
+    def unsubscribe(self, subscription: BoardEventSubscription) -> None:
+        """Remove a stream's registrations."""
+        for key in subscription.keys:
+            subscribers = self._subscriptions.get(key)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[key]
+
+    def notify_local(self, keys: Iterable[BoardEventKey]) -> None:
+        """Wake local subscribers and change listeners for the given keys."""
+        resolved = frozenset(keys)
+        for listener in list(_change_listeners):
+            try:
+                listener(resolved)
+            except Exception:
+                logger.exception("board_events.listener_failed")
+        for topic, scope_id in resolved:
+            if scope_id is None:
+                targets = chain.from_iterable(
+                    subscribers
+                    for (sub_topic, _), subscribers in self._subscriptions.items()
+                    if sub_topic == topic
+                )
+            else:
+                targets = chain(
+                    self._subscriptions.get((topic, scope_id), ()),
+                    self._subscriptions.get((topic, None), ()),
+                )
+            for subscription in targets:
+                subscription.notify()
+
+    def publish(self, keys: Iterable[BoardEventKey]) -> None:
+        """Notify local subscribers and forward the keys to other processes."""
+        resolved = set(keys)
+        if not resolved:
+            return
+        self.notify_local(resolved)
+        if self._redis_url is None or monotonic() < self._redis_unavailable_until:
+            return
+        message = json.dumps(
+            {
+                "origin": self._origin,
+                "keys": [
+                    [topic, str(scope_id) if scope_id else None] for topic, scope_id in resolved
+                ],
+            },
+        )
+        self._spawn(self._publish_remote(message))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _publish_remote(self, message: str) -> None:
+        try:
+            if self._publisher is None:
+                assert self._redis_url is not None
+                self._publisher = redis_async.Redis.from_url(self._redis_url)
+            await self._publisher.publish(REDIS_CHANNEL, message)
+        except (RedisError, OSError) as exc:
+            self._redis_unavailable_until = monotonic() + _REDIS_RETRY_SECONDS
+            logger.warning(
+                "board_events.redis.publish_failed error=%s retry_in_s=%s",
+                exc,
+                _REDIS_RETRY_SECONDS,
+            )
+
+    def _handle_remote(self, raw: bytes | str) -> None:
+        try:
+            data = json.loads(raw)
+            if data.get("origin") == self._origin:
+                return
+            keys: list[BoardEventKey] = [
+                (topic, UUID(scope_id) if scope_id else None) for topic, scope_id in data["keys"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            logger.warning("board_events.redis.invalid_message")
+            return
+        self.notify_local(keys)
+
+    def ensure_remote_listener(self) -> None:
+        """Start relaying notifications published by other processes, if enabled."""
+        if self._redis_url is None:
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        assert self._redis_url is not None
+        while True:
+            client = redis_async.Redis.from_url(self._redis_url)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(REDIS_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._handle_remote(message["data"])
+            except (RedisError, OSError) as exc:
+                logger.warning(
+                    "board_events.redis.listen_failed error=%s retry_in_s=%s",
+                    exc,
+                    _REDIS_RETRY_SECONDS,
+                )
+            finally:
+                await client.aclose()
+            await asyncio.sleep(_REDIS_RETRY_SECONDS)
+
+    async def close(self) -> None:
+        """Stop the Redis listener and any in-flight publishes."""
+        pending = list(self._tasks)
+        if self._listener is not None:
+            pending.append(self._listener)
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            with suppress(asyncio.CancelledError):
+                await task
+        if self._publisher is not None:
+            await self._publisher.aclose()
+            self._publisher = None
+
+
+_buses: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BoardEventBus] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def board_event_bus() -> BoardEventBus:
+    """Return the board event bus bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    bus = _buses.get(loop)
+    if bus is None:
+        redis_url = settings.rq_redis_url if settings.sse_event_bus_redis_enabled else None
+        bus = BoardEventBus(redis_url=redis_url)
+        _buses[loop] = bus
+    return bus
+
+
+async def close_board_event_bus() -> None:
+    """Shut down the board event bus for the running event loop."""
+    bus = _buses.pop(asyncio.get_running_loop(), None)
+    if bus is not None:
+        await bus.close()
+
+
+def _event_key(session: Session, obj: object) -> BoardEventKey | None:
+    if isinstance(obj, ActivityEvent | TagAssignment):
+        if obj.task_id is None:
+            return None
+        task = session.identity_map.get(identity_key(Task, obj.task_id))
+        board_id = task.board_id if isinstance(task, Task) else None
+        return ("tasks", board_id)
+    if isinstance(obj, Task | TaskDependency):
+        return ("tasks", obj.board_id)
+    if isinstance(obj, Tag):
+        # Tags are organization-scoped, so any board's task cards may show them.
+        return ("tasks", None)
+    if isinstance(obj, Board):
+        return ("boards", obj.id)
+    if isinstance(obj, Approval):
+        return ("approvals", obj.board_id)
+    if isinstance(obj, ApprovalTaskLink):
+        approval = session.identity_map.get(identity_key(Approval, obj.approval_id))
+        return ("approvals", approval.board_id if isinstance(approval, Approval) else None)
+    if isinstance(obj, BoardMemory):
+        return ("memory", obj.board_id)
+    if isinstance(obj, BoardGroupMemory):
+        return ("group_memory", obj.board_group_id)
+    if isinstance(obj, Agent) and obj.board_id is not None:
+        return ("agents", obj.board_id)
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_board_event_keys(session: Session, _flush_context: UOWTransaction) -> None:
+    pending: set[BoardEventKey] = session.info.setdefault(_PENDING_INFO_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        key = _event_key(session, obj)
+        if key is not None:
+            pending.add(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_board_event_keys(session: Session) -> None:
+    pending: set[BoardEventKey] | None = session.info.pop(_PENDING_INFO_KEY, None)
+    if not pending:
+        return
+    try:
+        bus = board_event_bus()
+    except RuntimeError:
+        # Committed outside an event loop (e.g. sync scripts); nobody to notify.
+        return
+    bus.publish(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_board_event_keys(session: Session) -> None:
+    session.info.pop(_PENDING_INFO_KEY, None)
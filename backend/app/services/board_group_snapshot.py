@@ -84,17 +84,39 @@ async def _ordered_tasks_for_boards(
     board_ids: list[UUID],
     *,
     include_done: bool,
+    per_board_limit: int,
 ) -> list[Task]:
-    """Return sorted tasks for boards, optionally excluding completed tasks."""
-    task_statement = select(Task).where(col(Task.board_id).in_(board_ids))
+    """Return the top `per_board_limit` tasks per board in snapshot order.
+
+    The limit is applied in SQL with a per-board `ROW_NUMBER()` window so only the
+    rows that end up in the snapshot are loaded (and later tag/agent-joined).
+    """
+    if per_board_limit <= 0:
+        return []
+    board_rank = (
+        func.row_number()
+        .over(
+            partition_by=col(Task.board_id),
+            order_by=(
+                _status_weight_expr().asc(),
+                _priority_weight_expr().asc(),
+                col(Task.updated_at).desc(),
+                col(Task.created_at).desc(),
+            ),
+        )
+        .label("board_rank")
+    )
+    filters: list[ColumnElement[bool]] = [col(Task.board_id).in_(board_ids)]
     if not include_done:
-        task_statement = task_statement.where(col(Task.status) != "done")
-    task_statement = task_statement.order_by(
-        col(Task.board_id).asc(),
-        _status_weight_expr().asc(),
-        _priority_weight_expr().asc(),
-        col(Task.updated_at).desc(),
-        col(Task.created_at).desc(),
+        filters.append(col(Task.status) != "done")
+    ranked = (
+        select(col(Task.id).label("task_id"), board_rank).where(*filters).subquery("ranked_tasks")
+    )
+    task_statement = (
+        select(Task)
+        .join(ranked, col(Task.id) == ranked.c.task_id)
+        .where(ranked.c.board_rank <= per_board_limit)
+        .order_by(col(Task.board_id).asc(), ranked.c.board_rank.asc())
     )
     return list(await session.exec(task_statement))
 
@@ -126,7 +148,7 @@ def _task_summaries_by_board(
     tag_state_by_task_id: dict[UUID, TagState],
     per_board_task_limit: int,
 ) -> dict[UUID, list[BoardGroupTaskSummary]]:
-    """Build limited per-board task summary lists."""
+    """Build per-board task summary lists, capped at `per_board_task_limit` each."""
     tasks_by_board: dict[UUID, list[BoardGroupTaskSummary]] = defaultdict(list)
     if per_board_task_limit <= 0:
         return tasks_by_board
@@ -189,6 +211,7 @@ async def build_group_snapshot(
         session,
         board_ids,
         include_done=include_done,
+        per_board_limit=per_board_task_limit,
     )
     agent_name_by_id = await _agent_names(session, tasks)
     tag_state_by_task_id = await load_tag_state(
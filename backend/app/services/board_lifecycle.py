@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 from fastapi import HTTPException, status
 from sqlmodel import col, select
 
+from app.core.agent_token_cache import agent_token_cache
 from app.db import crud
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
@@ -20,12 +21,14 @@ from app.models.board_memory import BoardMemory
 from app.models.board_onboarding import BoardOnboardingSession
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
+from app.models.metric_rollups import MetricRollup
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
 from app.models.tag_assignments import TagAssignment
 from app.models.task_custom_fields import BoardTaskCustomField, TaskCustomFieldValue
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.common import OkResponse
 from app.services.openclaw.gateway_resolver import gateway_client_config, require_gateway_for_board
@@ -103,6 +106,16 @@ async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
         TaskFingerprint,
         col(TaskFingerprint.board_id) == board.id,
     )
+    await crud.delete_where(
+        session,
+        MetricRollup,
+        col(MetricRollup.board_id) == board.id,
+    )
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.board_id) == board.id,
+    )
 
     # Approvals can reference tasks and agents, so delete before both.
     approval_ids = select(Approval.id).where(col(Approval.board_id) == board.id)
@@ -158,4 +171,5 @@ async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
 
     await session.delete(board)
     await session.commit()
+    agent_token_cache.evict_agents(agent.id for agent in agents)
     return OkResponse()
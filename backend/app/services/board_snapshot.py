@@ -1,12 +1,26 @@
-"""Helpers for assembling denormalized board snapshot response payloads."""
+"""Helpers for assembling denormalized board snapshot response payloads.
+
+Built snapshots are cached per board as encoded JSON plus an ETag. Task, approval,
+agent, memory and board writes drop the affected entries through board change
+notifications, which also arrive from other processes when the Redis event bus is
+enabled. A short TTL bounds staleness for changes the hooks cannot see, such as
+agents going offline by elapsed time or bulk SQL statements.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
 from typing import TYPE_CHECKING
 
 from sqlalchemy import func
 from sqlmodel import col, select
 
+from app.core.config import settings
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.board_memory import BoardMemory
@@ -16,6 +30,7 @@ from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
 from app.schemas.view_models import BoardSnapshot, TaskCardRead
 from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
+from app.services.board_events import add_board_change_listener, board_event_bus
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import TagState, load_tag_state
 from app.services.task_dependencies import (
@@ -30,6 +45,7 @@ if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.boards import Board
+    from app.services.board_events import BoardEventKey
 
 
 def _memory_to_read(memory: BoardMemory) -> BoardMemoryRead:
@@ -204,3 +220,133 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         chat_messages=chat_reads,
         pending_approvals_count=pending_approvals_count,
     )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBoardSnapshot:
+    """Encoded board snapshot body and its entity tag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def encode(cls, snapshot: BoardSnapshot) -> CachedBoardSnapshot:
+        """Serialize a snapshot once and derive a strong ETag from the bytes."""
+        body = snapshot.model_dump_json(by_alias=True).encode("utf-8")
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return cls(body=body, etag=f'"{digest}"')
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Return whether an `If-None-Match` header already names this snapshot."""
+        if not if_none_match:
+            return False
+        candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+        return "*" in candidates or self.etag in candidates
+
+
+class BoardSnapshotCache:
+    """Short-TTL LRU of encoded snapshots keyed by board id.
+
+    Each invalidation bumps a per-board generation, so a snapshot that was being
+    built while its board changed is discarded instead of cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_boards: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_boards = max_boards
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[CachedBoardSnapshot, float]] = OrderedDict()
+        self._generations: dict[UUID, int] = {}
+        self._epoch = 0
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether caching is active for the configured limits."""
+        return self._max_boards > 0 and self._ttl_seconds > 0
+
+    def generation(self, board_id: UUID) -> tuple[int, int]:
+        """Return the token a builder must hand back to `put`."""
+        with self._lock:
+            return (self._epoch, self._generations.get(board_id, 0))
+
+    def get(self, board_id: UUID) -> CachedBoardSnapshot | None:
+        """Return the cached snapshot for a board, or `None` on miss/expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(board_id)
+            if entry is None:
+                return None
+            cached, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[board_id]
+                return None
+            self._entries.move_to_end(board_id)
+            return cached
+
+    def put(
+        self,
+        board_id: UUID,
+        cached: CachedBoardSnapshot,
+        *,
+        generation: tuple[int, int],
+    ) -> None:
+        """Cache a snapshot unless its board changed since `generation` was taken."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != (self._epoch, self._generations.get(board_id, 0)):
+                return
+            self._entries[board_id] = (cached, self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(board_id)
+            while len(self._entries) > self._max_boards:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, board_id: UUID | None) -> None:
+        """Drop one board's snapshot, or every snapshot when `board_id` is `None`."""
+        with self._lock:
+            if board_id is None:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            self._generations[board_id] = self._generations.get(board_id, 0) + 1
+            self._entries.pop(board_id, None)
+
+    def invalidate_keys(self, keys: frozenset[BoardEventKey]) -> None:
+        """Apply board change notifications to the cache."""
+        for topic, scope_id in keys:
+            if topic != "group_memory":
+                self.invalidate(scope_id)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+board_snapshot_cache = BoardSnapshotCache(
+    max_boards=settings.board_snapshot_cache_max_boards,
+    ttl_seconds=settings.board_snapshot_cache_ttl_seconds,
+)
+add_board_change_listener(board_snapshot_cache.invalidate_keys)
+
+
+async def load_board_snapshot(session: AsyncSession, board: Board) -> CachedBoardSnapshot:
+    """Return the encoded snapshot for a board, building it on a cache miss."""
+    cached = board_snapshot_cache.get(board.id)
+    if cached is not None:
+        return cached
+    if board_snapshot_cache.enabled:
+        # Make sure writes committed by other processes reach the cache.
+        board_event_bus().ensure_remote_listener()
+    generation = board_snapshot_cache.generation(board.id)
+    cached = CachedBoardSnapshot.encode(await build_board_snapshot(session, board))
+    board_snapshot_cache.put(board.id, cached, generation=generation)
+    return cached
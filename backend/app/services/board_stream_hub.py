@@ -0,0 +1,272 @@
+"""Shared per-board SSE fan-out so every viewer of a board shares one poller.
+
+Each `(topic, board_id)` pair gets one hub while it has subscribers. The hub waits
+on the board event bus, runs the stream's fetch query once per change, encodes every
+payload to JSON once, and hands the pre-encoded messages to each subscriber's
+bounded buffer. The hub's poller stops when the last subscriber leaves.
+
+Subscribers whose `since` predates the hub's cursor, or who fall behind and
+overflow their buffer, re-sync with their own catch-up query from the last
+message they delivered. A slow client therefore never stalls the hub or other
+viewers, and it never silently skips events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.services.board_events import BoardEventTopic, board_event_bus
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from fastapi import Request
+
+logger = get_logger(__name__)
+
+SEEN_KEYS_MAX = 2000
+
+
+@dataclass(frozen=True, slots=True)
+class StreamMessage:
+    """One pre-encoded SSE message plus the metadata needed to route it."""
+
+    event: str
+    data: str
+    key: Hashable
+    cursor: datetime
+    is_chat: bool | None = None
+
+    def as_sse(self) -> dict[str, str]:
+        """Return the mapping expected by `EventSourceResponse`."""
+        return {"event": self.event, "data": self.data}
+
+
+StreamFetcher = Callable[[AsyncSession, UUID, datetime], Awaitable[list[StreamMessage]]]
+StreamFilter = Callable[[StreamMessage], bool]
+
+
+class _SeenKeys:
+    """Bounded set of recently delivered message keys."""
+
+    def __init__(self, max_items: int = SEEN_KEYS_MAX) -> None:
+        self._max_items = max_items
+        self._keys: set[Hashable] = set()
+        self._order: deque[Hashable] = deque()
+
+    def add(self, key: Hashable) -> bool:
+        """Record a key, returning `False` when it was already seen."""
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self._order.append(key)
+        if len(self._order) > self._max_items:
+            self._keys.discard(self._order.popleft())
+        return True
+
+
+class HubSubscriber:
+    """Bounded message buffer for one connected client."""
+
+    def __init__(self, *, max_buffered: int) -> None:
+        self._max_buffered = max_buffered
+        self._buffer: deque[StreamMessage] = deque()
+        self._ready = asyncio.Event()
+        self.lagged = False
+
+    def offer(self, messages: list[StreamMessage]) -> None:
+        """Buffer messages, or flag the subscriber for re-sync when it overflows."""
+        if self.lagged:
+            return
+        if len(self._buffer) + len(messages) > self._max_buffered:
+            self._buffer.clear()
+            self.lagged = True
+        else:
+            self._buffer.extend(messages)
+        self._ready.set()
+
+    async def drain(self, timeout: float | None = None) -> list[StreamMessage]:
+        """Wait for buffered messages (or a lag signal) and return them.
+
+        Returns an empty list after `timeout` so callers can check for disconnects.
+        """
+        resolved_timeout = settings.sse_fallback_poll_seconds if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=resolved_timeout)
+        except TimeoutError:
+            return []
+        self._ready.clear()
+        messages = list(self._buffer)
+        self._buffer.clear()
+        return messages
+
+    def reset(self) -> None:
+        """Clear lag state before the subscriber runs its own catch-up query."""
+        self._buffer.clear()
+        self._ready.clear()
+        self.lagged = False
+
+
+class BoardStreamHub:
+    """Single poller broadcasting one board stream to all of its subscribers."""
+
+    def __init__(
+        self,
+        registry: BoardStreamHubRegistry,
+        *,
+        topic: BoardEventTopic,
+        board_id: UUID,
+        fetch: StreamFetcher,
+    ) -> None:
+        self._registry = registry
+        self.topic = topic
+        self.board_id = board_id
+        self._fetch = fetch
+        self.cursor = utcnow()
+        self._seen = _SeenKeys()
+        self._subscribers: set[HubSubscriber] = set()
+        self._poller: asyncio.Task[None] | None = None
+        self.fetch_count = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of connected subscribers."""
+        return len(self._subscribers)
+
+    def subscribe(self) -> HubSubscriber:
+        """Attach a subscriber and start the poller if needed."""
+        subscriber = HubSubscriber(max_buffered=settings.sse_subscriber_buffer_max)
+        self._subscribers.add(subscriber)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._run())
+        return subscriber
+
+    def unsubscribe(self, subscriber: HubSubscriber) -> None:
+        """Detach a subscriber, stopping the poller after the last one leaves."""
+        self._subscribers.discard(subscriber)
+        if self._subscribers:
+            return
+        if self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+        self._registry.discard(self)
+
+    def _accept(self, messages: Iterable[StreamMessage]) -> list[StreamMessage]:
+        fresh: list[StreamMessage] = []
+        for message in messages:
+            if not self._seen.add(message.key):
+                continue
+            self.cursor = max(self.cursor, message.cursor)
+            fresh.append(message)
+        return fresh
+
+    async def _run(self) -> None:
+        with board_event_bus().subscribe([(self.topic, self.board_id)]) as changes:
+            while True:
+                try:
+                    async with async_session_maker() as session:
+                        messages = await self._fetch(session, self.board_id, self.cursor)
+                    self.fetch_count += 1
+                except Exception:
+                    logger.exception(
+                        "board_stream_hub.fetch_failed topic=%s board_id=%s",
+                        self.topic,
+                        self.board_id,
+                    )
+                    messages = []
+                fresh = self._accept(messages)
+                if fresh:
+                    for subscriber in list(self._subscribers):
+                        subscriber.offer(fresh)
+                await changes.wait()
+
+
+class BoardStreamHubRegistry:
+    """Per-event-loop registry of active board stream hubs."""
+
+    def __init__(self) -> None:
+        self._hubs: dict[tuple[BoardEventTopic, UUID], BoardStreamHub] = {}
+
+    def hub(self, topic: BoardEventTopic, board_id: UUID, fetch: StreamFetcher) -> BoardStreamHub:
+        """Return the hub for a board stream, creating it on first use."""
+        key = (topic, board_id)
+        hub = self._hubs.get(key)
+        if hub is None:
+            hub = BoardStreamHub(self, topic=topic, board_id=board_id, fetch=fetch)
+            self._hubs[key] = hub
+        return hub
+
+    def get(self, topic: BoardEventTopic, board_id: UUID) -> BoardStreamHub | None:
+        """Return the active hub for a board stream, if any."""
+        return self._hubs.get((topic, board_id))
+
+    def discard(self, hub: BoardStreamHub) -> None:
+        """Forget a hub that has no subscribers left."""
+        key = (hub.topic, hub.board_id)
+        if self._hubs.get(key) is hub:
+            del self._hubs[key]
+
+
+_registries: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BoardStreamHubRegistry] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def board_stream_hubs() -> BoardStreamHubRegistry:
+    """Return the hub registry bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    registry = _registries.get(loop)
+    if registry is None:
+        registry = BoardStreamHubRegistry()
+        _registries[loop] = registry
+    return registry
+
+
+async def stream_board_messages(
+    request: Request,
+    *,
+    topic: BoardEventTopic,
+    board_id: UUID,
+    since: datetime,
+    fetch: StreamFetcher,
+    include: StreamFilter | None = None,
+) -> AsyncIterator[dict[str, str]]:
+    """Yield SSE messages for one client from the shared hub for its board."""
+    hub = board_stream_hubs().hub(topic, board_id, fetch)
+    subscriber = hub.subscribe()
+    cursor = since
+    seen = _SeenKeys()
+    needs_catch_up = since < hub.cursor
+    try:
+        while True:
+            if await request.is_disconnected():
+                break
+            if needs_catch_up or subscriber.lagged:
+                subscriber.reset()
+                needs_catch_up = False
+                async with async_session_maker() as session:
+                    messages = await fetch(session, board_id, cursor)
+            else:
+                messages = await subscriber.drain()
+            for message in messages:
+                if include is not None and not include(message):
+                    continue
+                if not seen.add(message.key):
+                    continue
+                cursor = max(cursor, message.cursor)
+                yield message.as_sse()
+    finally:
+        hub.unsubscribe(subscriber)
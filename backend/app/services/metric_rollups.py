@@ -0,0 +1,216 @@
+"""Hourly per-board rollups that keep long-range dashboard metrics cheap to read.
+
+A background job in the queue worker folds closed hours of task and activity data
+into `metric_rollups` rows, one per (board, hour, metric), and advances a watermark
+so each hour is rolled up exactly once. Dashboard queries for day/week/month ranges
+sum these rows for everything before the watermark and only scan raw rows for the
+short tail after it; the tail reads the same transition log through
+`transition_metrics`, so nothing is counted differently across the watermark.
+
+Task metrics count `TaskStatusTransition` rows (see
+`app.services.task_status_transitions`): each move into a status adds one to that
+status in the hour it happened, and each move into review adds its cycle time. A
+task edited again later without a status change adds nothing, and a task moved
+back out of done keeps its earlier count, so every transition lands in exactly
+one hour. Rows committed more than `metrics_rollup_settle_seconds` late miss
+their hour.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlmodel import col, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.metric_rollups import MetricRollup, MetricRollupWatermark
+from app.models.task_status_transitions import TaskStatusTransition
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+ROLLUP_WATERMARK_NAME = "dashboard_hourly"
+ROLLUP_BATCH = timedelta(hours=24)
+ERROR_EVENT_SUFFIX = "failed"
+
+METRIC_TASKS_INBOX = "tasks_inbox"
+METRIC_TASKS_IN_PROGRESS = "tasks_in_progress"
+METRIC_TASKS_REVIEW = "tasks_review"
+METRIC_TASKS_DONE = "tasks_done"
+METRIC_CYCLE_TIME_HOURS = "cycle_time_hours"
+METRIC_ACTIVITY_EVENTS = "activity_events"
+METRIC_ERROR_EVENTS = "error_events"
+# Upper bounds (inclusive, in hours) of the cycle-time histogram; one overflow bucket follows.
+CYCLE_TIME_BUCKET_EDGES_HOURS = (0.5, 1, 2, 4, 8, 12, 24, 48, 72, 120, 168, 336, 720)
+STATUS_METRICS = {
+    "in_progress": METRIC_TASKS_IN_PROGRESS,
+    "review": METRIC_TASKS_REVIEW,
+    "done": METRIC_TASKS_DONE,
+}
+TRANSITION_METRICS = {"inbox": METRIC_TASKS_INBOX, **STATUS_METRICS}
+
+
+def cycle_time_bucket_metric(index: int) -> str:
+    """Return the metric name for one cycle-time histogram bucket."""
+    return f"cycle_time_bucket:{index}"
+
+
+def cycle_time_bucket_index(hours: float) -> int:
+    """Return the histogram bucket holding a cycle time."""
+    for index, edge in enumerate(CYCLE_TIME_BUCKET_EDGES_HOURS):
+        if hours <= edge:
+            return index
+    return len(CYCLE_TIME_BUCKET_EDGES_HOURS)
+
+
+def cycle_time_hours(changed_at: datetime, in_progress_at: datetime) -> float:
+    """Return the hours from starting a task to the transition that ended its cycle."""
+    return (changed_at - in_progress_at).total_seconds() / 3600.0
+
+
+def transition_metrics(
+    to_status: str,
+    changed_at: datetime,
+    in_progress_at: datetime | None,
+) -> Iterator[tuple[str, float]]:
+    """Yield the `(metric, value)` pairs one status transition adds to its hour.
+
+    Shared by the rollup job and the dashboard's live tail, so both sides of the
+    watermark count a transition the same way.
+    """
+    yield TRANSITION_METRICS[to_status], 1.0
+    if to_status == "review" and in_progress_at is not None:
+        hours = cycle_time_hours(changed_at, in_progress_at)
+        yield METRIC_CYCLE_TIME_HOURS, hours
+        yield cycle_time_bucket_metric(cycle_time_bucket_index(hours)), 1.0
+
+
+def median_from_histogram(counts: dict[int, float]) -> float | None:
+    """Estimate the median cycle time by interpolating inside its histogram bucket."""
+    total = sum(counts.values())
+    if total <= 0:
+        return None
+    target = total / 2
+    seen = 0.0
+    lower = 0.0
+    for index, edge in enumerate(CYCLE_TIME_BUCKET_EDGES_HOURS):
+        count = counts.get(index, 0.0)
+        if count > 0 and seen + count >= target:
+            return lower + (edge - lower) * ((target - seen) / count)
+        seen += count
+        lower = float(edge)
+    # The overflow bucket has no upper bound; report its lower edge.
+    return lower
+
+
+def hour_floor(value: datetime) -> datetime:
+    """Truncate a timestamp to the start of its hour."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+async def load_rollup_watermark(session: AsyncSession) -> datetime | None:
+    """Return the end of the rolled-up history, or `None` before the first run."""
+    watermark = await session.get(MetricRollupWatermark, ROLLUP_WATERMARK_NAME)
+    return watermark.rolled_until if watermark is not None else None
+
+
+async def _initial_watermark(session: AsyncSession, cutoff: datetime) -> datetime:
+    earliest_task = (await session.exec(select(func.min(col(Task.created_at))))).one()
+    earliest_event = (await session.exec(select(func.min(col(ActivityEvent.created_at))))).one()
+    candidates = [value for value in (earliest_task, earliest_event) if value is not None]
+    return hour_floor(min(candidates)) if candidates else cutoff
+
+
+async def _collect_rollups(
+    session: AsyncSession,
+    start: datetime,
+    end: datetime,
+) -> dict[tuple[UUID, datetime, str], float]:
+    totals: dict[tuple[UUID, datetime, str], float] = defaultdict(float)
+
+    transition_rows = await session.exec(
+        select(
+            col(TaskStatusTransition.board_id),
+            col(TaskStatusTransition.to_status),
+            col(TaskStatusTransition.created_at),
+            col(TaskStatusTransition.in_progress_at),
+        )
+        .where(col(TaskStatusTransition.to_status).in_(tuple(TRANSITION_METRICS)))
+        .where(col(TaskStatusTransition.created_at) >= start)
+        .where(col(TaskStatusTransition.created_at) < end),
+    )
+    for transition_board_id, to_status, changed_at, in_progress_at in transition_rows:
+        hour = hour_floor(changed_at)
+        for metric, value in transition_metrics(to_status, changed_at, in_progress_at):
+            totals[(transition_board_id, hour, metric)] += value
+
+    event_rows = await session.exec(
+        select(col(Task.board_id), col(ActivityEvent.created_at), col(ActivityEvent.event_type))
+        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
+        .where(col(ActivityEvent.created_at) >= start)
+        .where(col(ActivityEvent.created_at) < end),
+    )
+    for board_id, created_at, event_type in event_rows:
+        if board_id is None:
+            continue
+        hour = hour_floor(created_at)
+        totals[(board_id, hour, METRIC_ACTIVITY_EVENTS)] += 1
+        if event_type.endswith(ERROR_EVENT_SUFFIX):
+            totals[(board_id, hour, METRIC_ERROR_EVENTS)] += 1
+    return totals
+
+
+async def roll_up_metrics(session: AsyncSession, *, now: datetime | None = None) -> int:
+    """Roll up the next batch of closed hours and return how many hours were added.
+
+    Runs in one transaction that locks the watermark row, so concurrent workers
+    serialize and never roll up the same hour twice. Callers loop until this
+    returns `0` to catch up after downtime or on first run.
+    """
+    settle = timedelta(seconds=settings.metrics_rollup_settle_seconds)
+    cutoff = hour_floor((now or utcnow()) - settle)
+    watermark = (
+        await session.exec(
+            select(MetricRollupWatermark)
+            .where(col(MetricRollupWatermark.name) == ROLLUP_WATERMARK_NAME)
+            .with_for_update(),
+        )
+    ).first()
+    if watermark is None:
+        watermark = MetricRollupWatermark(
+            name=ROLLUP_WATERMARK_NAME,
+            rolled_until=await _initial_watermark(session, cutoff),
+        )
+        session.add(watermark)
+    start = watermark.rolled_until
+    if start >= cutoff:
+        await session.commit()
+        return 0
+    end = min(start + ROLLUP_BATCH, cutoff)
+    totals = await _collect_rollups(session, start, end)
+    session.add_all(
+        MetricRollup(board_id=board_id, hour=hour, metric=metric, value=value)
+        for (board_id, hour, metric), value in totals.items()
+    )
+    watermark.rolled_until = end
+    watermark.updated_at = utcnow()
+    session.add(watermark)
+    await session.commit()
+    hours = int((end - start) / timedelta(hours=1))
+    logger.info(
+        "metric_rollups.rolled_up",
+        extra={"start": start.isoformat(), "end": end.isoformat(), "rows": len(totals)},
+    )
+    return hours
@@ -19,7 +19,7 @@ from app.models.approvals import Approval
 from app.models.board_webhooks import BoardWebhook
 from app.models.gateways import Gateway
 from app.models.tasks import Task
-from app.schemas.gateways import GatewayTemplatesSyncResult
+from app.schemas.gateways import GatewayTemplatesSyncAgentResult, GatewayTemplatesSyncResult
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
 from app.services.openclaw.db_agent_state import (
     mark_provision_complete,
@@ -38,8 +38,11 @@ from app.services.openclaw.provisioning_db import (
 from app.services.openclaw.session_service import GatewayTemplateSyncQuery
 from app.services.openclaw.shared import GatewayAgentIdentity
 from app.services.organizations import get_org_owner_user
+from app.services.task_status_transitions import record_bulk_status_transitions
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.users import User
@@ -212,7 +215,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Organization owner not found (required for gateway agent USER.md rendering).",
             )
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(
             agent,
             action=action,
@@ -307,6 +310,13 @@ class GatewayAdminLifecycleService(OpenClawDBService):
 
     async def clear_agent_foreign_keys(self, *, agent_id: UUID) -> None:
         now = utcnow()
+        await record_bulk_status_transitions(
+            self.session,
+            col(Task.assigned_agent_id) == agent_id,
+            col(Task.status) == "in_progress",
+            to_status="inbox",
+            changed_at=now,
+        )
         await crud.update_where(
             self.session,
             Task,
@@ -357,6 +367,19 @@ class GatewayAdminLifecycleService(OpenClawDBService):
         query: GatewayTemplateSyncQuery,
         auth: AuthContext,
     ) -> GatewayTemplatesSyncResult:
+        async for update in self.iter_template_sync(gateway, query=query, auth=auth):
+            if isinstance(update, GatewayTemplatesSyncResult):
+                return update
+        msg = "Gateway template sync finished without a result"
+        raise RuntimeError(msg)
+
+    async def iter_template_sync(
+        self,
+        gateway: Gateway,
+        *,
+        query: GatewayTemplateSyncQuery,
+        auth: AuthContext,
+    ) -> AsyncIterator[GatewayTemplatesSyncAgentResult | GatewayTemplatesSyncResult]:
         self.logger.log(
             TRACE_LEVEL,
             "gateway.templates.sync.start gateway_id=%s include_main=%s",
@@ -364,7 +387,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
             query.include_main,
         )
         await self.ensure_gateway_agents_exist([gateway])
-        result = await OpenClawProvisioningService(self.session).sync_gateway_templates(
+        updates = OpenClawProvisioningService(self.session).iter_gateway_template_sync(
             gateway,
             GatewayTemplateSyncOptions(
                 user=auth.user,
@@ -377,5 +400,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
                 board_id=query.board_id,
             ),
         )
-        self.logger.info("gateway.templates.sync.success gateway_id=%s", gateway.id)
-        return result
+        async for update in updates:
+            if isinstance(update, GatewayTemplatesSyncResult):
+                self.logger.info("gateway.templates.sync.success gateway_id=%s", gateway.id)
+            yield update
@@ -0,0 +1,382 @@
+"""Outbound agent notifications: inline fan-out or a durable per-session outbox.
+
+`notify_agents` is the single entry point API handlers use for fire-and-forget
+messages to agent sessions (task assignment, comments and mentions, approval
+resolutions, chat, board-group changes). Delivery outcomes are written as the
+activity events attached to each `AgentNotification`.
+
+By default the batch is sent inline through `GatewayDispatchService`, concurrently
+and bounded per gateway. With `agent_notification_queue_enabled`, each message is
+appended to a Redis outbox list for its session key instead, and the first message
+into an idle outbox enqueues one `agent_notification_delivery` task. The worker:
+
+- moves up to `agent_notification_coalesce_max_messages` pending messages into an
+  in-flight list and sends them as one `chat.send`;
+- on gateway failure raises, so the queue worker retries the task with backoff;
+  in-flight messages stay put and are resent (with anything queued since) next time;
+- after the last retry records the failure activities and drops the messages, and
+  on any other error in the last attempt still releases the outbox;
+- when done, enqueues a follow-up task if more messages arrived meanwhile.
+
+Outbox entries carry board ids rather than gateway configs, so gateway tokens never
+land in Redis; the worker resolves configs when it sends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.models.boards import Board
+from app.services.activity_log import record_activity
+from app.services.openclaw.gateway_dispatch import (
+    AgentNotification,
+    GatewayDispatchService,
+    NotificationActivity,
+)
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.queue import QueuedTask, redis_client, redis_script, requeue_if_failed
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+AGENT_NOTIFICATION_TASK_TYPE = "agent_notification_delivery"
+COALESCED_MESSAGE_SEPARATOR = "\n\n---\n\n"
+
+# Appends one message to a session outbox. The first message into an idle outbox
+# sets the pending flag and enqueues the delivery task; later ones ride along.
+_PUSH_OUTBOX_LUA = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+if redis.call('SET', KEYS[2], '1', 'NX', 'EX', ARGV[3]) then
+    redis.call('LPUSH', KEYS[3], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Tops the in-flight list up to ARGV[1] messages from the outbox and returns it.
+_TAKE_OUTBOX_LUA = """
+local room = tonumber(ARGV[1]) - redis.call('LLEN', KEYS[2])
+if room > 0 then
+    local moved = redis.call('LRANGE', KEYS[1], 0, room - 1)
+    if #moved > 0 then
+        redis.call('RPUSH', KEYS[2], unpack(moved))
+        redis.call('LTRIM', KEYS[1], #moved, -1)
+    end
+end
+redis.call('EXPIRE', KEYS[3], ARGV[2])
+return redis.call('LRANGE', KEYS[2], 0, -1)
+"""
+
+# Clears the in-flight list, then either hands leftover outbox messages to a new
+# delivery task or releases the pending flag.
+_FINISH_OUTBOX_LUA = """
+redis.call('DEL', KEYS[2])
+if redis.call('LLEN', KEYS[1]) > 0 then
+    redis.call('LPUSH', KEYS[4], ARGV[1])
+    redis.call('EXPIRE', KEYS[3], ARGV[2])
+    return 1
+end
+redis.call('DEL', KEYS[3])
+return 0
+"""
+
+
+def _outbox_keys(session_key: str) -> list[str]:
+    prefix = f"{settings.rq_queue_name}:agent-outbox"
+    return [
+        f"{prefix}:{session_key}",
+        f"{prefix}:inflight:{session_key}",
+        f"{prefix}:pending:{session_key}",
+    ]
+
+
+def _pending_ttl_seconds() -> int:
+    # Outlives a task waiting out every retry, so a live task keeps its outbox.
+    return int(settings.rq_lease_visibility_seconds * (settings.rq_dispatch_max_retries + 2))
+
+
+def _delivery_task(session_key: str) -> QueuedTask:
+    return QueuedTask(
+        task_type=AGENT_NOTIFICATION_TASK_TYPE,
+        payload={"session_key": session_key},
+        created_at=utcnow(),
+    )
+
+
+def _encode_notification(notification: AgentNotification) -> str:
+    return json.dumps(
+        {
+            "board_id": str(notification.board_id),
+            "session_key": notification.session_key,
+            "agent_name": notification.agent_name,
+            "message": notification.message,
+            "deliver": notification.deliver,
+            "activities": [
+                {
+                    "sent_event_type": activity.sent_event_type,
+                    "sent_message": activity.sent_message,
+                    "failed_event_type": activity.failed_event_type,
+                    "failed_message": activity.failed_message,
+                    "agent_id": str(activity.agent_id) if activity.agent_id else None,
+                    "task_id": str(activity.task_id) if activity.task_id else None,
+                }
+                for activity in notification.activities
+            ],
+        },
+        sort_keys=True,
+    )
+
+
+def _decode_notification(raw: str | bytes) -> AgentNotification:
+    data: dict[str, Any] = json.loads(raw)
+    return AgentNotification(
+        board_id=UUID(data["board_id"]),
+        session_key=str(data["session_key"]),
+        agent_name=str(data["agent_name"]),
+        message=str(data["message"]),
+        deliver=bool(data.get("deliver", False)),
+        activities=tuple(
+            NotificationActivity(
+                sent_event_type=item["sent_event_type"],
+                sent_message=item["sent_message"],
+                failed_event_type=item["failed_event_type"],
+                failed_message=item["failed_message"],
+                agent_id=UUID(item["agent_id"]) if item.get("agent_id") else None,
+                task_id=UUID(item["task_id"]) if item.get("task_id") else None,
+            )
+            for item in data.get("activities", [])
+        ),
+    )
+
+
+def _push_outbox(notification: AgentNotification) -> bool:
+    client = redis_client(redis_url=settings.rq_redis_url)
+    push = redis_script(client, _PUSH_OUTBOX_LUA)
+    started = push(
+        keys=[*_outbox_keys(notification.session_key)[::2], settings.rq_queue_name],
+        args=[
+            _encode_notification(notification),
+            _delivery_task(notification.session_key).to_json(),
+            _pending_ttl_seconds(),
+        ],
+    )
+    return bool(started)
+
+
+def _take_outbox(session_key: str) -> list[str | bytes]:
+    client = redis_client(redis_url=settings.rq_redis_url)
+    take = redis_script(client, _TAKE_OUTBOX_LUA)
+    return cast(
+        list[str | bytes],
+        take(
+            keys=_outbox_keys(session_key),
+            args=[settings.agent_notification_coalesce_max_messages, _pending_ttl_seconds()],
+        ),
+    )
+
+
+def _finish_outbox(session_key: str) -> bool:
+    client = redis_client(redis_url=settings.rq_redis_url)
+    finish = redis_script(client, _FINISH_OUTBOX_LUA)
+    follow_up = finish(
+        keys=[*_outbox_keys(session_key), settings.rq_queue_name],
+        args=[_delivery_task(session_key).to_json(), _pending_ttl_seconds()],
+    )
+    return bool(follow_up)
+
+
+def enqueue_agent_notification(notification: AgentNotification) -> bool:
+    """Append a notification to its session outbox; return whether it was stored."""
+    try:
+        started = _push_outbox(notification)
+    except Exception as exc:
+        logger.warning(
+            "gateway.notify.enqueue_failed board_id=%s agent_name=%s error=%s",
+            notification.board_id,
+            notification.agent_name,
+            exc,
+        )
+        return False
+    logger.info(
+        "gateway.notify.enqueued board_id=%s agent_name=%s started_delivery=%s",
+        notification.board_id,
+        notification.agent_name,
+        started,
+    )
+    return True
+
+
+def _record_outcome(
+    session: AsyncSession,
+    notifications: Iterable[AgentNotification],
+    error: OpenClawGatewayError | None,
+) -> bool:
+    recorded = False
+    for notification in notifications:
+        for activity in notification.activities:
+            record_activity(
+                session,
+                event_type=(
+                    activity.sent_event_type if error is None else activity.failed_event_type
+                ),
+                message=(
+                    activity.sent_message
+                    if error is None
+                    else f"{activity.failed_message}: {error}"
+                ),
+                agent_id=activity.agent_id,
+                task_id=activity.task_id,
+            )
+            recorded = True
+    return recorded
+
+
+async def _send_batch(
+    dispatch: GatewayDispatchService,
+    notifications: Sequence[AgentNotification],
+    boards: Iterable[Board],
+) -> None:
+    board_ids = {item.board_id for item in notifications}
+    configs = await dispatch.gateway_configs_for_boards(
+        board for board in boards if board.id in board_ids
+    )
+    deliverable = [item for item in notifications if item.board_id in configs]
+    results = await dispatch.send_agent_notifications(deliverable, configs=configs)
+    recorded = False
+    for notification, error in zip(deliverable, results, strict=True):
+        recorded = _record_outcome(dispatch.session, [notification], error) or recorded
+    if recorded:
+        await dispatch.session.commit()
+    logger.info(
+        "gateway.notify.batch_complete total=%s sent=%s failed=%s skipped_no_gateway=%s",
+        len(notifications),
+        sum(1 for error in results if error is None),
+        sum(1 for error in results if error is not None),
+        len(notifications) - len(deliverable),
+    )
+
+
+async def notify_agents(
+    session: AsyncSession,
+    notifications: Sequence[AgentNotification],
+    *,
+    boards: Iterable[Board],
+) -> None:
+    """Deliver notifications to agent sessions, via the session outboxes when enabled.
+
+    Messages that cannot be queued (for example while Redis is unreachable) are
+    sent inline instead.
+    """
+    if not notifications:
+        return
+    inline = list(notifications)
+    if settings.agent_notification_queue_enabled:
+        inline = [item for item in notifications if not enqueue_agent_notification(item)]
+        if not inline:
+            return
+    await _send_batch(GatewayDispatchService(session), inline, boards)
+
+
+def coalesce_messages(notifications: Sequence[AgentNotification]) -> str:
+    """Join pending messages for one session into a single chat message."""
+    if len(notifications) == 1:
+        return notifications[0].message
+    return f"{len(notifications)} NOTIFICATIONS{COALESCED_MESSAGE_SEPARATOR}" + (
+        COALESCED_MESSAGE_SEPARATOR.join(item.message for item in notifications)
+    )
+
+
+async def _deliver_outbox(
+    session_key: str,
+    notifications: Sequence[AgentNotification],
+    *,
+    final_attempt: bool,
+) -> None:
+    latest = notifications[-1]
+    async with async_session_maker() as session:
+        dispatch = GatewayDispatchService(session)
+        board = await Board.objects.by_id(latest.board_id).first(session)
+        config = await dispatch.optional_gateway_config_for_board(board) if board else None
+        if config is None:
+            logger.warning(
+                "gateway.notify.outbox_dropped session_key=%s messages=%s reason=no_gateway_config",
+                session_key,
+                len(notifications),
+            )
+            return
+        try:
+            await dispatch.send_agent_message(
+                session_key=session_key,
+                config=config,
+                agent_name=latest.agent_name,
+                message=coalesce_messages(notifications),
+                deliver=any(item.deliver for item in notifications),
+            )
+        except OpenClawGatewayError as exc:
+            if not final_attempt:
+                raise
+            logger.warning(
+                "gateway.notify.outbox_failed session_key=%s messages=%s error=%s",
+                session_key,
+                len(notifications),
+                exc,
+            )
+            error: OpenClawGatewayError | None = exc
+        else:
+            error = None
+        if _record_outcome(session, notifications, error):
+            await session.commit()
+
+
+async def process_agent_notification_task(task: QueuedTask) -> None:
+    """Queue worker handler: send a session's pending notifications as one message.
+
+    Gateway errors propagate so the worker retries with backoff; the in-flight
+    messages stay in Redis until they are sent or the final attempt fails. Any
+    error on the final attempt still releases the outbox before propagating, so
+    the pending flag cannot outlive the task and stall later notifications.
+    """
+    session_key = str(task.payload["session_key"])
+    final_attempt = task.attempts >= settings.rq_dispatch_max_retries
+    try:
+        raw_messages = await asyncio.to_thread(_take_outbox, session_key)
+        notifications = [_decode_notification(raw) for raw in raw_messages]
+        if notifications:
+            await _deliver_outbox(session_key, notifications, final_attempt=final_attempt)
+            logger.info(
+                "gateway.notify.outbox_delivered session_key=%s messages=%s attempt=%s",
+                session_key,
+                len(notifications),
+                task.attempts,
+            )
+    except Exception:
+        if final_attempt:
+            logger.warning(
+                "gateway.notify.outbox_abandoned session_key=%s attempt=%s",
+                session_key,
+                task.attempts,
+            )
+            await asyncio.to_thread(_finish_outbox, session_key)
+        raise
+    await asyncio.to_thread(_finish_outbox, session_key)
+
+
+def requeue_agent_notification_task(task: QueuedTask, *, delay_seconds: float = 0) -> bool:
+    """Retry a failed delivery task with capped attempts."""
+    return requeue_if_failed(
+        task,
+        settings.rq_queue_name,
+        max_retries=settings.rq_dispatch_max_retries,
+        redis_url=settings.rq_redis_url,
+        delay_seconds=delay_seconds,
+    )
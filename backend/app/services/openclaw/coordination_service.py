@@ -38,6 +38,7 @@ from app.services.openclaw.gateway_resolver import gateway_client_config
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError, openclaw_call
 from app.services.openclaw.internal.agent_key import agent_key
+from app.services.openclaw.internal.fanout import fan_out
 from app.services.openclaw.internal.retry import with_coordination_gateway_retry
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning_db import (
@@ -520,13 +521,12 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             main_agent_name=main_agent.name if main_agent else None,
         )
 
-    async def _ensure_and_message_board_lead(
+    async def _ensure_board_lead(
         self,
         *,
         gateway: Gateway,
         config: GatewayClientConfig,
         board: Board,
-        message: str,
     ) -> tuple[Agent, bool]:
         lead, lead_created = await OpenClawProvisioningService(
             self.session
@@ -544,6 +544,21 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Lead agent has no session key",
             )
+        return lead, lead_created
+
+    async def _ensure_and_message_board_lead(
+        self,
+        *,
+        gateway: Gateway,
+        config: GatewayClientConfig,
+        board: Board,
+        message: str,
+    ) -> tuple[Agent, bool]:
+        lead, lead_created = await self._ensure_board_lead(
+            gateway=gateway,
+            config=config,
+            board=board,
+        )
         await self._dispatch_gateway_message(
             session_key=lead.openclaw_session_id or "",
             config=config,
@@ -643,6 +658,17 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             lead_created=lead_created,
         )
 
+    @staticmethod
+    def _lead_broadcast_failure(
+        board: Board,
+        exc: Exception,
+    ) -> GatewayLeadBroadcastBoardResult:
+        return GatewayLeadBroadcastBoardResult(
+            board_id=board.id,
+            ok=False,
+            error=map_gateway_error_message(GatewayOperation.LEAD_BROADCAST_DISPATCH, exc),
+        )
+
     async def broadcast_gateway_lead_message(
         self,
         *,
@@ -668,11 +694,24 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             statement = statement.where(col(Board.id).in_(payload.board_ids))
         boards = list(await self.session.exec(statement))
 
-        results: list[GatewayLeadBroadcastBoardResult] = []
-        sent = 0
-        failed = 0
-
+        # Lead records are ensured one board at a time on the shared DB session; only
+        # the gateway dispatches, which do not touch the session, run concurrently.
+        results_by_board: dict[UUID, GatewayLeadBroadcastBoardResult] = {}
+        leads: dict[UUID, Agent] = {}
         for board in boards:
+            try:
+                lead, _lead_created = await self._ensure_board_lead(
+                    gateway=gateway,
+                    config=config,
+                    board=board,
+                )
+            except (HTTPException, OpenClawGatewayError, TimeoutError, ValueError) as exc:
+                results_by_board[board.id] = self._lead_broadcast_failure(board, exc)
+            else:
+                leads[board.id] = lead
+
+        async def _send(board: Board) -> GatewayLeadBroadcastBoardResult:
+            lead = leads[board.id]
             message = self._build_gateway_lead_message(
                 board=board,
                 actor_agent_name=actor_agent.name,
@@ -683,30 +722,31 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
                 reply_source=payload.reply_source,
             )
             try:
-                lead, _lead_created = await self._ensure_and_message_board_lead(
-                    gateway=gateway,
+                await self._dispatch_gateway_message(
+                    session_key=lead.openclaw_session_id or "",
                     config=config,
-                    board=board,
+                    agent_name=lead.name,
                     message=message,
+                    deliver=False,
                 )
-                board_result = GatewayLeadBroadcastBoardResult(
-                    board_id=board.id,
-                    lead_agent_id=lead.id,
-                    lead_agent_name=lead.name,
-                    ok=True,
-                )
-                sent += 1
             except (HTTPException, OpenClawGatewayError, TimeoutError, ValueError) as exc:
-                board_result = GatewayLeadBroadcastBoardResult(
-                    board_id=board.id,
-                    ok=False,
-                    error=map_gateway_error_message(
-                        GatewayOperation.LEAD_BROADCAST_DISPATCH,
-                        exc,
-                    ),
-                )
-                failed += 1
-            results.append(board_result)
+                return self._lead_broadcast_failure(board, exc)
+            return GatewayLeadBroadcastBoardResult(
+                board_id=board.id,
+                lead_agent_id=lead.id,
+                lead_agent_name=lead.name,
+                ok=True,
+            )
+
+        dispatched = await fan_out(
+            [board for board in boards if board.id in leads],
+            _send,
+            limit=settings.gateway_lead_broadcast_concurrency,
+        )
+        results_by_board.update((result.board_id, result) for result in dispatched)
+        results = [results_by_board[board.id] for board in boards]
+        sent = sum(1 for result in results if result.ok)
+        failed = len(results) - sent
 
         record_activity(
             self.session,
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 from typing import Literal
 
-from app.core.agent_tokens import generate_agent_token, hash_agent_token
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import (
+    agent_token_fingerprint,
+    generate_agent_token,
+    hash_agent_token_async,
+)
 from app.core.time import utcnow
 from app.models.agents import Agent
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
@@ -17,11 +22,13 @@ def ensure_heartbeat_config(agent: Agent) -> None:
         agent.heartbeat_config = DEFAULT_HEARTBEAT_CONFIG.copy()
 
 
-def mint_agent_token(agent: Agent) -> str:
-    """Generate a new raw token and update the agent's token hash."""
+async def mint_agent_token(agent: Agent) -> str:
+    """Generate a new raw token and update the agent's token hash and fingerprint."""
 
+    agent_token_cache.evict_agent(agent.id)
     raw_token = generate_agent_token()
-    agent.agent_token_hash = hash_agent_token(raw_token)
+    agent.agent_token_hash = await hash_agent_token_async(raw_token)
+    agent.agent_token_fingerprint = agent_token_fingerprint(raw_token)
     return raw_token
 
 
@@ -6,19 +6,49 @@ directly orchestrate gateway RPC calls.
 
 from __future__ import annotations
 
-from uuid import uuid4
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from uuid import UUID, uuid4
 
+from app.core.config import settings
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.services.openclaw.db_service import OpenClawDBService
 from app.services.openclaw.gateway_resolver import (
+    cached_gateway_config_for_board,
     gateway_client_config,
-    get_gateway_for_board,
-    optional_gateway_client_config,
     require_gateway_for_board,
 )
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError, ensure_session, send_message
+from app.services.openclaw.internal.fanout import fan_out
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationActivity:
+    """Activity event recorded once a notification is sent or finally fails.
+
+    Failures are recorded as `"{failed_message}: {error}"`.
+    """
+
+    sent_event_type: str
+    sent_message: str
+    failed_event_type: str
+    failed_message: str
+    agent_id: UUID | None = None
+    task_id: UUID | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AgentNotification:
+    """One message for an agent session, addressed through its board's gateway."""
+
+    board_id: UUID
+    session_key: str
+    agent_name: str
+    message: str
+    deliver: bool = False
+    activities: tuple[NotificationActivity, ...] = ()
 
 
 class GatewayDispatchService(OpenClawDBService):
@@ -28,8 +58,7 @@ class GatewayDispatchService(OpenClawDBService):
         self,
         board: Board,
     ) -> GatewayClientConfig | None:
-        gateway = await get_gateway_for_board(self.session, board)
-        return optional_gateway_client_config(gateway)
+        return await cached_gateway_config_for_board(self.session, board)
 
     async def require_gateway_config_for_board(
         self,
@@ -71,6 +100,57 @@ class GatewayDispatchService(OpenClawDBService):
             return exc
         return None
 
+    async def gateway_configs_for_boards(
+        self,
+        boards: Iterable[Board],
+    ) -> dict[UUID, GatewayClientConfig]:
+        """Resolve gateway configs once per distinct board, skipping unconfigured boards."""
+        configs: dict[UUID, GatewayClientConfig] = {}
+        seen: set[UUID] = set()
+        for board in boards:
+            if board.id in seen:
+                continue
+            seen.add(board.id)
+            config = await self.optional_gateway_config_for_board(board)
+            if config is not None:
+                configs[board.id] = config
+        return configs
+
+    async def send_agent_notifications(
+        self,
+        notifications: Sequence[AgentNotification],
+        *,
+        configs: Mapping[UUID, GatewayClientConfig],
+    ) -> list[OpenClawGatewayError | None]:
+        """Send notifications concurrently, bounded per gateway; results follow input order.
+
+        Every notification's board must have an entry in `configs`.
+        """
+
+        async def _send(notification: AgentNotification) -> OpenClawGatewayError | None:
+            error = await self.try_send_agent_message(
+                session_key=notification.session_key,
+                config=configs[notification.board_id],
+                agent_name=notification.agent_name,
+                message=notification.message,
+                deliver=notification.deliver,
+            )
+            if error is not None:
+                self.logger.warning(
+                    "gateway.notify.failed board_id=%s agent_name=%s error=%s",
+                    notification.board_id,
+                    notification.agent_name,
+                    error,
+                )
+            return error
+
+        return await fan_out(
+            notifications,
+            _send,
+            limit=settings.agent_notification_gateway_concurrency,
+            key=lambda notification: configs[notification.board_id],
+        )
+
     @staticmethod
     def resolve_trace_id(correlation_id: str | None, *, prefix: str) -> str:
         normalized = (correlation_id or "").strip()
@@ -7,14 +7,23 @@ Goals:
 - Centralize "board -> gateway row" resolution and defensive org checks.
 - Centralize construction of `GatewayConfig` objects used by gateway RPC calls.
 - Keep call-sites thin and avoid re-implementing the same validation rules.
+
+Gateway rows are loaded with `session.get`, so repeated lookups within one request
+session reuse the identity map instead of re-querying. Notification paths resolve
+configs through a short-lived per-process cache that the gateway update/delete
+routes invalidate.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
@@ -23,6 +32,18 @@ if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedGatewayConfig:
+    organization_id: UUID
+    config: GatewayClientConfig | None
+
+
+_gateway_configs: TTLCache[UUID, _CachedGatewayConfig] = TTLCache(
+    max_entries=settings.gateway_config_cache_max_entries,
+    ttl_seconds=settings.gateway_config_cache_ttl_seconds,
+)
+
+
 def gateway_client_config(gateway: Gateway) -> GatewayClientConfig:
     """Build a gateway RPC config from a Gateway model, requiring a URL."""
     url = (gateway.url or "").strip()
@@ -64,7 +85,7 @@ async def get_gateway_for_board(
     """Return the gateway for a board when present and valid; otherwise return None."""
     if board.gateway_id is None:
         return None
-    gateway = await Gateway.objects.by_id(board.gateway_id).first(session)
+    gateway = await session.get(Gateway, board.gateway_id)
     if gateway is None:
         return None
     # Defensive guard: boards and gateways are tenant-scoped; reject cross-org mismatches.
@@ -94,3 +115,31 @@ async def require_gateway_for_board(
     if require_workspace_root:
         require_gateway_workspace_root(gateway)
     return gateway
+
+
+async def cached_gateway_config_for_board(
+    session: AsyncSession,
+    board: Board,
+) -> GatewayClientConfig | None:
+    """Return a board's gateway RPC config, reusing recently resolved gateways."""
+    if board.gateway_id is None:
+        return None
+    cached = _gateway_configs.get(board.gateway_id)
+    if cached is None:
+        gateway = await session.get(Gateway, board.gateway_id)
+        if gateway is None:
+            return None
+        cached = _CachedGatewayConfig(
+            organization_id=gateway.organization_id,
+            config=optional_gateway_client_config(gateway),
+        )
+        _gateway_configs.put(gateway.id, cached)
+    # Defensive guard: boards and gateways are tenant-scoped; reject cross-org mismatches.
+    if cached.organization_id != board.organization_id:
+        return None
+    return cached.config
+
+
+def invalidate_gateway_config(gateway_id: UUID) -> None:
+    """Drop a cached gateway config after the gateway row changes or is deleted."""
+    _gateway_configs.pop(gateway_id)
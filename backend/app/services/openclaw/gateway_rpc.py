@@ -3,14 +3,21 @@
 This is the low-level, DB-free interface for talking to the OpenClaw gateway.
 Keep gateway RPC protocol details and client helpers here so OpenClaw services
 operate within a single scope (no `app.integrations.*` plumbing).
+
+Calls are routed through a per-gateway pool of long-lived, authenticated
+websocket connections. Each connection multiplexes concurrent requests by
+request id, so a burst of RPCs pays for one `connect` handshake instead of one
+per call.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import weakref
+from contextlib import suppress
 from dataclasses import dataclass
-from time import perf_counter
+from time import monotonic, perf_counter
 from typing import Any
 from urllib.parse import urlencode, urlparse, urlunparse
 from uuid import uuid4
@@ -18,6 +25,7 @@ from uuid import uuid4
 import websockets
 from websockets.exceptions import WebSocketException
 
+from app.core.config import settings
 from app.core.logging import TRACE_LEVEL, get_logger
 
 PROTOCOL_VERSION = 3
@@ -179,6 +187,19 @@ def _redacted_url_for_log(raw_url: str) -> str:
     return str(urlunparse(parsed._replace(query="", fragment="")))
 
 
+def _response_payload(data: dict[str, Any]) -> object:
+    if data.get("type") == "res":
+        ok = data.get("ok")
+        if ok is not None and not ok:
+            error = data.get("error", {}).get("message", "Gateway error")
+            raise OpenClawGatewayError(error)
+        return data.get("payload")
+    if data.get("error"):
+        message = data["error"].get("message", "Gateway error")
+        raise OpenClawGatewayError(message)
+    return data.get("result")
+
+
 async def _await_response(
     ws: websockets.ClientConnection,
     request_id: str,
@@ -192,26 +213,11 @@ async def _await_response(
             request_id,
             data.get("type"),
         )
-
-        if data.get("type") == "res" and data.get("id") == request_id:
-            ok = data.get("ok")
-            if ok is not None and not ok:
-                error = data.get("error", {}).get("message", "Gateway error")
-                raise OpenClawGatewayError(error)
-            return data.get("payload")
-
         if data.get("id") == request_id:
-            if data.get("error"):
-                message = data["error"].get("message", "Gateway error")
-                raise OpenClawGatewayError(message)
-            return data.get("result")
+            return _response_payload(data)
 
 
-async def _send_request(
-    ws: websockets.ClientConnection,
-    method: str,
-    params: dict[str, Any] | None,
-) -> object:
+def _request_message(method: str, params: dict[str, Any] | None) -> tuple[str, str]:
     request_id = str(uuid4())
     message = {
         "type": "req",
@@ -226,7 +232,16 @@ async def _send_request(
         request_id,
         sorted((params or {}).keys()),
     )
-    await ws.send(json.dumps(message))
+    return request_id, json.dumps(message)
+
+
+async def _send_request(
+    ws: websockets.ClientConnection,
+    method: str,
+    params: dict[str, Any] | None,
+) -> object:
+    request_id, message = _request_message(method, params)
+    await ws.send(message)
     return await _await_response(ws, request_id)
 
 
@@ -274,6 +289,282 @@ async def _ensure_connected(
     await _await_response(ws, connect_id)
 
 
+async def _open_connection(
+    config: GatewayConfig,
+    *,
+    ping_interval: float | None = None,
+) -> websockets.ClientConnection:
+    """Open a websocket and complete the gateway `connect` handshake."""
+    ws = await websockets.connect(_build_gateway_url(config), ping_interval=ping_interval)
+    try:
+        first_message = None
+        try:
+            first_message = await asyncio.wait_for(ws.recv(), timeout=2)
+        except TimeoutError:
+            first_message = None
+        await _ensure_connected(ws, first_message, config)
+    except BaseException:
+        await ws.close()
+        raise
+    return ws
+
+
+class _RequestNotSentError(Exception):
+    """Raised when a pooled connection died before a request was written."""
+
+
+class _PooledGatewayConnection:
+    """One authenticated websocket that multiplexes requests by request id."""
+
+    def __init__(
+        self,
+        ws: websockets.ClientConnection,
+        *,
+        max_in_flight: int,
+        request_timeout: float | None = None,
+    ) -> None:
+        self._ws = ws
+        self._pending: dict[str, asyncio.Future[object]] = {}
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._max_in_flight = max_in_flight
+        self._request_timeout = request_timeout
+        self.in_flight = 0
+        self.last_used_at = monotonic()
+        self._reader = asyncio.create_task(self._read_loop())
+
+    @property
+    def is_open(self) -> bool:
+        return not self._reader.done()
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.in_flight < self._max_in_flight
+
+    async def _read_loop(self) -> None:
+        error = OpenClawGatewayError("Gateway connection closed.")
+        try:
+            async for raw in self._ws:
+                data = json.loads(raw)
+                if not isinstance(data, dict):
+                    continue
+                request_id = data.get("id")
+                logger.log(
+                    TRACE_LEVEL,
+                    "gateway.rpc.recv request_id=%s type=%s",
+                    request_id,
+                    data.get("type"),
+                )
+                future = self._pending.get(request_id) if isinstance(request_id, str) else None
+                if future is None or future.done():
+                    continue
+                try:
+                    future.set_result(_response_payload(data))
+                except OpenClawGatewayError as exc:
+                    future.set_exception(exc)
+        except (WebSocketException, OSError, ValueError) as exc:
+            error = OpenClawGatewayError(str(exc))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            with suppress(WebSocketException, OSError):
+                await self._ws.close()
+
+    async def call(self, method: str, params: dict[str, Any] | None) -> object:
+        self.in_flight += 1
+        try:
+            async with self._slots:
+                if not self.is_open:
+                    raise _RequestNotSentError
+                request_id, message = _request_message(method, params)
+                future: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+                self._pending[request_id] = future
+                try:
+                    try:
+                        await self._ws.send(message)
+                    except (WebSocketException, OSError) as exc:
+                        raise _RequestNotSentError from exc
+                    try:
+                        return await asyncio.wait_for(future, timeout=self._request_timeout)
+                    except TimeoutError as exc:
+                        # Frees the slot; a late response for this id is ignored.
+                        raise OpenClawGatewayError(
+                            f"Gateway request {method} timed out after {self._request_timeout}s.",
+                        ) from exc
+                finally:
+                    self._pending.pop(request_id, None)
+                    if future.done() and not future.cancelled():
+                        # Mark a reader-side failure as retrieved when we never awaited it.
+                        future.exception()
+        finally:
+            self.in_flight -= 1
+            self.last_used_at = monotonic()
+
+    async def close(self) -> None:
+        with suppress(WebSocketException, OSError):
+            await self._ws.close()
+        with suppress(asyncio.CancelledError):
+            await self._reader
+
+
+class GatewayConnectionPool:
+    """Per-gateway pool of long-lived, multiplexed gateway connections."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int,
+        max_in_flight: int,
+        idle_seconds: float,
+        ping_interval: float | None,
+        request_timeout: float | None = None,
+    ) -> None:
+        self._max_connections = max_connections
+        self._max_in_flight = max_in_flight
+        self._idle_seconds = idle_seconds
+        self._ping_interval = ping_interval
+        self._request_timeout = request_timeout
+        self._connections: dict[tuple[str, str | None], list[_PooledGatewayConnection]] = {}
+        self._open_locks: dict[tuple[str, str | None], asyncio.Lock] = {}
+
+    async def call(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        config: GatewayConfig,
+    ) -> object:
+        """Send one request over a pooled connection, reconnecting once if it died."""
+        key = (config.url, config.token)
+        connection = await self._acquire(key, config)
+        try:
+            return await connection.call(method, params)
+        except _RequestNotSentError:
+            self._discard(key, connection)
+            logger.info(
+                "gateway.rpc.pool.reconnect gateway_url=%s",
+                _redacted_url_for_log(config.url),
+            )
+        connection = await self._acquire(key, config)
+        try:
+            return await connection.call(method, params)
+        except _RequestNotSentError as exc:
+            self._discard(key, connection)
+            message = "Gateway connection closed before the request was sent."
+            raise OpenClawGatewayError(message) from exc
+
+    def _live_connections(self, key: tuple[str, str | None]) -> list[_PooledGatewayConnection]:
+        # Prune in place: a concurrent opener may hold a reference to this list.
+        connections = self._connections.setdefault(key, [])
+        connections[:] = [conn for conn in connections if conn.is_open]
+        return connections
+
+    async def _acquire(
+        self,
+        key: tuple[str, str | None],
+        config: GatewayConfig,
+    ) -> _PooledGatewayConnection:
+        await self._evict_idle()
+        available = [conn for conn in self._live_connections(key) if conn.has_capacity]
+        if available:
+            return min(available, key=lambda conn: conn.in_flight)
+        lock = self._open_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            connections = self._live_connections(key)
+            available = [conn for conn in connections if conn.has_capacity]
+            if available:
+                return min(available, key=lambda conn: conn.in_flight)
+            if len(connections) < self._max_connections:
+                ws = await _open_connection(config, ping_interval=self._ping_interval)
+                connection = _PooledGatewayConnection(
+                    ws,
+                    max_in_flight=self._max_in_flight,
+                    request_timeout=self._request_timeout,
+                )
+                connections.append(connection)
+                logger.debug(
+                    "gateway.rpc.pool.connected gateway_url=%s connections=%s",
+                    _redacted_url_for_log(config.url),
+                    len(connections),
+                )
+                return connection
+        # Every connection is saturated; queue on the least loaded one.
+        return min(connections, key=lambda conn: conn.in_flight)
+
+    def _discard(self, key: tuple[str, str | None], connection: _PooledGatewayConnection) -> None:
+        connections = self._connections.get(key, [])
+        if connection in connections:
+            connections.remove(connection)
+
+    async def _evict_idle(self) -> None:
+        now = monotonic()
+        stale: list[_PooledGatewayConnection] = []
+        for connections in self._connections.values():
+            keep: list[_PooledGatewayConnection] = []
+            for conn in connections:
+                if not conn.is_open:
+                    continue
+                if conn.in_flight == 0 and now - conn.last_used_at >= self._idle_seconds:
+                    stale.append(conn)
+                    continue
+                keep.append(conn)
+            connections[:] = keep
+        if stale:
+            logger.debug("gateway.rpc.pool.evict_idle count=%s", len(stale))
+            await asyncio.gather(*(conn.close() for conn in stale))
+
+    def connection_count(self, config: GatewayConfig) -> int:
+        """Return the number of live pooled connections for a gateway."""
+        return len(self._live_connections((config.url, config.token)))
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        connections = [conn for group in self._connections.values() for conn in group]
+        self._connections.clear()
+        await asyncio.gather(*(conn.close() for conn in connections))
+
+
+_gateway_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GatewayConnectionPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def gateway_connection_pool() -> GatewayConnectionPool:
+    """Return the gateway connection pool bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _gateway_pools.get(loop)
+    if pool is None:
+        pool = GatewayConnectionPool(
+            max_connections=settings.gateway_rpc_pool_max_connections,
+            max_in_flight=settings.gateway_rpc_pool_max_in_flight,
+            idle_seconds=settings.gateway_rpc_pool_idle_seconds,
+            ping_interval=settings.gateway_rpc_pool_ping_interval_seconds or None,
+            request_timeout=settings.gateway_rpc_request_timeout_seconds or None,
+        )
+        _gateway_pools[loop] = pool
+    return pool
+
+
+async def close_gateway_connections() -> None:
+    """Close pooled gateway connections for the running event loop."""
+    pool = _gateway_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+async def _call_unpooled(
+    method: str,
+    params: dict[str, Any] | None,
+    *,
+    config: GatewayConfig,
+) -> object:
+    ws = await _open_connection(config)
+    try:
+        return await _send_request(ws, method, params)
+    finally:
+        await ws.close()
+
+
 async def openclaw_call(
     method: str,
     params: dict[str, Any] | None = None,
@@ -289,20 +580,16 @@ async def openclaw_call(
         _redacted_url_for_log(gateway_url),
     )
     try:
-        async with websockets.connect(gateway_url, ping_interval=None) as ws:
-            first_message = None
-            try:
-                first_message = await asyncio.wait_for(ws.recv(), timeout=2)
-            except TimeoutError:
-                first_message = None
-            await _ensure_connected(ws, first_message, config)
-            payload = await _send_request(ws, method, params)
-            logger.debug(
-                "gateway.rpc.call.success method=%s duration_ms=%s",
-                method,
-                int((perf_counter() - started_at) * 1000),
-            )
-            return payload
+        if settings.gateway_rpc_pool_enabled:
+            payload = await gateway_connection_pool().call(method, params, config=config)
+        else:
+            payload = await _call_unpooled(method, params, config=config)
+        logger.debug(
+            "gateway.rpc.call.success method=%s duration_ms=%s",
+            method,
+            int((perf_counter() - started_at) * 1000),
+        )
+        return payload
     except OpenClawGatewayError:
         logger.warning(
             "gateway.rpc.call.gateway_error method=%s duration_ms=%s",
@@ -0,0 +1,49 @@
+"""Bounded-concurrency fan-out for per-target gateway calls.
+
+Callers pass a coroutine function that handles its own per-item failures and
+returns a result object, so one unreachable target never aborts the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+async def fan_out(
+    items: Sequence[_T],
+    fn: Callable[[_T], Awaitable[_R]],
+    *,
+    limit: int,
+    key: Callable[[_T], Hashable] | None = None,
+) -> list[_R]:
+    """Run `fn` for every item with at most `limit` calls in flight.
+
+    With `key`, the limit applies per key instead (for example per gateway), so a
+    slow target only holds back items that share it.
+
+    Results are returned in input order. An exception escaping `fn` cancels the
+    calls still pending and propagates to the caller.
+    """
+    semaphores: dict[Hashable, asyncio.Semaphore] = {}
+
+    async def _run(item: _T) -> _R:
+        slot = key(item) if key is not None else None
+        semaphore = semaphores.get(slot)
+        if semaphore is None:
+            semaphore = semaphores[slot] = asyncio.Semaphore(max(1, limit))
+        async with semaphore:
+            return await fn(item)
+
+    tasks = [asyncio.create_task(_run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -7,16 +7,27 @@ DB-backed workflows (template sync, lead-agent record creation) live in
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    select_autoescape,
+)
 
 from app.core.config import settings
+from app.core.ttl_cache import TTLCache
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.gateways import Gateway
@@ -52,6 +63,10 @@ from app.services.openclaw.internal.session_keys import (
 from app.services.openclaw.shared import GatewayAgentIdentity
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
+    from jinja2.bccache import Bucket
+
     from app.models.users import User
 
 
@@ -64,6 +79,39 @@ class ProvisionOptions:
     overwrite: bool = False
 
 
+@dataclass(slots=True)
+class AgentFileSyncStats:
+    """Workspace file uploads performed or skipped while provisioning one agent."""
+
+    files_written: int = 0
+    files_unchanged: int = 0
+    bytes_unchanged: int = 0
+
+
+# sha256 of the content last written to each (gateway, agent, file). An upload is
+# skipped only when this matches and the gateway still lists the file at that size.
+# The cache is per process: a digest recorded here goes stale if another API or
+# worker process (or the agent itself) rewrites the file with same-size content.
+_pushed_file_digests: TTLCache[tuple[UUID, str, str], str] = TTLCache(
+    max_entries=settings.gateway_agent_file_digest_cache_max_entries,
+    ttl_seconds=settings.gateway_agent_file_digest_cache_ttl_seconds,
+)
+
+
+def _gateway_file_unchanged(
+    entry: dict[str, Any] | None,
+    *,
+    size: int,
+    digest: str,
+    pushed_digest: str | None,
+) -> bool:
+    if entry is None or bool(entry.get("missing")) or pushed_digest != digest:
+        return False
+    # Without a listed size the gateway copy cannot be checked, so treat it as changed.
+    listed_size = entry.get("size")
+    return isinstance(listed_size, int) and listed_size == size
+
+
 _ROLE_SOUL_MAX_CHARS = 24_000
 _ROLE_SOUL_WORD_RE = re.compile(r"[a-z0-9]+")
 
@@ -130,6 +178,29 @@ def _channel_heartbeat_visibility_patch(config_data: dict[str, Any]) -> dict[str
     return {"defaults": {"heartbeat": merged}}
 
 
+class _InMemoryBytecodeCache(BytecodeCache):
+    """Keep compiled template bytecode in process memory.
+
+    Jinja still checks template mtimes, so an edited file is recompiled once and
+    an unchanged file reloaded after eviction reuses its stored bytecode.
+    """
+
+    def __init__(self) -> None:
+        self._bytecode: dict[str, bytes] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        self._bytecode[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self) -> None:
+        self._bytecode.clear()
+
+
+@lru_cache(maxsize=1)
 def _template_env() -> Environment:
     return Environment(
         loader=FileSystemLoader(_templates_root()),
@@ -137,9 +208,28 @@ def _template_env() -> Environment:
         autoescape=select_autoescape(default=False),
         undefined=StrictUndefined,
         keep_trailing_newline=True,
+        bytecode_cache=_InMemoryBytecodeCache(),
     )
 
 
+_OVERRIDE_TEMPLATE_CACHE_SIZE = 256
+_override_templates: OrderedDict[str, Template] = OrderedDict()
+
+
+def _override_template(env: Environment, source: str) -> Template:
+    """Compile an agent's identity/soul override once per distinct content."""
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    template = _override_templates.get(key)
+    if template is not None:
+        _override_templates.move_to_end(key)
+        return template
+    template = env.from_string(source)
+    _override_templates[key] = template
+    if len(_override_templates) > _OVERRIDE_TEMPLATE_CACHE_SIZE:
+        _override_templates.popitem(last=False)
+    return template
+
+
 def _heartbeat_template_name(agent: Agent) -> str:
     return HEARTBEAT_LEAD_TEMPLATE if agent.is_board_lead else HEARTBEAT_AGENT_TEMPLATE
 
@@ -418,7 +508,7 @@ def _render_agent_files(
             continue
         override = overrides.get(name)
         if override:
-            rendered[name] = env.from_string(override).render(**context).strip()
+            rendered[name] = _override_template(env, override).render(**context).strip()
             continue
         template_name = (
             template_overrides[name] if template_overrides and name in template_overrides else name
@@ -742,7 +832,8 @@ class BaseAgentLifecycleManager(ABC):
         existing_files: dict[str, dict[str, Any]],
         action: str,
         overwrite: bool = False,
-    ) -> None:
+    ) -> AgentFileSyncStats:
+        stats = AgentFileSyncStats()
         preserve_files = (
             self._preserve_files(agent) if agent is not None else set(PRESERVE_AGENT_EDITABLE_FILES)
         )
@@ -759,6 +850,19 @@ class BaseAgentLifecycleManager(ABC):
                 entry = existing_files.get(name)
                 if entry and not bool(entry.get("missing")):
                     continue
+            size = len(content.encode("utf-8"))
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            digest_key = (self._gateway.id, agent_id, name)
+            # `overwrite` forces every upload, e.g. to repair files edited on the gateway.
+            if not overwrite and _gateway_file_unchanged(
+                existing_files.get(name),
+                size=size,
+                digest=digest,
+                pushed_digest=_pushed_file_digests.get(digest_key),
+            ):
+                stats.files_unchanged += 1
+                stats.bytes_unchanged += size
+                continue
             try:
                 await self._control_plane.set_agent_file(
                     agent_id=agent_id,
@@ -770,6 +874,8 @@ class BaseAgentLifecycleManager(ABC):
                     unsupported_names.append(name)
                     continue
                 raise
+            _pushed_file_digests.put(digest_key, digest)
+            stats.files_written += 1
 
         if agent is not None and agent.is_board_lead and unsupported_names:
             unsupported_sorted = ", ".join(sorted(set(unsupported_names)))
@@ -780,12 +886,13 @@ class BaseAgentLifecycleManager(ABC):
             raise RuntimeError(msg)
 
         if agent is None or not self._allow_stale_file_deletion(agent):
-            return
+            return stats
 
         stale_names = (
             set(existing_files.keys()) & self._stale_file_candidates(agent)
         ) - target_file_names
         for name in sorted(stale_names):
+            _pushed_file_digests.pop((self._gateway.id, agent_id, name))
             try:
                 await self._control_plane.delete_agent_file(agent_id=agent_id, name=name)
             except OpenClawGatewayError as exc:
@@ -801,6 +908,7 @@ class BaseAgentLifecycleManager(ABC):
                 ):
                     continue
                 raise
+        return stats
 
     async def provision(
         self,
@@ -812,7 +920,7 @@ class BaseAgentLifecycleManager(ABC):
         options: ProvisionOptions,
         board: Board | None = None,
         session_label: str | None = None,
-    ) -> None:
+    ) -> AgentFileSyncStats:
         if not self._gateway.workspace_root:
             msg = "gateway_workspace_root is required"
             raise ValueError(msg)
@@ -855,7 +963,7 @@ class BaseAgentLifecycleManager(ABC):
             template_overrides=self._template_overrides(agent),
         )
 
-        await self._set_agent_files(
+        return await self._set_agent_files(
             agent=agent,
             agent_id=agent_id,
             rendered=rendered,
@@ -1042,12 +1150,12 @@ class OpenClawGatewayProvisioner:
         wake: bool = True,
         deliver_wakeup: bool = True,
         wakeup_verb: str | None = None,
-    ) -> None:
+    ) -> AgentFileSyncStats:
         """Create/update an agent, sync all template files, and optionally wake the agent.
 
         Lifecycle steps (same for all agent types):
         1) create agent (idempotent)
-        2) set/update all template files
+        2) set/update template files whose content changed
         3) wake the agent session (chat.send)
         """
 
@@ -1075,7 +1183,7 @@ class OpenClawGatewayProvisioner:
 
         control_plane = _control_plane_for_gateway(gateway)
         manager = manager_type(gateway, control_plane)
-        await manager.provision(
+        stats = await manager.provision(
             agent=agent,
             board=board,
             session_key=session_key,
@@ -1097,7 +1205,7 @@ class OpenClawGatewayProvisioner:
                     raise
 
         if not wake:
-            return
+            return stats
 
         client_config = GatewayClientConfig(url=gateway.url, token=gateway.token)
         await ensure_session(session_key, config=client_config, label=agent.name)
@@ -1108,6 +1216,7 @@ class OpenClawGatewayProvisioner:
             config=client_config,
             deliver=deliver_wakeup,
         )
+        return stats
 
     async def delete_agent_lifecycle(
         self,
@@ -1133,6 +1242,9 @@ class OpenClawGatewayProvisioner:
             agent_gateway_id = GatewayAgentIdentity.openclaw_agent_id(gateway)
         else:
             agent_gateway_id = _agent_key(agent)
+        _pushed_file_digests.evict_where(
+            lambda key: key[0] == gateway.id and key[1] == agent_gateway_id,
+        )
         try:
             await control_plane.delete_agent(agent_gateway_id, delete_files=delete_files)
         except OpenClawGatewayError as exc:
@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import json
 import re
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar
@@ -21,7 +22,9 @@ from sqlalchemy import asc, func, or_
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import verify_agent_token_async
+from app.core.config import settings
 from app.core.logging import TRACE_LEVEL
 from app.core.time import utcnow
 from app.db import crud
@@ -44,8 +47,14 @@ from app.schemas.agents import (
     AgentUpdate,
 )
 from app.schemas.common import OkResponse
-from app.schemas.gateways import GatewayTemplatesSyncError, GatewayTemplatesSyncResult
+from app.schemas.gateways import (
+    GatewayTemplatesSyncAgentResult,
+    GatewayTemplatesSyncError,
+    GatewayTemplatesSyncResult,
+)
 from app.services.activity_log import record_activity
+from app.services.board_events import BoardEventKey, board_event_bus
+from app.services.board_stream_hub import StreamMessage, stream_board_messages
 from app.services.openclaw.constants import (
     _TOOLS_KV_RE,
     DEFAULT_HEARTBEAT_CONFIG,
@@ -76,6 +85,7 @@ from app.services.openclaw.internal.session_keys import (
 )
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning import (
+    AgentFileSyncStats,
     OpenClawGatewayControlPlane,
     OpenClawGatewayProvisioner,
 )
@@ -89,6 +99,7 @@ from app.services.organizations import (
     list_accessible_board_ids,
     require_board_access,
 )
+from app.services.task_status_transitions import record_bulk_status_transitions
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
@@ -212,7 +223,7 @@ class OpenClawProvisioningService(OpenClawDBService):
             identity_profile=merged_identity_profile,
             openclaw_session_id=self.lead_session_key(board),
         )
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action=config_options.action, status="provisioning")
         await self.add_commit_refresh(agent)
 
@@ -240,6 +251,22 @@ class OpenClawProvisioningService(OpenClawDBService):
         options: GatewayTemplateSyncOptions,
     ) -> GatewayTemplatesSyncResult:
         """Synchronize AGENTS/TOOLS/etc templates to gateway-connected agents."""
+        async for update in self.iter_gateway_template_sync(gateway, options):
+            if isinstance(update, GatewayTemplatesSyncResult):
+                return update
+        msg = "Gateway template sync finished without a result"
+        raise RuntimeError(msg)
+
+    async def iter_gateway_template_sync(
+        self,
+        gateway: Gateway,
+        options: GatewayTemplateSyncOptions,
+    ) -> AsyncIterator[GatewayTemplatesSyncAgentResult | GatewayTemplatesSyncResult]:
+        """Sync gateway templates, yielding per-agent outcomes as they finish.
+
+        Board agents are provisioned by up to `gateway_template_sync_concurrency`
+        workers sharing one backoff; the summary result is always yielded last.
+        """
         template_user = options.user
         if template_user is None:
             template_user = await get_org_owner_user(
@@ -270,7 +297,8 @@ class OpenClawProvisioningService(OpenClawDBService):
                     "rendering)."
                 ),
             )
-            return result
+            yield result
+            return
 
         result = _base_result(
             gateway,
@@ -282,7 +310,8 @@ class OpenClawProvisioningService(OpenClawDBService):
                 result,
                 message="Gateway URL is not configured for this gateway.",
             )
-            return result
+            yield result
+            return
 
         control_plane = OpenClawGatewayControlPlane(
             GatewayClientConfig(url=gateway.url, token=gateway.token),
@@ -296,7 +325,8 @@ class OpenClawProvisioningService(OpenClawDBService):
             provisioner=self._gateway,
         )
         if not await _ping_gateway(ctx, result):
-            return result
+            yield result
+            return
 
         boards = await Board.objects.filter_by(gateway_id=gateway.id).all(self.session)
         boards_by_id = _boards_by_id(boards, board_id=options.board_id)
@@ -305,7 +335,8 @@ class OpenClawProvisioningService(OpenClawDBService):
                 result,
                 message="Board does not belong to this gateway.",
             )
-            return result
+            yield result
+            return
         paused_board_ids = await _paused_board_ids(self.session, list(boards_by_id.keys()))
         if boards_by_id:
             query = Agent.objects.by_field_in("board_id", list(boards_by_id.keys())).order_by(
@@ -317,7 +348,7 @@ class OpenClawProvisioningService(OpenClawDBService):
         else:
             agents = []
 
-        stop_sync = False
+        work: list[tuple[Agent, Board]] = []
         for agent in agents:
             board = boards_by_id.get(agent.board_id) if agent.board_id is not None else None
             if board is None:
@@ -331,13 +362,16 @@ class OpenClawProvisioningService(OpenClawDBService):
             if board.id in paused_board_ids:
                 result.agents_skipped += 1
                 continue
-            stop_sync = await _sync_one_agent(ctx, result, agent, board)
-            if stop_sync:
-                break
+            work.append((agent, board))
+
+        # Set only by a fatal gateway error, not by an individual agent failing.
+        stop_sync = asyncio.Event()
+        async for agent_result in _sync_agents_concurrently(ctx, result, work, stop=stop_sync):
+            yield agent_result
 
-        if not stop_sync and options.include_main:
+        if not stop_sync.is_set() and options.include_main:
             await _sync_main_agent(ctx, result)
-        return result
+        yield result
 
 
 @dataclass(frozen=True)
@@ -348,6 +382,8 @@ class _SyncContext:
     backoff: GatewayBackoff
     options: GatewayTemplateSyncOptions
     provisioner: OpenClawGatewayProvisioner
+    # Serializes token rotation commits on the shared session across sync workers.
+    session_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 def _parse_tools_md(content: str) -> dict[str, str]:
@@ -454,8 +490,14 @@ def _append_sync_error(
     )
 
 
+def _add_file_stats(result: GatewayTemplatesSyncResult, stats: AgentFileSyncStats) -> None:
+    result.files_written += stats.files_written
+    result.files_unchanged += stats.files_unchanged
+    result.bytes_unchanged += stats.bytes_unchanged
+
+
 async def _rotate_agent_token(session: AsyncSession, agent: Agent) -> str:
-    token = mint_agent_token(agent)
+    token = await mint_agent_token(agent)
     agent.updated_at = utcnow()
     session.add(agent)
     await session.commit()
@@ -507,6 +549,13 @@ def _boards_by_id(
     return {board_id: board}
 
 
+# How resolving an agent's AUTH_TOKEN ended: "skipped" means it could not be read
+# and `rotate_tokens` is off; "fatal" is a gateway backoff timeout.
+_TokenResolution = Literal["resolved", "skipped", "fatal"]
+# How one board agent's sync ended; "fatal" also stops the run.
+_AgentSyncOutcome = Literal["updated", "skipped", "failed", "fatal"]
+
+
 async def _resolve_agent_auth_token(
     ctx: _SyncContext,
     result: GatewayTemplatesSyncResult,
@@ -514,7 +563,7 @@ async def _resolve_agent_auth_token(
     board: Board | None,
     *,
     agent_gateway_id: str,
-) -> tuple[str | None, bool]:
+) -> tuple[str | None, _TokenResolution]:
     try:
         auth_token = await _get_existing_auth_token(
             agent_gateway_id=agent_gateway_id,
@@ -523,7 +572,7 @@ async def _resolve_agent_auth_token(
         )
     except TimeoutError as exc:
         _append_sync_error(result, agent=agent, board=board, message=str(exc))
-        return None, True
+        return None, "fatal"
 
     if not auth_token:
         if not ctx.options.rotate_tokens:
@@ -537,15 +586,17 @@ async def _resolve_agent_auth_token(
                     "(run with rotate_tokens=true to re-key)."
                 ),
             )
-            return None, False
-        auth_token = await _rotate_agent_token(ctx.session, agent)
+            return None, "skipped"
+        async with ctx.session_lock:
+            auth_token = await _rotate_agent_token(ctx.session, agent)
 
-    if agent.agent_token_hash and not verify_agent_token(
+    if agent.agent_token_hash and not await verify_agent_token_async(
         auth_token,
         agent.agent_token_hash,
     ):
         if ctx.options.rotate_tokens:
-            auth_token = await _rotate_agent_token(ctx.session, agent)
+            async with ctx.session_lock:
+                auth_token = await _rotate_agent_token(ctx.session, agent)
         else:
             _append_sync_error(
                 result,
@@ -556,7 +607,7 @@ async def _resolve_agent_auth_token(
                     "token hash (agent auth may be broken)."
                 ),
             )
-    return auth_token, False
+    return auth_token, "resolved"
 
 
 async def _sync_one_agent(
@@ -564,22 +615,20 @@ async def _sync_one_agent(
     result: GatewayTemplatesSyncResult,
     agent: Agent,
     board: Board,
-) -> bool:
-    auth_token, fatal = await _resolve_agent_auth_token(
+) -> _AgentSyncOutcome:
+    auth_token, resolution = await _resolve_agent_auth_token(
         ctx,
         result,
         agent,
         board,
         agent_gateway_id=_agent_key(agent),
     )
-    if fatal:
-        return True
-    if not auth_token:
-        return False
+    if resolution != "resolved" or not auth_token:
+        return "fatal" if resolution == "fatal" else "skipped"
     try:
 
-        async def _do_provision() -> bool:
-            await ctx.provisioner.apply_agent_lifecycle(
+        async def _do_provision() -> AgentFileSyncStats:
+            return await ctx.provisioner.apply_agent_lifecycle(
                 agent=agent,
                 gateway=ctx.gateway,
                 board=board,
@@ -591,14 +640,13 @@ async def _sync_one_agent(
                 reset_session=ctx.options.reset_sessions,
                 wake=False,
             )
-            return True
 
-        await ctx.backoff.run(_do_provision)
+        _add_file_stats(result, await ctx.backoff.run(_do_provision))
         result.agents_updated += 1
     except TimeoutError as exc:  # pragma: no cover - gateway/network dependent
         result.agents_skipped += 1
         _append_sync_error(result, agent=agent, board=board, message=str(exc))
-        return True
+        return "fatal"
     except (OSError, RuntimeError, ValueError) as exc:  # pragma: no cover
         result.agents_skipped += 1
         _append_sync_error(
@@ -607,9 +655,86 @@ async def _sync_one_agent(
             board=board,
             message=f"Failed to sync templates: {exc}",
         )
-        return False
+        return "failed"
     else:
-        return False
+        return "updated"
+
+
+def _agent_sync_outcome(
+    agent: Agent,
+    board: Board,
+    agent_result: GatewayTemplatesSyncResult,
+    *,
+    outcome: _AgentSyncOutcome,
+) -> GatewayTemplatesSyncAgentResult:
+    status: Literal["updated", "skipped", "failed"] = "failed" if outcome == "fatal" else outcome
+    return GatewayTemplatesSyncAgentResult(
+        agent_id=agent.id,
+        agent_name=agent.name,
+        board_id=board.id,
+        status=status,
+        errors=agent_result.errors,
+    )
+
+
+async def _sync_agents_concurrently(
+    ctx: _SyncContext,
+    result: GatewayTemplatesSyncResult,
+    work: list[tuple[Agent, Board]],
+    *,
+    stop: asyncio.Event,
+) -> AsyncIterator[GatewayTemplatesSyncAgentResult]:
+    """Provision agents with a bounded worker pool, yielding outcomes in completion order.
+
+    A fatal gateway error (backoff timeout) sets `stop`, so workers start no new
+    agents; agents already in flight still finish and are reported.
+    """
+    pending = deque(work)
+    outcomes: asyncio.Queue[GatewayTemplatesSyncAgentResult | None] = asyncio.Queue()
+
+    async def _worker() -> None:
+        try:
+            while pending and not stop.is_set():
+                agent, board = pending.popleft()
+                agent_result = _base_result(
+                    ctx.gateway,
+                    include_main=result.include_main,
+                    reset_sessions=result.reset_sessions,
+                )
+                outcome = await _sync_one_agent(ctx, agent_result, agent, board)
+                if outcome == "fatal":
+                    stop.set()
+                result.agents_updated += agent_result.agents_updated
+                result.agents_skipped += agent_result.agents_skipped
+                result.files_written += agent_result.files_written
+                result.files_unchanged += agent_result.files_unchanged
+                result.bytes_unchanged += agent_result.bytes_unchanged
+                result.errors.extend(agent_result.errors)
+                await outcomes.put(
+                    _agent_sync_outcome(agent, board, agent_result, outcome=outcome),
+                )
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            await outcomes.put(None)
+
+    worker_count = min(settings.gateway_template_sync_concurrency, len(work))
+    workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+    try:
+        finished = 0
+        while finished < len(workers):
+            outcome = await outcomes.get()
+            if outcome is None:
+                finished += 1
+                continue
+            yield outcome
+        # Surface unexpected worker failures the same way the serial loop did.
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
 
 async def _sync_main_agent(
@@ -630,14 +755,14 @@ async def _sync_main_agent(
         return True
 
     main_gateway_agent_id = GatewayAgentIdentity.openclaw_agent_id(ctx.gateway)
-    token, fatal = await _resolve_agent_auth_token(
+    token, resolution = await _resolve_agent_auth_token(
         ctx,
         result,
         main_agent,
         board=None,
         agent_gateway_id=main_gateway_agent_id,
     )
-    if fatal:
+    if resolution == "fatal":
         return True
     if not token:
         _append_sync_error(
@@ -649,8 +774,8 @@ async def _sync_main_agent(
     stop_sync = False
     try:
 
-        async def _do_provision_main() -> bool:
-            await ctx.provisioner.apply_agent_lifecycle(
+        async def _do_provision_main() -> AgentFileSyncStats:
+            return await ctx.provisioner.apply_agent_lifecycle(
                 agent=main_agent,
                 gateway=ctx.gateway,
                 board=None,
@@ -662,9 +787,8 @@ async def _sync_main_agent(
                 reset_session=ctx.options.reset_sessions,
                 wake=False,
             )
-            return True
 
-        await ctx.backoff.run(_do_provision_main)
+        _add_file_stats(result, await ctx.backoff.run(_do_provision_main))
     except TimeoutError as exc:  # pragma: no cover - gateway/network dependent
         _append_sync_error(result, agent=main_agent, message=str(exc))
         stop_sync = True
@@ -863,6 +987,27 @@ class AgentLifecycleService(OpenClawDBService):
         ).order_by(asc(col(Agent.updated_at)))
         return list(await self.session.exec(statement))
 
+    @classmethod
+    async def fetch_agent_stream_messages(
+        cls,
+        session: AsyncSession,
+        board_id: UUID,
+        since: datetime,
+    ) -> list[StreamMessage]:
+        agents = await cls(session).fetch_agent_events(board_id, since)
+        messages: list[StreamMessage] = []
+        for agent in agents:
+            updated_at = agent.updated_at or agent.last_seen_at or utcnow()
+            messages.append(
+                StreamMessage(
+                    event="agent",
+                    data=json.dumps({"agent": cls.serialize_agent(agent)}),
+                    key=(agent.id, agent.updated_at, agent.last_seen_at),
+                    cursor=updated_at,
+                ),
+            )
+        return messages
+
     async def require_user_context(self, user: User | None) -> OrganizationContext:
         if user is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
@@ -1032,7 +1177,7 @@ class AgentLifecycleService(OpenClawDBService):
         data: dict[str, Any],
     ) -> tuple[Agent, str]:
         agent = Agent.model_validate(data)
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action="provision", status="provisioning")
         agent.openclaw_session_id = self.resolve_session_key(agent)
         await self.add_commit_refresh(agent)
@@ -1308,8 +1453,8 @@ class AgentLifecycleService(OpenClawDBService):
         )
 
     @staticmethod
-    def mark_agent_update_pending(agent: Agent) -> str:
-        raw_token = mint_agent_token(agent)
+    async def mark_agent_update_pending(agent: Agent) -> str:
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action="update", status="updating")
         return raw_token
 
@@ -1384,7 +1529,7 @@ class AgentLifecycleService(OpenClawDBService):
         if agent.agent_token_hash is not None:
             return
 
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action="provision", status="provisioning")
         await self.add_commit_refresh(agent)
         board = await self.require_board(
@@ -1504,31 +1649,40 @@ class AgentLifecycleService(OpenClawDBService):
         allowed_ids = set(board_ids)
         if board_id is not None:
             OpenClawAuthorizationPolicy.require_board_write_access(allowed=board_id in allowed_ids)
+        if board_id is not None:
+            # Board-scoped viewers share one query per change through the stream hub.
+            return EventSourceResponse(
+                stream_board_messages(
+                    request,
+                    topic="agents",
+                    board_id=board_id,
+                    since=since_dt,
+                    fetch=self.fetch_agent_stream_messages,
+                ),
+                ping=15,
+            )
+        stream_keys: list[BoardEventKey] = [("agents", item) for item in allowed_ids]
 
         async def event_generator() -> AsyncIterator[dict[str, str]]:
             nonlocal last_seen
-            while True:
-                if await request.is_disconnected():
-                    break
-                async with async_session_maker() as stream_session:
-                    stream_service = AgentLifecycleService(stream_session)
-                    stream_service.logger = self.logger
-                    if board_id is not None:
-                        agents = await stream_service.fetch_agent_events(
-                            board_id,
-                            last_seen,
-                        )
-                    elif allowed_ids:
-                        agents = await stream_service.fetch_agent_events(None, last_seen)
-                        agents = [agent for agent in agents if agent.board_id in allowed_ids]
-                    else:
-                        agents = []
-                for agent in agents:
-                    updated_at = agent.updated_at or agent.last_seen_at or utcnow()
-                    last_seen = max(updated_at, last_seen)
-                    payload = {"agent": self.serialize_agent(agent)}
-                    yield {"event": "agent", "data": json.dumps(payload)}
-                await asyncio.sleep(2)
+            with board_event_bus().subscribe(stream_keys) as subscription:
+                while True:
+                    if await request.is_disconnected():
+                        break
+                    async with async_session_maker() as stream_session:
+                        stream_service = AgentLifecycleService(stream_session)
+                        stream_service.logger = self.logger
+                        if allowed_ids:
+                            agents = await stream_service.fetch_agent_events(None, last_seen)
+                            agents = [agent for agent in agents if agent.board_id in allowed_ids]
+                        else:
+                            agents = []
+                    for agent in agents:
+                        updated_at = agent.updated_at or agent.last_seen_at or utcnow()
+                        last_seen = max(updated_at, last_seen)
+                        payload = {"agent": self.serialize_agent(agent)}
+                        yield {"event": "agent", "data": json.dumps(payload)}
+                    await subscription.wait()
 
         return EventSourceResponse(event_generator(), ping=15)
 
@@ -1622,7 +1776,7 @@ class AgentLifecycleService(OpenClawDBService):
             main_gateway=main_gateway,
             gateway_for_main=gateway_for_main,
         )
-        raw_token = self.mark_agent_update_pending(agent)
+        raw_token = await self.mark_agent_update_pending(agent)
         self.session.add(agent)
         await self.session.commit()
         await self.session.refresh(agent)
@@ -1816,6 +1970,13 @@ class AgentLifecycleService(OpenClawDBService):
             agent_id=None,
         )
         now = utcnow()
+        await record_bulk_status_transitions(
+            self.session,
+            col(Task.assigned_agent_id) == agent.id,
+            col(Task.status) == "in_progress",
+            to_status="inbox",
+            changed_at=now,
+        )
         await crud.update_where(
             self.session,
             Task,
@@ -1860,6 +2021,7 @@ class AgentLifecycleService(OpenClawDBService):
         )
         await self.session.delete(agent)
         await self.session.commit()
+        agent_token_cache.evict_agent(agent.id)
 
         try:
             # Notify the gateway-main agent about cleanup for board-scoped deletes.
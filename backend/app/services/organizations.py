@@ -5,15 +5,18 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from fastapi import HTTPException, status
 from sqlalchemy import or_
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import col, select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
 from app.core.time import utcnow
+from app.core.ttl_cache import TTLCache
 from app.db import crud
 from app.models.boards import Board
 from app.models.organization_board_access import OrganizationBoardAccess
@@ -36,6 +39,8 @@ if TYPE_CHECKING:
 
 DEFAULT_ORG_NAME = "Personal"
 
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
 
 def _normalize_skill_pack_source_url(source_url: str) -> str:
     """Normalize pack source URL so duplicates with trivial formatting differences match."""
@@ -76,6 +81,59 @@ def is_org_admin(member: OrganizationMember) -> bool:
     return member.role in ADMIN_ROLES
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedMembership:
+    organization_id: UUID
+    member: dict[str, Any]
+    organization: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _BoardGrants:
+    readable: frozenset[UUID]
+    writable: frozenset[UUID]
+
+
+# Org-scoped dependencies resolve the same membership on every request. Rows are
+# cached as plain column snapshots and re-attached to each request session without
+# a query; the membership and access mutation paths below invalidate them.
+_active_memberships: TTLCache[UUID, _CachedMembership] = TTLCache(
+    max_entries=settings.org_membership_cache_max_entries,
+    ttl_seconds=settings.org_membership_cache_ttl_seconds,
+)
+_member_board_grants: TTLCache[UUID, _BoardGrants] = TTLCache(
+    max_entries=settings.org_membership_cache_max_entries,
+    ttl_seconds=settings.org_membership_cache_ttl_seconds,
+)
+
+
+def invalidate_active_membership(user_id: UUID) -> None:
+    """Drop the cached active membership for one user."""
+    _active_memberships.pop(user_id)
+
+
+def invalidate_member_access(member: OrganizationMember) -> None:
+    """Drop cached membership and board grants after a member's role or access changes."""
+    _active_memberships.pop(member.user_id)
+    _member_board_grants.pop(member.id)
+
+
+def clear_membership_caches() -> None:
+    """Drop every cached membership and board grant (e.g. after deleting an org)."""
+    _active_memberships.clear()
+    _member_board_grants.clear()
+
+
+async def _attach_snapshot(
+    session: AsyncSession,
+    model: type[ModelT],
+    values: dict[str, Any],
+) -> ModelT:
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return await session.merge(instance, load=False)
+
+
 async def get_member(
     session: AsyncSession,
     *,
@@ -135,6 +193,7 @@ async def set_active_organization(
         user.active_organization_id = organization_id
         session.add(user)
         await session.commit()
+        invalidate_active_membership(user.id)
     return member
 
 
@@ -170,6 +229,34 @@ async def get_active_membership(
     return member
 
 
+async def get_active_organization_context(
+    session: AsyncSession,
+    user: User,
+) -> OrganizationContext | None:
+    """Resolve the user's active membership and organization, using the short-lived cache."""
+    cached = _active_memberships.get(user.id)
+    if cached is not None and cached.organization_id == user.active_organization_id:
+        return OrganizationContext(
+            organization=await _attach_snapshot(session, Organization, cached.organization),
+            member=await _attach_snapshot(session, OrganizationMember, cached.member),
+        )
+    member = await get_active_membership(session, user)
+    if member is None:
+        return None
+    organization = await Organization.objects.get(session, member.organization_id)
+    if organization is None:
+        return None
+    _active_memberships.put(
+        user.id,
+        _CachedMembership(
+            organization_id=organization.id,
+            member=member.model_dump(),
+            organization=organization.model_dump(),
+        ),
+    )
+    return OrganizationContext(organization=organization, member=member)
+
+
 async def _find_pending_invite(
     session: AsyncSession,
     email: str,
@@ -233,6 +320,7 @@ async def accept_invite(
         user.active_organization_id = invite.organization_id
         session.add(user)
     await session.commit()
+    invalidate_active_membership(user.id)
     await session.refresh(member)
     return member
 
@@ -378,15 +466,23 @@ async def has_board_access(
             return True
     elif member_all_boards_read(member):
         return True
-    access = await OrganizationBoardAccess.objects.filter_by(
+    grants = await _board_grants(session, member)
+    return board.id in (grants.writable if write else grants.readable)
+
+
+async def _board_grants(session: AsyncSession, member: OrganizationMember) -> _BoardGrants:
+    cached = _member_board_grants.get(member.id)
+    if cached is not None:
+        return cached
+    rows = await OrganizationBoardAccess.objects.filter_by(
         organization_member_id=member.id,
-        board_id=board.id,
-    ).first(session)
-    if access is None:
-        return False
-    if write:
-        return bool(access.can_write)
-    return bool(access.can_read or access.can_write)
+    ).all(session)
+    grants = _BoardGrants(
+        readable=frozenset(row.board_id for row in rows if row.can_read or row.can_write),
+        writable=frozenset(row.board_id for row in rows if row.can_write),
+    )
+    _member_board_grants.put(member.id, grants)
+    return grants
 
 
 async def require_board_access(
@@ -397,11 +493,19 @@ async def require_board_access(
     write: bool,
 ) -> OrganizationMember:
     """Require board access for a user and return matching membership."""
-    member = await get_member(
-        session,
-        user_id=user.id,
-        organization_id=board.organization_id,
-    )
+    cached = _active_memberships.get(user.id)
+    if cached is not None and cached.organization_id == board.organization_id:
+        member: OrganizationMember | None = await _attach_snapshot(
+            session,
+            OrganizationMember,
+            cached.member,
+        )
+    else:
+        member = await get_member(
+            session,
+            user_id=user.id,
+            organization_id=board.organization_id,
+        )
     if member is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -459,22 +563,8 @@ async def list_accessible_board_ids(
         )
         return list(ids)
 
-    access_stmt = select(OrganizationBoardAccess.board_id).where(
-        col(OrganizationBoardAccess.organization_member_id) == member.id,
-    )
-    if write:
-        access_stmt = access_stmt.where(
-            col(OrganizationBoardAccess.can_write).is_(True),
-        )
-    else:
-        access_stmt = access_stmt.where(
-            or_(
-                col(OrganizationBoardAccess.can_read).is_(True),
-                col(OrganizationBoardAccess.can_write).is_(True),
-            ),
-        )
-    board_ids = await session.exec(access_stmt)
-    return list(board_ids)
+    grants = await _board_grants(session, member)
+    return list(grants.writable if write else grants.readable)
 
 
 async def apply_member_access_update(
@@ -484,6 +574,7 @@ async def apply_member_access_update(
     update: OrganizationMemberAccessUpdate,
 ) -> None:
     """Replace explicit member board-access rows from an access update."""
+    invalidate_member_access(member)
     now = utcnow()
     member.all_boards_read = update.all_boards_read
     member.all_boards_write = update.all_boards_write
@@ -567,6 +658,7 @@ async def apply_invite_to_member(
     invite: OrganizationInvite,
 ) -> None:
     """Apply invite role/access grants onto an existing organization member."""
+    invalidate_member_access(member)
     now = utcnow()
     member_changed = False
     invite_role = normalize_role(invite.role or "member")
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, cast
 
 import redis
+from redis.commands.core import Script
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -16,7 +19,77 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 _SCHEDULED_SUFFIX = ":scheduled"
+_PROCESSING_SUFFIX = ":processing:"
+_LEASES_SUFFIX = ":leases"
+_WORKERS_SUFFIX = ":workers"
 _DRY_RUN_BATCH_SIZE = 100
+_MIN_BLOCK_TIMEOUT_SECONDS = 0.01
+
+# Moves due entries from the scheduled sorted set onto the ready list in one atomic
+# step, so concurrent workers cannot both deliver the same task. Returns the number
+# of moved entries and the earliest remaining score (nil when the set is empty).
+_DRAIN_SCHEDULED_LUA = """
+local ready = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #ready > 0 then
+    redis.call('LPUSH', KEYS[2], unpack(ready))
+    redis.call('ZREM', KEYS[1], unpack(ready))
+end
+local next_item = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {#ready, next_item[2] or false}
+"""
+
+# Re-queues leased entries whose visibility timeout passed. ARGV carries
+# (raw, retry) pairs after `now` and `visibility`: the retry payload is encoded in
+# Python (cjson would turn `[]` into `{}` and round floats), and an empty retry
+# drops the entry. Each pair is applied only if its lease is still expired, so a
+# task acked since the caller looked is left alone. Entries found in a processing
+# list without a lease (worker died between BLMOVE and ZADD) are given one so they
+# expire normally, and empty processing lists are unregistered so dead workers do
+# not accumulate. Every processing list is declared in KEYS[4..].
+_REAP_EXPIRED_LEASES_LUA = """
+local now = tonumber(ARGV[1])
+local visibility = tonumber(ARGV[2])
+local requeued = 0
+local dropped = 0
+for i = 3, #ARGV, 2 do
+    local raw = ARGV[i]
+    local retry = ARGV[i + 1]
+    local deadline = redis.call('ZSCORE', KEYS[2], raw)
+    if deadline and tonumber(deadline) <= now then
+        for k = 4, #KEYS do
+            if redis.call('LREM', KEYS[k], 1, raw) > 0 then
+                redis.call('ZREM', KEYS[2], raw)
+                if retry == '' then
+                    dropped = dropped + 1
+                else
+                    redis.call('RPUSH', KEYS[1], retry)
+                    requeued = requeued + 1
+                end
+                break
+            end
+        end
+    end
+end
+for k = 4, #KEYS do
+    for _, raw in ipairs(redis.call('LRANGE', KEYS[k], 0, -1)) do
+        if not redis.call('ZSCORE', KEYS[2], raw) then
+            redis.call('ZADD', KEYS[2], now + visibility, raw)
+        end
+    end
+    if redis.call('LLEN', KEYS[k]) == 0 then
+        redis.call('SREM', KEYS[3], KEYS[k])
+    end
+end
+return {requeued, dropped}
+"""
+
+_redis_clients: dict[str, redis.Redis] = {}
+_redis_clients_lock = threading.Lock()
+# Lua scripts registered per client, so repeat calls reuse one Script (and its SHA for EVALSHA).
+_redis_scripts: weakref.WeakKeyDictionary[redis.Redis, dict[str, Script]] = (
+    weakref.WeakKeyDictionary()
+)
+_redis_scripts_lock = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -40,14 +113,66 @@ class QueuedTask:
         )
 
 
-def _redis_client(redis_url: str | None = None) -> redis.Redis:
-    return redis.Redis.from_url(redis_url or settings.rq_redis_url)
+def redis_client(redis_url: str | None = None) -> redis.Redis:
+    """Return the process-wide client (and its connection pool) for a Redis URL."""
+    url = redis_url or settings.rq_redis_url
+    client = _redis_clients.get(url)
+    if client is not None:
+        return client
+    with _redis_clients_lock:
+        client = _redis_clients.get(url)
+        if client is None:
+            client = redis.Redis.from_url(url)
+            _redis_clients[url] = client
+        return client
+
+
+def redis_script(client: redis.Redis, source: str) -> Script:
+    """Return the Lua script registered on a client, registering it on first use."""
+    with _redis_scripts_lock:
+        scripts = _redis_scripts.setdefault(client, {})
+        script = scripts.get(source)
+        if script is None:
+            script = client.register_script(source)
+            scripts[source] = script
+        return script
+
+
+def close_redis_clients() -> None:
+    """Disconnect and forget every cached queue Redis client."""
+    with _redis_clients_lock:
+        clients = list(_redis_clients.values())
+        _redis_clients.clear()
+    for client in clients:
+        client.close()
+
+
+@dataclass(frozen=True)
+class LeasedTask:
+    """A task moved onto a worker's processing list until it is acknowledged."""
+
+    task: QueuedTask
+    raw: str
+    queue_name: str
+    processing_queue: str
 
 
 def _scheduled_queue_name(queue_name: str) -> str:
     return f"{queue_name}{_SCHEDULED_SUFFIX}"
 
 
+def _processing_queue_name(queue_name: str, worker_id: str) -> str:
+    return f"{queue_name}{_PROCESSING_SUFFIX}{worker_id}"
+
+
+def _leases_key(queue_name: str) -> str:
+    return f"{queue_name}{_LEASES_SUFFIX}"
+
+
+def _workers_key(queue_name: str) -> str:
+    return f"{queue_name}{_WORKERS_SUFFIX}"
+
+
 def _now_seconds() -> float:
     return time.time()
 
@@ -61,44 +186,23 @@ def _drain_ready_scheduled_tasks(
     scheduled_queue = _scheduled_queue_name(queue_name)
     now = _now_seconds()
 
-    ready_items = cast(
-        list[str | bytes],
-        client.zrangebyscore(
-            scheduled_queue,
-            "-inf",
-            now,
-            start=0,
-            num=max_items,
-        ),
+    drain = redis_script(client, _DRAIN_SCHEDULED_LUA)
+    moved, next_score = cast(
+        list[Any],
+        drain(keys=[scheduled_queue, queue_name], args=[now, max_items]),
     )
-    if ready_items:
-        ready_values = tuple(ready_items)
-        client.lpush(queue_name, *ready_values)
-        client.zrem(scheduled_queue, *ready_values)
+    if moved:
         logger.debug(
             "rq.queue.drain_ready_scheduled",
             extra={
                 "queue_name": queue_name,
-                "count": len(ready_items),
+                "count": int(moved),
             },
         )
 
-    next_item = cast(
-        list[tuple[str | bytes, float]],
-        client.zrangebyscore(
-            scheduled_queue,
-            now,
-            "+inf",
-            start=0,
-            num=1,
-            withscores=True,
-        ),
-    )
-    if not next_item:
+    if next_score is None:
         return None
-
-    next_score = float(next_item[0][1])
-    return max(0.0, next_score - now)
+    return max(0.0, float(next_score) - now)
 
 
 def _schedule_for_later(
@@ -108,7 +212,7 @@ def _schedule_for_later(
     *,
     redis_url: str | None = None,
 ) -> bool:
-    client = _redis_client(redis_url=redis_url)
+    client = redis_client(redis_url=redis_url)
     scheduled_queue = _scheduled_queue_name(queue_name)
     score = _now_seconds() + delay_seconds
     client.zadd(scheduled_queue, {task.to_json(): score})
@@ -131,7 +235,7 @@ def enqueue_task(
 ) -> bool:
     """Persist a task envelope in a Redis list-backed queue."""
     try:
-        client = _redis_client(redis_url=redis_url)
+        client = redis_client(redis_url=redis_url)
         client.lpush(queue_name, task.to_json())
         logger.info(
             "rq.queue.enqueued",
@@ -166,6 +270,22 @@ def _coerce_datetime(raw: object | None) -> datetime:
     return datetime.now(UTC)
 
 
+def _blocking_timeout(block_timeout: float, next_delay: float | None) -> float:
+    """Return the BRPOP/BLMOVE timeout, waking up for the next scheduled task.
+
+    Redis truncates the timeout to whole milliseconds and treats `0` as "block
+    forever", so any finite wait (e.g. a scheduled task due right now) is clamped
+    to a small positive minimum. Only `block_timeout=0` with nothing scheduled
+    blocks indefinitely.
+    """
+    timeout = max(0.0, float(block_timeout))
+    if next_delay is not None:
+        timeout = next_delay if timeout == 0 else min(timeout, next_delay)
+    elif timeout == 0:
+        return 0.0
+    return max(timeout, _MIN_BLOCK_TIMEOUT_SECONDS)
+
+
 def dequeue_task(
     queue_name: str,
     *,
@@ -174,15 +294,11 @@ def dequeue_task(
     block_timeout: float = 0,
 ) -> QueuedTask | None:
     """Pop one task envelope from the queue."""
-    client = _redis_client(redis_url=redis_url)
-    timeout = max(0.0, float(block_timeout))
+    client = redis_client(redis_url=redis_url)
     raw: str | bytes | None
     if block:
         next_delay = _drain_ready_scheduled_tasks(client, queue_name)
-        if timeout == 0:
-            timeout = next_delay if next_delay is not None else 0
-        else:
-            timeout = min(timeout, next_delay) if next_delay is not None else timeout
+        timeout = _blocking_timeout(block_timeout, next_delay)
         raw_result = cast(
             tuple[bytes | str, bytes | str] | None,
             client.brpop([queue_name], timeout=timeout),
@@ -199,6 +315,205 @@ def dequeue_task(
     return _decode_task(raw, queue_name)
 
 
+def lease_task(
+    queue_name: str,
+    *,
+    worker_id: str,
+    redis_url: str | None = None,
+    block: bool = False,
+    block_timeout: float = 0,
+    visibility_seconds: float | None = None,
+) -> LeasedTask | None:
+    """Move one task onto the worker's processing list and lease it.
+
+    Unlike `dequeue_task`, the task stays in Redis until `ack_task` is called. If
+    the worker dies first, `reap_expired_leases` re-queues it once the lease's
+    visibility timeout passes.
+    """
+    client = redis_client(redis_url=redis_url)
+    processing_queue = _processing_queue_name(queue_name, worker_id)
+    client.sadd(_workers_key(queue_name), processing_queue)
+    raw: str | bytes | None
+    if block:
+        next_delay = _drain_ready_scheduled_tasks(client, queue_name)
+        timeout = _blocking_timeout(block_timeout, next_delay)
+        raw = cast(
+            str | bytes | None,
+            # Redis accepts fractional BLMOVE timeouts; redis-py only annotates `int`.
+            client.blmove(queue_name, processing_queue, timeout, "RIGHT", "LEFT"),  # type: ignore[arg-type]
+        )
+    else:
+        raw = cast(str | bytes | None, client.lmove(queue_name, processing_queue, "RIGHT", "LEFT"))
+    if raw is None:
+        _drain_ready_scheduled_tasks(client, queue_name)
+        return None
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+
+    visibility = (
+        settings.rq_lease_visibility_seconds if visibility_seconds is None else visibility_seconds
+    )
+    pipe = client.pipeline(transaction=True)
+    pipe.zadd(_leases_key(queue_name), {raw: _now_seconds() + visibility})
+    # Re-register in case the reaper unregistered the list while it was empty.
+    pipe.sadd(_workers_key(queue_name), processing_queue)
+    pipe.execute()
+    try:
+        task = _decode_task(raw, queue_name)
+    except Exception:
+        # Undecodable payloads would be redelivered forever; drop them like RPOP did.
+        _release_lease(client, queue_name, processing_queue, raw)
+        raise
+    return LeasedTask(
+        task=task,
+        raw=raw,
+        queue_name=queue_name,
+        processing_queue=processing_queue,
+    )
+
+
+def _release_lease(
+    client: redis.Redis,
+    queue_name: str,
+    processing_queue: str,
+    raw: str,
+) -> None:
+    pipe = client.pipeline(transaction=True)
+    pipe.lrem(processing_queue, 1, raw)
+    pipe.zrem(_leases_key(queue_name), raw)
+    pipe.execute()
+
+
+def ack_task(lease: LeasedTask, *, redis_url: str | None = None) -> None:
+    """Remove a finished (or already re-queued) task from its processing list."""
+    _release_lease(
+        redis_client(redis_url=redis_url),
+        lease.queue_name,
+        lease.processing_queue,
+        lease.raw,
+    )
+
+
+def extend_lease(
+    lease: LeasedTask,
+    *,
+    redis_url: str | None = None,
+    visibility_seconds: float | None = None,
+) -> bool:
+    """Push a held lease's deadline out by the visibility timeout.
+
+    Returns `False` when the lease is gone (acked, deferred or already reaped), in
+    which case it is not recreated.
+    """
+    visibility = (
+        settings.rq_lease_visibility_seconds if visibility_seconds is None else visibility_seconds
+    )
+    changed = redis_client(redis_url=redis_url).zadd(
+        _leases_key(lease.queue_name),
+        {lease.raw: _now_seconds() + visibility},
+        xx=True,
+        ch=True,
+    )
+    return bool(changed)
+
+
+def defer_leased_task(
+    lease: LeasedTask,
+    delay_seconds: float,
+    *,
+    redis_url: str | None = None,
+) -> None:
+    """Move a leased task back to the scheduled set without counting an attempt."""
+    client = redis_client(redis_url=redis_url)
+    pipe = client.pipeline(transaction=True)
+    pipe.zadd(
+        _scheduled_queue_name(lease.queue_name),
+        {lease.task.to_json(): _now_seconds() + delay_seconds},
+    )
+    pipe.lrem(lease.processing_queue, 1, lease.raw)
+    pipe.zrem(_leases_key(lease.queue_name), lease.raw)
+    pipe.execute()
+
+
+def _as_str(value: str | bytes) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _reaped_retry_payload(raw: str, max_retries: int) -> str:
+    """Return `raw` with one more attempt recorded, or `""` once retries run out."""
+    try:
+        task = json.loads(raw)
+    except ValueError:
+        return raw
+    if not isinstance(task, dict):
+        return raw
+    try:
+        attempts = int(task.get("attempts") or 0) + 1
+    except (TypeError, ValueError):
+        attempts = 1
+    if attempts > max_retries:
+        return ""
+    task["attempts"] = attempts
+    return json.dumps(task, sort_keys=True)
+
+
+def reap_expired_leases(
+    queue_name: str,
+    *,
+    max_retries: int,
+    redis_url: str | None = None,
+    visibility_seconds: float | None = None,
+) -> int:
+    """Re-queue leased tasks whose worker did not ack them in time.
+
+    Each reaped task counts as a failed attempt, matching `requeue_if_failed`:
+    tasks that exceed `max_retries` are dropped. Empty processing lists are
+    unregistered, so workers that died without `release_worker` do not pile up
+    (a live worker re-registers on its next lease). Returns the number re-queued.
+    """
+    client = redis_client(redis_url=redis_url)
+    visibility = (
+        settings.rq_lease_visibility_seconds if visibility_seconds is None else visibility_seconds
+    )
+    processing_queues = sorted(
+        _as_str(member) for member in cast(set[Any], client.smembers(_workers_key(queue_name)))
+    )
+    if not processing_queues:
+        return 0
+    now = _now_seconds()
+    args: list[Any] = [now, visibility]
+    for raw in cast(list[Any], client.zrangebyscore(_leases_key(queue_name), "-inf", now)):
+        raw = _as_str(raw)
+        args.extend([raw, _reaped_retry_payload(raw, max_retries)])
+    reap = redis_script(client, _REAP_EXPIRED_LEASES_LUA)
+    requeued, dropped = cast(
+        list[int],
+        reap(
+            keys=[
+                queue_name,
+                _leases_key(queue_name),
+                _workers_key(queue_name),
+                *processing_queues,
+            ],
+            args=args,
+        ),
+    )
+    if requeued or dropped:
+        logger.warning(
+            "rq.queue.leases_reaped",
+            extra={"queue_name": queue_name, "requeued": requeued, "dropped": dropped},
+        )
+    return int(requeued)
+
+
+def release_worker(queue_name: str, *, worker_id: str, redis_url: str | None = None) -> None:
+    """Unregister a stopping worker's processing list if it holds no leases."""
+    client = redis_client(redis_url=redis_url)
+    processing_queue = _processing_queue_name(queue_name, worker_id)
+    if not client.llen(processing_queue):
+        client.srem(_workers_key(queue_name), processing_queue)
+
+
 def _decode_task(raw: str | bytes, queue_name: str) -> QueuedTask:
     if isinstance(raw, bytes):
         raw = raw.decode("utf-8")
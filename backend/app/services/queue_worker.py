@@ -3,13 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import random
+import signal
+import socket
+import time
 from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from dataclasses import dataclass
+from uuid import uuid4
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.services.queue import QueuedTask, dequeue_task
+from app.db.session import async_session_maker
+from app.services.metric_rollups import roll_up_metrics
+from app.services.openclaw.agent_notifications import (
+    AGENT_NOTIFICATION_TASK_TYPE,
+    process_agent_notification_task,
+    requeue_agent_notification_task,
+)
+from app.services.queue import (
+    LeasedTask,
+    QueuedTask,
+    ack_task,
+    close_redis_clients,
+    defer_leased_task,
+    extend_lease,
+    lease_task,
+    reap_expired_leases,
+    release_worker,
+)
+from app.services.skill_packs import SKILL_PACK_SYNC_TASK_TYPE, process_skill_pack_sync_task
 from app.services.webhooks.dispatch import (
     process_webhook_queue_task,
     requeue_webhook_queue_task,
@@ -18,12 +42,22 @@ from app.services.webhooks.queue import TASK_TYPE as WEBHOOK_TASK_TYPE
 
 logger = get_logger(__name__)
 
+# Names this process's processing list; the suffix keeps restarted containers apart.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
 
 @dataclass(frozen=True)
 class _TaskHandler:
     handler: Callable[[QueuedTask], Awaitable[None]]
     attempts_to_delay: Callable[[int], float]
     requeue: Callable[[QueuedTask, float], bool]
+    # Tasks sharing a key are spaced by `rq_dispatch_throttle_seconds`; `None` is unthrottled.
+    rate_limit_key: Callable[[QueuedTask], str | None] = lambda _task: None
+
+
+def _board_rate_limit_key(task: QueuedTask) -> str | None:
+    board_id = task.payload.get("board_id")
+    return f"board:{board_id}" if board_id else None
 
 
 _TASK_HANDLERS: dict[str, _TaskHandler] = {
@@ -34,6 +68,21 @@ _TASK_HANDLERS: dict[str, _TaskHandler] = {
             settings.rq_dispatch_retry_max_seconds,
         ),
         requeue=lambda task, delay: requeue_webhook_queue_task(task, delay_seconds=delay),
+        rate_limit_key=_board_rate_limit_key,
+    ),
+    SKILL_PACK_SYNC_TASK_TYPE: _TaskHandler(
+        handler=process_skill_pack_sync_task,
+        attempts_to_delay=lambda _attempts: 0,
+        # Failures are recorded on the job status; the user re-triggers the sync.
+        requeue=lambda _task, _delay: False,
+    ),
+    AGENT_NOTIFICATION_TASK_TYPE: _TaskHandler(
+        handler=process_agent_notification_task,
+        attempts_to_delay=lambda attempts: min(
+            settings.rq_dispatch_retry_base_seconds * (2 ** max(0, attempts)),
+            settings.rq_dispatch_retry_max_seconds,
+        ),
+        requeue=lambda task, delay: requeue_agent_notification_task(task, delay_seconds=delay),
     ),
 }
 
@@ -42,96 +91,301 @@ def _compute_jitter(base_delay: float) -> float:
     return random.uniform(0, min(settings.rq_dispatch_retry_max_seconds / 10, base_delay * 0.1))
 
 
-async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
-    """Consume one queue batch and dispatch by task type."""
-    processed = 0
+class _KeyedThrottle:
+    """Space task starts that share a rate-limit key by a fixed interval."""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval = interval_seconds
+        self._next_start: dict[str, float] = {}
+
+    def reserve(self, key: str | None) -> float:
+        """Claim a start for `key` now, or return how long until one is free."""
+        if key is None or self._interval <= 0:
+            return 0.0
+        now = time.monotonic()
+        # Forget keys whose slot has passed so the map only tracks busy boards.
+        self._next_start = {k: v for k, v in self._next_start.items() if v > now}
+        next_start = self._next_start.get(key, now)
+        if next_start > now:
+            return next_start - now
+        self._next_start[key] = now + self._interval
+        return 0.0
+
+
+def _throttle_delay(task: QueuedTask, throttle: _KeyedThrottle) -> float:
+    handler = _TASK_HANDLERS.get(task.task_type)
+    return throttle.reserve(handler.rate_limit_key(task)) if handler is not None else 0.0
+
+
+async def _defer_leased_task(lease: LeasedTask, delay: float) -> None:
+    try:
+        await asyncio.to_thread(
+            defer_leased_task,
+            lease,
+            delay,
+            redis_url=settings.rq_redis_url,
+        )
+    except Exception:
+        # The lease stays put, so the reaper re-queues the task once it expires.
+        logger.exception(
+            "queue.worker.defer_failed",
+            extra={"task_type": lease.task.task_type, "queue_name": lease.queue_name},
+        )
+
+
+async def _keep_lease_alive(lease: LeasedTask) -> None:
+    """Extend the lease every third of the visibility timeout while the task runs."""
+    interval = settings.rq_lease_visibility_seconds / 3
     while True:
+        await asyncio.sleep(interval)
         try:
-            task = dequeue_task(
-                settings.rq_queue_name,
+            extended = await asyncio.to_thread(
+                extend_lease,
+                lease,
                 redis_url=settings.rq_redis_url,
-                block=block,
-                block_timeout=block_timeout,
             )
         except Exception:
             logger.exception(
-                "queue.worker.dequeue_failed",
-                extra={"queue_name": settings.rq_queue_name},
+                "queue.worker.lease_extend_failed",
+                extra={"task_type": lease.task.task_type, "queue_name": lease.queue_name},
             )
             continue
+        if not extended:
+            # Already reaped; another worker may be running it, so stop claiming it.
+            logger.warning(
+                "queue.worker.lease_lost",
+                extra={"task_type": lease.task.task_type, "queue_name": lease.queue_name},
+            )
+            return
 
-        if task is None:
-            break
 
-        handler = _TASK_HANDLERS.get(task.task_type)
-        if handler is None:
-            logger.warning(
-                "queue.worker.task_unhandled",
-                extra={
-                    "task_type": task.task_type,
-                    "queue_name": settings.rq_queue_name,
-                },
+async def _run_leased_task(lease: LeasedTask) -> bool:
+    # Long handlers keep their lease, so the reaper does not hand them to another worker.
+    heartbeat = asyncio.create_task(_keep_lease_alive(lease))
+    try:
+        return await _run_task(lease.task)
+    finally:
+        heartbeat.cancel()
+        with suppress(asyncio.CancelledError):
+            await heartbeat
+        # Failed tasks were already re-queued by their handler, so every outcome acks.
+        try:
+            await asyncio.to_thread(ack_task, lease, redis_url=settings.rq_redis_url)
+        except Exception:
+            logger.exception(
+                "queue.worker.ack_failed",
+                extra={"task_type": lease.task.task_type, "queue_name": lease.queue_name},
             )
-            continue
 
+
+class _LeaseReaper:
+    """Periodically re-queue tasks leased by workers that never acknowledged them."""
+
+    def __init__(self) -> None:
+        self._next_run_at = 0.0
+
+    async def maybe_run(self) -> None:
+        now = time.monotonic()
+        if now < self._next_run_at:
+            return
+        self._next_run_at = now + settings.rq_lease_reap_interval_seconds
         try:
-            await handler.handler(task)
-            processed += 1
-            logger.info(
-                "queue.worker.success",
-                extra={
-                    "task_type": task.task_type,
-                    "attempt": task.attempts,
-                },
+            await asyncio.to_thread(
+                reap_expired_leases,
+                settings.rq_queue_name,
+                max_retries=settings.rq_dispatch_max_retries,
+                redis_url=settings.rq_redis_url,
             )
-        except Exception as exc:
+        except Exception:
             logger.exception(
-                "queue.worker.failed",
+                "queue.worker.reap_failed",
+                extra={"queue_name": settings.rq_queue_name},
+            )
+
+
+_lease_reaper = _LeaseReaper()
+
+
+async def _run_task(task: QueuedTask) -> bool:
+    handler = _TASK_HANDLERS.get(task.task_type)
+    if handler is None:
+        logger.warning(
+            "queue.worker.task_unhandled",
+            extra={
+                "task_type": task.task_type,
+                "queue_name": settings.rq_queue_name,
+            },
+        )
+        return False
+
+    try:
+        await handler.handler(task)
+    except Exception as exc:
+        logger.exception(
+            "queue.worker.failed",
+            extra={
+                "task_type": task.task_type,
+                "attempt": task.attempts,
+                "error": str(exc),
+            },
+        )
+        base_delay = handler.attempts_to_delay(task.attempts)
+        delay = base_delay + _compute_jitter(base_delay)
+        if not handler.requeue(task, delay):
+            logger.warning(
+                "queue.worker.drop_task",
                 extra={
                     "task_type": task.task_type,
                     "attempt": task.attempts,
-                    "error": str(exc),
                 },
             )
-            base_delay = handler.attempts_to_delay(task.attempts)
-            delay = base_delay + _compute_jitter(base_delay)
-            if not handler.requeue(task, delay):
-                logger.warning(
-                    "queue.worker.drop_task",
-                    extra={
-                        "task_type": task.task_type,
-                        "attempt": task.attempts,
-                    },
+        return False
+    logger.info(
+        "queue.worker.success",
+        extra={
+            "task_type": task.task_type,
+            "attempt": task.attempts,
+        },
+    )
+    return True
+
+
+async def flush_queue(
+    *,
+    block: bool = False,
+    block_timeout: float = 0,
+    concurrency: int | None = None,
+    stop: asyncio.Event | None = None,
+) -> int:
+    """Consume queued tasks until the queue is empty, running handlers concurrently.
+
+    Up to `concurrency` handlers run at once (default `rq_worker_concurrency`). Tasks
+    with the same rate-limit key (the board for webhook deliveries) start at most once
+    per `rq_dispatch_throttle_seconds`; a task leased before its key's next start is
+    moved back to the scheduled set for that long rather than waiting in a slot, so
+    one busy board never holds up other boards or task types. Setting `stop` ends
+    dequeuing; in-flight handlers always run to completion before this returns.
+
+    Tasks are leased rather than popped and acknowledged once handled. Leases left
+    behind by crashed workers are re-queued every `rq_lease_reap_interval_seconds`.
+    """
+    slots = asyncio.Semaphore(concurrency or settings.rq_worker_concurrency)
+    throttle = _KeyedThrottle(settings.rq_dispatch_throttle_seconds)
+    in_flight: set[asyncio.Task[bool]] = set()
+    processed = 0
+
+    def _finished(job: asyncio.Task[bool]) -> None:
+        nonlocal processed
+        in_flight.discard(job)
+        slots.release()
+        if not job.cancelled() and job.exception() is None and job.result():
+            processed += 1
+
+    try:
+        while stop is None or not stop.is_set():
+            await slots.acquire()
+            if stop is not None and stop.is_set():
+                slots.release()
+                break
+            await _lease_reaper.maybe_run()
+            try:
+                lease = await asyncio.to_thread(
+                    lease_task,
+                    settings.rq_queue_name,
+                    worker_id=WORKER_ID,
+                    redis_url=settings.rq_redis_url,
+                    block=block,
+                    block_timeout=block_timeout,
+                )
+            except Exception:
+                slots.release()
+                logger.exception(
+                    "queue.worker.dequeue_failed",
+                    extra={"queue_name": settings.rq_queue_name},
                 )
-        await asyncio.sleep(settings.rq_dispatch_throttle_seconds)
+                continue
+
+            if lease is None:
+                slots.release()
+                break
+
+            delay = _throttle_delay(lease.task, throttle)
+            if delay > 0:
+                await _defer_leased_task(lease, delay)
+                slots.release()
+                continue
+
+            job = asyncio.create_task(_run_leased_task(lease))
+            in_flight.add(job)
+            job.add_done_callback(_finished)
+    finally:
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
     if processed > 0:
         logger.info("queue.worker.batch_complete", extra={"count": processed})
     return processed
 
 
-async def _run_worker_loop() -> None:
-    while True:
+async def _run_metrics_rollup_loop(stop: asyncio.Event) -> None:
+    """Keep dashboard metric rollups current alongside queue processing."""
+    while not stop.is_set():
         try:
-            await flush_queue(
-                block=True,
-                block_timeout=0,
-            )
+            while not stop.is_set():
+                async with async_session_maker() as session:
+                    if await roll_up_metrics(session) == 0:
+                        break
         except Exception:
-            logger.exception(
-                "queue.worker.loop_failed",
-                extra={"queue_name": settings.rq_queue_name},
-            )
-            await asyncio.sleep(1)
+            logger.exception("queue.worker.metrics_rollup_failed")
+        with suppress(TimeoutError):
+            await asyncio.wait_for(stop.wait(), timeout=settings.metrics_rollup_interval_seconds)
+
+
+async def _run_worker_loop(stop: asyncio.Event | None = None) -> None:
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        with suppress(NotImplementedError, RuntimeError):
+            loop.add_signal_handler(signum, stop.set)
+    rollups = asyncio.create_task(_run_metrics_rollup_loop(stop))
+    try:
+        while not stop.is_set():
+            try:
+                # Bounded blocking keeps shutdown responsive while the queue is idle.
+                await flush_queue(
+                    block=True,
+                    block_timeout=settings.rq_worker_poll_seconds,
+                    stop=stop,
+                )
+            except Exception:
+                logger.exception(
+                    "queue.worker.loop_failed",
+                    extra={"queue_name": settings.rq_queue_name},
+                )
+                await asyncio.sleep(1)
+    finally:
+        rollups.cancel()
+        with suppress(asyncio.CancelledError):
+            await rollups
 
 
 def run_worker() -> None:
     """RQ entrypoint for running continuous queue processing."""
     logger.info(
         "queue.worker.batch_started",
-        extra={"throttle_seconds": settings.rq_dispatch_throttle_seconds},
+        extra={
+            "throttle_seconds": settings.rq_dispatch_throttle_seconds,
+            "concurrency": settings.rq_worker_concurrency,
+        },
     )
     try:
         asyncio.run(_run_worker_loop())
     finally:
+        with suppress(Exception):
+            release_worker(
+                settings.rq_queue_name,
+                worker_id=WORKER_ID,
+                redis_url=settings.rq_redis_url,
+            )
+        close_redis_clients()
         logger.info("queue.worker.stopped", extra={"queue_name": settings.rq_queue_name})
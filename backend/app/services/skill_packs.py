@@ -0,0 +1,914 @@
+"""Skill pack discovery and sync, runnable inline or as a background queue job.
+
+Discovery clones a pack repository and scans it for skills. That work is blocking
+(git subprocesses plus filesystem walks), so it always runs on a bounded thread
+pool, never on the event loop, and at most `skill_pack_sync_max_per_org` syncs
+per organization run at once in a process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import json
+import re
+import subprocess
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, TextIO, cast
+from urllib.parse import unquote, urlparse
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.models.skills import MarketplaceSkill, SkillPack
+from app.schemas.skills_marketplace import SkillPackSyncResponse, SkillPackSyncStatusRead
+from app.services.queue import QueuedTask, enqueue_task, redis_client
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+ALLOWED_PACK_SOURCE_SCHEMES = {"https"}
+GIT_CLONE_TIMEOUT_SECONDS = 30
+GIT_REV_PARSE_TIMEOUT_SECONDS = 10
+BRANCH_NAME_ALLOWED_RE = r"^[A-Za-z0-9._/\-]+$"
+SKILLS_INDEX_READ_CHUNK_BYTES = 16 * 1024
+
+
+def normalize_pack_branch(raw_branch: str | None) -> str:
+    if not raw_branch:
+        return "main"
+    normalized = raw_branch.strip()
+    if not normalized:
+        return "main"
+    if any(ch in normalized for ch in {"\n", "\r", "\t"}):
+        return "main"
+    if not re.match(BRANCH_NAME_ALLOWED_RE, normalized):
+        return "main"
+    return normalized
+
+
+@dataclass(frozen=True)
+class PackSkillCandidate:
+    """Single skill discovered in a pack repository."""
+
+    name: str
+    description: str | None
+    source_url: str
+    category: str | None = None
+    risk: str | None = None
+    source: str | None = None
+    metadata: dict[str, object] | None = None
+
+
+def infer_skill_name(source_url: str) -> str:
+    parsed = urlparse(source_url)
+    path = parsed.path.rstrip("/")
+    candidate = path.rsplit("/", maxsplit=1)[-1] if path else parsed.netloc
+    candidate = unquote(candidate).removesuffix(".git").replace("-", " ").replace("_", " ")
+    if candidate.strip():
+        return candidate.strip()
+    return "Skill"
+
+
+def _infer_skill_description(skill_file: Path) -> str | None:
+    try:
+        content = skill_file.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+
+    lines = [line.strip() for line in content.splitlines()]
+    if not lines:
+        return None
+
+    in_frontmatter = False
+    for line in lines:
+        if line == "---":
+            in_frontmatter = not in_frontmatter
+            continue
+        if in_frontmatter:
+            if line.lower().startswith("description:"):
+                value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
+                return value or None
+            continue
+        if not line or line.startswith("#"):
+            continue
+        return line
+
+    return None
+
+
+def _infer_skill_display_name(skill_file: Path, fallback: str) -> str:
+    try:
+        content = skill_file.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        content = ""
+
+    in_frontmatter = False
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if line == "---":
+            in_frontmatter = not in_frontmatter
+            continue
+        if in_frontmatter and line.lower().startswith("name:"):
+            value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
+            if value:
+                return value
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if line.startswith("#"):
+            heading = line.lstrip("#").strip()
+            if heading:
+                return heading
+
+    normalized_fallback = fallback.replace("-", " ").replace("_", " ").strip()
+    return normalized_fallback or "Skill"
+
+
+def normalize_repo_source_url(source_url: str) -> str:
+    normalized = source_url.strip().rstrip("/")
+    if normalized.endswith(".git"):
+        return normalized[: -len(".git")]
+    return normalized
+
+
+def normalize_pack_source_url(source_url: str) -> str:
+    """Normalize pack repository source URLs for uniqueness checks."""
+    return normalize_repo_source_url(source_url)
+
+
+def validate_pack_source_url(source_url: str) -> None:
+    """Validate that a skill pack source URL is safe to clone.
+
+    The current implementation is intentionally conservative:
+    - allow only https URLs
+    - block localhost
+    - block literal private/loopback/link-local IPs
+
+    Note: DNS-based private resolution is not checked here.
+    """
+
+    parsed = urlparse(source_url)
+    scheme = (parsed.scheme or "").lower()
+    if scheme not in ALLOWED_PACK_SOURCE_SCHEMES:
+        raise ValueError(f"Unsupported pack source URL scheme: {parsed.scheme!r}")
+
+    host = (parsed.hostname or "").strip().lower()
+    if not host:
+        raise ValueError("Pack source URL must include a hostname")
+
+    if host in {"localhost"}:
+        raise ValueError("Pack source URL hostname is not allowed")
+
+    if host != "github.com":
+        raise ValueError(
+            "Pack source URL must be a GitHub repository URL (https://github.com/<owner>/<repo>)"
+        )
+
+    path = parsed.path.strip("/")
+    if not path or path.count("/") < 1:
+        raise ValueError(
+            "Pack source URL must be a GitHub repository URL (https://github.com/<owner>/<repo>)"
+        )
+
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return
+
+    if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved or ip.is_multicast:
+        raise ValueError("Pack source URL hostname is not allowed")
+
+
+def _to_tree_source_url(repo_source_url: str, branch: str, rel_path: str) -> str:
+    repo_url = normalize_repo_source_url(repo_source_url)
+    safe_branch = branch.strip() or "main"
+    rel = rel_path.strip().lstrip("/")
+    if not rel:
+        return f"{repo_url}/tree/{safe_branch}"
+    return f"{repo_url}/tree/{safe_branch}/{rel}"
+
+
+def _normalize_repo_path(path_value: str) -> str:
+    cleaned = path_value.strip().replace("\\", "/")
+    while cleaned.startswith("./"):
+        cleaned = cleaned[2:]
+    cleaned = cleaned.lstrip("/").rstrip("/")
+
+    lowered = cleaned.lower()
+    if lowered.endswith("/skill.md"):
+        cleaned = cleaned.rsplit("/", maxsplit=1)[0]
+    elif lowered == "skill.md":
+        cleaned = ""
+
+    return cleaned
+
+
+def _coerce_index_entries(payload: object) -> list[dict[str, object]]:
+    if isinstance(payload, list):
+        return [entry for entry in payload if isinstance(entry, dict)]
+
+    if isinstance(payload, dict):
+        entries = payload.get("skills")
+        if isinstance(entries, list):
+            return [entry for entry in entries if isinstance(entry, dict)]
+
+    return []
+
+
+class _StreamingJSONReader:
+    """Incrementally decode JSON content from a file object."""
+
+    def __init__(self, file_obj: TextIO):
+        self._file_obj = file_obj
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill_buffer(self) -> None:
+        if self._eof:
+            return
+
+        chunk = self._file_obj.read(SKILLS_INDEX_READ_CHUNK_BYTES)
+        if not chunk:
+            self._eof = True
+            return
+        self._buffer += chunk
+
+    def _peek(self) -> str | None:
+        self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            return None
+        return self._buffer[self._position]
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position].isspace():
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return
+
+            self._fill_buffer()
+            if self._position < len(self._buffer):
+                return
+            if self._eof:
+                return
+
+    def _decode_value(self) -> object:
+        self._skip_whitespace()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                self._position = end
+                return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise RuntimeError("skills_index.json is not valid JSON")
+                self._fill_buffer()
+                self._skip_whitespace()
+                if self._position >= len(self._buffer):
+                    if self._eof:
+                        raise RuntimeError("skills_index.json is not valid JSON")
+
+    def _consume_char(self, expected: str) -> None:
+        self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            self._fill_buffer()
+            self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            raise RuntimeError("skills_index.json is not valid JSON")
+
+        actual = self._buffer[self._position]
+        if actual != expected:
+            raise RuntimeError("skills_index.json is not valid JSON")
+        self._position += 1
+
+    def read_top_level_entries(self) -> list[dict[str, object]]:
+        self._fill_buffer()
+        self._skip_whitespace()
+        first = self._peek()
+        if first is None:
+            raise RuntimeError("skills_index.json is not valid JSON")
+
+        if first == "[":
+            self._position += 1
+            return list(self._read_array_values())
+        if first == "{":
+            self._position += 1
+            return list(self._read_skills_from_object())
+        raise RuntimeError("skills_index.json is not valid JSON")
+
+    def _read_array_values(self) -> Iterator[dict[str, object]]:
+        while True:
+            self._skip_whitespace()
+            current = self._peek()
+            if current is None:
+                if self._eof:
+                    raise RuntimeError("skills_index.json is not valid JSON")
+                continue
+            if current == "]":
+                self._position += 1
+                return
+
+            if current == ",":
+                self._position += 1
+                continue
+
+            entry = self._decode_value()
+            if isinstance(entry, dict):
+                yield entry
+            else:
+                raise RuntimeError("skills_index.json is not valid JSON")
+
+    def _read_skills_from_object(self) -> Iterator[dict[str, object]]:
+        while True:
+            self._skip_whitespace()
+            current = self._peek()
+            if current is None:
+                if self._eof:
+                    raise RuntimeError("skills_index.json is not valid JSON")
+                continue
+
+            if current == "}":
+                self._position += 1
+                return
+
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise RuntimeError("skills_index.json is not valid JSON")
+
+            self._skip_whitespace()
+            if self._peek() == ":":
+                self._position += 1
+            else:
+                self._consume_char(":")
+
+            if key == "skills":
+                self._skip_whitespace()
+                current = self._peek()
+                if current is None:
+                    if self._eof:
+                        raise RuntimeError("skills_index.json is not valid JSON")
+                    continue
+
+                if current != "[":
+                    value = self._decode_value()
+                    if isinstance(value, list):
+                        for entry in value:
+                            if isinstance(entry, dict):
+                                yield entry
+                            else:
+                                raise RuntimeError("skills_index.json is not valid JSON")
+                    continue
+
+                self._position += 1
+                yield from self._read_array_values()
+            else:
+                self._decode_value()
+
+            self._skip_whitespace()
+            current = self._peek()
+            if current == ",":
+                self._position += 1
+                continue
+            if current == "}":
+                self._position += 1
+                return
+
+
+def _collect_pack_skills_from_index(
+    *,
+    repo_dir: Path,
+    source_url: str,
+    branch: str,
+    discovery_warnings: list[str] | None = None,
+) -> list[PackSkillCandidate] | None:
+    index_file = repo_dir / "skills_index.json"
+    if not index_file.is_file():
+        return None
+
+    try:
+        with index_file.open(encoding="utf-8") as fp:
+            payload = _StreamingJSONReader(fp).read_top_level_entries()
+    except OSError as exc:
+        raise RuntimeError("unable to read skills_index.json") from exc
+    except RuntimeError as exc:
+        if discovery_warnings is not None:
+            discovery_warnings.append(f"Failed to parse skills_index.json: {exc}")
+        return None
+
+    found: dict[str, PackSkillCandidate] = {}
+    for entry in _coerce_index_entries(payload):
+        indexed_path = entry.get("path")
+        has_indexed_path = False
+        rel_path = ""
+        resolved_skill_path: str | None = None
+        if isinstance(indexed_path, str) and indexed_path.strip():
+            has_indexed_path = True
+            rel_path = _normalize_repo_path(indexed_path)
+            resolved_skill_path = rel_path or None
+
+        indexed_source = entry.get("source_url")
+        candidate_source_url: str | None = None
+        resolved_metadata: dict[str, object] = {
+            "discovery_mode": "skills_index",
+            "pack_branch": branch,
+        }
+        if isinstance(indexed_source, str) and indexed_source.strip():
+            source_candidate = indexed_source.strip()
+            resolved_metadata["source_url"] = source_candidate
+            if source_candidate.startswith(("https://", "http://")):
+                parsed = urlparse(source_candidate)
+                if parsed.path:
+                    marker = "/tree/"
+                    marker_index = parsed.path.find(marker)
+                    if marker_index > 0:
+                        tree_suffix = parsed.path[marker_index + len(marker) :]
+                        slash_index = tree_suffix.find("/")
+                        candidate_path = tree_suffix[slash_index + 1 :] if slash_index >= 0 else ""
+                        resolved_skill_path = _normalize_repo_path(candidate_path)
+                candidate_source_url = source_candidate
+            else:
+                indexed_rel = _normalize_repo_path(source_candidate)
+                resolved_skill_path = resolved_skill_path or indexed_rel
+                resolved_metadata["resolved_path"] = indexed_rel
+                if indexed_rel:
+                    candidate_source_url = _to_tree_source_url(source_url, branch, indexed_rel)
+        elif has_indexed_path:
+            resolved_metadata["resolved_path"] = rel_path
+            candidate_source_url = _to_tree_source_url(source_url, branch, rel_path)
+            if rel_path:
+                resolved_skill_path = rel_path
+
+        if not candidate_source_url:
+            continue
+
+        indexed_name = entry.get("name")
+        if isinstance(indexed_name, str) and indexed_name.strip():
+            name = indexed_name.strip()
+        else:
+            fallback = Path(rel_path).name if rel_path else "Skill"
+            name = infer_skill_name(fallback)
+
+        indexed_description = entry.get("description")
+        description = (
+            indexed_description.strip()
+            if isinstance(indexed_description, str) and indexed_description.strip()
+            else None
+        )
+        indexed_category = entry.get("category")
+        category = (
+            indexed_category.strip()
+            if isinstance(indexed_category, str) and indexed_category.strip()
+            else None
+        )
+        indexed_risk = entry.get("risk")
+        risk = (
+            indexed_risk.strip() if isinstance(indexed_risk, str) and indexed_risk.strip() else None
+        )
+        source_label = resolved_skill_path
+
+        found[candidate_source_url] = PackSkillCandidate(
+            name=name,
+            description=description,
+            source_url=candidate_source_url,
+            category=category,
+            risk=risk,
+            source=source_label,
+            metadata=resolved_metadata,
+        )
+
+    return list(found.values())
+
+
+def collect_pack_skills_from_repo(
+    *,
+    repo_dir: Path,
+    source_url: str,
+    branch: str,
+    discovery_warnings: list[str] | None = None,
+) -> list[PackSkillCandidate]:
+    indexed = _collect_pack_skills_from_index(
+        repo_dir=repo_dir,
+        source_url=source_url,
+        branch=branch,
+        discovery_warnings=discovery_warnings,
+    )
+    if indexed is not None:
+        return indexed
+
+    found: dict[str, PackSkillCandidate] = {}
+    for skill_file in sorted(repo_dir.rglob("SKILL.md")):
+        rel_file_parts = skill_file.relative_to(repo_dir).parts
+        # Skip hidden folders like .git, .github, etc.
+        if any(part.startswith(".") for part in rel_file_parts):
+            continue
+
+        skill_dir = skill_file.parent
+        rel_dir = "" if skill_dir == repo_dir else skill_dir.relative_to(repo_dir).as_posix()
+        fallback_name = infer_skill_name(source_url) if skill_dir == repo_dir else skill_dir.name
+        name = _infer_skill_display_name(skill_file, fallback=fallback_name)
+        description = _infer_skill_description(skill_file)
+        tree_url = _to_tree_source_url(source_url, branch, rel_dir)
+        found[tree_url] = PackSkillCandidate(
+            name=name,
+            description=description,
+            source_url=tree_url,
+            metadata={
+                "discovery_mode": "skills_md",
+                "pack_branch": branch,
+                "skill_dir": rel_dir,
+            },
+        )
+
+    if found:
+        return list(found.values())
+
+    return []
+
+
+def collect_pack_skills(
+    *,
+    source_url: str,
+    branch: str = "main",
+) -> list[PackSkillCandidate]:
+    """Clone a pack repository and collect skills from index or `skills/**/SKILL.md`."""
+    return collect_pack_skills_with_warnings(
+        source_url=source_url,
+        branch=branch,
+    )[0]
+
+
+def collect_pack_skills_with_warnings(
+    *,
+    source_url: str,
+    branch: str,
+) -> tuple[list[PackSkillCandidate], list[str]]:
+    """Clone a pack repository and return discovered skills plus sync warnings."""
+    # Defense-in-depth: validate again at point of use before invoking git.
+    validate_pack_source_url(source_url)
+
+    requested_branch = normalize_pack_branch(branch)
+    discovery_warnings: list[str] = []
+
+    with TemporaryDirectory(prefix="skill-pack-sync-") as tmp_dir:
+        repo_dir = Path(tmp_dir)
+        used_branch = requested_branch
+        try:
+            subprocess.run(
+                [
+                    "git",
+                    "clone",
+                    "--depth",
+                    "1",
+                    "--single-branch",
+                    "--branch",
+                    requested_branch,
+                    source_url,
+                    str(repo_dir),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=GIT_CLONE_TIMEOUT_SECONDS,
+            )
+        except FileNotFoundError as exc:
+            raise RuntimeError("git binary not available on the server") from exc
+        except subprocess.TimeoutExpired as exc:
+            raise RuntimeError("timed out cloning pack repository") from exc
+        except subprocess.CalledProcessError as exc:
+            if requested_branch != "main":
+                try:
+                    subprocess.run(
+                        ["git", "clone", "--depth", "1", source_url, str(repo_dir)],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=GIT_CLONE_TIMEOUT_SECONDS,
+                    )
+                    used_branch = "main"
+                except (
+                    FileNotFoundError,
+                    subprocess.TimeoutExpired,
+                    subprocess.CalledProcessError,
+                ):
+                    stderr = (exc.stderr or "").strip()
+                    detail = "unable to clone pack repository"
+                    if stderr:
+                        detail = f"{detail}: {stderr.splitlines()[0][:200]}"
+                    raise RuntimeError(detail) from exc
+            else:
+                stderr = (exc.stderr or "").strip()
+                detail = "unable to clone pack repository"
+                if stderr:
+                    detail = f"{detail}: {stderr.splitlines()[0][:200]}"
+                raise RuntimeError(detail) from exc
+
+        try:
+            discovered_branch = subprocess.run(
+                ["git", "-C", str(repo_dir), "rev-parse", "--abbrev-ref", "HEAD"],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+            ).stdout.strip()
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            discovered_branch = used_branch or "main"
+
+        return (
+            collect_pack_skills_from_repo(
+                repo_dir=repo_dir,
+                source_url=source_url,
+                branch=normalize_pack_branch(discovered_branch),
+                discovery_warnings=discovery_warnings,
+            ),
+            discovery_warnings,
+        )
+
+
+def _apply_pack_candidate_updates(
+    *,
+    existing: MarketplaceSkill,
+    candidate: PackSkillCandidate,
+) -> bool:
+    changed = False
+    if existing.name != candidate.name:
+        existing.name = candidate.name
+        changed = True
+    if existing.description != candidate.description:
+        existing.description = candidate.description
+        changed = True
+    if existing.category != candidate.category:
+        existing.category = candidate.category
+        changed = True
+    if existing.risk != candidate.risk:
+        existing.risk = candidate.risk
+        changed = True
+    if existing.source != candidate.source:
+        existing.source = candidate.source
+        changed = True
+    if existing.metadata_ != (candidate.metadata or {}):
+        existing.metadata_ = candidate.metadata or {}
+        changed = True
+    return changed
+
+
+SKILL_PACK_SYNC_TASK_TYPE = "skill_pack_sync"
+_SYNC_STATUS_KEY_PREFIX = "mission-control:skill-pack-sync:"
+_SYNC_CLAIM_KEY_PREFIX = "mission-control:skill-pack-sync-active:"
+_ACTIVE_SYNC_STATES = frozenset({"queued", "running"})
+
+
+class _SkillPackSyncPool:
+    """Lazily created clone/scan pool plus per-organization admission limits."""
+
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    _org_slots: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[UUID, asyncio.Semaphore]]
+    ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.skill_pack_sync_workers,
+                thread_name_prefix="skill-pack-sync",
+            )
+        return cls._executor
+
+    @classmethod
+    def org_slots(cls, organization_id: UUID) -> asyncio.Semaphore:
+        per_org = cls._org_slots.setdefault(asyncio.get_running_loop(), {})
+        slots = per_org.get(organization_id)
+        if slots is None:
+            slots = asyncio.Semaphore(settings.skill_pack_sync_max_per_org)
+            per_org[organization_id] = slots
+        return slots
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+
+def shutdown_skill_pack_sync() -> None:
+    """Release clone/scan worker threads (called on application shutdown)."""
+    _SkillPackSyncPool.shutdown()
+
+
+async def run_skill_pack_sync(session: AsyncSession, pack: SkillPack) -> SkillPackSyncResponse:
+    """Clone a pack repository off the event loop and upsert its discovered skills.
+
+    Raises `RuntimeError` when the repository cannot be cloned.
+    """
+    source_url = pack.source_url
+    async with _SkillPackSyncPool.org_slots(pack.organization_id):
+        loop = asyncio.get_running_loop()
+        discovered = await loop.run_in_executor(
+            _SkillPackSyncPool.executor(),
+            partial(collect_pack_skills, source_url=source_url),
+        )
+
+    existing_skills = await MarketplaceSkill.objects.filter_by(
+        organization_id=pack.organization_id,
+    ).all(session)
+    existing_by_source = {skill.source_url: skill for skill in existing_skills}
+
+    created = 0
+    updated = 0
+    for candidate in discovered:
+        existing = existing_by_source.get(candidate.source_url)
+        if existing is None:
+            session.add(
+                MarketplaceSkill(
+                    organization_id=pack.organization_id,
+                    source_url=candidate.source_url,
+                    name=candidate.name,
+                    description=candidate.description,
+                    category=candidate.category,
+                    risk=candidate.risk,
+                    source=candidate.source,
+                    metadata_=candidate.metadata or {},
+                ),
+            )
+            created += 1
+            continue
+
+        changed = _apply_pack_candidate_updates(existing=existing, candidate=candidate)
+        if changed:
+            existing.updated_at = utcnow()
+            session.add(existing)
+            updated += 1
+
+    await session.commit()
+
+    return SkillPackSyncResponse(
+        pack_id=pack.id,
+        synced=len(discovered),
+        created=created,
+        updated=updated,
+        warnings=[],
+    )
+
+
+def _sync_status_key(pack_id: UUID) -> str:
+    return f"{_SYNC_STATUS_KEY_PREFIX}{pack_id}"
+
+
+def _sync_claim_key(pack_id: UUID) -> str:
+    return f"{_SYNC_CLAIM_KEY_PREFIX}{pack_id}"
+
+
+def _sync_claim_ttl() -> int:
+    return max(1, int(settings.skill_pack_sync_claim_ttl_seconds))
+
+
+def read_skill_pack_sync_status(pack_id: UUID) -> SkillPackSyncStatusRead | None:
+    """Return the active or latest finished background sync status for a pack."""
+    client = redis_client(settings.rq_redis_url)
+    raw = cast(bytes | None, client.get(_sync_claim_key(pack_id)))
+    if raw is None:
+        raw = cast(bytes | None, client.get(_sync_status_key(pack_id)))
+    if raw is None:
+        return None
+    return SkillPackSyncStatusRead.model_validate_json(raw)
+
+
+def _claim_skill_pack_sync(status: SkillPackSyncStatusRead) -> bool:
+    """Atomically take the pack's short-lived active-job claim if nobody holds it."""
+    claimed = redis_client(settings.rq_redis_url).set(
+        _sync_claim_key(status.pack_id),
+        status.model_dump_json(),
+        nx=True,
+        ex=_sync_claim_ttl(),
+    )
+    return bool(claimed)
+
+
+def _hold_skill_pack_sync_claim(status: SkillPackSyncStatusRead) -> None:
+    redis_client(settings.rq_redis_url).set(
+        _sync_claim_key(status.pack_id),
+        status.model_dump_json(),
+        ex=_sync_claim_ttl(),
+    )
+
+
+def _refresh_skill_pack_sync_claim(pack_id: UUID) -> None:
+    redis_client(settings.rq_redis_url).expire(_sync_claim_key(pack_id), _sync_claim_ttl())
+
+
+def _finish_skill_pack_sync(status: SkillPackSyncStatusRead) -> None:
+    """Store a terminal status for the long TTL and release the active claim."""
+    pipe = redis_client(settings.rq_redis_url).pipeline()
+    pipe.set(
+        _sync_status_key(status.pack_id),
+        status.model_dump_json(),
+        ex=int(settings.skill_pack_sync_status_ttl_seconds),
+    )
+    pipe.delete(_sync_claim_key(status.pack_id))
+    pipe.execute()
+
+
+async def _keep_skill_pack_sync_claim(pack_id: UUID) -> None:
+    """Refresh the active claim while a sync runs so only a live worker holds it."""
+    interval = settings.skill_pack_sync_claim_ttl_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_refresh_skill_pack_sync_claim, pack_id)
+        except Exception:
+            logger.warning("skill_pack.sync.claim_refresh_failed pack_id=%s", pack_id)
+
+
+def enqueue_skill_pack_sync(pack: SkillPack) -> SkillPackSyncStatusRead | None:
+    """Queue a background sync unless one is already queued or running.
+
+    The active claim is taken with a single `SET NX`, so concurrent requests queue
+    at most one job. It expires after `skill_pack_sync_claim_ttl_seconds` unless a
+    worker keeps refreshing it, so a crashed worker does not block re-syncs.
+
+    Returns the job status, or `None` when the task could not be queued.
+    """
+    status = SkillPackSyncStatusRead(pack_id=pack.id, status="queued", requested_at=utcnow())
+    while not _claim_skill_pack_sync(status):
+        current = read_skill_pack_sync_status(pack.id)
+        if current is not None and current.status in _ACTIVE_SYNC_STATES:
+            return current
+        # The claim expired between `SET NX` and the read; try to take it again.
+
+    queued = enqueue_task(
+        QueuedTask(
+            task_type=SKILL_PACK_SYNC_TASK_TYPE,
+            payload={"pack_id": str(pack.id), "organization_id": str(pack.organization_id)},
+            created_at=status.requested_at,
+        ),
+        settings.rq_queue_name,
+        redis_url=settings.rq_redis_url,
+    )
+    if not queued:
+        _finish_skill_pack_sync(
+            status.model_copy(
+                update={"status": "failed", "finished_at": utcnow(), "error": "enqueue failed"},
+            ),
+        )
+        return None
+    return status
+
+
+async def process_skill_pack_sync_task(task: QueuedTask) -> None:
+    """Queue worker handler: run one background pack sync and record its outcome.
+
+    Failures are recorded on the job status instead of raised, so the worker does
+    not retry a clone the user can simply re-trigger.
+    """
+    pack_id = UUID(str(task.payload["pack_id"]))
+    organization_id = UUID(str(task.payload["organization_id"]))
+    current = await asyncio.to_thread(read_skill_pack_sync_status, pack_id)
+    if current is None or current.status not in _ACTIVE_SYNC_STATES:
+        current = SkillPackSyncStatusRead(
+            pack_id=pack_id,
+            status="queued",
+            requested_at=task.created_at,
+        )
+    status = current.model_copy(update={"status": "running", "started_at": utcnow()})
+    await asyncio.to_thread(_hold_skill_pack_sync_claim, status)
+    keepalive = asyncio.create_task(_keep_skill_pack_sync_claim(pack_id))
+
+    update: dict[str, Any]
+    try:
+        async with async_session_maker() as session:
+            pack = await SkillPack.objects.filter_by(
+                id=pack_id,
+                organization_id=organization_id,
+            ).first(session)
+            if pack is None:
+                update = {"status": "failed", "error": "skill pack not found"}
+            else:
+                result = await run_skill_pack_sync(session, pack)
+                update = {"status": "succeeded", "result": result}
+    except RuntimeError as exc:
+        update = {"status": "failed", "error": str(exc)}
+    except Exception:
+        logger.exception("skill_pack.sync.failed pack_id=%s", pack_id)
+        update = {"status": "failed", "error": "unexpected error while syncing pack"}
+    finally:
+        keepalive.cancel()
+        with suppress(asyncio.CancelledError):
+            await keepalive
+
+    update["finished_at"] = utcnow()
+    await asyncio.to_thread(_finish_skill_pack_sync, status.model_copy(update=update))
@@ -238,3 +238,24 @@ async def dependent_task_ids(
         .where(col(TaskDependency.depends_on_task_id) == dependency_task_id),
     )
     return list(rows)
+
+
+async def dependent_task_ids_by_dependency_id(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    dependency_task_ids: Sequence[UUID],
+) -> dict[UUID, list[UUID]]:
+    """Return dependent task ids keyed by each provided dependency task id."""
+    if not dependency_task_ids:
+        return {}
+    rows = await session.exec(
+        select(col(TaskDependency.depends_on_task_id), col(TaskDependency.task_id))
+        .where(col(TaskDependency.board_id) == board_id)
+        .where(col(TaskDependency.depends_on_task_id).in_(dependency_task_ids))
+        .order_by(col(TaskDependency.created_at).asc()),
+    )
+    mapping: dict[UUID, list[UUID]] = defaultdict(list)
+    for depends_on_task_id, task_id in rows:
+        mapping[depends_on_task_id].append(task_id)
+    return dict(mapping)
@@ -0,0 +1,88 @@
+"""Record every task status change as a `TaskStatusTransition` row.
+
+A `before_flush` hook compares each new or modified task's status with its loaded
+value, so ORM writes from any endpoint or service are captured without call-site
+changes. Bulk `UPDATE` statements bypass the ORM; callers that change status that
+way record the transitions first with `record_bulk_status_transitions`.
+
+Transitions are stamped with the task's new `updated_at` when the same flush sets
+it (every status-changing path does), which keeps them in the hour the raw
+dashboard queries attribute the change to.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, attributes
+from sqlmodel import col, select
+
+from app.core.time import utcnow
+from app.models.task_status_transitions import TaskStatusTransition
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import UOWTransaction
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def _transition_for(task: Task, *, is_new: bool) -> TaskStatusTransition | None:
+    if task.board_id is None:
+        return None
+    if is_new:
+        from_status = None
+        changed_at = task.updated_at
+    else:
+        history = attributes.get_history(task, "status")
+        if not history.deleted or history.deleted[0] == task.status:
+            return None
+        from_status = history.deleted[0]
+        updated = attributes.get_history(task, "updated_at")
+        changed_at = task.updated_at if updated.added else utcnow()
+    return TaskStatusTransition(
+        board_id=task.board_id,
+        task_id=task.id,
+        from_status=from_status,
+        to_status=task.status,
+        in_progress_at=task.in_progress_at or task.previous_in_progress_at,
+        created_at=changed_at,
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _record_task_status_transitions(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: Any,
+) -> None:
+    candidates = [(obj, True) for obj in session.new if isinstance(obj, Task)]
+    candidates.extend((obj, False) for obj in session.dirty if isinstance(obj, Task))
+    transitions = [_transition_for(task, is_new=is_new) for task, is_new in candidates]
+    session.add_all(item for item in transitions if item is not None)
+
+
+async def record_bulk_status_transitions(
+    session: AsyncSession,
+    *criteria: Any,
+    to_status: str,
+    changed_at: datetime,
+) -> None:
+    """Record transitions for tasks a bulk `UPDATE` is about to move to `to_status`."""
+    rows = await session.exec(
+        select(col(Task.id), col(Task.board_id), col(Task.status))
+        .where(*criteria)
+        .where(col(Task.status) != to_status),
+    )
+    session.add_all(
+        TaskStatusTransition(
+            board_id=board_id,
+            task_id=task_id,
+            from_status=from_status,
+            to_status=to_status,
+            created_at=changed_at,
+        )
+        for task_id, board_id, from_status in rows
+        if board_id is not None
+    )
@@ -0,0 +1,104 @@
+"""Add the task status transition log used by metric rollups.
+
+Revision ID: a5c3e9d17b42
+Revises: d3a7f5c2b8e1
+Create Date: 2026-02-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a5c3e9d17b42"
+down_revision = "d3a7f5c2b8e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the transition table and seed one row per task from its current status.
+
+    Seeded rows reproduce what earlier rollups counted: inbox tasks at creation and
+    other tasks in the hour of their last update.
+    """
+    op.create_table(
+        "task_status_transitions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=False),
+        sa.Column("in_progress_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_task_status_transitions_board_id",
+        "task_status_transitions",
+        ["board_id"],
+    )
+    op.create_index(
+        "ix_task_status_transitions_task_id",
+        "task_status_transitions",
+        ["task_id"],
+    )
+    op.create_index(
+        "ix_task_status_transitions_created_at",
+        "task_status_transitions",
+        ["created_at"],
+    )
+
+    tasks_table = sa.table(
+        "tasks",
+        sa.column("id", sa.Uuid()),
+        sa.column("board_id", sa.Uuid()),
+        sa.column("status", sa.String()),
+        sa.column("in_progress_at", sa.DateTime()),
+        sa.column("created_at", sa.DateTime()),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    transitions_table = sa.table(
+        "task_status_transitions",
+        sa.column("id", sa.Uuid()),
+        sa.column("board_id", sa.Uuid()),
+        sa.column("task_id", sa.Uuid()),
+        sa.column("to_status", sa.String()),
+        sa.column("in_progress_at", sa.DateTime()),
+        sa.column("created_at", sa.DateTime()),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            tasks_table.c.id,
+            tasks_table.c.board_id,
+            tasks_table.c.status,
+            tasks_table.c.in_progress_at,
+            tasks_table.c.created_at,
+            tasks_table.c.updated_at,
+        ).where(tasks_table.c.board_id.is_not(None)),
+    )
+    seeded = [
+        {
+            "id": uuid4(),
+            "board_id": board_id,
+            "task_id": task_id,
+            "to_status": status,
+            "in_progress_at": in_progress_at,
+            "created_at": created_at if status == "inbox" else updated_at,
+        }
+        for task_id, board_id, status, in_progress_at, created_at, updated_at in rows
+    ]
+    if seeded:
+        op.bulk_insert(transitions_table, seeded)
+
+
+def downgrade() -> None:
+    """Drop the task status transition log."""
+    op.drop_index("ix_task_status_transitions_created_at", table_name="task_status_transitions")
+    op.drop_index("ix_task_status_transitions_task_id", table_name="task_status_transitions")
+    op.drop_index("ix_task_status_transitions_board_id", table_name="task_status_transitions")
+    op.drop_table("task_status_transitions")
@@ -0,0 +1,38 @@
+"""Add indexed agent token fingerprint for single-row auth lookup.
+
+Revision ID: c1d8e4a7f2b9
+Revises: b7a1d9c3e4f5
+Create Date: 2026-02-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c1d8e4a7f2b9"
+down_revision = "b7a1d9c3e4f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add agent_token_fingerprint column; existing rows backfill on next auth."""
+    op.add_column(
+        "agents",
+        sa.Column("agent_token_fingerprint", sa.String(), nullable=True),
+    )
+    op.create_index(
+        "ix_agents_agent_token_fingerprint",
+        "agents",
+        ["agent_token_fingerprint"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop agent_token_fingerprint column."""
+    op.drop_index("ix_agents_agent_token_fingerprint", table_name="agents")
+    op.drop_column("agents", "agent_token_fingerprint")
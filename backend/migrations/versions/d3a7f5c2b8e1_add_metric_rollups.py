@@ -0,0 +1,54 @@
+"""Add hourly metric rollup and watermark tables.
+
+Revision ID: d3a7f5c2b8e1
+Revises: c1d8e4a7f2b9
+Create Date: 2026-02-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d3a7f5c2b8e1"
+down_revision = "c1d8e4a7f2b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create metric rollup tables; the worker backfills them from the watermark."""
+    op.create_table(
+        "metric_rollups",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("hour", sa.DateTime(), nullable=False),
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "board_id",
+            "hour",
+            "metric",
+            name="uq_metric_rollups_board_id_hour_metric",
+        ),
+    )
+    op.create_index("ix_metric_rollups_board_id", "metric_rollups", ["board_id"])
+    op.create_index("ix_metric_rollups_hour", "metric_rollups", ["hour"])
+    op.create_table(
+        "metric_rollup_watermarks",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("rolled_until", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop metric rollup tables."""
+    op.drop_table("metric_rollup_watermarks")
+    op.drop_index("ix_metric_rollups_hour", table_name="metric_rollups")
+    op.drop_index("ix_metric_rollups_board_id", table_name="metric_rollups")
+    op.drop_table("metric_rollups")
@@ -1,56 +1,165 @@
 # ruff: noqa: INP001
-"""Regression test sketch for agent-token lookup complexity.
+"""Regression tests for agent-token lookup complexity.
 
 Context:
-- Current implementation performs PBKDF2 verification in a loop over *all* agents
+- Token lookup used to perform PBKDF2 verification in a loop over *all* agents
   that have a token hash (`agent_auth._find_agent_for_token`).
-- This is O(N_agents) *and* each verify is expensive (PBKDF2 200k iterations).
-
-This test is marked xfail to document the desired behavior after a hardening
-refactor: O(1) lookup + single hash verify.
-
-Once token lookup is refactored, flip this to a normal passing test.
+- Lookup now narrows to a single candidate via `Agent.agent_token_fingerprint`
+  and only scans legacy (fingerprint-less) agents, backfilling them on match.
 """
 
 from __future__ import annotations
 
 from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
 
 import pytest
 
 from app.core import agent_auth
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import agent_token_fingerprint, hash_agent_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_agent_token_cache() -> None:
+    agent_token_cache.clear()
+
+
+class _FakeSession:
+    def __init__(self, *results: list[Any]) -> None:
+        self._results = list(results)
+        self.exec_calls = 0
+        self.added: list[Any] = []
+        self.commits = 0
+        self.by_id: dict[Any, Any] = {}
+
+    async def exec(self, _stmt: object) -> list[Any]:
+        self.exec_calls += 1
+        if not self._results:
+            return []
+        return self._results.pop(0)
+
+    async def get(self, _model: object, ident: Any) -> Any:
+        return self.by_id.get(ident)
+
+    def add(self, value: Any) -> None:
+        self.added.append(value)
+
+    async def commit(self) -> None:
+        self.commits += 1
 
 
 @pytest.mark.asyncio
-@pytest.mark.xfail(
-    reason="Known DoS risk: agent token verification is currently O(N_agents)."
-    " Refactor token scheme/lookup to O(1) and make this pass.",
-    strict=False,
-)
 async def test_agent_token_lookup_should_not_verify_more_than_once(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # Fake a session that returns many agents with token hashes.
-    class _FakeSession:
-        async def exec(self, _stmt: object) -> list[object]:
-            agents = []
-            for i in range(50):
-                agents.append(
-                    SimpleNamespace(agent_token_hash=f"pbkdf2_sha256$1$salt{i}$digest{i}")
-                )
-            return agents
-
+    candidate = SimpleNamespace(
+        agent_token_hash="pbkdf2_sha256$1$salt$digest",
+        agent_token_fingerprint=agent_token_fingerprint("invalid"),
+    )
+    session = _FakeSession([candidate], [])
     calls = {"n": 0}
 
-    def _fake_verify(_token: str, _stored_hash: str) -> bool:
+    async def _fake_verify(_token: str, _stored_hash: str) -> bool:
         calls["n"] += 1
         # Always invalid
         return False
 
-    monkeypatch.setattr(agent_auth, "verify_agent_token", _fake_verify)
+    monkeypatch.setattr(agent_auth, "verify_agent_token_async", _fake_verify)
 
-    out = await agent_auth._find_agent_for_token(_FakeSession(), "invalid")  # type: ignore[arg-type]
+    out = await agent_auth._find_agent_for_token(session, "invalid")  # type: ignore[arg-type]
     assert out is None
-
-    # Desired behavior after refactor: avoid linear scan.
     assert calls["n"] <= 1
+
+
+@pytest.mark.asyncio
+async def test_agent_token_lookup_returns_fingerprint_match_without_legacy_scan() -> None:
+    token = "token-abc"
+    agent = SimpleNamespace(
+        id="agent-1",
+        agent_token_hash=hash_agent_token(token),
+        agent_token_fingerprint=agent_token_fingerprint(token),
+    )
+    session = _FakeSession([agent])
+
+    out = await agent_auth._find_agent_for_token(session, token)  # type: ignore[arg-type]
+
+    assert out is agent
+    assert session.exec_calls == 1
+    assert session.commits == 0
+
+
+@pytest.mark.asyncio
+async def test_agent_token_lookup_backfills_legacy_agent_fingerprint() -> None:
+    token = "legacy-token"
+    other = SimpleNamespace(
+        id="agent-other",
+        agent_token_hash=hash_agent_token("someone-else"),
+        agent_token_fingerprint=None,
+    )
+    legacy = SimpleNamespace(
+        id="agent-legacy",
+        agent_token_hash=hash_agent_token(token),
+        agent_token_fingerprint=None,
+    )
+    session = _FakeSession([], [other, legacy])
+
+    out = await agent_auth._find_agent_for_token(session, token)  # type: ignore[arg-type]
+
+    assert out is legacy
+    assert legacy.agent_token_fingerprint == agent_token_fingerprint(token)
+    assert other.agent_token_fingerprint is None
+    assert session.added == [legacy]
+    assert session.commits == 1
+
+
+def test_agent_token_fingerprint_is_stable_and_short() -> None:
+    assert agent_token_fingerprint("abc") == agent_token_fingerprint("abc")
+    assert agent_token_fingerprint("abc") != agent_token_fingerprint("abd")
+    assert len(agent_token_fingerprint("abc")) == 16
+
+
+@pytest.mark.asyncio
+async def test_agent_token_lookup_uses_cache_on_repeat_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    token = "cached-token"
+    agent = SimpleNamespace(
+        id=uuid4(),
+        agent_token_hash="pbkdf2_sha256$1$salt$digest",
+        agent_token_fingerprint=agent_token_fingerprint(token),
+    )
+    session = _FakeSession([agent])
+    session.by_id[agent.id] = agent
+    calls = {"n": 0}
+
+    async def _fake_verify(_token: str, _stored_hash: str) -> bool:
+        calls["n"] += 1
+        return True
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token_async", _fake_verify)
+
+    assert await agent_auth._find_agent_for_token(session, token) is agent  # type: ignore[arg-type]
+    assert await agent_auth._find_agent_for_token(session, token) is agent  # type: ignore[arg-type]
+
+    assert calls["n"] == 1
+    assert agent_token_cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_token_lookup_drops_cache_entry_after_rotation() -> None:
+    token = "rotated-token"
+    agent = SimpleNamespace(
+        id=uuid4(),
+        agent_token_hash=hash_agent_token("replacement"),
+        agent_token_fingerprint=agent_token_fingerprint("replacement"),
+    )
+    session = _FakeSession()
+    session.by_id[agent.id] = agent
+    agent_token_cache.put(token, agent.id)
+
+    out = await agent_auth._find_agent_for_token(session, token)  # type: ignore[arg-type]
+
+    assert out is None
+    assert agent_token_cache.stats().size == 0
@@ -127,6 +127,11 @@ async def test_delete_agent_as_lead_removes_board_agent(
     monkeypatch.setattr(agent_service.crud, "update_where", _fake_update_where)
     monkeypatch.setattr(agent_service, "record_activity", lambda *_a, **_k: None)
 
+    async def _fake_record_transitions(*_args: object, **_kwargs: object) -> None:
+        return None
+
+    monkeypatch.setattr(agent_service, "record_bulk_status_transitions", _fake_record_transitions)
+
     result = await service.delete_agent_as_lead(
         agent_id=str(target.id),
         actor_agent=lead,  # type: ignore[arg-type]
@@ -125,6 +125,11 @@ async def test_delete_gateway_main_agent_does_not_require_board_id(
     monkeypatch.setattr(agent_service.crud, "update_where", _fake_update_where)
     monkeypatch.setattr(agent_service, "record_activity", lambda *_a, **_k: None)
 
+    async def _fake_record_transitions(*_args: object, **_kwargs: object) -> None:
+        return None
+
+    monkeypatch.setattr(agent_service, "record_bulk_status_transitions", _fake_record_transitions)
+
     result = await service.delete_agent(agent_id=str(agent.id), ctx=ctx)  # type: ignore[arg-type]
 
     assert result.ok is True
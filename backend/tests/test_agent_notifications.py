@@ -0,0 +1,280 @@
+# ruff: noqa: INP001
+"""Tests for agent notification fan-out and the queued per-session outbox."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.agent_notifications as agent_notifications
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.services.openclaw.gateway_dispatch import (
+    AgentNotification,
+    GatewayDispatchService,
+    NotificationActivity,
+)
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.openclaw.internal.fanout import fan_out
+from app.services.queue import QueuedTask
+
+
+def _board(gateway_url: str) -> tuple[Board, GatewayClientConfig]:
+    board = Board(id=uuid4(), organization_id=uuid4(), name="b", slug="b", gateway_id=uuid4())
+    return board, GatewayClientConfig(url=gateway_url)
+
+
+def _notifications(board: Board, count: int) -> list[AgentNotification]:
+    return [
+        AgentNotification(
+            board_id=board.id,
+            session_key=f"agent:{index}:main",
+            agent_name=f"agent-{index}",
+            message="hello",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_limits_concurrency_per_key() -> None:
+    in_flight: dict[str, int] = {"a": 0, "b": 0}
+    peaks: dict[str, int] = {"a": 0, "b": 0}
+    total_peak = 0
+
+    async def _work(item: str) -> str:
+        nonlocal total_peak
+        in_flight[item] += 1
+        peaks[item] = max(peaks[item], in_flight[item])
+        total_peak = max(total_peak, sum(in_flight.values()))
+        await asyncio.sleep(0.01)
+        in_flight[item] -= 1
+        return item.upper()
+
+    items = ["a", "b", "a", "b", "a", "b"]
+    results = await fan_out(items, _work, limit=1, key=lambda item: item)
+
+    assert results == ["A", "B", "A", "B", "A", "B"]
+    assert peaks == {"a": 1, "b": 1}
+    assert total_peak == 2
+
+
+@pytest.mark.asyncio
+async def test_notify_agents_resolves_each_board_once_and_sends_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board_a, config_a = _board("ws://gateway-a/ws")
+    board_b, config_b = _board("ws://gateway-b/ws")
+    unconfigured, _ = _board("ws://unused/ws")
+    configs = {board_a.id: config_a, board_b.id: config_b}
+    resolved: list[Board] = []
+    sent: list[dict[str, Any]] = []
+    in_flight = 0
+    peak = 0
+
+    async def _config(_self: GatewayDispatchService, board: Board) -> GatewayClientConfig | None:
+        resolved.append(board)
+        return configs.get(board.id)
+
+    async def _send(_self: GatewayDispatchService, **kwargs: Any) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        sent.append(kwargs)
+
+    monkeypatch.setattr(GatewayDispatchService, "optional_gateway_config_for_board", _config)
+    monkeypatch.setattr(GatewayDispatchService, "try_send_agent_message", _send)
+    monkeypatch.setattr(agent_notifications.settings, "agent_notification_gateway_concurrency", 2)
+
+    notifications = [
+        *_notifications(board_a, 4),
+        *_notifications(board_b, 4),
+        *_notifications(unconfigured, 2),
+    ]
+    await agent_notifications.notify_agents(
+        None,  # type: ignore[arg-type]
+        notifications,
+        boards=[board_a, board_b, unconfigured, board_a],
+    )
+
+    assert [board.id for board in resolved] == [board_a.id, board_b.id, unconfigured.id]
+    assert len(sent) == 8
+    assert {item["config"] for item in sent} == {config_a, config_b}
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_notify_agents_appends_to_session_outbox_when_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board, _config = _board("ws://gateway/ws")
+    pushed: list[str] = []
+    inline: list[AgentNotification] = []
+
+    def _push(notification: AgentNotification) -> bool:
+        if notification.session_key == "agent:1:main":
+            raise ConnectionError("redis down")
+        pushed.append(agent_notifications._encode_notification(notification))
+        return True
+
+    async def _send(
+        _dispatch: GatewayDispatchService,
+        notifications: list[AgentNotification],
+        _boards: object,
+    ) -> None:
+        inline.extend(notifications)
+
+    monkeypatch.setattr(agent_notifications, "_push_outbox", _push)
+    monkeypatch.setattr(agent_notifications, "_send_batch", _send)
+    monkeypatch.setattr(agent_notifications.settings, "agent_notification_queue_enabled", True)
+
+    notifications = _notifications(board, 3)
+    await agent_notifications.notify_agents(
+        None,  # type: ignore[arg-type]
+        notifications,
+        boards=[board],
+    )
+
+    assert [item.session_key for item in inline] == ["agent:1:main"]
+    assert all("token" not in raw for raw in pushed)
+    assert [agent_notifications._decode_notification(raw) for raw in pushed] == [
+        notifications[0],
+        notifications[2],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_worker_coalesces_pending_messages_and_records_after_retry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    board, config = _board("ws://gateway/ws")
+    agent = Agent(board_id=board.id, gateway_id=uuid4(), name="worker")
+    task_ids = [uuid4(), uuid4()]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([Organization(id=board.organization_id, name="org"), board, agent])
+        await session.commit()
+
+    outbox = [
+        agent_notifications._encode_notification(
+            AgentNotification(
+                board_id=board.id,
+                session_key="agent:worker:main",
+                agent_name="worker",
+                message=f"TASK ASSIGNED {task_id}",
+                activities=(
+                    NotificationActivity(
+                        sent_event_type="task.assignee_notified",
+                        sent_message="sent",
+                        failed_event_type="task.assignee_notify_failed",
+                        failed_message="failed",
+                        agent_id=agent.id,
+                        task_id=task_id,
+                    ),
+                ),
+            ),
+        )
+        for task_id in task_ids
+    ]
+    finished: list[str] = []
+    sent: list[dict[str, Any]] = []
+
+    async def _config(_self: GatewayDispatchService, _board: Board) -> GatewayClientConfig:
+        return config
+
+    async def _send(_self: GatewayDispatchService, **kwargs: Any) -> None:
+        sent.append(kwargs)
+        if len(sent) == 1:
+            raise OpenClawGatewayError("gateway busy")
+
+    monkeypatch.setattr(agent_notifications, "_take_outbox", lambda _key: list(outbox))
+    monkeypatch.setattr(agent_notifications, "_finish_outbox", finished.append)
+    monkeypatch.setattr(
+        agent_notifications,
+        "async_session_maker",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+    monkeypatch.setattr(GatewayDispatchService, "optional_gateway_config_for_board", _config)
+    monkeypatch.setattr(GatewayDispatchService, "send_agent_message", _send)
+
+    task = QueuedTask(
+        task_type=agent_notifications.AGENT_NOTIFICATION_TASK_TYPE,
+        payload={"session_key": "agent:worker:main"},
+        created_at=utcnow(),
+    )
+    try:
+        with pytest.raises(OpenClawGatewayError):
+            await agent_notifications.process_agent_notification_task(task)
+        assert finished == []
+
+        await agent_notifications.process_agent_notification_task(replace(task, attempts=1))
+
+        assert finished == ["agent:worker:main"]
+        assert len(sent) == 2
+        message = sent[1]["message"]
+        assert message.startswith("2 NOTIFICATIONS")
+        assert all(f"TASK ASSIGNED {task_id}" in message for task_id in task_ids)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            events = (await session.exec(select(ActivityEvent))).all()
+        assert sorted((event.event_type, event.task_id) for event in events) == sorted(
+            ("task.assignee_notified", task_id) for task_id in task_ids
+        )
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_final_attempt_releases_outbox_on_unexpected_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board, _config = _board("ws://gateway/ws")
+    outbox = [
+        agent_notifications._encode_notification(
+            AgentNotification(
+                board_id=board.id,
+                session_key="agent:worker:main",
+                agent_name="worker",
+                message="hello",
+            ),
+        ),
+    ]
+    finished: list[str] = []
+
+    async def _deliver(*_args: object, **_kwargs: object) -> None:
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(agent_notifications, "_take_outbox", lambda _key: list(outbox))
+    monkeypatch.setattr(agent_notifications, "_finish_outbox", finished.append)
+    monkeypatch.setattr(agent_notifications, "_deliver_outbox", _deliver)
+    monkeypatch.setattr(agent_notifications.settings, "rq_dispatch_max_retries", 2)
+    task = QueuedTask(
+        task_type=agent_notifications.AGENT_NOTIFICATION_TASK_TYPE,
+        payload={"session_key": "agent:worker:main"},
+        created_at=utcnow(),
+        attempts=1,
+    )
+
+    # A retry is still coming: the in-flight messages and pending flag stay put.
+    with pytest.raises(RuntimeError):
+        await agent_notifications.process_agent_notification_task(task)
+    assert finished == []
+
+    # The worker will drop the task after this attempt, so the outbox is released.
+    with pytest.raises(RuntimeError):
+        await agent_notifications.process_agent_notification_task(replace(task, attempts=2))
+    assert finished == ["agent:worker:main"]
@@ -78,6 +78,35 @@ def test_templates_root_points_to_repo_templates_dir():
     assert (root / "BOARD_AGENTS.md.j2").exists()
 
 
+def test_render_agent_files_reuses_environment_and_compiled_overrides(monkeypatch):
+    monkeypatch.setattr(
+        agent_provisioning, "_override_templates", type(agent_provisioning._override_templates)()
+    )
+    compiled: list[str] = []
+    env = agent_provisioning._template_env()
+    original_from_string = env.from_string
+
+    def _counting_from_string(source, *args, **kwargs):
+        compiled.append(source)
+        return original_from_string(source, *args, **kwargs)
+
+    monkeypatch.setattr(env, "from_string", _counting_from_string)
+    first = _AgentStub(name="Alice", identity_template="Name: {{ agent_name }}")
+    second = _AgentStub(name="Bob", identity_template="Name: {{ agent_name }}")
+
+    for agent in (first, second):
+        rendered = agent_provisioning._render_agent_files(
+            {"agent_name": agent.name},
+            agent,
+            {"IDENTITY.md"},
+            include_bootstrap=False,
+        )
+        assert rendered == {"IDENTITY.md": f"Name: {agent.name}"}
+
+    assert agent_provisioning._template_env() is env
+    assert compiled == ["Name: {{ agent_name }}"]
+
+
 def test_user_context_uses_email_fallback_when_name_is_missing():
     user = SimpleNamespace(
         name=None,
@@ -452,6 +481,79 @@ async def test_set_agent_files_update_overwrite_writes_preserved_user_md():
     assert ("USER.md", "filled") in cp.writes
 
 
+@pytest.mark.asyncio
+async def test_set_agent_files_skips_uploads_the_gateway_already_has():
+    class _ControlPlaneStub:
+        def __init__(self):
+            self.writes: list[tuple[str, str]] = []
+
+        async def set_agent_file(self, *, agent_id, name, content):
+            self.writes.append((name, content))
+
+    @dataclass
+    class _GatewayTiny:
+        id: UUID
+        name: str
+        url: str
+        token: str | None
+        workspace_root: str
+
+    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
+        def _agent_id(self, agent):
+            return "agent-x"
+
+        def _build_context(self, *, agent, auth_token, user, board):
+            return {}
+
+    gateway = _GatewayTiny(
+        id=uuid4(),
+        name="G",
+        url="ws://x",
+        token=None,
+        workspace_root="/tmp",
+    )
+    cp = _ControlPlaneStub()
+    mgr = _Manager(gateway, cp)  # type: ignore[arg-type]
+    rendered = {"AGENTS.md": "agents", "TOOLS.md": "tools"}
+
+    async def _sync(existing_files, **kwargs):
+        cp.writes.clear()
+        return await mgr._set_agent_files(
+            agent_id="agent-x",
+            rendered=rendered,
+            existing_files=existing_files,
+            action="update",
+            **kwargs,
+        )
+
+    first = await _sync({})
+    assert len(cp.writes) == 2
+    assert (first.files_written, first.files_unchanged) == (2, 0)
+
+    listed = {
+        "AGENTS.md": {"name": "AGENTS.md", "missing": False, "size": 6},
+        "TOOLS.md": {"name": "TOOLS.md", "missing": False, "size": 99},
+    }
+    second = await _sync(listed)
+    # TOOLS.md changed size on the gateway, so only it is re-uploaded.
+    assert cp.writes == [("TOOLS.md", "tools")]
+    assert (second.files_written, second.files_unchanged, second.bytes_unchanged) == (1, 1, 6)
+
+    rendered["AGENTS.md"] = "agents v2"
+    third = await _sync(listed | {"TOOLS.md": {"name": "TOOLS.md", "size": 5}})
+    assert cp.writes == [("AGENTS.md", "agents v2")]
+    assert third.files_unchanged == 1
+
+    forced = await _sync(listed, overwrite=True)
+    assert len(cp.writes) == 2
+    assert forced.files_unchanged == 0
+
+    # Without a listed size the gateway copy cannot be checked, so both are re-uploaded.
+    unsized = await _sync({name: {"name": name, "missing": False} for name in rendered})
+    assert len(cp.writes) == 2
+    assert unsized.files_unchanged == 0
+
+
 @pytest.mark.asyncio
 async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
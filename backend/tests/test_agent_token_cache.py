@@ -0,0 +1,127 @@
+# ruff: noqa: INP001
+"""Unit tests for the verified agent-token cache."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from uuid import uuid4
+
+import pytest
+
+from app.core import agent_token_cache
+from app.core.agent_token_cache import AgentTokenCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss_counters() -> None:
+    cache = AgentTokenCache(max_entries=4, ttl_seconds=30)
+    agent_id = uuid4()
+
+    assert cache.get("tok") is None
+    cache.put("tok", agent_id)
+    assert cache.get("tok") == agent_id
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_cache_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache = AgentTokenCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.put("tok", uuid4())
+
+    clock.now = 10.0
+
+    assert cache.get("tok") is None
+    assert cache.stats().size == 0
+
+
+def test_cache_drops_least_recently_used_entry_when_full() -> None:
+    cache = AgentTokenCache(max_entries=2, ttl_seconds=30)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    cache.put("a", first)
+    cache.put("b", second)
+    assert cache.get("a") == first
+
+    cache.put("c", third)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == first
+    assert cache.get("c") == third
+
+
+def test_evict_agent_removes_all_tokens_for_agent() -> None:
+    cache = AgentTokenCache(max_entries=8, ttl_seconds=30)
+    target, other = uuid4(), uuid4()
+    cache.put("old", target)
+    cache.put("new", target)
+    cache.put("keep", other)
+
+    cache.evict_agent(target)
+
+    assert cache.get("old") is None
+    assert cache.get("new") is None
+    assert cache.get("keep") == other
+    assert cache.stats().evictions == 2
+
+
+def test_zero_ttl_disables_cache() -> None:
+    cache = AgentTokenCache(max_entries=8, ttl_seconds=0)
+    cache.put("tok", uuid4())
+
+    assert cache.get("tok") is None
+    assert cache.stats().size == 0
+
+
+def test_stats_log_line_reports_counters(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    cache = AgentTokenCache(max_entries=4, ttl_seconds=30)
+    cache.put("tok", uuid4())
+    cache.get("tok")
+    cache.get("tok")
+    cache.get("other")
+    monkeypatch.setattr(agent_token_cache, "agent_token_cache", cache)
+
+    with caplog.at_level(logging.INFO, logger=agent_token_cache.logger.name):
+        agent_token_cache.log_agent_token_cache_stats()
+
+    record = next(r for r in caplog.records if r.getMessage() == "agent_token_cache.stats")
+    assert (record.hits, record.misses, record.size) == (2, 1, 1)
+    assert record.hit_ratio == 0.667
+
+
+@pytest.mark.asyncio
+async def test_stats_logging_runs_until_stopped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lines: list[None] = []
+    monkeypatch.setattr(
+        agent_token_cache.settings,
+        "agent_token_cache_stats_log_interval_seconds",
+        0.01,
+    )
+    monkeypatch.setattr(
+        agent_token_cache,
+        "log_agent_token_cache_stats",
+        lambda: lines.append(None),
+    )
+
+    agent_token_cache.start_agent_token_cache_stats_logging()
+    await asyncio.sleep(0.05)
+    await agent_token_cache.stop_agent_token_cache_stats_logging()
+    logged = len(lines)
+
+    # Periodic lines plus one final line on shutdown, then nothing more.
+    assert logged >= 2
+    await asyncio.sleep(0.03)
+    assert len(lines) == logged
@@ -0,0 +1,68 @@
+# ruff: noqa: INP001
+"""Tests for agent token hashing helpers and their worker-pool wrappers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core import agent_tokens
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_round_trip() -> None:
+    token = agent_tokens.generate_agent_token()
+
+    stored = await agent_tokens.hash_agent_token_async(token)
+
+    assert await agent_tokens.verify_agent_token_async(token, stored) is True
+    assert await agent_tokens.verify_agent_token_async("wrong", stored) is False
+    assert agent_tokens.verify_agent_token(token, stored) is True
+
+
+@pytest.mark.asyncio
+async def test_async_verify_runs_off_event_loop_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[str] = []
+
+    def _fake_verify(_token: str, _stored_hash: str) -> bool:
+        seen.append(threading.current_thread().name)
+        return True
+
+    monkeypatch.setattr(agent_tokens, "verify_agent_token", _fake_verify)
+
+    assert await agent_tokens.verify_agent_token_async("tok", "hash") is True
+    assert seen and seen[0].startswith("agent-token-hash")
+
+
+@pytest.mark.asyncio
+async def test_async_verify_respects_concurrency_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(agent_tokens.settings, "agent_token_hash_max_concurrency", 2)
+    monkeypatch.setattr(
+        agent_tokens._TokenHashPool, "_slots", type(agent_tokens._TokenHashPool._slots)()
+    )
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+    release = threading.Event()
+
+    def _fake_verify(_token: str, _stored_hash: str) -> bool:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        release.wait(timeout=1)
+        with lock:
+            active["now"] -= 1
+        return True
+
+    monkeypatch.setattr(agent_tokens, "verify_agent_token", _fake_verify)
+
+    jobs = [asyncio.create_task(agent_tokens.verify_agent_token_async("t", "h")) for _ in range(6)]
+    await asyncio.sleep(0.05)
+    release.set()
+    assert all(await asyncio.gather(*jobs))
+    assert active["peak"] <= 2
@@ -11,6 +11,7 @@ from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.boards import Board
 from app.schemas.approvals import ApprovalRead, ApprovalUpdate
+from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 
 
@@ -94,14 +95,14 @@ async def test_update_approval_notifies_lead_when_approved(
         return lead
 
     async def _fake_optional_gateway_config_for_board(
-        self: approvals.GatewayDispatchService,
+        self: GatewayDispatchService,
         _board: Board,
     ) -> GatewayClientConfig:
         _ = self
         return GatewayClientConfig(url="ws://gateway.example/ws", token=None)
 
     async def _fake_try_send_agent_message(
-        self: approvals.GatewayDispatchService,
+        self: GatewayDispatchService,
         **kwargs: Any,
     ) -> None:
         _ = self
@@ -110,12 +111,12 @@ async def test_update_approval_notifies_lead_when_approved(
 
     monkeypatch.setattr(approvals, "_resolve_board_lead", _fake_resolve_lead)
     monkeypatch.setattr(
-        approvals.GatewayDispatchService,
+        GatewayDispatchService,
         "optional_gateway_config_for_board",
         _fake_optional_gateway_config_for_board,
     )
     monkeypatch.setattr(
-        approvals.GatewayDispatchService,
+        GatewayDispatchService,
         "try_send_agent_message",
         _fake_try_send_agent_message,
     )
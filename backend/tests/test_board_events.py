@@ -0,0 +1,142 @@
+# ruff: noqa: INP001
+"""Tests for board change notifications used to wake SSE streams."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.activity_events import ActivityEvent
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services import board_events
+from app.services.board_events import BoardEventBus, board_event_bus
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    await session.commit()
+    return board
+
+
+@pytest.mark.asyncio
+async def test_subscription_wakes_only_for_matching_keys() -> None:
+    bus = BoardEventBus(redis_url=None)
+    board_id, other_id = uuid4(), uuid4()
+    subscription = bus.subscribe([("tasks", board_id)])
+
+    bus.publish([("tasks", other_id), ("approvals", board_id)])
+    assert await subscription.wait(timeout=0.01) is False
+
+    bus.publish([("tasks", board_id)])
+    assert await subscription.wait(timeout=0.01) is True
+
+    subscription.close()
+    bus.publish([("tasks", board_id)])
+    assert await subscription.wait(timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_unknown_board_scope_wakes_every_subscriber_for_topic() -> None:
+    bus = BoardEventBus(redis_url=None)
+    first = bus.subscribe([("tasks", uuid4())])
+    second = bus.subscribe([("tasks", uuid4())])
+    memory = bus.subscribe([("memory", uuid4())])
+
+    bus.publish([("tasks", None)])
+
+    assert await first.wait(timeout=0.01) is True
+    assert await second.wait(timeout=0.01) is True
+    assert await memory.wait(timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_commit_publishes_board_memory_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(board_events.settings, "sse_event_bus_redis_enabled", False)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            with board_event_bus().subscribe([("memory", board.id)]) as subscription:
+                session.add(BoardMemory(board_id=board.id, content="hello", is_chat=True))
+                await session.flush()
+                assert await subscription.wait(timeout=0.01) is False
+
+                await session.commit()
+                assert await subscription.wait(timeout=0.01) is True
+    finally:
+        await board_events.close_board_event_bus()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rollback_discards_pending_notifications(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(board_events.settings, "sse_event_bus_redis_enabled", False)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            with board_event_bus().subscribe([("memory", board.id)]) as subscription:
+                session.add(BoardMemory(board_id=board.id, content="draft", is_chat=False))
+                await session.flush()
+                await session.rollback()
+                await session.commit()
+                assert await subscription.wait(timeout=0.01) is False
+    finally:
+        await board_events.close_board_event_bus()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_task_activity_resolves_board_from_loaded_task(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(board_events.settings, "sse_event_bus_redis_enabled", False)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            task = Task(board_id=board.id, title="t")
+            session.add(task)
+            await session.commit()
+            bus = board_event_bus()
+            this_board = bus.subscribe([("tasks", board.id)])
+            other_board = bus.subscribe([("tasks", uuid4())])
+
+            session.add(ActivityEvent(event_type="task.comment", message="hi", task_id=task.id))
+            await session.commit()
+
+            assert await this_board.wait(timeout=0.01) is True
+            assert await other_board.wait(timeout=0.01) is False
+    finally:
+        await board_events.close_board_event_bus()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_remote_messages_from_other_processes_wake_subscribers() -> None:
+    bus = BoardEventBus(redis_url=None)
+    board_id = uuid4()
+    subscription = bus.subscribe([("agents", board_id)])
+
+    bus._handle_remote(f'{{"origin": "other", "keys": [["agents", "{board_id}"]]}}')
+    await asyncio.sleep(0)
+
+    assert await subscription.wait(timeout=0.01) is True
@@ -0,0 +1,130 @@
+# ruff: noqa: INP001
+"""Tests for per-board task limits in board-group snapshots."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.time import utcnow
+from app.models.board_groups import BoardGroup
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services import board_group_snapshot
+from app.services.tags import TagState
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_group(session: AsyncSession) -> tuple[BoardGroup, list[Board]]:
+    org = Organization(id=uuid4(), name="org")
+    group = BoardGroup(id=uuid4(), organization_id=org.id, name="g", slug="g")
+    boards = [
+        Board(
+            id=uuid4(),
+            organization_id=org.id,
+            name=name,
+            slug=name,
+            board_group_id=group.id,
+        )
+        for name in ("alpha", "beta")
+    ]
+    session.add(org)
+    session.add(group)
+    session.add_all(boards)
+    await session.commit()
+    return group, boards
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_limits_tasks_per_board_in_sql(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            group, boards = await _seed_group(session)
+            now = utcnow()
+            for board in boards:
+                session.add(
+                    Task(board_id=board.id, title="done", status="done", priority="high"),
+                )
+                for index in range(6):
+                    session.add(
+                        Task(
+                            board_id=board.id,
+                            title=f"{board.name}-inbox-{index}",
+                            status="inbox",
+                            priority="low",
+                            updated_at=now - timedelta(minutes=index),
+                        ),
+                    )
+                session.add(
+                    Task(
+                        board_id=board.id,
+                        title=f"{board.name}-review",
+                        status="review",
+                        priority="medium",
+                    ),
+                )
+            await session.commit()
+
+            tagged_ids: list[UUID] = []
+
+            async def _fake_load_tag_state(
+                _session: AsyncSession,
+                *,
+                task_ids: list[UUID],
+            ) -> dict[UUID, TagState]:
+                tagged_ids.extend(task_ids)
+                return {}
+
+            monkeypatch.setattr(board_group_snapshot, "load_tag_state", _fake_load_tag_state)
+
+            snapshot = await board_group_snapshot.build_group_snapshot(
+                session,
+                group=group,
+                per_board_task_limit=3,
+            )
+
+        titles = {item.board.name: [task.title for task in item.tasks] for item in snapshot.boards}
+        assert titles == {
+            "alpha": ["alpha-review", "alpha-inbox-0", "alpha-inbox-1"],
+            "beta": ["beta-review", "beta-inbox-0", "beta-inbox-1"],
+        }
+        assert len(tagged_ids) == 6
+        assert snapshot.boards[0].task_counts == {"done": 1, "inbox": 6, "review": 1}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_with_zero_limit_skips_task_query() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            group, boards = await _seed_group(session)
+            session.add(Task(board_id=boards[0].id, title="t"))
+            await session.commit()
+
+            snapshot = await board_group_snapshot.build_group_snapshot(
+                session,
+                group=group,
+                per_board_task_limit=0,
+            )
+
+        assert all(item.tasks == [] for item in snapshot.boards)
+        assert snapshot.boards[0].task_counts == {"inbox": 1}
+    finally:
+        await engine.dispose()
@@ -0,0 +1,158 @@
+# ruff: noqa: INP001
+"""Tests for cached board snapshots, their invalidation, and ETag handling."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import boards as boards_api
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.view_models import BoardSnapshot
+from app.services import board_events, board_snapshot
+from app.services.board_snapshot import BoardSnapshotCache, CachedBoardSnapshot
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    await session.commit()
+    return board
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(board_events.settings, "sse_event_bus_redis_enabled", False)
+    board_snapshot.board_snapshot_cache.clear()
+
+
+def _cached(payload: str) -> CachedBoardSnapshot:
+    return CachedBoardSnapshot(body=payload.encode(), etag=f'"{payload}"')
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    clock = _Clock()
+    cache = BoardSnapshotCache(max_boards=4, ttl_seconds=10, clock=clock)
+    board_id = uuid4()
+    cache.put(board_id, _cached("a"), generation=cache.generation(board_id))
+
+    clock.now = 9.9
+    assert cache.get(board_id) == _cached("a")
+    clock.now = 10.0
+    assert cache.get(board_id) is None
+
+
+def test_cache_discards_snapshot_built_across_an_invalidation() -> None:
+    cache = BoardSnapshotCache(max_boards=4, ttl_seconds=10)
+    board_id, other_id = uuid4(), uuid4()
+    generation = cache.generation(board_id)
+    other_generation = cache.generation(other_id)
+
+    cache.invalidate(board_id)
+    cache.put(board_id, _cached("stale"), generation=generation)
+    cache.put(other_id, _cached("fresh"), generation=other_generation)
+
+    assert cache.get(board_id) is None
+    assert cache.get(other_id) == _cached("fresh")
+
+    cache.invalidate_keys(frozenset({("tasks", None)}))
+    assert cache.get(other_id) is None
+
+
+def test_etag_matching_accepts_lists_and_weak_validators() -> None:
+    cached = _cached("abc")
+
+    assert cached.matches('"other", W/"abc"')
+    assert cached.matches("*")
+    assert not cached.matches('"other"')
+    assert not cached.matches(None)
+
+
+@pytest.mark.asyncio
+async def test_committed_task_change_invalidates_cached_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds = 0
+    build = board_snapshot.build_board_snapshot
+
+    async def _counting_build(session: AsyncSession, board: Board) -> BoardSnapshot:
+        nonlocal builds
+        builds += 1
+        return await build(session, board)
+
+    monkeypatch.setattr(board_snapshot, "build_board_snapshot", _counting_build)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+
+            first = await board_snapshot.load_board_snapshot(session, board)
+            again = await board_snapshot.load_board_snapshot(session, board)
+            assert again is first
+            assert builds == 1
+            assert json.loads(first.body)["tasks"] == []
+
+            session.add(Task(board_id=board.id, title="new task"))
+            await session.commit()
+
+            rebuilt = await board_snapshot.load_board_snapshot(session, board)
+            assert builds == 2
+            assert rebuilt.etag != first.etag
+            assert [task["title"] for task in json.loads(rebuilt.body)["tasks"]] == ["new task"]
+    finally:
+        await board_events.close_board_event_bus()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_endpoint_returns_not_modified_for_matching_etag() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+
+            response = await boards_api.get_board_snapshot(
+                SimpleNamespace(headers={}),  # type: ignore[arg-type]
+                board=board,
+                session=session,
+            )
+            etag = response.headers["etag"]
+            assert response.status_code == 200
+            assert json.loads(response.body)["board"]["id"] == str(board.id)
+
+            not_modified = await boards_api.get_board_snapshot(
+                SimpleNamespace(headers={"if-none-match": etag}),  # type: ignore[arg-type]
+                board=board,
+                session=session,
+            )
+            assert not_modified.status_code == 304
+            assert not_modified.body == b""
+            assert not_modified.headers["etag"] == etag
+    finally:
+        await board_events.close_board_event_bus()
+        await engine.dispose()
@@ -0,0 +1,177 @@
+# ruff: noqa: INP001
+"""Tests for the shared per-board SSE fan-out hub."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import pytest
+
+from app.core.time import utcnow
+from app.services import board_events, board_stream_hub
+from app.services.board_events import board_event_bus
+from app.services.board_stream_hub import (
+    HubSubscriber,
+    StreamMessage,
+    board_stream_hubs,
+    stream_board_messages,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from datetime import datetime
+    from uuid import UUID
+
+
+class _FakeRequest:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+class _FakeFeed:
+    """Fetcher over an in-memory message list that counts hub vs. catch-up queries."""
+
+    def __init__(self) -> None:
+        self.messages: list[StreamMessage] = []
+        self.calls: list[datetime] = []
+
+    def append(self, key: str, *, is_chat: bool | None = None) -> StreamMessage:
+        message = StreamMessage(
+            event="memory",
+            data=f'{{"key": "{key}"}}',
+            key=key,
+            cursor=utcnow(),
+            is_chat=is_chat,
+        )
+        self.messages.append(message)
+        return message
+
+    async def fetch(self, _session: Any, _board_id: UUID, since: datetime) -> list[StreamMessage]:
+        self.calls.append(since)
+        return [message for message in self.messages if message.cursor >= since]
+
+
+@asynccontextmanager
+async def _fake_session() -> AsyncIterator[None]:
+    yield None
+
+
+@pytest.fixture(autouse=True)
+def _local_bus(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(board_events.settings, "sse_event_bus_redis_enabled", False)
+    monkeypatch.setattr(board_stream_hub, "async_session_maker", _fake_session)
+
+
+async def _next(stream: AsyncIterator[dict[str, str]]) -> dict[str, str]:
+    return await asyncio.wait_for(anext(stream), timeout=1)
+
+
+def test_subscriber_flags_lag_instead_of_growing_without_bound() -> None:
+    subscriber = HubSubscriber(max_buffered=2)
+    feed = _FakeFeed()
+    first, second, third = feed.append("a"), feed.append("b"), feed.append("c")
+
+    subscriber.offer([first, second])
+    assert subscriber.lagged is False
+    subscriber.offer([third])
+
+    assert subscriber.lagged is True
+    subscriber.reset()
+    assert subscriber.lagged is False
+
+
+@pytest.mark.asyncio
+async def test_viewers_of_one_board_share_a_single_query_per_change() -> None:
+    feed = _FakeFeed()
+    board_id = uuid4()
+    since = utcnow() + timedelta(hours=1)
+    streams = [
+        stream_board_messages(
+            _FakeRequest(),  # type: ignore[arg-type]
+            topic="memory",
+            board_id=board_id,
+            since=since,
+            fetch=feed.fetch,
+        )
+        for _ in range(3)
+    ]
+    pending = [asyncio.ensure_future(_next(stream)) for stream in streams]
+    await asyncio.sleep(0.01)
+    hub = board_stream_hubs().get("memory", board_id)
+    assert hub is not None
+    assert hub.subscriber_count == 3
+    assert hub.fetch_count == 1
+
+    feed.append("m1")
+    board_event_bus().notify_local([("memory", board_id)])
+    results = await asyncio.gather(*pending)
+
+    assert [result["data"] for result in results] == ['{"key": "m1"}'] * 3
+    assert hub.fetch_count == 2
+    assert len(feed.calls) == 2
+
+    for stream in streams:
+        await stream.aclose()  # type: ignore[attr-defined]
+    assert board_stream_hubs().get("memory", board_id) is None
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_catches_up_from_its_own_since() -> None:
+    feed = _FakeFeed()
+    board_id = uuid4()
+    since = utcnow() - timedelta(minutes=1)
+    feed.append("earlier")
+    stream = stream_board_messages(
+        _FakeRequest(),  # type: ignore[arg-type]
+        topic="memory",
+        board_id=board_id,
+        since=since,
+        fetch=feed.fetch,
+    )
+
+    first = await _next(stream)
+
+    assert first == {"event": "memory", "data": '{"key": "earlier"}'}
+    assert since in feed.calls
+    await stream.aclose()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_include_filter_is_applied_per_subscriber() -> None:
+    feed = _FakeFeed()
+    board_id = uuid4()
+    since = utcnow() + timedelta(hours=1)
+    chat_only = stream_board_messages(
+        _FakeRequest(),  # type: ignore[arg-type]
+        topic="memory",
+        board_id=board_id,
+        since=since,
+        fetch=feed.fetch,
+        include=lambda message: message.is_chat is True,
+    )
+    everything = stream_board_messages(
+        _FakeRequest(),  # type: ignore[arg-type]
+        topic="memory",
+        board_id=board_id,
+        since=since,
+        fetch=feed.fetch,
+    )
+    chat_next = asyncio.ensure_future(_next(chat_only))
+    all_next = asyncio.ensure_future(_next(everything))
+    await asyncio.sleep(0.01)
+
+    feed.append("note", is_chat=False)
+    feed.append("chat", is_chat=True)
+    board_event_bus().notify_local([("memory", board_id)])
+
+    assert (await all_next)["data"] == '{"key": "note"}'
+    assert (await chat_next)["data"] == '{"key": "chat"}'
+    await chat_only.aclose()  # type: ignore[attr-defined]
+    await everything.aclose()  # type: ignore[attr-defined]
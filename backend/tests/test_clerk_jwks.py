@@ -0,0 +1,172 @@
+# ruff: noqa: INP001, SLF001
+"""Tests for local Clerk session verification against a cached JWKS."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import jwt
+import pytest
+from clerk_backend_api.security.types import (
+    AuthStatus,
+    TokenVerificationError,
+    TokenVerificationErrorReason,
+)
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.core import auth
+from app.core.clerk_jwks import ClerkSessionVerifier
+from app.core.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeJWKS:
+    """Serves the current signing keys and counts fetches."""
+
+    def __init__(self) -> None:
+        self.keys: dict[str, rsa.RSAPrivateKey] = {}
+        self.fetches = 0
+
+    def rotate(self, kid: str) -> None:
+        self.keys[kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer sk_test"
+        self.fetches += 1
+        keys = [
+            {**RSAAlgorithm.to_jwk(key.public_key(), as_dict=True), "kid": kid, "use": "sig"}
+            for kid, key in self.keys.items()
+        ]
+        return httpx.Response(200, json={"keys": keys})
+
+    def token(self, kid: str, **claims: Any) -> str:
+        payload = {"sub": "user_1", "iat": int(time.time()), "exp": int(time.time()) + 60}
+        payload.update(claims)
+        return jwt.encode(payload, self.keys[kid], algorithm="RS256", headers={"kid": kid})
+
+
+def _verifier(jwks: _FakeJWKS, clock: _Clock) -> ClerkSessionVerifier:
+    return ClerkSessionVerifier(
+        jwks_url="https://clerk.test/v1/jwks",
+        secret_key="sk_test",
+        refresh_seconds=3600,
+        min_refresh_interval_seconds=30,
+        leeway_seconds=0,
+        verify_iat=True,
+        verified_tokens=TTLCache(max_entries=16, ttl_seconds=300, clock=clock),
+        transport=httpx.MockTransport(jwks.handler),
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_verifier_caches_keys_and_verified_tokens() -> None:
+    jwks = _FakeJWKS()
+    jwks.rotate("kid-1")
+    clock = _Clock()
+    verifier = _verifier(jwks, clock)
+
+    first = jwks.token("kid-1", sub="user_1")
+    assert (await verifier.verify(first))["sub"] == "user_1"
+    assert (await verifier.verify(jwks.token("kid-1", sub="user_2")))["sub"] == "user_2"
+    assert jwks.fetches == 1
+    assert len(verifier._verified_tokens) == 2
+
+    # A cached token is answered without touching the keys at all.
+    verifier._keys = {}
+    assert (await verifier.verify(first))["sub"] == "user_1"
+
+
+@pytest.mark.asyncio
+async def test_verifier_refetches_on_rotation_with_rate_limit() -> None:
+    jwks = _FakeJWKS()
+    jwks.rotate("kid-1")
+    clock = _Clock()
+    verifier = _verifier(jwks, clock)
+    await verifier.verify(jwks.token("kid-1"))
+
+    clock.now += 31
+    jwks.rotate("kid-2")
+    assert (await verifier.verify(jwks.token("kid-2")))["sub"] == "user_1"
+    assert jwks.fetches == 2
+
+    jwks.rotate("kid-3")
+    with pytest.raises(TokenVerificationError) as excinfo:
+        await verifier.verify(jwks.token("kid-3"))
+    assert excinfo.value.reason == TokenVerificationErrorReason.JWK_KID_MISMATCH
+    assert jwks.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_verifier_refreshes_stale_keys_in_background() -> None:
+    jwks = _FakeJWKS()
+    jwks.rotate("kid-1")
+    clock = _Clock()
+    verifier = _verifier(jwks, clock)
+    await verifier.verify(jwks.token("kid-1", sub="a"))
+
+    clock.now += 3601
+    await verifier.verify(jwks.token("kid-1", sub="b"))
+    assert verifier._background_refresh is not None
+    await asyncio.wait_for(verifier._background_refresh, timeout=1)
+    assert jwks.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_verifier_rejects_expired_and_forged_tokens() -> None:
+    jwks = _FakeJWKS()
+    jwks.rotate("kid-1")
+    verifier = _verifier(jwks, _Clock())
+
+    with pytest.raises(TokenVerificationError) as excinfo:
+        await verifier.verify(jwks.token("kid-1", exp=int(time.time()) - 5))
+    assert excinfo.value.reason == TokenVerificationErrorReason.TOKEN_EXPIRED
+
+    forger = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    forged = jwt.encode(
+        {"sub": "user_1", "exp": int(time.time()) + 60},
+        forger,
+        algorithm="RS256",
+        headers={"kid": "kid-1"},
+    )
+    with pytest.raises(TokenVerificationError) as excinfo:
+        await verifier.verify(forged)
+    assert excinfo.value.reason == TokenVerificationErrorReason.TOKEN_INVALID_SIGNATURE
+
+
+@pytest.mark.asyncio
+async def test_authenticate_clerk_request_reads_bearer_and_session_cookie(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    jwks = _FakeJWKS()
+    jwks.rotate("kid-1")
+    verifier = _verifier(jwks, _Clock())
+    monkeypatch.setattr(auth, "_clerk_session_verifier", lambda: verifier)
+    token = jwks.token("kid-1", sub="user_9")
+
+    bearer = await auth._authenticate_clerk_request(
+        SimpleNamespace(headers={"Authorization": f"Bearer {token}"}, cookies={}),  # type: ignore[arg-type]
+    )
+    cookie = await auth._authenticate_clerk_request(
+        SimpleNamespace(headers={}, cookies={"__session": token}),  # type: ignore[arg-type]
+    )
+    missing = await auth._authenticate_clerk_request(
+        SimpleNamespace(headers={}, cookies={}),  # type: ignore[arg-type]
+    )
+
+    assert bearer.status == AuthStatus.SIGNED_IN
+    assert bearer.payload is not None and bearer.payload["sub"] == "user_9"
+    assert cookie.status == AuthStatus.SIGNED_IN
+    assert missing.status == AuthStatus.SIGNED_OUT
@@ -0,0 +1,77 @@
+# ruff: noqa: INP001
+"""Tests for cached gateway config resolution used by notification dispatch."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.gateway_resolver as gateway_resolver
+from app.core.ttl_cache import TTLCache
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_gateway_config_is_cached_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        gateway_resolver,
+        "_gateway_configs",
+        TTLCache(max_entries=8, ttl_seconds=60),
+    )
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            gateway = Gateway(
+                organization_id=org_id,
+                name="gw",
+                url="ws://one",
+                token=" secret ",
+                workspace_root="/w",
+            )
+            board = Board(organization_id=org_id, name="b", slug="b", gateway_id=gateway.id)
+            foreign_board = Board(
+                organization_id=uuid4(), name="f", slug="f", gateway_id=gateway.id
+            )
+            session.add_all([Organization(id=org_id, name="org"), gateway, board])
+            await session.commit()
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            config = await gateway_resolver.cached_gateway_config_for_board(session, board)
+            assert config == GatewayClientConfig(url="ws://one", token="secret")
+            assert (
+                await gateway_resolver.cached_gateway_config_for_board(session, foreign_board)
+                is None
+            )
+
+            await session.exec(
+                update(Gateway).where(col(Gateway.id) == gateway.id).values(url="ws://two"),
+            )
+            await session.commit()
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            cached = await gateway_resolver.cached_gateway_config_for_board(session, board)
+            assert cached == config
+
+            gateway_resolver.invalidate_gateway_config(gateway.id)
+            refreshed = await gateway_resolver.cached_gateway_config_for_board(session, board)
+            assert refreshed == GatewayClientConfig(url="ws://two", token="secret")
+    finally:
+        await engine.dispose()
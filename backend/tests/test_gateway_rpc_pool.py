@@ -0,0 +1,204 @@
+# ruff: noqa: INP001
+"""Tests for the pooled, multiplexed OpenClaw gateway RPC client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from websockets.asyncio.server import ServerConnection, serve
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_rpc import (
+    GatewayConfig,
+    GatewayConnectionPool,
+    OpenClawGatewayError,
+)
+
+
+@dataclass
+class _FakeGateway:
+    handshakes: int = 0
+    requests: list[str] = field(default_factory=list)
+    delays: dict[str, float] = field(default_factory=dict)
+    connections: list[ServerConnection] = field(default_factory=list)
+
+    async def handler(self, ws: ServerConnection) -> None:
+        self.connections.append(ws)
+        await ws.send(json.dumps({"type": "event", "event": "connect.challenge"}))
+        async for raw in ws:
+            data = json.loads(raw)
+            if data["method"] == "connect":
+                self.handshakes += 1
+                await ws.send(json.dumps({"type": "res", "id": data["id"], "ok": True}))
+                continue
+            asyncio.create_task(self._respond(ws, data))
+
+    async def _respond(self, ws: ServerConnection, data: dict[str, Any]) -> None:
+        method = data["method"]
+        self.requests.append(method)
+        await asyncio.sleep(self.delays.get(method, 0))
+        if method == "noise":
+            await ws.send(json.dumps(["not", "an", "object"]))
+        if method == "fail":
+            body = {"type": "res", "id": data["id"], "ok": False, "error": {"message": "nope"}}
+        else:
+            body = {"type": "res", "id": data["id"], "ok": True, "payload": {"echo": method}}
+        await ws.send(json.dumps(body))
+
+
+@asynccontextmanager
+async def _fake_gateway() -> AsyncIterator[tuple[_FakeGateway, GatewayConfig]]:
+    gateway = _FakeGateway()
+    async with serve(gateway.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield gateway, GatewayConfig(url=f"ws://127.0.0.1:{port}")
+
+
+def _pool(**overrides: Any) -> GatewayConnectionPool:
+    options: dict[str, Any] = {
+        "max_connections": 2,
+        "max_in_flight": 8,
+        "idle_seconds": 60.0,
+        "ping_interval": None,
+    }
+    options.update(overrides)
+    return GatewayConnectionPool(**options)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_one_handshake_for_sequential_calls() -> None:
+    async with _fake_gateway() as (gateway, config):
+        pool = _pool()
+        try:
+            for method in ("agents.list", "agents.files.list", "agents.files.set"):
+                assert await pool.call(method, None, config=config) == {"echo": method}
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 1
+        assert gateway.requests == ["agents.list", "agents.files.list", "agents.files.set"]
+
+
+@pytest.mark.asyncio
+async def test_pool_multiplexes_concurrent_calls_by_request_id() -> None:
+    async with _fake_gateway() as (gateway, config):
+        gateway.delays = {"slow": 0.1}
+        pool = _pool()
+        try:
+            slow = asyncio.create_task(pool.call("slow", None, config=config))
+            await asyncio.sleep(0.02)
+            fast = await pool.call("fast", None, config=config)
+            assert fast == {"echo": "fast"}
+            assert not slow.done()
+            assert await slow == {"echo": "slow"}
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_surfaces_gateway_errors_without_dropping_connection() -> None:
+    async with _fake_gateway() as (gateway, config):
+        pool = _pool()
+        try:
+            with pytest.raises(OpenClawGatewayError, match="nope"):
+                await pool.call("fail", None, config=config)
+            assert await pool.call("health", None, config=config) == {"echo": "health"}
+            assert pool.connection_count(config) == 1
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_times_out_unanswered_calls_and_frees_the_slot() -> None:
+    async with _fake_gateway() as (gateway, config):
+        gateway.delays = {"hung": 10.0}
+        pool = _pool(max_in_flight=1, max_connections=1, request_timeout=0.05)
+        try:
+            with pytest.raises(OpenClawGatewayError, match="timed out"):
+                await pool.call("hung", None, config=config)
+            assert await pool.call("health", None, config=config) == {"echo": "health"}
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_ignores_frames_that_are_not_objects() -> None:
+    async with _fake_gateway() as (gateway, config):
+        pool = _pool()
+        try:
+            assert await pool.call("noise", None, config=config) == {"echo": "noise"}
+            assert await pool.call("health", None, config=config) == {"echo": "health"}
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_reconnects_after_server_closes_connection() -> None:
+    async with _fake_gateway() as (gateway, config):
+        pool = _pool()
+        try:
+            await pool.call("health", None, config=config)
+            await gateway.connections[0].close()
+            await asyncio.sleep(0.05)
+
+            assert await pool.call("health", None, config=config) == {"echo": "health"}
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_opens_extra_connection_only_when_saturated() -> None:
+    async with _fake_gateway() as (gateway, config):
+        gateway.delays = {"slow": 0.1}
+        pool = _pool(max_in_flight=1, max_connections=2)
+        try:
+            results = await asyncio.gather(
+                *(pool.call("slow", None, config=config) for _ in range(4))
+            )
+        finally:
+            await pool.close()
+
+        assert results == [{"echo": "slow"}] * 4
+        assert gateway.handshakes == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_idle_connections() -> None:
+    async with _fake_gateway() as (gateway, config):
+        pool = _pool(idle_seconds=0.0)
+        try:
+            await pool.call("health", None, config=config)
+            await pool.call("health", None, config=config)
+        finally:
+            await pool.close()
+
+        assert gateway.handshakes == 2
+
+
+@pytest.mark.asyncio
+async def test_openclaw_call_routes_through_event_loop_pool() -> None:
+    async with _fake_gateway() as (gateway, config):
+        try:
+            await gateway_rpc.openclaw_call("health", config=config)
+            await gateway_rpc.ensure_session("agent:main", config=config)
+        finally:
+            await gateway_rpc.close_gateway_connections()
+
+        assert gateway.handshakes == 1
+        assert gateway.requests == ["health", "sessions.patch"]
@@ -0,0 +1,217 @@
+# ruff: noqa: INP001
+"""Tests for concurrent gateway template sync workers."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.provisioning_db as provisioning_db
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.schemas.gateways import GatewayTemplatesSyncResult
+
+
+def _result() -> GatewayTemplatesSyncResult:
+    return GatewayTemplatesSyncResult(
+        gateway_id=uuid4(),
+        include_main=False,
+        reset_sessions=False,
+        agents_updated=0,
+        agents_skipped=0,
+        main_updated=False,
+    )
+
+
+def _work(count: int) -> list[tuple[object, object]]:
+    return [
+        (SimpleNamespace(id=uuid4(), name=f"agent-{index}"), SimpleNamespace(id=uuid4()))
+        for index in range(count)
+    ]
+
+
+async def _collect(
+    ctx: object,
+    result: GatewayTemplatesSyncResult,
+    work: list,
+    stop: asyncio.Event | None = None,
+) -> list:
+    return [
+        outcome
+        async for outcome in provisioning_db._sync_agents_concurrently(
+            ctx,  # type: ignore[arg-type]
+            result,
+            work,
+            stop=stop or asyncio.Event(),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_workers_are_bounded_and_merge_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(provisioning_db.settings, "gateway_template_sync_concurrency", 3)
+    running = 0
+    peak = 0
+
+    async def _sync_one(_ctx, agent_result, agent, _board):  # type: ignore[no-untyped-def]
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if agent.name == "agent-4":
+            agent_result.agents_skipped += 1
+            provisioning_db._append_sync_error(agent_result, agent=agent, message="no token")
+            return "skipped"
+        agent_result.agents_updated += 1
+        return "updated"
+
+    monkeypatch.setattr(provisioning_db, "_sync_one_agent", _sync_one)
+    result = _result()
+    ctx = SimpleNamespace(gateway=SimpleNamespace(id=result.gateway_id))
+
+    outcomes = await _collect(ctx, result, _work(10))
+
+    assert peak == 3
+    assert len(outcomes) == 10
+    assert (result.agents_updated, result.agents_skipped) == (9, 1)
+    skipped = [outcome for outcome in outcomes if outcome.status == "skipped"]
+    assert [outcome.agent_name for outcome in skipped] == ["agent-4"]
+    assert skipped[0].errors[0].message == "no token"
+
+
+@pytest.mark.asyncio
+async def test_agent_with_provisioning_errors_is_reported_as_failed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _sync_one(_ctx, agent_result, agent, _board):  # type: ignore[no-untyped-def]
+        # Provisioning raised: counted as skipped in the totals, but it is a failure.
+        agent_result.agents_skipped += 1
+        provisioning_db._append_sync_error(
+            agent_result,
+            agent=agent,
+            message="Failed to sync templates: boom",
+        )
+        return "failed"
+
+    monkeypatch.setattr(provisioning_db, "_sync_one_agent", _sync_one)
+    result = _result()
+    ctx = SimpleNamespace(gateway=SimpleNamespace(id=result.gateway_id))
+
+    stop = asyncio.Event()
+    outcomes = await _collect(ctx, result, _work(1), stop)
+
+    assert not stop.is_set()
+    assert [outcome.status for outcome in outcomes] == ["failed"]
+    assert outcomes[0].errors[0].message == "Failed to sync templates: boom"
+
+
+@pytest.mark.asyncio
+async def test_sync_stops_starting_agents_after_a_fatal_gateway_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(provisioning_db.settings, "gateway_template_sync_concurrency", 2)
+    started: list[str] = []
+
+    async def _sync_one(_ctx, agent_result, agent, _board):  # type: ignore[no-untyped-def]
+        started.append(agent.name)
+        await asyncio.sleep(0.01)
+        if agent.name == "agent-0":
+            provisioning_db._append_sync_error(agent_result, agent=agent, message="down")
+            return "fatal"
+        agent_result.agents_updated += 1
+        return "updated"
+
+    monkeypatch.setattr(provisioning_db, "_sync_one_agent", _sync_one)
+    result = _result()
+    ctx = SimpleNamespace(gateway=SimpleNamespace(id=result.gateway_id))
+
+    stop = asyncio.Event()
+    outcomes = await _collect(ctx, result, _work(6), stop)
+
+    assert stop.is_set()
+    assert started == ["agent-0", "agent-1"]
+    assert {outcome.agent_name: outcome.status for outcome in outcomes} == {
+        "agent-0": "failed",
+        "agent-1": "updated",
+    }
+    assert [error.message for error in result.errors] == ["down"]
+
+
+@pytest.mark.asyncio
+async def test_failed_board_agent_does_not_skip_the_main_agent(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            organization = Organization(id=uuid4(), name="org")
+            gateway = Gateway(
+                id=uuid4(),
+                organization_id=organization.id,
+                name="gw",
+                url="https://gateway.example.local",
+                workspace_root="/workspace/openclaw",
+            )
+            board = Board(
+                id=uuid4(),
+                organization_id=organization.id,
+                gateway_id=gateway.id,
+                name="b",
+                slug="b",
+            )
+            session.add_all([organization, gateway, board])
+            session.add(Agent(board_id=board.id, gateway_id=gateway.id, name="worker"))
+            await session.commit()
+            main_synced: list[bool] = []
+
+            async def _sync_one(_ctx, agent_result, agent, _board):  # type: ignore[no-untyped-def]
+                agent_result.agents_skipped += 1
+                provisioning_db._append_sync_error(
+                    agent_result,
+                    agent=agent,
+                    message="Failed to sync templates: boom",
+                )
+                return "failed"
+
+            async def _sync_main(_ctx: object, _result: object) -> bool:
+                main_synced.append(True)
+                return False
+
+            async def _ping(_ctx: object, _result: object) -> bool:
+                return True
+
+            async def _no_paused_boards(_session: object, _board_ids: object) -> set[object]:
+                return set()
+
+            monkeypatch.setattr(provisioning_db, "_ping_gateway", _ping)
+            monkeypatch.setattr(provisioning_db, "_paused_board_ids", _no_paused_boards)
+            monkeypatch.setattr(provisioning_db, "_sync_one_agent", _sync_one)
+            monkeypatch.setattr(provisioning_db, "_sync_main_agent", _sync_main)
+
+            result = await provisioning_db.OpenClawProvisioningService(
+                session,
+            ).sync_gateway_templates(
+                gateway,
+                provisioning_db.GatewayTemplateSyncOptions(
+                    user=SimpleNamespace(id=uuid4()),  # type: ignore[arg-type]
+                    include_main=True,
+                ),
+            )
+
+        assert main_synced == [True]
+        assert [error.message for error in result.errors] == ["Failed to sync templates: boom"]
+    finally:
+        await engine.dispose()
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from types import SimpleNamespace
 from typing import Any
@@ -13,6 +14,7 @@ from fastapi import HTTPException, status
 
 import app.services.openclaw.coordination_service as coordination_lifecycle
 import app.services.openclaw.onboarding_service as onboarding_lifecycle
+from app.schemas.gateway_coordination import GatewayLeadBroadcastRequest
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.shared import GatewayAgentIdentity
@@ -270,3 +272,79 @@ async def test_board_onboarding_dispatch_answer_maps_timeout_error(
 
     assert exc_info.value.status_code == status.HTTP_502_BAD_GATEWAY
     assert "Gateway onboarding answer dispatch failed:" in str(exc_info.value.detail)
+
+
+@pytest.mark.asyncio
+async def test_gateway_lead_broadcast_dispatches_concurrently_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway_id = uuid4()
+    boards = [_BoardStub(id=uuid4(), gateway_id=gateway_id, name=f"b{i}") for i in range(5)]
+
+    class _BroadcastSession(_FakeSession):
+        async def exec(self, _statement: object) -> list[_BoardStub]:
+            return boards
+
+    session = _BroadcastSession()
+    service = coordination_lifecycle.GatewayCoordinationService(session)  # type: ignore[arg-type]
+    actor = _AgentStub(id=uuid4(), name="Gateway Agent")
+    monkeypatch.setattr(coordination_lifecycle.settings, "gateway_lead_broadcast_concurrency", 2)
+    running = 0
+    peak = 0
+
+    async def _fake_require_gateway_main_actor(
+        self: coordination_lifecycle.GatewayCoordinationService,
+        _actor: object,
+    ) -> tuple[object, GatewayClientConfig]:
+        _ = self
+        gateway = SimpleNamespace(id=gateway_id, url="ws://gateway.example/ws")
+        return gateway, GatewayClientConfig(url="ws://gateway.example/ws", token=None)
+
+    async def _fake_ensure_board_lead(
+        self: coordination_lifecycle.GatewayCoordinationService,
+        *,
+        board: _BoardStub,
+        **_kwargs: object,
+    ) -> tuple[_AgentStub, bool]:
+        _ = self
+        if board is boards[1]:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
+        return _AgentStub(id=uuid4(), name="Lead", openclaw_session_id=f"lead-{board.id}"), False
+
+    async def _fake_send_agent_message(self, **kwargs: Any) -> None:
+        nonlocal running, peak
+        _ = self
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if kwargs["session_key"] == f"lead-{boards[3].id}":
+            raise OpenClawGatewayError("agent not found")
+
+    monkeypatch.setattr(
+        coordination_lifecycle.GatewayCoordinationService,
+        "require_gateway_main_actor",
+        _fake_require_gateway_main_actor,
+    )
+    monkeypatch.setattr(
+        coordination_lifecycle.GatewayCoordinationService,
+        "_ensure_board_lead",
+        _fake_ensure_board_lead,
+    )
+    monkeypatch.setattr(
+        coordination_lifecycle.GatewayDispatchService,
+        "send_agent_message",
+        _fake_send_agent_message,
+    )
+
+    response = await service.broadcast_gateway_lead_message(
+        actor_agent=actor,  # type: ignore[arg-type]
+        payload=GatewayLeadBroadcastRequest(content="Status check"),
+    )
+
+    assert peak == 2
+    assert (response.sent, response.failed) == (3, 2)
+    assert [result.board_id for result in response.results] == [board.id for board in boards]
+    assert [result.ok for result in response.results] == [True, False, True, False, True]
+    assert session.committed == 1
+    assert len(session.added) == 1
@@ -0,0 +1,277 @@
+# ruff: noqa: INP001
+"""Tests for the hourly dashboard metric rollup job."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import metrics as metrics_api
+from app.api.metrics import MetricWindows, RangeSpec
+from app.models.activity_events import ActivityEvent
+from app.models.boards import Board
+from app.models.metric_rollups import MetricRollup
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services import metric_rollups
+from app.services import task_status_transitions as _task_status_transitions
+from app.services.metric_rollups import (
+    cycle_time_bucket_index,
+    cycle_time_bucket_metric,
+    load_rollup_watermark,
+    median_from_histogram,
+    roll_up_metrics,
+)
+
+_HOUR = datetime(2026, 2, 10, 10, 0, 0)
+# Rollups read the transition log this module's session hook writes.
+_HOOKS = (_task_status_transitions,)
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    await session.commit()
+    return board
+
+
+async def _rollup_values(session: AsyncSession) -> dict[tuple[datetime, str], float]:
+    rows = await session.exec(select(MetricRollup).order_by(col(MetricRollup.hour)))
+    return {(row.hour, row.metric): row.value for row in rows}
+
+
+def test_median_is_interpolated_inside_its_histogram_bucket() -> None:
+    # Three tasks in (1h, 2h] and one in (4h, 8h]: the median sits halfway into (1h, 2h].
+    counts = {cycle_time_bucket_index(1.5): 3.0, cycle_time_bucket_index(6): 1.0}
+
+    assert median_from_histogram(counts) == pytest.approx(1 + (2 / 3))
+    assert median_from_histogram({}) is None
+    assert median_from_histogram({cycle_time_bucket_index(10_000): 1.0}) == 720.0
+
+
+@pytest.mark.asyncio
+async def test_roll_up_aggregates_closed_hours_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(metric_rollups.settings, "metrics_rollup_settle_seconds", 300)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            reviewed = Task(
+                board_id=board.id,
+                title="reviewed",
+                status="review",
+                created_at=_HOUR - timedelta(hours=3),
+                in_progress_at=_HOUR - timedelta(hours=1, minutes=30),
+                updated_at=_HOUR + timedelta(minutes=30),
+            )
+            inbox = Task(
+                board_id=board.id,
+                title="inbox",
+                status="inbox",
+                created_at=_HOUR + timedelta(minutes=10),
+                updated_at=_HOUR + timedelta(minutes=10),
+            )
+            # Still inside the settle window, so it must wait for a later run.
+            late = Task(
+                board_id=board.id,
+                title="late",
+                status="done",
+                created_at=_HOUR + timedelta(hours=1, minutes=58),
+                updated_at=_HOUR + timedelta(hours=1, minutes=58),
+            )
+            session.add_all([reviewed, inbox, late])
+            await session.commit()
+            session.add_all(
+                [
+                    ActivityEvent(
+                        event_type="task.comment",
+                        task_id=reviewed.id,
+                        created_at=_HOUR + timedelta(minutes=5),
+                    ),
+                    ActivityEvent(
+                        event_type="agent.dispatch_failed",
+                        task_id=reviewed.id,
+                        created_at=_HOUR + timedelta(minutes=6),
+                    ),
+                ],
+            )
+            await session.commit()
+
+            now = _HOUR + timedelta(hours=2, minutes=2)
+            rolled = await roll_up_metrics(session, now=now)
+            assert rolled == 4
+            assert await roll_up_metrics(session, now=now) == 0
+            assert await load_rollup_watermark(session) == _HOUR + timedelta(hours=1)
+
+            values = await _rollup_values(session)
+            assert values == {
+                (_HOUR, "tasks_inbox"): 1.0,
+                (_HOUR, "tasks_review"): 1.0,
+                (_HOUR, "cycle_time_hours"): 2.0,
+                (_HOUR, cycle_time_bucket_metric(cycle_time_bucket_index(2.0))): 1.0,
+                (_HOUR, "activity_events"): 2.0,
+                (_HOUR, "error_events"): 1.0,
+            }
+
+            assert await roll_up_metrics(session, now=now + timedelta(hours=1)) == 1
+            values = await _rollup_values(session)
+            assert values[(_HOUR + timedelta(hours=1), "tasks_done")] == 1.0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_roll_up_backfills_in_bounded_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(metric_rollups.settings, "metrics_rollup_settle_seconds", 0)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            session.add(Task(board_id=board.id, title="old", created_at=_HOUR))
+            await session.commit()
+
+            now = _HOUR + timedelta(days=2, hours=5)
+            batches = []
+            while rolled := await roll_up_metrics(session, now=now):
+                batches.append(rolled)
+
+            assert batches == [24, 24, 5]
+            assert await load_rollup_watermark(session) == now
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_roll_up_counts_each_status_transition_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(metric_rollups.settings, "metrics_rollup_settle_seconds", 0)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            task = Task(
+                board_id=board.id,
+                title="t",
+                status="in_progress",
+                created_at=_HOUR,
+                in_progress_at=_HOUR,
+                updated_at=_HOUR,
+            )
+            session.add(task)
+            await session.commit()
+            task.status = "review"
+            task.updated_at = _HOUR + timedelta(minutes=30)
+            await session.commit()
+            task.status = "done"
+            task.updated_at = _HOUR + timedelta(minutes=45)
+            await session.commit()
+
+            assert await roll_up_metrics(session, now=_HOUR + timedelta(hours=1)) == 1
+
+            # Editing the done task in a later hour is not another transition.
+            task.title = "renamed"
+            task.updated_at = _HOUR + timedelta(hours=1, minutes=15)
+            await session.commit()
+            while await roll_up_metrics(session, now=_HOUR + timedelta(hours=3)):
+                pass
+
+            values = await _rollup_values(session)
+            assert values == {
+                (_HOUR, "tasks_in_progress"): 1.0,
+                (_HOUR, "tasks_review"): 1.0,
+                (_HOUR, "tasks_done"): 1.0,
+                (_HOUR, "cycle_time_hours"): 0.5,
+                (_HOUR, cycle_time_bucket_metric(cycle_time_bucket_index(0.5))): 1.0,
+            }
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_live_tail_does_not_recount_rolled_up_transitions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(metric_rollups.settings, "metrics_rollup_settle_seconds", 0)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            reviewed = Task(
+                board_id=board.id,
+                title="reviewed",
+                status="in_progress",
+                created_at=_HOUR,
+                in_progress_at=_HOUR,
+                updated_at=_HOUR,
+            )
+            session.add(reviewed)
+            await session.commit()
+            reviewed.status = "review"
+            reviewed.updated_at = _HOUR + timedelta(minutes=30)
+            await session.commit()
+            assert await roll_up_metrics(session, now=_HOUR + timedelta(hours=1)) == 1
+
+            # After the watermark: an edit without a status change, plus a task that
+            # reaches review and then done entirely inside the tail.
+            tail = _HOUR + timedelta(hours=1)
+            reviewed.title = "renamed"
+            reviewed.updated_at = tail + timedelta(minutes=10)
+            finished = Task(
+                board_id=board.id,
+                title="finished",
+                status="in_progress",
+                created_at=tail,
+                in_progress_at=tail,
+                updated_at=tail,
+            )
+            session.add(finished)
+            await session.commit()
+            finished.status = "review"
+            finished.updated_at = tail + timedelta(minutes=20)
+            await session.commit()
+            finished.status = "done"
+            finished.updated_at = tail + timedelta(minutes=40)
+            await session.commit()
+
+            primary = RangeSpec(
+                key="7d",
+                start=_HOUR - timedelta(days=6),
+                end=tail + timedelta(minutes=50),
+                bucket="day",
+                duration=timedelta(days=7),
+            )
+            windows = MetricWindows(
+                primary=primary,
+                comparison=metrics_api._comparison_range(primary),
+                rollups_until=await load_rollup_watermark(session),
+            )
+            live, median = await metrics_api._query_transitions(session, windows, [board.id])
+
+            rolled = await _rollup_values(session)
+            assert rolled[(_HOUR, "tasks_review")] == 1.0
+            day = metrics_api._bucket_start(tail, "day")
+            assert live["primary"][day] == {
+                "tasks_in_progress": 1.0,
+                "tasks_review": 1.0,
+                "tasks_done": 1.0,
+                "cycle_time_hours": pytest.approx(1 / 3),
+                cycle_time_bucket_metric(cycle_time_bucket_index(1 / 3)): 1.0,
+            }
+            assert median is None
+    finally:
+        await engine.dispose()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.api import metrics as metrics_api
+from app.core.ttl_cache import TTLCache
+from app.schemas.metrics import DashboardMetrics
+from app.services.metric_rollups import cycle_time_bucket_metric
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from app.api.metrics import MetricWindows, RangeSpec
+
+
+class _FakeResult:
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, *results: list[tuple[object, ...]]) -> None:
+        self._results = list(results)
+        self.statements: list[object] = []
+
+    async def exec(self, statement: object) -> _FakeResult:
+        self.statements.append(statement)
+        return _FakeResult(self._results.pop(0))
+
+
+def _windows(range_key: str, *, rolled: bool = False) -> MetricWindows:
+    primary = metrics_api._resolve_range(range_key)  # type: ignore[arg-type]
+    comparison = metrics_api._comparison_range(primary)
+    return metrics_api.MetricWindows(
+        primary=primary,
+        comparison=comparison,
+        rollups_until=primary.end - timedelta(hours=2) if rolled else None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_transition_query_splits_rows_into_both_windows() -> None:
+    windows = _windows("3d")
+    primary_at = windows.primary.end - timedelta(minutes=5)
+    comparison_at = windows.comparison.start + timedelta(minutes=5)
+    session = _FakeSession(
+        [
+            ("inbox", primary_at, None),
+            ("review", primary_at, primary_at - timedelta(hours=1)),
+            ("review", primary_at, primary_at - timedelta(hours=3)),
+            ("in_progress", primary_at, primary_at),
+            ("review", comparison_at, None),
+        ],
+    )
+
+    totals, median = await metrics_api._query_transitions(
+        session,  # type: ignore[arg-type]
+        windows,
+        [uuid4()],
+    )
+
+    assert "task_status_transitions" in str(session.statements[0])
+    assert median == 2.0
+    throughput = metrics_api._series_set(
+        windows,
+        totals,
+        lambda values: values.get("tasks_review", 0),
+    )
+    assert throughput.primary.points[-1].value == 2.0
+    assert throughput.comparison.points[0].value == 1.0
+    cycle_time = metrics_api._series_set(windows, totals, metrics_api._cycle_time_value)
+    assert cycle_time.primary.points[-1].value == 2.0
+    wip = metrics_api._wip_series_from_totals(windows.primary, totals["primary"])
+    latest = wip.points[-1]
+    assert (latest.inbox, latest.in_progress, latest.review, latest.done) == (1, 1, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_live_queries_start_at_the_rollup_watermark() -> None:
+    windows = _windows("7d", rolled=True)
+    session = _FakeSession([])
+
+    await metrics_api._query_error_rate(
+        session,  # type: ignore[arg-type]
+        windows,
+        [uuid4()],
+    )
+
+    params = session.statements[0].compile().params  # type: ignore[attr-defined]
+    assert windows.rollups_until in params.values()
+    assert windows.comparison.start not in params.values()
+
+
+def test_cycle_time_and_error_rate_are_derived_from_merged_totals() -> None:
+    windows = _windows("7d", rolled=True)
+    bucket = metrics_api._build_buckets(windows.primary)[-1]
+    rollups = metrics_api._empty_totals()
+    live = metrics_api._empty_totals()
+    metrics_api._add_total(rollups, "primary", bucket, "cycle_time_hours", 6.0)
+    metrics_api._add_total(rollups, "primary", bucket, cycle_time_bucket_metric(3), 2)
+    metrics_api._add_total(rollups, "primary", bucket, "activity_events", 3)
+    metrics_api._add_total(live, "primary", bucket, "cycle_time_hours", 3.0)
+    metrics_api._add_total(live, "primary", bucket, cycle_time_bucket_metric(3), 1)
+    metrics_api._add_total(live, "primary", bucket, "activity_events", 1)
+    metrics_api._add_total(live, "primary", bucket, "error_events", 1)
+
+    totals = metrics_api._merge_totals(rollups, live)
+
+    cycle_time = metrics_api._series_set(windows, totals, metrics_api._cycle_time_value)
+    error_rate = metrics_api._series_set(windows, totals, metrics_api._error_rate_value)
+    assert cycle_time.primary.points[-1].value == 3.0
+    assert error_rate.primary.points[-1].value == 25.0
+
+
+@pytest.mark.asyncio
+async def test_dashboard_runs_families_concurrently_and_caches_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board_ids = [uuid4()]
+    running = 0
+    peak = 0
+    calls = 0
+
+    @asynccontextmanager
+    async def _session_maker() -> AsyncIterator[object]:
+        yield object()
+
+    async def _track() -> None:
+        nonlocal running, peak, calls
+        calls += 1
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    def _totals(metric: str, value: float) -> metrics_api._WindowTotals:
+        totals = metrics_api._empty_totals()
+        metrics_api._add_total(totals, "primary", _windows("7d").primary.end, metric, value)
+        return totals
+
+    async def _rollups(
+        _session: object,
+        _windows: MetricWindows,
+        _board_ids: list[UUID],
+    ) -> metrics_api._WindowTotals:
+        await _track()
+        return _totals("tasks_in_progress", 2)
+
+    async def _transitions(
+        _session: object,
+        _windows: MetricWindows,
+        _board_ids: list[UUID],
+    ) -> tuple[metrics_api._WindowTotals, float | None]:
+        await _track()
+        return _totals("tasks_in_progress", 1), 1.5
+
+    async def _error_rate(
+        _session: object,
+        _windows: MetricWindows,
+        _board_ids: list[UUID],
+    ) -> metrics_api._WindowTotals:
+        await _track()
+        return _totals("activity_events", 10)
+
+    async def _agents(_session: object, _primary: RangeSpec, _board_ids: list[UUID]) -> int:
+        await _track()
+        return 2
+
+    async def _resolve(*_args: object, **_kwargs: object) -> list[UUID]:
+        return board_ids
+
+    async def _no_watermark(_session: object) -> None:
+        return None
+
+    monkeypatch.setattr(metrics_api, "async_session_maker", _session_maker)
+    monkeypatch.setattr(metrics_api, "_query_rollups", _rollups)
+    monkeypatch.setattr(metrics_api, "_query_transitions", _transitions)
+    monkeypatch.setattr(metrics_api, "_query_error_rate", _error_rate)
+    monkeypatch.setattr(metrics_api, "_active_agents", _agents)
+    monkeypatch.setattr(metrics_api, "_resolve_dashboard_board_ids", _resolve)
+    monkeypatch.setattr(metrics_api, "load_rollup_watermark", _no_watermark)
+    monkeypatch.setattr(
+        metrics_api,
+        "_dashboard_cache",
+        TTLCache(max_entries=8, ttl_seconds=60),
+    )
+    ctx = SimpleNamespace(member=SimpleNamespace(organization_id=uuid4()))
+
+    async def _load() -> DashboardMetrics:
+        return await metrics_api.dashboard_metrics(
+            range_key="7d",
+            board_id=None,
+            group_id=None,
+            session=object(),  # type: ignore[arg-type]
+            ctx=ctx,  # type: ignore[arg-type]
+        )
+
+    first = await _load()
+    second = await _load()
+
+    assert peak == 4
+    assert calls == 4
+    assert second is first
+    assert first.kpis.model_dump() == {
+        "active_agents": 2,
+        "tasks_in_progress": 3,
+        "error_rate_pct": 0.0,
+        "median_cycle_time_hours_7d": 1.5,
+    }
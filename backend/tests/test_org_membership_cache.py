@@ -0,0 +1,143 @@
+# ruff: noqa: INP001
+"""Tests for the short-lived membership and board-grant cache used by org dependencies."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import deps
+from app.core.auth import AuthContext
+from app.db.query_stats import count_queries
+from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.users import User
+from app.schemas.organizations import OrganizationBoardAccessSpec, OrganizationMemberAccessUpdate
+from app.services import organizations
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine) -> tuple[User, OrganizationMember, Board, Board]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        org = Organization(name=f"org-{uuid4()}")
+        user = User(clerk_user_id=f"user-{uuid4()}", active_organization_id=org.id)
+        member = OrganizationMember(organization_id=org.id, user_id=user.id, role="member")
+        readable = Board(organization_id=org.id, name="readable", slug="readable")
+        writable = Board(organization_id=org.id, name="writable", slug="writable")
+        session.add_all(
+            [
+                org,
+                user,
+                member,
+                readable,
+                writable,
+                OrganizationBoardAccess(
+                    organization_member_id=member.id,
+                    board_id=readable.id,
+                    can_read=True,
+                    can_write=False,
+                ),
+                OrganizationBoardAccess(
+                    organization_member_id=member.id,
+                    board_id=writable.id,
+                    can_read=True,
+                    can_write=True,
+                ),
+            ],
+        )
+        await session.commit()
+    return user, member, readable, writable
+
+
+@pytest.mark.asyncio
+async def test_org_member_and_board_access_are_reused_across_requests() -> None:
+    engine = await _make_engine()
+    try:
+        user, member, readable, writable = await _seed(engine)
+        auth = AuthContext(actor_type="user", user=user)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ctx = await deps.require_org_member(auth=auth, session=session)
+            assert ctx.member.id == member.id
+            assert set(
+                await organizations.list_accessible_board_ids(
+                    session,
+                    member=ctx.member,
+                    write=False,
+                ),
+            ) == {readable.id, writable.id}
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            with count_queries() as queries:
+                ctx = await deps.require_org_member(auth=auth, session=session)
+                await organizations.require_board_access(
+                    session,
+                    user=user,
+                    board=writable,
+                    write=True,
+                )
+                write_ids = await organizations.list_accessible_board_ids(
+                    session,
+                    member=ctx.member,
+                    write=True,
+                )
+            assert queries.count == 0
+            assert write_ids == [writable.id]
+            assert ctx.member in session
+            assert ctx.organization.id == user.active_organization_id
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_member_access_update_invalidates_cached_grants() -> None:
+    engine = await _make_engine()
+    try:
+        user, member, readable, writable = await _seed(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await organizations.require_board_access(
+                session,
+                user=user,
+                board=readable,
+                write=False,
+            )
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            stored = await session.get(OrganizationMember, member.id)
+            assert stored is not None
+            await organizations.apply_member_access_update(
+                session,
+                member=stored,
+                update=OrganizationMemberAccessUpdate(
+                    board_access=[OrganizationBoardAccessSpec(board_id=writable.id)],
+                ),
+            )
+            await session.commit()
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            assert not await organizations.has_board_access(
+                session,
+                member=member,
+                board=readable,
+                write=False,
+            )
+            assert await organizations.has_board_access(
+                session,
+                member=member,
+                board=writable,
+                write=False,
+            )
+    finally:
+        await engine.dispose()
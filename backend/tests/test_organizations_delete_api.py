@@ -56,6 +56,8 @@ async def test_delete_my_org_cleans_dependents_before_organization_delete() -> N
         "activity_events",
         "task_dependencies",
         "task_fingerprints",
+        "task_status_transitions",
+        "metric_rollups",
         "approval_task_links",
         "approvals",
         "board_memory",
@@ -439,7 +439,7 @@ async def test_has_board_access_uses_org_board_access_row_read_and_write() -> No
         can_read=True,
         can_write=False,
     )
-    session = _FakeSession(exec_results=[_FakeExecResult(first_value=access)])
+    session = _FakeSession(exec_results=[_FakeExecResult(all_values=[access])])
     assert (
         await organizations.has_board_access(
             session,
@@ -456,7 +456,8 @@ async def test_has_board_access_uses_org_board_access_row_read_and_write() -> No
         can_read=False,
         can_write=True,
     )
-    session2 = _FakeSession(exec_results=[_FakeExecResult(first_value=access2)])
+    organizations.invalidate_member_access(member)
+    session2 = _FakeSession(exec_results=[_FakeExecResult(all_values=[access2])])
     assert (
         await organizations.has_board_access(
             session2,
@@ -473,7 +474,8 @@ async def test_has_board_access_uses_org_board_access_row_read_and_write() -> No
         can_read=True,
         can_write=False,
     )
-    session3 = _FakeSession(exec_results=[_FakeExecResult(first_value=access3)])
+    organizations.invalidate_member_access(member)
+    session3 = _FakeSession(exec_results=[_FakeExecResult(all_values=[access3])])
     assert (
         await organizations.has_board_access(
             session3,
@@ -5,9 +5,11 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
+from typing import Any
 
 import pytest
 
+from app.services import queue
 from app.services.queue import QueuedTask, dequeue_task, enqueue_task, requeue_if_failed
 
 
@@ -33,7 +35,7 @@ def test_generic_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int)
     def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
         return fake
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue.redis_client", _fake_redis)
     payload = QueuedTask(
         task_type="generic-task",
         payload={"name": "webhook.delivery"},
@@ -56,7 +58,7 @@ def test_generic_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, att
     def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
         return fake
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue.redis_client", _fake_redis)
     payload = QueuedTask(
         task_type="generic-task",
         payload={"attempt": attempts},
@@ -82,7 +84,7 @@ def test_dequeue_task_tolerates_legacy_payload_without_envelope(
     def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
         return fake
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue.redis_client", _fake_redis)
     created_at = datetime.now(UTC)
     fake.values.append(
         json.dumps(
@@ -103,3 +105,282 @@ def test_dequeue_task_tolerates_legacy_payload_without_envelope(
     assert task.task_type == "legacy"
     assert task.attempts == 2
     assert task.payload["board_id"] == "6f3ab1ec-3ef6-4f4d-a6a7-e2d6e5d6f7a8"
+
+
+class _FakeScriptRedis:
+    def __init__(self, result: list[Any]) -> None:
+        self.result = result
+        self.calls: list[tuple[list[str], list[Any]]] = []
+        self.registered: list[str] = []
+
+    def register_script(self, script: str) -> Any:
+        self.registered.append(script)
+
+        def _run(*, keys: list[str], args: list[Any]) -> list[Any]:
+            self.calls.append((keys, args))
+            return self.result
+
+        return _run
+
+
+def test_redis_client_is_cached_per_url() -> None:
+    first = queue.redis_client(redis_url="redis://localhost:6379/14")
+    try:
+        assert queue.redis_client(redis_url="redis://localhost:6379/14") is first
+        assert queue.redis_client(redis_url="redis://localhost:6379/15") is not first
+    finally:
+        queue.close_redis_clients()
+    assert queue.redis_client(redis_url="redis://localhost:6379/14") is not first
+    queue.close_redis_clients()
+
+
+def test_drain_scheduled_runs_one_atomic_script(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    client = _FakeScriptRedis([2, b"112.5"])
+
+    delay = queue._drain_ready_scheduled_tasks(client, "generic-queue", max_items=5)  # type: ignore[arg-type]
+    queue._drain_ready_scheduled_tasks(client, "generic-queue", max_items=5)  # type: ignore[arg-type]
+
+    assert delay == 12.5
+    assert client.calls == [(["generic-queue:scheduled", "generic-queue"], [100.0, 5])] * 2
+    # The script is registered once per client and reused, so Redis sees EVALSHA.
+    assert client.registered == [queue._DRAIN_SCHEDULED_LUA]
+
+
+def test_drain_scheduled_reports_no_delay_when_set_is_empty(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    client = _FakeScriptRedis([0, None])
+
+    assert queue._drain_ready_scheduled_tasks(client, "generic-queue") is None  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("block_timeout", "next_delay", "expected"),
+    [
+        (0, None, 0.0),
+        (0, 0.0, queue._MIN_BLOCK_TIMEOUT_SECONDS),
+        (5, 0.0004, queue._MIN_BLOCK_TIMEOUT_SECONDS),
+        (5, 2.5, 2.5),
+        (1, 2.5, 1.0),
+        (0.0001, None, queue._MIN_BLOCK_TIMEOUT_SECONDS),
+    ],
+)
+def test_blocking_timeout_never_rounds_down_to_block_forever(
+    block_timeout: float,
+    next_delay: float | None,
+    expected: float,
+) -> None:
+    assert queue._blocking_timeout(block_timeout, next_delay) == expected
+
+
+class _FakeBlockingRedis(_FakeScriptRedis):
+    def __init__(self) -> None:
+        # The scheduled set holds a task that is due right now.
+        super().__init__([0, b"100.0"])
+        self.timeouts: list[float] = []
+
+    def brpop(self, _keys: list[str], *, timeout: float) -> None:
+        self.timeouts.append(timeout)
+
+    def sadd(self, _key: str, _member: str) -> None:
+        return None
+
+    def blmove(self, _src: str, _dest: str, timeout: float, _a: str, _b: str) -> None:
+        self.timeouts.append(timeout)
+
+
+def test_blocking_pops_wake_up_for_a_task_due_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeBlockingRedis()
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+
+    assert dequeue_task("generic-queue", block=True) is None
+    assert queue.lease_task("generic-queue", worker_id="w1", block=True) is None
+
+    assert fake.timeouts == [queue._MIN_BLOCK_TIMEOUT_SECONDS] * 2
+
+
+class _FakeLeaseRedis:
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.leases: dict[str, float] = {}
+        self.scheduled: dict[str, float] = {}
+        self.workers: set[str] = set()
+
+    def sadd(self, _key: str, member: str) -> None:
+        self.workers.add(member)
+
+    def lmove(self, source: str, destination: str, _src: str, _dest: str) -> str | None:
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop()
+        self.lists.setdefault(destination, []).insert(0, value)
+        return value
+
+    def zadd(
+        self,
+        key: str,
+        mapping: dict[str, float],
+        *,
+        xx: bool = False,
+        ch: bool = False,
+    ) -> int:
+        target = self.scheduled if key.endswith(":scheduled") else self.leases
+        if xx:
+            mapping = {member: score for member, score in mapping.items() if member in target}
+        target.update(mapping)
+        return len(mapping)
+
+    def register_script(self, _script: str) -> Any:
+        return lambda *, keys, args: [0, None]
+
+    def pipeline(self, *, transaction: bool) -> _FakeLeaseRedis:
+        assert transaction
+        return self
+
+    def lrem(self, key: str, _count: int, value: str) -> None:
+        self.lists[key].remove(value)
+
+    def zrem(self, _key: str, value: str) -> None:
+        self.leases.pop(value, None)
+
+    def execute(self) -> None:
+        return None
+
+
+class _FakeReaperRedis(_FakeScriptRedis):
+    def __init__(self, expired: list[bytes]) -> None:
+        super().__init__([1, 1])
+        self.expired = expired
+
+    def smembers(self, _key: str) -> set[bytes]:
+        return {b"generic-queue:processing:w2", b"generic-queue:processing:w1"}
+
+    def zrangebyscore(self, _key: str, _min: str, _max: float) -> list[bytes]:
+        return self.expired
+
+
+def test_reaper_declares_processing_lists_and_encodes_retries_in_python(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    retry = QueuedTask(
+        task_type="generic-task",
+        payload={"items": [], "ratio": 0.1 + 0.2},
+        created_at=datetime.now(UTC),
+        attempts=1,
+    )
+    exhausted = QueuedTask(
+        task_type="generic-task",
+        payload={},
+        created_at=datetime.now(UTC),
+        attempts=3,
+    )
+    fake = _FakeReaperRedis([retry.to_json().encode(), exhausted.to_json().encode()])
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+
+    assert queue.reap_expired_leases("generic-queue", max_retries=3, visibility_seconds=30) == 1
+
+    [(keys, args)] = fake.calls
+    assert keys == [
+        "generic-queue",
+        "generic-queue:leases",
+        "generic-queue:workers",
+        "generic-queue:processing:w1",
+        "generic-queue:processing:w2",
+    ]
+    assert args[:2] == [100.0, 30]
+    assert args[2::2] == [retry.to_json(), exhausted.to_json()]
+    requeued = queue._decode_task(args[3], "generic-queue")
+    assert requeued.payload == {"items": [], "ratio": 0.1 + 0.2}
+    assert requeued.attempts == 2
+    # Past the retry cap: an empty retry payload tells the script to drop it.
+    assert args[5] == ""
+
+
+def test_reaper_skips_the_script_when_no_worker_is_registered(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeReaperRedis([])
+    fake.smembers = lambda _key: set()  # type: ignore[method-assign]
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+
+    assert queue.reap_expired_leases("generic-queue", max_retries=3) == 0
+    assert fake.calls == []
+
+
+def test_leased_task_stays_in_processing_list_until_acked(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeLeaseRedis()
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    task = QueuedTask(task_type="generic-task", payload={}, created_at=datetime.now(UTC))
+    fake.lists["generic-queue"] = [task.to_json()]
+
+    lease = queue.lease_task("generic-queue", worker_id="w1", visibility_seconds=30)
+
+    assert lease is not None
+    assert lease.task.task_type == "generic-task"
+    assert fake.lists["generic-queue:processing:w1"] == [task.to_json()]
+    assert fake.leases == {task.to_json(): 130.0}
+    assert fake.workers == {"generic-queue:processing:w1"}
+
+    queue.ack_task(lease)
+
+    assert fake.lists["generic-queue:processing:w1"] == []
+    assert fake.leases == {}
+
+
+def test_lease_drops_undecodable_payloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLeaseRedis()
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+    fake.lists["generic-queue"] = ["not-json"]
+
+    with pytest.raises(ValueError):
+        queue.lease_task("generic-queue", worker_id="w1")
+
+    assert fake.lists["generic-queue:processing:w1"] == []
+    assert fake.leases == {}
+
+
+def test_deferred_lease_is_rescheduled_without_an_attempt(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeLeaseRedis()
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    task = QueuedTask(task_type="generic-task", payload={}, created_at=datetime.now(UTC))
+    fake.lists["generic-queue"] = [task.to_json()]
+    lease = queue.lease_task("generic-queue", worker_id="w1")
+    assert lease is not None
+
+    queue.defer_leased_task(lease, 12.5)
+
+    assert fake.lists["generic-queue:processing:w1"] == []
+    assert fake.leases == {}
+    assert fake.scheduled == {task.to_json(): 112.5}
+
+
+def test_extend_lease_refreshes_only_a_held_lease(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLeaseRedis()
+    monkeypatch.setattr(queue, "redis_client", lambda *, redis_url=None: fake)
+    now = 100.0
+    monkeypatch.setattr(queue, "_now_seconds", lambda: now)
+    task = QueuedTask(task_type="generic-task", payload={}, created_at=datetime.now(UTC))
+    fake.lists["generic-queue"] = [task.to_json()]
+    lease = queue.lease_task("generic-queue", worker_id="w1", visibility_seconds=30)
+    assert lease is not None
+
+    now = 120.0
+    assert queue.extend_lease(lease, visibility_seconds=30) is True
+    assert fake.leases == {task.to_json(): 150.0}
+
+    queue.ack_task(lease)
+
+    # An acked (or reaped) lease is not recreated by a late heartbeat.
+    assert queue.extend_lease(lease, visibility_seconds=30) is False
+    assert fake.leases == {}
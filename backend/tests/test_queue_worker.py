@@ -0,0 +1,271 @@
+# ruff: noqa: INP001
+"""Concurrency and rate-limit tests for the generic queue worker."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.services import queue_worker
+from app.services.queue import LeasedTask, QueuedTask
+
+_TASK_TYPE = "test-task"
+
+
+def _task(board_id: str | None = None) -> QueuedTask:
+    payload: dict[str, object] = {"id": str(uuid4())}
+    if board_id is not None:
+        payload["board_id"] = board_id
+    return QueuedTask(task_type=_TASK_TYPE, payload=payload, created_at=datetime.now(UTC))
+
+
+def _patch_queue(
+    monkeypatch: pytest.MonkeyPatch,
+    tasks: list[QueuedTask],
+    deferred: list[tuple[QueuedTask, float]] | None = None,
+) -> list[QueuedTask]:
+    pending = list(tasks)
+    acked: list[QueuedTask] = []
+
+    def _lease(queue_name: str, **_kwargs: object) -> LeasedTask | None:
+        if not pending:
+            return None
+        task = pending.pop(0)
+        return LeasedTask(
+            task=task,
+            raw=task.to_json(),
+            queue_name=queue_name,
+            processing_queue=f"{queue_name}:processing:test",
+        )
+
+    def _ack(lease: LeasedTask, **_kwargs: object) -> None:
+        acked.append(lease.task)
+
+    def _defer(lease: LeasedTask, delay_seconds: float, **_kwargs: object) -> None:
+        if deferred is not None:
+            deferred.append((lease.task, delay_seconds))
+
+    monkeypatch.setattr(queue_worker, "lease_task", _lease)
+    monkeypatch.setattr(queue_worker, "ack_task", _ack)
+    monkeypatch.setattr(queue_worker, "defer_leased_task", _defer)
+    monkeypatch.setattr(queue_worker, "extend_lease", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(queue_worker, "reap_expired_leases", lambda *_args, **_kwargs: 0)
+    return acked
+
+
+def _patch_handler(
+    monkeypatch: pytest.MonkeyPatch,
+    handler: queue_worker._TaskHandler,
+) -> None:
+    monkeypatch.setitem(queue_worker._TASK_HANDLERS, _TASK_TYPE, handler)
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_runs_handlers_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_queue(monkeypatch, [_task("board-a"), _task("board-b"), _task("board-c")])
+    running = 0
+    peak = 0
+
+    async def _handle(_task: QueuedTask) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    _patch_handler(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 0,
+            requeue=lambda _task, _delay: True,
+            rate_limit_key=queue_worker._board_rate_limit_key,
+        ),
+    )
+    monkeypatch.setattr(queue_worker.settings, "rq_dispatch_throttle_seconds", 10)
+
+    processed = await queue_worker.flush_queue(concurrency=2)
+
+    assert processed == 3
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_defers_tasks_for_a_throttled_board(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first, second = _task("board-a"), _task("board-a")
+    deferred: list[tuple[QueuedTask, float]] = []
+    acked = _patch_queue(monkeypatch, [first, second, _task("board-b")], deferred)
+    started: list[QueuedTask] = []
+
+    async def _handle(task: QueuedTask) -> None:
+        started.append(task)
+
+    _patch_handler(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 0,
+            requeue=lambda _task, _delay: True,
+            rate_limit_key=queue_worker._board_rate_limit_key,
+        ),
+    )
+    monkeypatch.setattr(queue_worker.settings, "rq_dispatch_throttle_seconds", 30)
+
+    assert await queue_worker.flush_queue(concurrency=4) == 2
+
+    assert [task.payload["board_id"] for task in started] == ["board-a", "board-b"]
+    assert [task for task, _ in deferred] == [second]
+    assert 29 < deferred[0][1] <= 30
+    assert second not in acked
+
+
+@pytest.mark.asyncio
+async def test_throttled_board_does_not_hold_worker_slots(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backlog = [_task("board-a") for _ in range(4)]
+    deferred: list[tuple[QueuedTask, float]] = []
+    _patch_queue(monkeypatch, [*backlog, _task("board-b")], deferred)
+    started: list[str] = []
+
+    async def _handle(task: QueuedTask) -> None:
+        started.append(str(task.payload["board_id"]))
+
+    _patch_handler(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 0,
+            requeue=lambda _task, _delay: True,
+            rate_limit_key=queue_worker._board_rate_limit_key,
+        ),
+    )
+    monkeypatch.setattr(queue_worker.settings, "rq_dispatch_throttle_seconds", 15)
+
+    began = time.monotonic()
+    assert await queue_worker.flush_queue(concurrency=1) == 2
+
+    # Board B runs right away even with a single slot behind board A's backlog.
+    assert time.monotonic() - began < 1
+    assert started == ["board-a", "board-b"]
+    assert [task for task, _ in deferred] == backlog[1:]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_requeues_failed_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    failing = _task()
+    acked = _patch_queue(monkeypatch, [failing])
+    requeued: list[tuple[QueuedTask, float]] = []
+
+    async def _handle(_task: QueuedTask) -> None:
+        raise RuntimeError("boom")
+
+    def _requeue(task: QueuedTask, delay: float) -> bool:
+        requeued.append((task, delay))
+        return True
+
+    _patch_handler(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 1.0,
+            requeue=_requeue,
+        ),
+    )
+
+    assert await queue_worker.flush_queue() == 0
+    assert [task for task, _ in requeued] == [failing]
+    assert requeued[0][1] >= 1.0
+    assert acked == [failing]
+
+
+@pytest.mark.asyncio
+async def test_stop_event_drains_in_flight_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    acked = _patch_queue(
+        monkeypatch,
+        [_task("board-a"), _task("board-b"), _task("board-c")],
+    )
+    stop = asyncio.Event()
+    finished: list[str] = []
+
+    async def _handle(task: QueuedTask) -> None:
+        stop.set()
+        await asyncio.sleep(0.01)
+        finished.append(str(task.payload["board_id"]))
+
+    _patch_handler(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 0,
+            requeue=lambda _task, _delay: True,
+        ),
+    )
+
+    processed = await queue_worker.flush_queue(concurrency=1, stop=stop)
+
+    assert processed == 1
+    assert finished == ["board-a"]
+    assert [task.payload["board_id"] for task in acked] == ["board-a"]
+
+
+@pytest.mark.asyncio
+async def test_lease_reaper_runs_at_most_once_per_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[int] = []
+
+    def _reap(*_args: object, max_retries: int, **_kwargs: object) -> int:
+        calls.append(max_retries)
+        return 0
+
+    monkeypatch.setattr(queue_worker, "reap_expired_leases", _reap)
+    monkeypatch.setattr(queue_worker.settings, "rq_lease_reap_interval_seconds", 60)
+    monkeypatch.setattr(queue_worker.settings, "rq_dispatch_max_retries", 3)
+    reaper = queue_worker._LeaseReaper()
+
+    await reaper.maybe_run()
+    await reaper.maybe_run()
+
+    assert calls == [3]
+
+
+@pytest.mark.asyncio
+async def test_long_running_task_keeps_extending_its_lease(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    acked = _patch_queue(monkeypatch, [_task("board-a")])
+    extended: list[LeasedTask] = []
+
+    def _extend(lease: LeasedTask, **_kwargs: object) -> bool:
+        extended.append(lease)
+        return True
+
+    async def _handle(_task: QueuedTask) -> None:
+        await asyncio.sleep(0.1)
+
+    monkeypatch.setattr(queue_worker, "extend_lease", _extend)
+    monkeypatch.setattr(queue_worker.settings, "rq_lease_visibility_seconds", 0.03)
+    _patch_handler(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 0,
+            requeue=lambda _task, _delay: True,
+        ),
+    )
+
+    assert await queue_worker.flush_queue() == 1
+    count = len(extended)
+    await asyncio.sleep(0.03)
+
+    # Several heartbeats while the handler ran, none after it was acked.
+    assert count >= 3
+    assert len(extended) == count
+    assert len(acked) == 1
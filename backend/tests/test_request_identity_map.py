@@ -0,0 +1,72 @@
+# ruff: noqa: INP001
+"""Tests for request-scoped entity reuse and per-request query counting."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import deps
+from app.api import tasks as tasks_api
+from app.api.deps import ActorContext
+from app.db.query_stats import count_queries
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.tasks import TaskUpdate
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_task_update_reuses_board_loaded_by_dependencies() -> None:
+    engine = await _make_engine()
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            board = Board(organization_id=org_id, name="b", slug="b")
+            agent = Agent(board_id=board.id, gateway_id=uuid4(), name="worker")
+            task = Task(board_id=board.id, title="t", assigned_agent_id=agent.id)
+            session.add_all([Organization(id=org_id, name="org"), board, agent, task])
+            await session.commit()
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            with count_queries() as queries:
+                loaded_board = await deps.get_board_or_404(str(board.id), session)
+                loaded_task = await deps.get_task_or_404(task.id, loaded_board, session)
+                loaded_agent = await session.get(Agent, agent.id)
+                statements.clear()
+                read = await tasks_api.update_task(
+                    payload=TaskUpdate(status="in_progress"),
+                    task=loaded_task,
+                    session=session,
+                    actor=ActorContext(actor_type="agent", agent=loaded_agent),
+                )
+
+            assert read.status == "in_progress"
+            assert not [sql for sql in statements if "FROM boards" in sql]
+            assert queries.count == len(statements) + 3
+
+            with pytest.raises(HTTPException) as excinfo:
+                await deps.get_board_or_404("not-a-uuid", session)
+            assert excinfo.value.status_code == 404
+    finally:
+        await engine.dispose()
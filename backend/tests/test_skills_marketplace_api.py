@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import json
+import time
+from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
 
@@ -16,18 +18,20 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import require_org_admin
 from app.api.gateways import router as gateways_router
-from app.api.skills_marketplace import (
-    PackSkillCandidate,
-    _collect_pack_skills_from_repo,
-    _validate_pack_source_url,
-)
 from app.api.skills_marketplace import router as skills_marketplace_router
 from app.db.session import get_session
 from app.models.gateways import Gateway
 from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.skills import GatewayInstalledSkill, MarketplaceSkill, SkillPack
+from app.services import skill_packs
 from app.services.organizations import OrganizationContext
+from app.services.queue import QueuedTask
+from app.services.skill_packs import (
+    PackSkillCandidate,
+    collect_pack_skills_from_repo,
+    validate_pack_source_url,
+)
 
 
 async def _make_engine() -> AsyncEngine:
@@ -327,7 +331,7 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
             return collected
 
         monkeypatch.setattr(
-            "app.api.skills_marketplace._collect_pack_skills",
+            "app.services.skill_packs.collect_pack_skills",
             _fake_collect_pack_skills,
         )
 
@@ -396,9 +400,250 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
         await engine.dispose()
 
 
+class _FakeStatusRedis:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.values: dict[str, tuple[str, float]] = {}
+
+    def get(self, key: str) -> str | None:
+        entry = self.values.get(key)
+        if entry is None or entry[1] <= self.now:
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: str, *, ex: int, nx: bool = False) -> bool:
+        assert ex > 0
+        if nx and self.get(key) is not None:
+            return False
+        self.values[key] = (value, self.now + ex)
+        return True
+
+    def expire(self, key: str, seconds: int) -> bool:
+        value = self.get(key)
+        if value is None:
+            return False
+        self.values[key] = (value, self.now + seconds)
+        return True
+
+    def delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None)
+
+    def pipeline(self) -> _FakeStatusRedis:
+        return self
+
+    def execute(self) -> list[object]:
+        return []
+
+
+@pytest.mark.asyncio
+async def test_sync_job_runs_in_background_and_reports_status(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(
+                organization_id=organization.id,
+                name="Pack",
+                source_url="https://github.com/org/pack",
+            )
+            session.add(pack)
+            await session.commit()
+            await session.refresh(pack)
+
+        app = _build_test_app(session_maker, organization=organization)
+        fake_redis = _FakeStatusRedis()
+        queued: list[QueuedTask] = []
+
+        def _fake_enqueue(task: QueuedTask, _queue_name: str, **_kwargs: object) -> bool:
+            queued.append(task)
+            return True
+
+        monkeypatch.setattr(skill_packs, "redis_client", lambda _url=None: fake_redis)
+        monkeypatch.setattr(skill_packs, "enqueue_task", _fake_enqueue)
+        monkeypatch.setattr(skill_packs, "async_session_maker", session_maker)
+        monkeypatch.setattr(
+            skill_packs,
+            "collect_pack_skills",
+            lambda source_url: [
+                PackSkillCandidate(
+                    name="Skill Alpha",
+                    description=None,
+                    source_url=f"{source_url}/tree/main/skills/alpha",
+                ),
+            ],
+        )
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            missing = await client.get(f"/api/v1/skills/packs/{pack.id}/sync-job")
+            started = await client.post(f"/api/v1/skills/packs/{pack.id}/sync-job")
+            duplicate = await client.post(f"/api/v1/skills/packs/{pack.id}/sync-job")
+
+            assert missing.status_code == 404
+            assert started.status_code == 202
+            assert started.json()["status"] == "queued"
+            assert duplicate.json()["status"] == "queued"
+            assert len(queued) == 1
+
+            await skill_packs.process_skill_pack_sync_task(queued[0])
+            finished = await client.get(f"/api/v1/skills/packs/{pack.id}/sync-job")
+
+        body = finished.json()
+        assert body["status"] == "succeeded"
+        assert body["started_at"] is not None
+        assert body["result"]["created"] == 1
+        async with session_maker() as session:
+            skills = await MarketplaceSkill.objects.filter_by(
+                organization_id=organization.id,
+            ).all(session)
+            assert [skill.name for skill in skills] == ["Skill Alpha"]
+    finally:
+        await engine.dispose()
+
+
+def test_sync_job_claim_expires_when_no_worker_keeps_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_redis = _FakeStatusRedis()
+    queued: list[QueuedTask] = []
+
+    def _fake_enqueue(task: QueuedTask, _queue_name: str, **_kwargs: object) -> bool:
+        queued.append(task)
+        return True
+
+    monkeypatch.setattr(skill_packs, "redis_client", lambda _url=None: fake_redis)
+    monkeypatch.setattr(skill_packs, "enqueue_task", _fake_enqueue)
+    monkeypatch.setattr(skill_packs.settings, "skill_pack_sync_claim_ttl_seconds", 60)
+    pack = SkillPack(organization_id=uuid4(), name="Pack", source_url="https://github.com/o/p")
+
+    first = skill_packs.enqueue_skill_pack_sync(pack)
+    duplicate = skill_packs.enqueue_skill_pack_sync(pack)
+    assert first is not None and duplicate == first
+    assert len(queued) == 1
+
+    # The worker that took the job died: the claim lapses after its short TTL,
+    # not the day-long status TTL, and a new sync can be queued.
+    fake_redis.now = 61
+    assert skill_packs.read_skill_pack_sync_status(pack.id) is None
+    retried = skill_packs.enqueue_skill_pack_sync(pack)
+    assert retried is not None and retried.status == "queued"
+    assert len(queued) == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_job_worker_refreshes_claim_while_running(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(
+                organization_id=organization.id,
+                name="Pack",
+                source_url="https://github.com/org/pack",
+            )
+            session.add(pack)
+            await session.commit()
+
+        fake_redis = _FakeStatusRedis()
+        refreshed: list[str] = []
+        expire = fake_redis.expire
+
+        def _expire(key: str, seconds: int) -> bool:
+            refreshed.append(key)
+            return expire(key, seconds)
+
+        def _slow_collect(source_url: str) -> list[PackSkillCandidate]:
+            time.sleep(0.1)
+            return []
+
+        fake_redis.expire = _expire  # type: ignore[method-assign]
+        monkeypatch.setattr(skill_packs, "redis_client", lambda _url=None: fake_redis)
+        monkeypatch.setattr(skill_packs, "enqueue_task", lambda *_args, **_kwargs: True)
+        monkeypatch.setattr(skill_packs, "async_session_maker", session_maker)
+        monkeypatch.setattr(skill_packs, "collect_pack_skills", _slow_collect)
+        monkeypatch.setattr(skill_packs.settings, "skill_pack_sync_claim_ttl_seconds", 0.03)
+
+        assert skill_packs.enqueue_skill_pack_sync(pack) is not None
+        await skill_packs.process_skill_pack_sync_task(
+            QueuedTask(
+                task_type=skill_packs.SKILL_PACK_SYNC_TASK_TYPE,
+                payload={"pack_id": str(pack.id), "organization_id": str(organization.id)},
+                created_at=datetime.now(UTC),
+            ),
+        )
+
+        assert refreshed
+        status = skill_packs.read_skill_pack_sync_status(pack.id)
+        assert status is not None and status.status == "succeeded"
+        # A finished job no longer blocks the next sync.
+        again = skill_packs.enqueue_skill_pack_sync(pack)
+        assert again is not None and again.status == "queued"
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sync_job_records_clone_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(
+                organization_id=organization.id,
+                name="Pack",
+                source_url="https://github.com/org/pack",
+            )
+            session.add(pack)
+            await session.commit()
+
+        def _fail(source_url: str) -> list[PackSkillCandidate]:
+            raise RuntimeError("timed out cloning pack repository")
+
+        fake_redis = _FakeStatusRedis()
+        monkeypatch.setattr(skill_packs, "redis_client", lambda _url=None: fake_redis)
+        monkeypatch.setattr(skill_packs, "async_session_maker", session_maker)
+        monkeypatch.setattr(skill_packs, "collect_pack_skills", _fail)
+
+        await skill_packs.process_skill_pack_sync_task(
+            QueuedTask(
+                task_type=skill_packs.SKILL_PACK_SYNC_TASK_TYPE,
+                payload={"pack_id": str(pack.id), "organization_id": str(organization.id)},
+                created_at=datetime.now(UTC),
+            ),
+        )
+
+        status = skill_packs.read_skill_pack_sync_status(pack.id)
+        assert status is not None
+        assert status.status == "failed"
+        assert status.error == "timed out cloning pack repository"
+    finally:
+        await engine.dispose()
+
+
 def test_validate_pack_source_url_allows_https_github_repo_with_optional_dot_git() -> None:
-    _validate_pack_source_url("https://github.com/org/repo")
-    _validate_pack_source_url("https://github.com/org/repo.git")
+    validate_pack_source_url("https://github.com/org/repo")
+    validate_pack_source_url("https://github.com/org/repo.git")
 
 
 @pytest.mark.parametrize(
@@ -414,13 +659,13 @@ def test_validate_pack_source_url_allows_https_github_repo_with_optional_dot_git
 )
 def test_validate_pack_source_url_rejects_unsafe_urls(url: str) -> None:
     with pytest.raises(ValueError):
-        _validate_pack_source_url(url)
+        validate_pack_source_url(url)
 
 
 def test_validate_pack_source_url_rejects_git_ssh_scp_like_syntax() -> None:
     # Not a URL, but worth asserting we fail closed.
     with pytest.raises(ValueError):
-        _validate_pack_source_url("git@github.com:org/repo.git")
+        validate_pack_source_url("git@github.com:org/repo.git")
 
 
 @pytest.mark.asyncio
@@ -750,7 +995,7 @@ def test_collect_pack_skills_from_repo_uses_root_index_when_present(tmp_path: Pa
         encoding="utf-8",
     )
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/sickn33/antigravity-awesome-skills",
         branch="main",
@@ -805,7 +1050,7 @@ def test_collect_pack_skills_from_repo_supports_root_skill_md(tmp_path: Path) ->
         encoding="utf-8",
     )
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/rohunvora/x-research-skill",
         branch="main",
@@ -830,7 +1075,7 @@ def test_collect_pack_skills_from_repo_supports_top_level_skill_folders(
     (first / "SKILL.md").write_text("# Content Idea Generator\n", encoding="utf-8")
     (second / "SKILL.md").write_text("# Homepage Audit\n", encoding="utf-8")
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/BrianRWagner/ai-marketing-skills",
         branch="main",
@@ -869,7 +1114,7 @@ def test_collect_pack_skills_from_repo_streams_large_index(tmp_path: Path) -> No
         encoding="utf-8",
     )
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/example/oversized-pack",
         branch="main",
@@ -0,0 +1,220 @@
+# ruff: noqa: INP001
+"""Tests for the set-based bulk task update endpoint."""
+
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import tasks as tasks_api
+from app.api.deps import ActorContext
+from app.models.agents import Agent
+from app.models.approvals import Approval
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+from app.schemas.tasks import TaskBulkUpdate
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession, **rules: bool) -> tuple[Board, Agent, Agent]:
+    org_id = uuid4()
+    board = Board(
+        organization_id=org_id,
+        name="board",
+        slug=f"board-{uuid4()}",
+        require_approval_for_done=False,
+        **rules,
+    )
+    lead = Agent(board_id=board.id, gateway_id=uuid4(), name="lead", is_board_lead=True)
+    worker = Agent(board_id=board.id, gateway_id=uuid4(), name="worker")
+    session.add_all([Organization(id=org_id, name=f"org-{org_id}"), board, lead, worker])
+    await session.commit()
+    return board, lead, worker
+
+
+async def _add_tasks(
+    session: AsyncSession,
+    board: Board,
+    count: int,
+    *,
+    status: str = "inbox",
+    assigned_agent_id: UUID | None = None,
+) -> list[Task]:
+    tasks = [
+        Task(
+            board_id=board.id,
+            title=f"task-{index}",
+            status=status,
+            assigned_agent_id=assigned_agent_id,
+        )
+        for index in range(count)
+    ]
+    session.add_all(tasks)
+    await session.commit()
+    return tasks
+
+
+async def _bulk_update(
+    session: AsyncSession,
+    board: Board,
+    actor: ActorContext,
+    **payload: object,
+) -> list[str]:
+    result = await tasks_api.bulk_update_tasks(
+        payload=TaskBulkUpdate.model_validate(payload),
+        board=board,
+        session=session,
+        actor=actor,
+    )
+    return [task.status for task in result]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_uses_constant_queries_and_batches_notifications(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    notified: list[tuple[str, int]] = []
+
+    async def _notify_assign(**kwargs: object) -> None:
+        agent = kwargs["agent"]
+        tasks = kwargs["tasks"]
+        assert isinstance(agent, Agent) and isinstance(tasks, list)
+        notified.append((agent.name, len(tasks)))
+
+    monkeypatch.setattr(tasks_api, "_notify_agent_on_tasks_assign", _notify_assign)
+    engine = await _make_engine()
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, worker = await _seed_board(session)
+            admin = ActorContext(actor_type="user")
+            counts = []
+            for size in (2, 6):
+                tasks = await _add_tasks(session, board, size)
+                statements.clear()
+                statuses = await _bulk_update(
+                    session,
+                    board,
+                    admin,
+                    task_ids=[task.id for task in tasks],
+                    status="in_progress",
+                    assigned_agent_id=worker.id,
+                )
+                assert statuses == ["in_progress"] * size
+                assert all(task.assigned_agent_id == worker.id for task in tasks)
+                counts.append(len([sql for sql in statements if sql.startswith("SELECT")]))
+
+            assert counts[0] == counts[1]
+            assert notified == [("worker", 2), ("worker", 6)]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_is_all_or_nothing_and_reports_failing_task() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, worker = await _seed_board(session)
+            tasks = await _add_tasks(session, board, 3, assigned_agent_id=worker.id)
+            dependency = (await _add_tasks(session, board, 1))[0]
+            session.add(
+                TaskDependency(
+                    board_id=board.id,
+                    task_id=tasks[1].id,
+                    depends_on_task_id=dependency.id,
+                ),
+            )
+            await session.commit()
+
+            with pytest.raises(HTTPException) as exc_info:
+                await _bulk_update(
+                    session,
+                    board,
+                    ActorContext(actor_type="agent", agent=worker),
+                    task_ids=[task.id for task in tasks],
+                    status="in_progress",
+                )
+            assert exc_info.value.status_code == 409
+            assert exc_info.value.detail["task_id"] == str(tasks[1].id)
+            assert exc_info.value.detail["blocked_by_task_ids"] == [str(dependency.id)]
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            for task in tasks:
+                stored = await session.get(Task, task.id)
+                assert stored is not None and stored.status == "inbox"
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_lead_approval_checks_every_task_against_board_rules() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, lead, _worker = await _seed_board(session)
+            board.require_approval_for_done = True
+            tasks = await _add_tasks(session, board, 3, status="review")
+            session.add_all(
+                [
+                    Approval(
+                        board_id=board.id,
+                        task_id=task.id,
+                        action_type="task.done",
+                        confidence=90,
+                        status="approved",
+                    )
+                    for task in tasks[:2]
+                ],
+            )
+            await session.commit()
+            actor = ActorContext(actor_type="agent", agent=lead)
+            task_ids = [task.id for task in tasks]
+
+            with pytest.raises(HTTPException) as exc_info:
+                await _bulk_update(
+                    session,
+                    board,
+                    actor,
+                    task_ids=task_ids,
+                    status="done",
+                )
+            assert exc_info.value.detail["task_id"] == str(task_ids[2])
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            statuses = await _bulk_update(
+                session,
+                board,
+                actor,
+                task_ids=task_ids[:2],
+                status="done",
+            )
+            assert statuses == ["done", "done"]
+    finally:
+        await engine.dispose()
+
+
+def test_bulk_update_payload_requires_a_change() -> None:
+    with pytest.raises(ValueError, match="status or assigned_agent_id"):
+        TaskBulkUpdate(task_ids=[uuid4()])
+    with pytest.raises(ValueError, match="status is required"):
+        TaskBulkUpdate.model_validate({"task_ids": [uuid4()], "status": None})
@@ -0,0 +1,45 @@
+# ruff: noqa: INP001
+"""Tests for the generic TTL/LRU cache."""
+
+from __future__ import annotations
+
+from app.core.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_and_least_recently_used_is_evicted() -> None:
+    clock = _Clock()
+    cache: TTLCache[str, int] = TTLCache(max_entries=2, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_evict_where_and_disabled_cache() -> None:
+    cache: TTLCache[tuple[str, int], str] = TTLCache(max_entries=8, ttl_seconds=5)
+    cache.put(("org-a", 1), "x")
+    cache.put(("org-a", 2), "y")
+    cache.put(("org-b", 1), "z")
+
+    assert cache.evict_where(lambda key: key[0] == "org-a") == 2
+    assert cache.get(("org-b", 1)) == "z"
+
+    disabled: TTLCache[str, str] = TTLCache(max_entries=8, ttl_seconds=0)
+    disabled.put("k", "v")
+    assert disabled.enabled is False
+    assert disabled.get("k") is None
@@ -50,7 +50,7 @@ def test_webhook_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int)
         attempts=attempts,
     )
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue.redis_client", _fake_redis)
     assert enqueue_webhook_delivery(payload)
 
     dequeued = dequeue_webhook_delivery()
@@ -83,7 +83,7 @@ def test_webhook_queue_dequeue_legacy_payload(monkeypatch: pytest.MonkeyPatch) -
         )
     )
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue.redis_client", _fake_redis)
     dequeued = dequeue_webhook_delivery()
 
     assert dequeued is not None
@@ -100,7 +100,7 @@ def test_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, attempts: i
     def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
         return fake
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue.redis_client", _fake_redis)
 
     payload = QueuedInboundDelivery(
         board_id=uuid4(),